@@ -0,0 +1,99 @@
+"""
+Benchmark of prosemirror_to_html on synthetic BlockNote documents.
+
+Renders documents of 1,000 to 100,000 top-level blocks mixing paragraphs
+with marks and styles, headings, nested lists, tables and uploaded images,
+and reports the time per block, which stays flat when rendering scales
+linearly. The json.loads part of the total is reported on its own. A list nested 300 levels deep, close to the nesting json.loads
+accepts, checks that rendering does not depend on the interpreter stack:
+the former recursive renderer failed from about 200 levels.
+
+No database is needed.
+
+Usage:
+    python -m benchmarks.bench_prosemirror_render [max_blocks] [repeats]
+"""
+
+import json
+import sys
+import time
+from collections.abc import Callable
+from functools import partial
+
+from utils.prosemirror_to_html import prosemirror_to_html
+
+_IMAGE_URL = "/uploads/0f8fad5b-d9cb-469f-a165-70867728950e/photo.png"
+
+
+def _text(text: str, marks: tuple[str, ...] = (), **styles: bool) -> dict:
+    node: dict = {"type": "text", "text": text}
+    if marks:
+        node["marks"] = [{"type": mark} for mark in marks]
+    if styles:
+        node["styles"] = styles
+    return node
+
+
+def _block(i: int) -> dict:
+    """Return the i-th block of a synthetic document, cycling through the block types."""
+    kind = i % 5
+    if kind == 0:
+        return {"type": "paragraph", "content": [
+            _text(f"Paragraph {i} with "), _text("bold & italic", ("bold", "italic")), _text(" text", bold=True),
+            {"type": "text", "text": "a link", "marks": [{"type": "link", "attrs": {"href": "https://example.com"}}]},
+        ]}
+    if kind == 1:
+        return {"type": "heading", "props": {"level": 2}, "content": [_text(f"Section {i}")]}
+    if kind == 2:
+        return {"type": "bulletList", "content": [
+            {"type": "listItem", "content": [_text(f"Item {i}.{j}", ("code",))]} for j in range(3)
+        ]}
+    if kind == 3:
+        return {"type": "table", "content": [
+            {"type": "tableRow", "content": [
+                {"type": "tableCell", "content": [_text(f"{row}:{col}")]} for col in range(3)
+            ]} for row in range(2)
+        ]}
+    return {"type": "image", "props": {"url": _IMAGE_URL, "alt": f"Image {i}", "caption": "A caption"}}
+
+
+def _document(blocks: int) -> str:
+    return json.dumps([_block(i) for i in range(blocks)])
+
+
+def _nested_list(depth: int) -> str:
+    node: dict = {"type": "listItem", "content": [_text("leaf")]}
+    for _ in range(depth):
+        node = {"type": "listItem", "content": [{"type": "bulletList", "content": [node]}]}
+    return json.dumps([{"type": "bulletList", "content": [node]}])
+
+
+def _best_of(repeats: int, run: Callable[[], object]) -> float:
+    """Return the fastest of several runs in milliseconds."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main(max_blocks: int = 100_000, repeats: int = 3) -> None:
+    sys.stdout.write(f"best of {repeats} runs\n")
+    sys.stdout.write(f"{'blocks':>10}{'total (ms)':>14}{'json (ms)':>12}{'us/block':>12}\n")
+    blocks = 1_000
+    while blocks <= max_blocks:
+        document = _document(blocks)
+        elapsed = _best_of(repeats, partial(prosemirror_to_html, document))
+        parsing = _best_of(repeats, partial(json.loads, document))
+        sys.stdout.write(f"{blocks:>10}{elapsed:>14.1f}{parsing:>12.1f}{elapsed * 1000 / blocks:>12.2f}\n")
+        blocks *= 10
+
+    depth = 300
+    nested = _nested_list(depth)
+    elapsed = _best_of(repeats, partial(prosemirror_to_html, nested))
+    sys.stdout.write(f"list nested {depth} levels deep: {elapsed:.1f} ms\n")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
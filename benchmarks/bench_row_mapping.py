@@ -0,0 +1,113 @@
+"""
+Microbenchmark of the ORM-to-domain mapping of comments.
+
+Compares, on one article holding 10,000 comments:
+
+- orm + pydantic: loading CommentModel instances and validating each one
+  through CommentRecord (the mapping used before the row mappers),
+- rows + pydantic: selecting COMMENT_COLUMNS and validating each row
+  (SqlAlchemyCommentAdapter with validate_rows=True),
+- rows + mapper: selecting COMMENT_COLUMNS and calling comment_from_row
+  (the default adapter path).
+
+Each path is timed end to end (query and mapping) and on the mapping step
+alone. The rows are inserted in a transaction that is rolled back at the end.
+
+Usage:
+    TEST_DATABASE_URL=postgresql://... python -m benchmarks.bench_row_mapping [rows] [repeats]
+"""
+
+import sys
+import time
+from collections.abc import Callable
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from config.env_config import env_config
+from src.infrastructure.output_adapters.dto.comment_record import CommentRecord
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_account_model import AccountModel
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_article_model import ArticleModel
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_comment_model import CommentModel
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_registry import SqlAlchemyModel
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_comment_adapter import SqlAlchemyCommentAdapter
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_row_mappers import COMMENT_COLUMNS, comment_from_row
+
+
+def _best_of(repeats: int, run: Callable[[], object], session: Session) -> float:
+    """Return the fastest of several runs in milliseconds, on an empty identity map."""
+    timings = []
+    for _ in range(repeats):
+        session.expunge_all()
+        start = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def _seed(session: Session, rows: int) -> int:
+    """Insert an account, an article and its comments, and return the article ID."""
+    account = AccountModel(
+        account_username="bench", account_password="x", account_email="bench@example.com", account_role="user",
+    )
+    session.add(account)
+    session.flush()
+    article = ArticleModel(article_author_id=account.account_id, article_title="Bench", article_content="Bench")
+    session.add(article)
+    session.flush()
+    session.execute(insert(CommentModel), [
+        {
+            "comment_article_id": article.article_id,
+            "comment_written_account_id": account.account_id,
+            "comment_content": f"Comment {i}",
+        }
+        for i in range(rows)
+    ])
+    return article.article_id
+
+
+def main(rows: int = 10_000, repeats: int = 5) -> None:
+    engine = create_engine(env_config.test_database_url)
+    SqlAlchemyModel.metadata.create_all(engine)
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        session = Session(bind=connection, join_transaction_mode="create_savepoint")
+        try:
+            article_id = _seed(session, rows)
+            fast = SqlAlchemyCommentAdapter(session)
+            validated = SqlAlchemyCommentAdapter(session, validate_rows=True)
+
+            def orm_query() -> list[CommentModel]:
+                return session.query(CommentModel).filter(CommentModel.comment_article_id == article_id).all()
+
+            def column_query() -> list:
+                return session.query(*COMMENT_COLUMNS).filter(CommentModel.comment_article_id == article_id).all()
+
+            models = orm_query()
+            column_rows = column_query()
+            results = {
+                "orm + pydantic": (
+                    _best_of(repeats, lambda: [CommentRecord.model_validate(m).to_domain() for m in orm_query()], session),
+                    _best_of(repeats, lambda: [CommentRecord.model_validate(m).to_domain() for m in models], session),
+                ),
+                "rows + pydantic": (
+                    _best_of(repeats, lambda: validated.get_all_by_article_id(article_id), session),
+                    _best_of(repeats, lambda: [CommentRecord.model_validate(r).to_domain() for r in column_rows], session),
+                ),
+                "rows + mapper": (
+                    _best_of(repeats, lambda: fast.get_all_by_article_id(article_id), session),
+                    _best_of(repeats, lambda: [comment_from_row(r) for r in column_rows], session),
+                ),
+            }
+        finally:
+            session.close()
+            transaction.rollback()
+
+    sys.stdout.write(f"{rows} comments, best of {repeats} runs\n")
+    sys.stdout.write(f"{'path':<18}{'end to end (ms)':>18}{'mapping only (ms)':>20}\n")
+    for name, (end_to_end, mapping) in results.items():
+        sys.stdout.write(f"{name:<18}{end_to_end:>18.1f}{mapping:>20.1f}\n")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -2,15 +2,18 @@ import glob
 import os
 from datetime import timedelta
 
-from flask import Flask, render_template, session
+from flask import Flask, has_request_context, render_template, session
 from flask_babel import Babel
 from flask_babel import gettext as _
 from flask_compress import Compress
 from sqlalchemy.orm import Session
 
 from config.env_config import env_config
+from flask_setup.commands import register_cli_commands
 from flask_setup.middleware import init_web_security
 from flask_setup.routes import register_web_routes
+from src.application.application_exceptions import PasswordHasherBusyError
+from src.application.output_ports.file_storage_repository import FileStorageRepository
 from src.application.services.article_service import ArticleService
 from src.application.services.comment_service import CommentService
 from src.application.services.file_service import FileService
@@ -22,13 +25,24 @@ from src.infrastructure.input_adapters.flask.flask_comment_adapter import Commen
 from src.infrastructure.input_adapters.flask.flask_file_adapter import FlaskFileAdapter
 from src.infrastructure.input_adapters.flask.flask_login_adapter import LoginAdapter
 from src.infrastructure.input_adapters.flask.flask_registration_adapter import RegistrationAdapter
+from src.infrastructure.output_adapters.cache.identity_map_account_adapter import IdentityMapAccountAdapter
+from src.infrastructure.output_adapters.cache.lru_file_storage_adapter import LruFileStorageAdapter
+from src.infrastructure.output_adapters.filesystem.content_addressed_blob_store import ContentAddressedBlobStore
+from src.infrastructure.output_adapters.imaging.pillow_image_processor_adapter import PillowImageProcessorAdapter
+from src.infrastructure.output_adapters.rendering.blocknote_html_renderer_adapter import BlockNoteHtmlRendererAdapter
 from src.infrastructure.output_adapters.security.argon2_password_hasher_adapter import Argon2PasswordHasherAdapter
 from src.infrastructure.output_adapters.session.flask_session_adapter import FlaskSessionAdapter
 from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_account_adapter import SqlAlchemyAccountAdapter
 from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_article_adapter import SqlAlchemyArticleAdapter
 from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_comment_adapter import SqlAlchemyCommentAdapter
 from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_file_storage_adapter import SqlAlchemyFileStorageAdapter
-from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_setup_database import setup_database
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_filesystem_file_storage_adapter import (
+    SqlAlchemyFilesystemFileStorageAdapter,
+)
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_full_text_article_adapter import (
+    SqlAlchemyFullTextArticleAdapter,
+)
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_setup_database import remove_session, setup_database
 from utils.prosemirror_to_html import prosemirror_to_html
 from utils.template_helpers import (
     ViteManifest,
@@ -40,12 +54,79 @@ from utils.template_helpers import (
 )
 
 
+def _current_locale() -> str | None:
+    """Return the locale selected in the session, or None outside a request."""
+    if not has_request_context():
+        return None
+    return session.get("lang", "fr")
+
+
+def _create_article_repository(db_session: Session) -> SqlAlchemyArticleAdapter:
+    """
+    Instantiates the article persistence adapter for the configured search backend.
+
+    Args:
+        db_session: SQLAlchemy session shared by the output adapters.
+
+    Returns:
+        SqlAlchemyArticleAdapter: The full-text adapter, or the ILIKE adapter
+            when ARTICLE_SEARCH_BACKEND is set to "ilike".
+    """
+    if env_config.article_search_backend == "ilike":
+        return SqlAlchemyArticleAdapter(
+            db_session, env_config.approximate_count_threshold, env_config.validate_db_rows,
+        )
+    return SqlAlchemyFullTextArticleAdapter(
+        db_session, _current_locale, env_config.approximate_count_threshold, env_config.validate_db_rows,
+    )
+
+
+def _create_file_storage_backend(
+    db_session: Session, disk_file_storage_repo: SqlAlchemyFilesystemFileStorageAdapter,
+) -> SqlAlchemyFileStorageAdapter:
+    """
+    Instantiates the file persistence adapter for the configured storage backend.
+
+    Args:
+        db_session: SQLAlchemy session shared by the output adapters.
+        disk_file_storage_repo: The adapter keeping file contents on disk.
+
+    Returns:
+        SqlAlchemyFileStorageAdapter: The disk adapter when FILE_STORAGE_BACKEND
+            is "filesystem", the BYTEA adapter otherwise.
+    """
+    if env_config.file_storage_backend == "filesystem":
+        return disk_file_storage_repo
+    return SqlAlchemyFileStorageAdapter(db_session)
+
+
+def _create_file_storage_repository(repository: FileStorageRepository) -> FileStorageRepository:
+    """
+    Wraps the file persistence adapter in an in-memory LRU.
+
+    Args:
+        repository: The adapter of the configured storage backend.
+
+    Returns:
+        FileStorageRepository: The LRU around repository, or repository
+            itself when FILE_CACHE_MAX_BYTES is 0.
+    """
+    if env_config.file_cache_max_bytes <= 0:
+        return repository
+    return LruFileStorageAdapter(repository, env_config.file_cache_max_bytes, env_config.file_cache_max_entry_bytes)
+
+
 def _create_output_adapters(db_session: Session) -> dict:
     """
     Instantiates persistence and security adapters.
 
     Uses test argon2 parameters when db_session is provided (test mode),
-    production argon2 parameters otherwise.
+    production argon2 parameters otherwise. The disk file adapter is always
+    built for the uploads migrate-to-disk command, and the unwrapped adapter
+    of the storage backend is exposed for the uploads deduplicate and
+    collect-orphans commands. The account adapter is wrapped in a
+    request-scoped identity map shared by the session adapter and the
+    services, so a request loads each account at most once.
 
     Args:
         db_session: SQLAlchemy session for dependency injection (None for prod).
@@ -53,7 +134,13 @@ def _create_output_adapters(db_session: Session) -> dict:
     Returns:
         dict: Initialized output adapters keyed by role.
     """
-    account_repo = SqlAlchemyAccountAdapter(db_session)
+    account_repo = IdentityMapAccountAdapter(SqlAlchemyAccountAdapter(
+        db_session, env_config.approximate_count_threshold, env_config.validate_db_rows,
+    ))
+    disk_file_storage_repo = SqlAlchemyFilesystemFileStorageAdapter(
+        db_session, ContentAddressedBlobStore(env_config.upload_dir),
+    )
+    file_storage_backend_repo = _create_file_storage_backend(db_session, disk_file_storage_repo)
     if db_session is not None:
         time_cost = env_config.test_argon2_time_cost
         memory_cost = env_config.test_argon2_memory_cost
@@ -64,14 +151,20 @@ def _create_output_adapters(db_session: Session) -> dict:
         parallelism = env_config.argon2_parallelism
     return {
         "account_repo": account_repo,
-        "article_repo": SqlAlchemyArticleAdapter(db_session),
-        "comment_repo": SqlAlchemyCommentAdapter(db_session),
-        "file_storage_repo": SqlAlchemyFileStorageAdapter(db_session),
-        "session_repo": FlaskSessionAdapter(account_repo),
+        "article_repo": _create_article_repository(db_session),
+        "comment_repo": SqlAlchemyCommentAdapter(db_session, env_config.validate_db_rows),
+        "file_storage_repo": _create_file_storage_repository(file_storage_backend_repo),
+        "file_storage_backend_repo": file_storage_backend_repo,
+        "disk_file_storage_repo": disk_file_storage_repo,
+        "image_processor": PillowImageProcessorAdapter(env_config.image_process_pool_size),
+        "article_renderer": BlockNoteHtmlRendererAdapter(file_storage_repository=file_storage_backend_repo),
+        "session_repo": FlaskSessionAdapter(account_repo, env_config.session_snapshot_ttl),
         "password_hasher_repository": Argon2PasswordHasherAdapter(
             time_cost=time_cost,
             memory_cost=memory_cost,
             parallelism=parallelism,
+            pool_size=env_config.argon2_pool_size,
+            max_queued=env_config.argon2_max_queued,
         ),
     }
 
@@ -95,8 +188,12 @@ def _create_services(repositories: dict) -> dict:
 
     login_service = LoginService(account_repo, session_repo, password_hasher_repository)
     comment_service = CommentService(comment_repo, article_repo, account_repo)
-    file_service = FileService(repositories["file_storage_repo"])
-    article_service = ArticleService(article_repo, account_repo, comment_repo, file_service=file_service)
+    file_service = FileService(
+        repositories["file_storage_repo"], repositories["image_processor"], env_config.image_variants_eager,
+    )
+    article_service = ArticleService(
+        article_repo, account_repo, comment_repo, file_service=file_service, renderer=repositories["article_renderer"],
+    )
 
     return {
         "registration_service": registration_service,
@@ -163,12 +260,13 @@ def _init_template_utils(app: Flask) -> None:
     ``current_year`` via ``inject_current_year``.
 
     Injects Vite asset URLs (``vite_js_url``, ``vite_css_urls``) for the
-    BlockNote React frontend build.
+    BlockNote React frontend build, resolved once per manifest change
+    (see VITE_MANIFEST_RELOAD).
 
     Args:
         app: The Flask application instance to configure.
     """
-    ViteManifest.init(os.path.join(app.static_folder or "", "dist"))
+    ViteManifest.init(os.path.join(app.static_folder or "", "dist"), reload=env_config.vite_manifest_reload)
 
     app.jinja_env.filters["nl2br"] = nl2br_filter
     app.jinja_env.filters["date_iso"] = date_iso_filter
@@ -183,21 +281,34 @@ def _error_page(code: int, message: str) -> tuple[str, int]:
     return render_template("error.html", code=code, message=message), code
 
 
+def _password_hasher_busy_page(error: PasswordHasherBusyError) -> tuple[str, int, dict[str, str]]:
+    """Render the 503 page of a login or registration rejected by the saturated password hasher."""
+    message = _("Too many sign-in attempts are being processed. Please try again shortly.")
+    return render_template("error.html", code=503, message=message), 503, {"Retry-After": "5"}
+
+
 def create_app(db_session=None) -> Flask:
     """
     Bootstrap function to initialize the hexagonal application.
     Orchestrates the assembly of the Core and the Web Facade.
 
+    When no session is injected, a request-scoped session is created and
+    removed at the end of every application context. An injected session
+    is owned by the caller and is never removed by the application.
+
     Args:
         db_session: Optional pre-existing database session.
 
     Returns:
         Flask: The configured Flask application (Web Facade).
     """
+    owns_db_session = db_session is None
     db_session = setup_database(db_session)
     repositories = _create_output_adapters(db_session)
     services = _create_services(repositories)
     app = _init_web_facade_flask()
+    if owns_db_session:
+        app.teardown_appcontext(lambda exception: remove_session(db_session))
     Compress(app)
     Babel(app, locale_selector=lambda: session.get("lang", "fr"))
 
@@ -209,10 +320,12 @@ def create_app(db_session=None) -> Flask:
     _init_template_utils(app)
     web_adapters = _init_web_adapters(services)
     register_web_routes(app, web_adapters)
+    register_cli_commands(app, repositories)
     web_adapters["account_session_adapter"].register_before_request_handler(app)
     app.errorhandler(403)(lambda e: _error_page(403, _("You do not have permission to access this page.")))
     app.errorhandler(404)(lambda e: _error_page(404, _("The page you are looking for does not exist.")))
     app.errorhandler(500)(lambda e: _error_page(500, _("An unexpected error occurred. Please try again later.")))
+    app.errorhandler(PasswordHasherBusyError)(_password_hasher_busy_page)
     return app
 
 
@@ -33,6 +33,19 @@ class EnvConfig:
             raise RuntimeError(f"Infrastructure Error : Missing environment variable '{name}'")
         return value
 
+    def _get_optional_env(self, name: str, default: str) -> str:
+        """
+        Helper method to retrieve an optional environment variable.
+
+        Args:
+            name (str): The name of the environment variable to fetch.
+            default (str): The value returned when the variable is unset or empty.
+
+        Returns:
+            str: The value of the environment variable, or the default.
+        """
+        return os.getenv(name) or default
+
     @property
     def database_url(self) -> str:
         """
@@ -53,6 +66,164 @@ class EnvConfig:
         """
         return self._get_env("TEST_DATABASE_URL")
 
+    @property
+    def db_pool_size(self) -> int:
+        """
+        Retrieves the number of persistent connections kept in the pool.
+
+        Returns:
+            int: The pool size (defaults to 5).
+        """
+        return int(self._get_optional_env("DB_POOL_SIZE", "5"))
+
+    @property
+    def db_max_overflow(self) -> int:
+        """
+        Retrieves the number of extra connections allowed beyond the pool size.
+
+        Returns:
+            int: The maximum overflow (defaults to 10).
+        """
+        return int(self._get_optional_env("DB_MAX_OVERFLOW", "10"))
+
+    @property
+    def db_pool_pre_ping(self) -> bool:
+        """
+        Retrieves whether connections are tested for liveness on checkout.
+
+        Returns:
+            bool: True unless DB_POOL_PRE_PING is set to "false" (defaults to True).
+        """
+        return self._get_optional_env("DB_POOL_PRE_PING", "true").lower() == "true"
+
+    @property
+    def db_pool_recycle(self) -> int:
+        """
+        Retrieves the maximum age of a pooled connection before it is replaced.
+
+        Returns:
+            int: The recycle delay in seconds, -1 to disable (defaults to 1800).
+        """
+        return int(self._get_optional_env("DB_POOL_RECYCLE", "1800"))
+
+    @property
+    def article_search_backend(self) -> str:
+        """
+        Retrieves the article search backend.
+
+        Returns:
+            str: "fulltext" for PostgreSQL full-text search, or "ilike" for
+                the pattern-matching fallback (defaults to "fulltext").
+        """
+        return self._get_optional_env("ARTICLE_SEARCH_BACKEND", "fulltext").lower()
+
+    @property
+    def approximate_count_threshold(self) -> int:
+        """
+        Retrieves the estimated table size from which unfiltered list totals
+        use the planner estimate instead of an exact COUNT(*).
+
+        Returns:
+            int: The row threshold (defaults to 0, meaning always count exactly).
+        """
+        return int(self._get_optional_env("APPROXIMATE_COUNT_THRESHOLD", "0"))
+
+    @property
+    def validate_db_rows(self) -> bool:
+        """
+        Retrieves whether rows read by the SQLAlchemy adapters are validated
+        through the Pydantic records before being mapped to domain entities.
+
+        Returns:
+            bool: True if VALIDATE_DB_ROWS is set to "true" (defaults to False).
+        """
+        return self._get_optional_env("VALIDATE_DB_ROWS", "false").lower() == "true"
+
+    @property
+    def file_storage_backend(self) -> str:
+        """
+        Retrieves the storage backend of uploaded file contents.
+
+        Returns:
+            str: "database" for BYTEA in uploaded_files, or "filesystem" for
+                the content-addressed store in UPLOAD_DIR (defaults to "database").
+        """
+        return self._get_optional_env("FILE_STORAGE_BACKEND", "database").lower()
+
+    @property
+    def upload_dir(self) -> str:
+        """
+        Retrieves the root directory of the content-addressed upload store.
+
+        Returns:
+            str: The directory path (defaults to var/uploads in the project root).
+        """
+        return self._get_optional_env("UPLOAD_DIR", str(BASE_DIR / "var" / "uploads"))
+
+    @property
+    def file_cache_max_bytes(self) -> int:
+        """
+        Retrieves the memory budget of the in-process cache of uploaded files.
+
+        Returns:
+            int: Total cached bytes per process (defaults to 32 MiB, 0 disables the cache).
+        """
+        return int(self._get_optional_env("FILE_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+    @property
+    def file_cache_max_entry_bytes(self) -> int:
+        """
+        Retrieves the size above which an uploaded file is not cached in memory.
+
+        Returns:
+            int: The per-file limit in bytes (defaults to 256 KiB).
+        """
+        return int(self._get_optional_env("FILE_CACHE_MAX_ENTRY_BYTES", str(256 * 1024)))
+
+    @property
+    def image_variants_eager(self) -> bool:
+        """
+        Retrieves whether the resized variants of an image are rendered at
+        upload rather than on their first request.
+
+        Returns:
+            bool: True if IMAGE_VARIANTS_EAGER is set to "true" (defaults to False).
+        """
+        return self._get_optional_env("IMAGE_VARIANTS_EAGER", "false").lower() == "true"
+
+    @property
+    def vite_manifest_reload(self) -> bool:
+        """
+        Retrieves whether the Vite manifest is reloaded when the file changes.
+        Production deployments, whose assets only change with a restart,
+        can disable it to skip the stat of the file on every page.
+
+        Returns:
+            bool: False if VITE_MANIFEST_RELOAD is set to "false" (defaults to True).
+        """
+        return self._get_optional_env("VITE_MANIFEST_RELOAD", "true").lower() != "false"
+
+    @property
+    def image_process_pool_size(self) -> int:
+        """
+        Retrieves the number of worker processes rendering image variants at upload.
+
+        Returns:
+            int: The pool size (defaults to 0, rendering in the request thread).
+        """
+        return int(self._get_optional_env("IMAGE_PROCESS_POOL_SIZE", "0"))
+
+    @property
+    def session_snapshot_ttl(self) -> float:
+        """
+        Retrieves how long, in seconds, a checked account version is trusted
+        by the sessions holding a snapshot of the account.
+
+        Returns:
+            float: The TTL (defaults to 5.0; 0 loads the account on every request).
+        """
+        return float(self._get_optional_env("SESSION_SNAPSHOT_TTL", "5"))
+
     @property
     def secret_key(self) -> str:
         """
@@ -93,6 +264,29 @@ class EnvConfig:
         """
         return int(self._get_env("ARGON2_PARALLELISM"))
 
+    @property
+    def argon2_pool_size(self) -> int:
+        """
+        Retrieves the number of threads hashing and verifying passwords,
+        which caps the Argon2 memory in use at pool size × memory cost.
+
+        Returns:
+            int: The pool size (defaults to 4, 0 hashes in the request thread without limit).
+        """
+        return int(self._get_optional_env("ARGON2_POOL_SIZE", "4"))
+
+    @property
+    def argon2_max_queued(self) -> int:
+        """
+        Retrieves the number of password hashes allowed to wait for a free
+        thread of the pool; further logins and registrations are rejected
+        with a 503 response.
+
+        Returns:
+            int: The queue depth (defaults to 16).
+        """
+        return int(self._get_optional_env("ARGON2_MAX_QUEUED", "16"))
+
     @property
     def test_argon2_time_cost(self) -> int:
         """
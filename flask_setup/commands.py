@@ -0,0 +1,110 @@
+import os
+import time
+from datetime import timedelta
+
+import click
+from flask import Flask
+from flask.cli import AppGroup
+
+from src.infrastructure.output_adapters.imaging.pillow_image_processor_adapter import PillowImageProcessorAdapter
+from src.infrastructure.output_adapters.rendering.blocknote_html_renderer_adapter import BlockNoteHtmlRendererAdapter
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_article_adapter import SqlAlchemyArticleAdapter
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_file_storage_adapter import SqlAlchemyFileStorageAdapter
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_filesystem_file_storage_adapter import (
+    SqlAlchemyFilesystemFileStorageAdapter,
+)
+
+
+def _register_upload_commands(
+    app: Flask,
+    file_storage_backend_repo: SqlAlchemyFileStorageAdapter,
+    disk_file_storage_repo: SqlAlchemyFilesystemFileStorageAdapter,
+) -> None:
+    uploads = AppGroup("uploads", help="Manage uploaded files.")
+
+    @uploads.command("migrate-to-disk")
+    @click.option("--batch-size", default=100, show_default=True, type=click.IntRange(min=1),
+                  help="Number of files read and committed at once.")
+    def migrate_to_disk(batch_size: int) -> None:
+        """Move uploads stored as BYTEA to the content-addressed store in UPLOAD_DIR."""
+        moved = disk_file_storage_repo.migrate_database_blobs(
+            batch_size, on_batch=lambda count: click.echo(f"Moved {count} files"),
+        )
+        click.echo(f"Done: {moved} files moved to disk.")
+
+    @uploads.command("deduplicate")
+    @click.option("--batch-size", default=100, show_default=True, type=click.IntRange(min=1),
+                  help="Number of files read and committed at once.")
+    def deduplicate(batch_size: int) -> None:
+        """Collapse the contents of uploads stored before de-duplication into shared blobs."""
+        processed = file_storage_backend_repo.deduplicate_database_blobs(
+            batch_size, on_batch=lambda count: click.echo(f"Processed {count} files"),
+        )
+        click.echo(f"Done: {processed} files de-duplicated.")
+
+    @uploads.command("measure-images")
+    @click.option("--batch-size", default=100, show_default=True, type=click.IntRange(min=1),
+                  help="Number of files read and committed at once.")
+    def measure_images(batch_size: int) -> None:
+        """Record the width of the images uploaded before widths were recorded. Run it before `articles render`."""
+        measured = file_storage_backend_repo.measure_image_widths(
+            PillowImageProcessorAdapter().get_width, batch_size,
+            on_batch=lambda count: click.echo(f"Read {count} files"),
+        )
+        click.echo(f"Done: {measured} images measured.")
+
+    @uploads.command("collect-orphans")
+    @click.option("--grace-hours", default=24, show_default=True, type=click.IntRange(min=0),
+                  help="Minimum age of the files to delete.")
+    @click.option("--batch-size", default=100, show_default=True, type=click.IntRange(min=1),
+                  help="Number of files deleted and committed at once.")
+    @click.option("--pause", default=0.5, show_default=True, type=click.FloatRange(min=0),
+                  help="Seconds to sleep between batches.")
+    @click.option("--dry-run", is_flag=True, help="Report the orphans without deleting them.")
+    def collect_orphans(grace_hours: int, batch_size: int, pause: float, dry_run: bool) -> None:
+        """Delete the uploads no article and no avatar references anymore."""
+        verb = "Found" if dry_run else "Deleted"
+
+        def on_batch(count: int, size: int) -> None:
+            click.echo(f"{verb} {count} files ({size} bytes)")
+            if not dry_run:
+                time.sleep(pause)
+
+        count, size = file_storage_backend_repo.collect_orphans(
+            timedelta(hours=grace_hours), batch_size, dry_run=dry_run, on_batch=on_batch,
+        )
+        if dry_run:
+            click.echo(f"Done: {count} orphaned files, {size} bytes would be reclaimed.")
+        else:
+            click.echo(f"Done: {count} orphaned files deleted, {size} bytes reclaimed.")
+
+    app.cli.add_command(uploads)
+
+
+def _register_article_commands(
+    app: Flask, article_repo: SqlAlchemyArticleAdapter, file_storage_backend_repo: SqlAlchemyFileStorageAdapter,
+) -> None:
+    articles = AppGroup("articles", help="Manage articles.")
+
+    @articles.command("render")
+    @click.option("--batch-size", default=100, show_default=True, type=click.IntRange(min=1),
+                  help="Number of articles rendered and committed at once.")
+    @click.option("--workers", default=os.cpu_count() or 1, show_default="CPU count", type=click.IntRange(min=0),
+                  help="Number of rendering processes. 0 renders in this process.")
+    def render(batch_size: int, workers: int) -> None:
+        """Render again the articles whose stored HTML comes from another renderer version."""
+        rendered = article_repo.render_stale(
+            BlockNoteHtmlRendererAdapter(workers, file_storage_backend_repo),
+            batch_size,
+            on_batch=lambda count: click.echo(f"Rendered {count} articles"),
+        )
+        click.echo(f"Done: {rendered} articles rendered.")
+
+    app.cli.add_command(articles)
+
+
+def register_cli_commands(app: Flask, repositories: dict) -> None:
+    # The maintenance commands work on the SQLAlchemy adapters themselves:
+    # their batch jobs are not part of the output ports.
+    _register_upload_commands(app, repositories["file_storage_backend_repo"], repositories["disk_file_storage_repo"])
+    _register_article_commands(app, repositories["article_repo"], repositories["file_storage_backend_repo"])
@@ -190,4 +190,4 @@ def init_web_security(app: Flask) -> None:
     app.after_request(_add_referrer_policy)
     app.after_request(_add_cache_headers)
     csrf_protect.exempt(csp.handle_report)
-    app.add_url_rule("/csp-report", view_func=csp.handle_report, methods=["POST"])
+    app.add_url_rule("/csp-report", view_func=csp.handle_report, methods=["POST"], endpoint="csp.report")
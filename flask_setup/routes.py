@@ -133,6 +133,13 @@ def _register_auth_routes(app: Flask, adapters: dict) -> None:
         endpoint="auth.list_all_users",
     )
 
+    app.add_url_rule(
+        "/api/users/suggest",
+        view_func=acc.api_suggest_users,
+        methods=["GET"],
+        endpoint="auth.api_suggest_users",
+    )
+
     app.add_url_rule(
         "/account/delete",
         view_func=acc.delete_account,
@@ -188,6 +195,13 @@ def _register_file_routes(app: Flask, adapters: dict) -> None:
         endpoint="file.serve_file",
     )
 
+    app.add_url_rule(
+        "/uploads/<string:file_id>/<int:width>x<int:height>.<any(avif, webp):fmt>",
+        view_func=fad.serve_image_variant,
+        methods=["GET"],
+        endpoint="file.serve_image_variant",
+    )
+
 
 def register_web_routes(app: Flask, adapters: dict) -> None:
     _register_article_routes(app, adapters)
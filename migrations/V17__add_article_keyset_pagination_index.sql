@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS idx_articles_published_at_id
+    ON articles (article_published_at, article_id);
@@ -0,0 +1,23 @@
+ALTER TABLE articles
+    ADD COLUMN article_search_config REGCONFIG NOT NULL DEFAULT 'french',
+    ADD COLUMN article_search_vector TSVECTOR;
+
+CREATE FUNCTION pg_temp.blocknote_plain_text(content TEXT) RETURNS TEXT AS $$
+BEGIN
+    RETURN (
+        SELECT coalesce(string_agg(node #>> '{}', ' '), '')
+        FROM jsonb_path_query(content::jsonb, 'strict $.**.text') AS node
+        WHERE jsonb_typeof(node) = 'string'
+    );
+EXCEPTION WHEN others THEN
+    RETURN content;
+END;
+$$ LANGUAGE plpgsql;
+
+UPDATE articles
+SET article_search_vector =
+    setweight(to_tsvector(article_search_config, coalesce(article_title, '')), 'A')
+    || setweight(to_tsvector(article_search_config, coalesce(article_description, '')), 'B')
+    || setweight(to_tsvector(article_search_config, pg_temp.blocknote_plain_text(article_content)), 'C');
+
+CREATE INDEX idx_articles_search_vector ON articles USING GIN (article_search_vector);
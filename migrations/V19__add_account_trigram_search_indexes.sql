@@ -0,0 +1,6 @@
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_accounts_username_trgm ON accounts USING GIN (account_username gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_accounts_email_trgm ON accounts USING GIN (account_email gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_accounts_username_lower_prefix ON accounts (lower(account_username) text_pattern_ops);
@@ -0,0 +1,17 @@
+ALTER TABLE comments
+  ADD COLUMN comment_depth INTEGER NOT NULL DEFAULT 0;
+
+WITH RECURSIVE thread AS (
+    SELECT comment_id, 0 AS depth
+    FROM comments
+    WHERE comment_reply_to IS NULL
+  UNION ALL
+    SELECT c.comment_id, t.depth + 1
+    FROM comments c
+    JOIN thread t ON c.comment_reply_to = t.comment_id
+)
+UPDATE comments
+SET comment_depth = thread.depth
+FROM thread
+WHERE comments.comment_id = thread.comment_id
+  AND comments.comment_depth <> thread.depth;
@@ -0,0 +1,16 @@
+-- Comments of an article, read in posting order. Also serves the
+-- ON DELETE CASCADE from articles through its leading column.
+CREATE INDEX IF NOT EXISTS idx_comments_article_id_posted_at
+    ON comments (comment_article_id, comment_posted_at);
+
+-- Direct replies of a comment, and the ON DELETE CASCADE from the parent comment.
+CREATE INDEX IF NOT EXISTS idx_comments_reply_to
+    ON comments (comment_reply_to);
+
+-- Comments of an account, and the ON DELETE SET NULL from accounts.
+CREATE INDEX IF NOT EXISTS idx_comments_written_account_id
+    ON comments (comment_written_account_id);
+
+-- Articles of an account, and the ON DELETE SET NULL from accounts.
+CREATE INDEX IF NOT EXISTS idx_articles_author_id
+    ON articles (article_author_id);
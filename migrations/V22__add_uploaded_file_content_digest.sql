@@ -0,0 +1,12 @@
+-- Uploads may live on disk in a content-addressed store, keyed by the
+-- SHA-256 of their content. Their row then keeps the metadata and the
+-- digest, and no longer carries the bytes.
+ALTER TABLE uploaded_files ADD COLUMN IF NOT EXISTS content_sha256 CHAR(64);
+ALTER TABLE uploaded_files ALTER COLUMN file_data DROP NOT NULL;
+
+ALTER TABLE uploaded_files DROP CONSTRAINT IF EXISTS uploaded_files_content_check;
+ALTER TABLE uploaded_files ADD CONSTRAINT uploaded_files_content_check
+    CHECK (file_data IS NOT NULL OR content_sha256 IS NOT NULL);
+
+CREATE INDEX IF NOT EXISTS idx_uploaded_files_content_sha256
+    ON uploaded_files (content_sha256);
@@ -0,0 +1,5 @@
+-- Every upload now records the SHA-256 of its content, which serves as its
+-- strong ETag. Compute it for the contents stored before.
+UPDATE uploaded_files
+SET content_sha256 = encode(sha256(file_data), 'hex')
+WHERE content_sha256 IS NULL AND file_data IS NOT NULL;
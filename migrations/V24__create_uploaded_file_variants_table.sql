@@ -0,0 +1,18 @@
+-- Resized and re-encoded renditions of uploaded images, generated on first
+-- request or at upload. Like their original, they keep their content as
+-- BYTEA or on disk under content_sha256, and go away with it.
+CREATE TABLE IF NOT EXISTS uploaded_file_variants (
+    file_id UUID NOT NULL REFERENCES uploaded_files (file_id) ON DELETE CASCADE,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    format VARCHAR(8) NOT NULL,
+    mime_type VARCHAR(127) NOT NULL,
+    file_size INTEGER NOT NULL,
+    file_data BYTEA,
+    content_sha256 CHAR(64) NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT now(),
+    PRIMARY KEY (file_id, width, height, format)
+);
+
+CREATE INDEX IF NOT EXISTS idx_uploaded_file_variants_content_sha256
+    ON uploaded_file_variants (content_sha256);
@@ -0,0 +1,23 @@
+-- Upload contents are stored once per SHA-256 digest, however many
+-- uploaded_files rows share them. ref_count is the number of those rows;
+-- the blob is deleted along with its last reference. file_data is NULL when
+-- the content is kept on disk in the content-addressed store.
+--
+-- Rows uploaded before this table existed keep their own file_data and are
+-- not counted until `flask uploads deduplicate` has moved them here.
+CREATE TABLE IF NOT EXISTS file_blobs (
+    content_sha256 CHAR(64) PRIMARY KEY,
+    file_data BYTEA,
+    ref_count INTEGER NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT now(),
+    CONSTRAINT file_blobs_ref_count_check CHECK (ref_count >= 0)
+);
+
+-- Files already kept on disk carry no file_data: count them now, so that
+-- every row without file_data references a blob.
+INSERT INTO file_blobs (content_sha256, ref_count)
+SELECT content_sha256, count(*)
+FROM uploaded_files
+WHERE file_data IS NULL
+GROUP BY content_sha256
+ON CONFLICT (content_sha256) DO NOTHING;
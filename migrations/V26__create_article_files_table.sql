@@ -0,0 +1,24 @@
+-- The uploaded files each article references, maintained on every save, so
+-- that the files an edit or a deletion leaves unreferenced are found with a
+-- set difference instead of parsing article contents. The file_id index
+-- serves the "still referenced elsewhere" lookups and the ON DELETE CASCADE
+-- from uploaded_files.
+CREATE TABLE IF NOT EXISTS article_files (
+    article_id INTEGER NOT NULL REFERENCES articles (article_id) ON DELETE CASCADE,
+    file_id UUID NOT NULL REFERENCES uploaded_files (file_id) ON DELETE CASCADE,
+    PRIMARY KEY (article_id, file_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_article_files_file_id ON article_files (file_id);
+
+-- A file no article references anymore is kept while it is an avatar.
+CREATE INDEX IF NOT EXISTS idx_accounts_avatar_file_id ON accounts (avatar_file_id);
+
+-- Existing articles: every upload URL in the content counts as a reference.
+-- This keeps files linked outside image blocks too, which is the safe side.
+INSERT INTO article_files (article_id, file_id)
+SELECT DISTINCT a.article_id, f.file_id
+FROM articles a
+CROSS JOIN LATERAL regexp_matches(a.article_content, '/uploads/([0-9a-f-]{36})', 'g') AS m (groups)
+JOIN uploaded_files f ON f.file_id::text = m.groups[1]
+ON CONFLICT DO NOTHING;
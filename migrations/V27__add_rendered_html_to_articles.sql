@@ -0,0 +1,6 @@
+-- HTML rendered from article_content when the article is saved, and the
+-- version of the renderer that produced it. Existing articles start with
+-- NULL and are rendered on view until `flask articles render` fills them.
+ALTER TABLE articles
+    ADD COLUMN IF NOT EXISTS article_content_html TEXT,
+    ADD COLUMN IF NOT EXISTS article_renderer_version INTEGER;
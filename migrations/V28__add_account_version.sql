@@ -0,0 +1,5 @@
+-- Counter bumped by every change to an account. Sessions keep a snapshot of
+-- the account with the version it was taken at, and reload the account
+-- only when the stored version no longer matches.
+ALTER TABLE accounts
+    ADD COLUMN IF NOT EXISTS account_version INTEGER NOT NULL DEFAULT 0;
@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS idx_accounts_created_at_id
+    ON accounts (account_created_at, account_id);
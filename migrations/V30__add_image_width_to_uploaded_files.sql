@@ -0,0 +1,7 @@
+-- Width in pixels of uploaded raster images, read from their header at
+-- upload, so that the srcset of an article image only offers the variants
+-- the original is wide enough for. Files uploaded earlier start with NULL
+-- and render as a plain <img> until `flask uploads measure-images` has
+-- measured them; run it before `flask articles render`.
+ALTER TABLE uploaded_files
+    ADD COLUMN IF NOT EXISTS image_width INTEGER;
@@ -28,3 +28,12 @@ class FileTypeError(ApplicationError):
     Raised when an uploaded file has an unsupported MIME type or extension.
     """
     pass
+
+
+class PasswordHasherBusyError(ApplicationError):
+    """
+    Raised when the password hasher is saturated and rejects a hash or
+    verification instead of queueing it, so that a burst of logins cannot
+    exhaust the memory and threads of the web process.
+    """
+    pass
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
@@ -26,6 +27,7 @@ class Account:
         avatar_file_id (str | None): UUID of the avatar file in uploaded_files, or None.
         is_banned (bool): Whether the account is currently banned.
         ban_reason (str | None): Optional reason provided by admin when banning.
+        account_version (int): Counter bumped by every change to the account.
     """
 
     def __init__(
@@ -39,6 +41,7 @@ class Account:
         avatar_file_id: str | None = None,
         is_banned: bool = False,
         ban_reason: str | None = None,
+        account_version: int = 0,
     ):
         """
         Initialize a user account.
@@ -53,6 +56,7 @@ class Account:
             avatar_file_id (str | None): UUID of the avatar file in uploaded_files, or None.
             is_banned (bool): Whether the account is currently banned. Defaults to False.
             ban_reason (str | None): Optional reason provided by admin when banning.
+            account_version (int): Counter bumped by every change to the account. Defaults to 0.
         """
         self.account_id = account_id
         self.account_username = account_username
@@ -63,3 +67,16 @@ class Account:
         self.avatar_file_id = avatar_file_id
         self.is_banned = is_banned
         self.ban_reason = ban_reason
+        self.account_version = account_version
+
+@dataclass(frozen=True)
+class AccountCursor:
+    """
+    Keyset position in the account list, ordered by creation date then ID (both descending).
+
+    Attributes:
+        created_at (datetime): Creation timestamp of the last account already shown.
+        account_id (int): ID of the last account already shown, used as a tie-breaker.
+    """
+    created_at: datetime
+    account_id: int
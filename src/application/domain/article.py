@@ -17,6 +17,10 @@ class Article:
         article_content (str): Full text content of the article.
         article_published_at (datetime): Timestamp of publication.
         article_edited_at (datetime | None): Timestamp of last edit. None if never edited.
+        article_content_html (str | None): HTML rendered from article_content
+            when the article was saved. None if it was never rendered.
+        article_renderer_version (int | None): Version of the renderer that
+            produced article_content_html.
     """
 
     def __init__(
@@ -28,6 +32,8 @@ class Article:
         article_published_at: datetime | None,
         article_description: str = "",
         article_edited_at: datetime | None = None,
+        article_content_html: str | None = None,
+        article_renderer_version: int | None = None,
     ):
         self.article_id = article_id
         self.article_author_id = article_author_id
@@ -36,6 +42,20 @@ class Article:
         self.article_content = article_content
         self.article_published_at = article_published_at
         self.article_edited_at = article_edited_at
+        self.article_content_html = article_content_html
+        self.article_renderer_version = article_renderer_version
+
+@dataclass(frozen=True)
+class ArticleCursor:
+    """
+    Keyset position in the article list, ordered by publication date then ID (both descending).
+
+    Attributes:
+        published_at (datetime): Publication timestamp of the last article already shown.
+        article_id (int): ID of the last article already shown, used as a tie-breaker.
+    """
+    published_at: datetime
+    article_id: int
 
 @dataclass
 class ArticleWithAuthor:
@@ -52,6 +72,32 @@ class ArticleWithAuthor:
     author_name: str
     author_avatar_file_id: str | None = None
 
+@dataclass
+class ArticleSummary:
+    """
+    Read Model for an article in a list view: its metadata and its author,
+    without the article content.
+
+    Attributes:
+        article_id (int): Unique identifier for the article.
+        article_author_id (int | None): Reference to the author's Account.
+            None when the author's account has been deleted.
+        article_title (str): Title of the article.
+        article_description (str): Short description shown in article list.
+        article_published_at (datetime | None): Timestamp of publication.
+        article_edited_at (datetime | None): Timestamp of last edit. None if never edited.
+        author_name (str): The display name of the article author.
+        author_avatar_file_id (str | None): UUID of the author's avatar file, or None.
+    """
+    article_id: int
+    article_author_id: int | None
+    article_title: str
+    article_description: str
+    article_published_at: datetime | None
+    article_edited_at: datetime | None
+    author_name: str
+    author_avatar_file_id: str | None = None
+
 @dataclass
 class ArticleDetailView:
     """
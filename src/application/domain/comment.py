@@ -18,6 +18,8 @@ class Comment:
         is_deleted (bool): Soft-delete flag. True if the comment has been removed.
         deleted_at (datetime | None): When the comment was soft-deleted. None if not deleted.
         edited_at (datetime | None): Last edit timestamp. None if never edited.
+        comment_depth (int): Nesting level in the thread. 0 for a top-level
+            comment, parent depth + 1 for a reply.
     """
 
     def __init__(
@@ -31,6 +33,7 @@ class Comment:
         is_deleted: bool = False,
         deleted_at: datetime | None = None,
         edited_at: datetime | None = None,
+        comment_depth: int = 0,
     ):
         self.comment_id = comment_id
         self.comment_article_id = comment_article_id
@@ -41,6 +44,7 @@ class Comment:
         self.is_deleted = is_deleted
         self.deleted_at = deleted_at
         self.edited_at = edited_at
+        self.comment_depth = comment_depth
 
 @dataclass
 class CommentWithAuthor:
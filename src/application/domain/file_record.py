@@ -1,17 +1,30 @@
 from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO
 
 
 class FileRecord:
     """
-    Represents an uploaded file stored in the database.
+    Represents an uploaded file stored in the database or on disk.
 
     Attributes:
         file_id (str): UUID of the file.
         original_filename (str): Original name of the uploaded file.
         mime_type (str): MIME type of the file (image/*).
         size (int): File size in bytes.
-        data (bytes): Binary content of the file.
+        data (bytes): Binary content of the file. When the content lives on
+            disk or in a stream, it is read from content_path or stream on
+            first access.
         created_at (datetime): Timestamp of upload.
+        content_path (str | None): Local path of the content when the storage
+            keeps it on disk, so that it can be served without being loaded.
+        content_sha256 (str | None): Hex SHA-256 digest of the content, None
+            for files stored before digests were recorded.
+        stream (BinaryIO | None): Seekable stream over the content of an
+            upload, so that storage can copy it without loading it whole.
+        image_width (int | None): Width in pixels of a raster image, as
+            displayed once its EXIF orientation is applied. None for other
+            files and for images uploaded before widths were recorded.
     """
 
     def __init__(
@@ -20,12 +33,36 @@ class FileRecord:
         original_filename: str,
         mime_type: str,
         size: int,
-        data: bytes,
+        data: bytes | None,
         created_at: datetime | None = None,
+        content_path: str | None = None,
+        content_sha256: str | None = None,
+        stream: BinaryIO | None = None,
+        image_width: int | None = None,
     ):
         self.file_id = file_id
         self.original_filename = original_filename
         self.mime_type = mime_type
         self.size = size
-        self.data = data
+        self._data = data
         self.created_at = created_at or datetime.now()
+        self.content_path = content_path
+        self.content_sha256 = content_sha256
+        self.stream = stream
+        self.image_width = image_width
+
+    @property
+    def data(self) -> bytes:
+        if self._data is None:
+            if self.content_path:
+                self._data = Path(self.content_path).read_bytes()
+            elif self.stream is not None:
+                self.stream.seek(0)
+                self._data = self.stream.read()
+            else:
+                self._data = b""
+        return self._data
+
+    @data.setter
+    def data(self, value: bytes) -> None:
+        self._data = value
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ImageVariant:
+    """
+    Resized and re-encoded rendition of an uploaded image.
+
+    Attributes:
+        width (int): Width in pixels.
+        height (int): Height in pixels. 0 keeps the aspect ratio of the
+            original; otherwise the image is cropped to fill width x height.
+        format (str): Encoding of the rendition ("avif" or "webp").
+    """
+    width: int
+    height: int
+    format: str
+
+    @property
+    def filename(self) -> str:
+        """Name of the rendition in its URL, e.g. "64x64.webp"."""
+        return f"{self.width}x{self.height}.{self.format}"
+
+    @property
+    def mime_type(self) -> str:
+        """MIME type of the rendition."""
+        return f"image/{self.format}"
+
+
+# Square avatar sizes, covering the 32px and 64px avatars at 1x and 2x.
+AVATAR_SIZES = (32, 64, 128)
+
+# Widths of the images of an article body, from phones to wide screens.
+CONTENT_WIDTHS = (480, 960, 1440)
+
+# Encodings offered for every rendition, preferred first.
+VARIANT_FORMATS = ("avif", "webp")
+
+# The only renditions served, so that arbitrary sizes cannot be requested.
+IMAGE_VARIANTS = frozenset(
+    [ImageVariant(size, size, fmt) for size in AVATAR_SIZES for fmt in VARIANT_FORMATS]
+    + [ImageVariant(width, 0, fmt) for width in CONTENT_WIDTHS for fmt in VARIANT_FORMATS]
+)
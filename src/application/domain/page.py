@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class Page[T]:
+    """
+    Read Model for one page of a paginated listing and the size of the whole listing.
+
+    Attributes:
+        items (list[T]): The entries of the requested page.
+        total (int): Number of entries across all pages. May be a planner
+            estimate for very large unfiltered listings.
+    """
+    items: list[T]
+    total: int
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
-from src.application.domain.account import Account
+from src.application.domain.account import Account, AccountCursor
+from src.application.domain.page import Page
 
 
 class AccountSessionManagementPort(ABC):
@@ -99,39 +100,30 @@ class AccountSessionManagementPort(ABC):
         pass
 
     @abstractmethod
-    def get_all_accounts(self, page: int = 1, per_page: int = 20) -> list[Account]:
+    def get_account_page(self, page: int = 1, per_page: int = 20, after: AccountCursor | None = None) -> Page[Account]:
         """
-        Retrieves a paginated list of all registered accounts.
+        Retrieves a page of accounts together with the total account count.
 
         Intended for admin use only. The calling adapter is responsible
-        for enforcing role-based access control.
+        for enforcing role-based access control. The page and the total are
+        fetched in a single repository call. When a keyset cursor is given,
+        the page that follows it is returned and the page number is ignored.
 
         Args:
             page: The page number (1-indexed). Defaults to 1.
             per_page: The number of items per page. Defaults to 20.
+            after: Optional position of the last account already shown.
 
         Returns:
-            list[Account]: A list of Account domain entities for the given page.
-        """
-        pass
-
-    @abstractmethod
-    def count_all_accounts(self) -> int:
-        """
-        Returns the total number of registered accounts.
-
-        Intended for admin use only, paired with get_all_accounts()
-        to compute pagination metadata.
-
-        Returns:
-            int: The total count of accounts.
+            Page[Account]: The accounts of the page and the total account count.
         """
         pass
 
     @abstractmethod
-    def search_accounts(self, query: str, page: int = 1, per_page: int = 20) -> list[Account]:
+    def search_account_page(self, query: str, page: int = 1, per_page: int = 20) -> Page[Account]:
         """
-        Searches accounts by username or email with pagination.
+        Searches accounts by username or email and returns the requested page
+        with the total number of matches.
 
         Intended for admin use only. The calling adapter is responsible
         for enforcing role-based access control.
@@ -142,24 +134,24 @@ class AccountSessionManagementPort(ABC):
             per_page: The number of items per page. Defaults to 20.
 
         Returns:
-            list[Account]: A list of matching Account domain entities
-                for the given page.
+            Page[Account]: The matching accounts of the page and the total number of matches.
         """
         pass
 
     @abstractmethod
-    def count_search_accounts(self, query: str) -> int:
+    def suggest_accounts(self, query: str, limit: int = 10) -> list[Account]:
         """
-        Returns the total number of accounts matching the search query.
+        Retrieves accounts whose username matches a partial input, for autocomplete.
 
-        Intended for admin use only, paired with search_accounts()
-        to compute pagination metadata.
+        Intended for admin use only. The calling adapter is responsible
+        for enforcing role-based access control.
 
         Args:
-            query: The search string to match against username or email.
+            query: The partial username typed by the user.
+            limit: The maximum number of accounts to return. Defaults to 10.
 
         Returns:
-            int: The total count of matching accounts.
+            list[Account]: At most limit matching accounts, prefix matches first.
         """
         pass
 
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
-from src.application.domain.article import Article, ArticleDetailView, ArticleWithAuthor
+from src.application.domain.article import Article, ArticleCursor, ArticleDetailView, ArticleSummary
+from src.application.domain.page import Page
 
 
 class ArticleManagementPort(ABC):
@@ -28,12 +29,12 @@ class ArticleManagementPort(ABC):
         pass
 
     @abstractmethod
-    def get_all_ordered_by_date_desc(self) -> list[Article]:
+    def get_all_ordered_by_date_desc(self) -> list[ArticleSummary]:
         """
         Retrieves all articles ordered by their publication date in descending order.
 
         Returns:
-            list[Article]: A list of Article domain entities.
+            list[ArticleSummary]: The summaries of every article.
         """
         pass
 
@@ -83,26 +84,21 @@ class ArticleManagementPort(ABC):
         pass
 
     @abstractmethod
-    def get_paginated_articles(self, page: int, per_page: int) -> list[ArticleWithAuthor]:
+    def get_article_page(self, page: int, per_page: int, after: ArticleCursor | None = None) -> Page[ArticleSummary]:
         """
-        Retrieves a paginated list of articles along with their authors' usernames.
+        Retrieves a page of articles with their authors, together with the total article count.
+
+        The page and the total are fetched in a single repository call.
+        When a keyset cursor is given, the page that follows it is returned
+        and the page number is ignored.
 
         Args:
             page (int): The page number requested (1-indexed).
             per_page (int): The number of items to display per page.
+            after (ArticleCursor | None): Optional position of the last article already shown.
 
         Returns:
-            list[ArticleWithAuthor]: A list of Read Models combining articles and their authors.
-        """
-        pass
-
-    @abstractmethod
-    def get_total_count(self) -> int:
-        """
-        Retrieves the total number of articles.
-
-        Returns:
-            int: The total count of all articles.
+            Page[ArticleSummary]: The Read Models of the page and the total article count.
         """
         pass
 
@@ -137,33 +133,18 @@ class ArticleManagementPort(ABC):
         pass
 
     @abstractmethod
-    def search_articles(self, query: str, page: int, per_page: int) -> list[ArticleWithAuthor]:
+    def search_article_page(self, query: str, page: int, per_page: int) -> Page[ArticleSummary]:
         """
-        Searches articles by title or description.
+        Searches articles and returns the requested page with the total number of matches.
+
+        The page and the total are fetched in a single repository call.
 
         Args:
-            query: The search term to match against article titles
-                and descriptions.
+            query: The search term.
             page: The page number (1-indexed).
             per_page: The number of items per page.
 
         Returns:
-            A list of ArticleWithAuthor read models matching the query
-            for the given page, ordered by publication date descending.
+            Page[ArticleSummary]: The matching Read Models of the page and the total number of matches.
         """
         pass
-
-    @abstractmethod
-    def count_search(self, query: str) -> int:
-        """
-        Counts articles matching a search query.
-
-        Args:
-            query: The search term to match against article titles
-                and descriptions.
-
-        Returns:
-            The total number of matching articles.
-        """
-        pass
-
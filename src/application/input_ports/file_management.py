@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import BinaryIO
 
 from src.application.domain.file_record import FileRecord
 
@@ -28,6 +29,25 @@ class FileManagementPort(ABC):
         """
         pass
 
+    @abstractmethod
+    def upload_file_stream(self, filename: str, stream: BinaryIO, mime_type: str) -> FileRecord:
+        """
+        Validates and uploads a file read from a stream, without loading it whole.
+
+        Args:
+            filename (str): Original filename with extension.
+            stream (BinaryIO): Binary stream over the content of the file.
+            mime_type (str): MIME type declared for the file.
+
+        Returns:
+            FileRecord: The saved file record with ID.
+
+        Raises:
+            FileTooLargeError: If file exceeds max size.
+            FileTypeError: If file type, extension or content is not allowed.
+        """
+        pass
+
     @abstractmethod
     def get_file(self, file_id: str) -> FileRecord | None:
         """
@@ -41,6 +61,39 @@ class FileManagementPort(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_file_metadata(self, file_id: str) -> FileRecord | None:
+        """
+        Retrieves a file record by its UUID without loading its content.
+
+        Enough to answer conditional requests, and to serve contents kept on
+        disk from their path.
+
+        Args:
+            file_id (str): The UUID of the file.
+
+        Returns:
+            FileRecord | None: The file record if found, None otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def get_image_variant(self, file_id: str, width: int, height: int, fmt: str) -> FileRecord | None:
+        """
+        Retrieves a resized and re-encoded rendition of an uploaded image.
+
+        Args:
+            file_id (str): The UUID of the original file.
+            width (int): Width of the rendition in pixels.
+            height (int): Height of the rendition in pixels, 0 to keep the aspect ratio.
+            fmt (str): Encoding of the rendition ("avif" or "webp").
+
+        Returns:
+            FileRecord | None: The rendition, the original if it cannot be
+                rendered, or None if the file or the variant does not exist.
+        """
+        pass
+
     @abstractmethod
     def delete_file(self, file_id: str) -> None:
         """
@@ -52,3 +105,15 @@ class FileManagementPort(ABC):
             file_id (str): The UUID of the file to delete.
         """
         pass
+
+    @abstractmethod
+    def delete_files(self, file_ids: set[str]) -> None:
+        """
+        Deletes several file records by their UUIDs at once.
+
+        UUIDs of files that do not exist are ignored.
+
+        Args:
+            file_ids (set[str]): The UUIDs of the files to delete.
+        """
+        pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
-from src.application.domain.account import Account
+from src.application.domain.account import Account, AccountCursor
+from src.application.domain.page import Page
 
 
 class AccountRepository(ABC):
@@ -8,6 +9,10 @@ class AccountRepository(ABC):
     Output port defining the contract for Account persistence operations.
     Any infrastructure adapter (SQLAlchemy, MongoDB, etc.) must implement
     this interface.
+
+    Every change to an existing account (save, update_*) increments its
+    account_version, which lets cached copies of the account be checked
+    with get_version instead of being loaded again.
     """
 
     @abstractmethod
@@ -37,6 +42,19 @@ class AccountRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_version(self, account_id: int) -> int | None:
+        """
+        Retrieves the current account_version of an account.
+
+        Args:
+            account_id (int): The unique identifier of the account.
+
+        Returns:
+            int | None: The version counter, or None if the account does not exist.
+        """
+        pass
+
     @abstractmethod
     def get_by_ids(self, account_ids: list[int]) -> list[Account]:
         """
@@ -133,34 +151,32 @@ class AccountRepository(ABC):
         pass
 
     @abstractmethod
-    def get_all_paginated(self, page: int = 1, per_page: int = 20) -> list[Account]:
+    def get_page(self, page: int = 1, per_page: int = 20, cursor: AccountCursor | None = None) -> Page[Account]:
         """
-        Retrieves a paginated list of accounts, ordered by creation date descending.
+        Retrieves a page of accounts together with the total number of accounts.
+
+        Implementations should fetch both in a single round trip. The page is
+        located by keyset when a cursor is given, by OFFSET otherwise; both
+        follow the same order, so a keyset page holds the same accounts as
+        the numbered page it replaces.
 
         Args:
-            page: The page number (1-indexed). Defaults to 1.
+            page: The page number (1-indexed), used when cursor is None. Defaults to 1.
             per_page: The number of items per page. Defaults to 20.
+            cursor: Position of the last account already shown.
 
         Returns:
-            list[Account]: A list of Account domain entities for the given page.
+            Page[Account]: The accounts of the page, ordered by creation date
+            then ID, descending, and the total account count.
         """
         pass
 
     @abstractmethod
-    def count_all(self) -> int:
-        """
-        Returns the total number of accounts in the data store.
-
-        Returns:
-            int: The total count of accounts.
+    def search_page(self, query: str, page: int = 1, per_page: int = 20) -> Page[Account]:
         """
-        pass
-
-    @abstractmethod
-    def search(self, query: str, page: int = 1, per_page: int = 20) -> list[Account]:
-        """
-        Searches accounts by username or email with pagination.
-        Case-insensitive substring match.
+        Searches accounts by username or email (case-insensitive substring
+        match) and returns the requested page, newest first, together with
+        the total number of matches, in a single round trip.
 
         Args:
             query: The search string to match against username or email.
@@ -168,21 +184,25 @@ class AccountRepository(ABC):
             per_page: The number of items per page. Defaults to 20.
 
         Returns:
-            list[Account]: A list of matching Account domain entities
-                for the given page.
+            Page[Account]: The matching accounts of the page and the total number of matches.
         """
         pass
 
     @abstractmethod
-    def count_search(self, query: str) -> int:
+    def suggest_by_username(self, query: str, limit: int = 10) -> list[Account]:
         """
-        Returns the total number of accounts matching the search query.
+        Retrieves accounts for username autocomplete.
+
+        Usernames starting with the query come first, in alphabetical order.
+        Remaining slots are filled with usernames containing the query.
+        Case-insensitive.
 
         Args:
-            query: The search string to match against username or email.
+            query: The partial username typed by the user.
+            limit: The maximum number of accounts to return. Defaults to 10.
 
         Returns:
-            int: The total count of matching accounts.
+            list[Account]: At most limit matching Account domain entities.
         """
         pass
 
@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+
+
+class ArticleRendererRepository(ABC):
+    """
+    Output port defining how the stored content of an article is rendered
+    to HTML. Any infrastructure adapter must implement this interface.
+    """
+
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """
+        The version of the rendered output, increased whenever the HTML the
+        renderer produces for the same content changes.
+
+        Returns:
+            int: The renderer version.
+        """
+        pass
+
+    @abstractmethod
+    def render(self, content: str) -> str:
+        """
+        Renders the content of an article.
+
+        Args:
+            content (str): The serialized editor document, or plain text.
+
+        Returns:
+            str: The HTML of the article body.
+        """
+        pass
+
+    @abstractmethod
+    def render_all(self, contents: list[str]) -> list[str]:
+        """
+        Renders the contents of several articles, possibly in parallel.
+
+        Args:
+            contents (list[str]): The serialized editor documents.
+
+        Returns:
+            list[str]: The HTML of each article body, in the order of contents.
+        """
+        pass
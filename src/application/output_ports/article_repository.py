@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
-from src.application.domain.article import Article
+from src.application.domain.article import Article, ArticleCursor, ArticleSummary, ArticleWithAuthor
+from src.application.domain.page import Page
 
 
 class ArticleRepository(ABC):
@@ -8,15 +9,18 @@ class ArticleRepository(ABC):
     Output port defining the contract for Article persistence operations.
     Any infrastructure adapter (SQLAlchemy, MongoDB, etc.) must implement
     this interface.
+
+    List methods return ArticleSummary Read Models: implementations should
+    read only the list-view columns and leave article_content unread.
     """
 
     @abstractmethod
-    def get_all_ordered_by_date_desc(self) -> list[Article]:
+    def get_all_ordered_by_date_desc(self) -> list[ArticleSummary]:
         """
         Retrieves all articles ordered by publication date (descending).
 
         Returns:
-            list[Article]: A list of Article domain entities.
+            list[ArticleSummary]: The summaries of every article.
         """
         pass
 
@@ -34,6 +38,23 @@ class ArticleRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_with_author(self, article_id: int) -> ArticleWithAuthor | None:
+        """
+        Retrieves a single article together with its author's username and avatar.
+
+        Implementations should read the article and the author in a single
+        round trip. The author name is "Anonymous" when the author account
+        was deleted, and "Unknown" when it cannot be found.
+
+        Args:
+            article_id (int): The unique identifier of the article.
+
+        Returns:
+            ArticleWithAuthor | None: The Read Model if found, None otherwise.
+        """
+        pass
+
     @abstractmethod
     def save(self, article: Article) -> None:
         """
@@ -57,58 +78,58 @@ class ArticleRepository(ABC):
         pass
 
     @abstractmethod
-    def get_paginated(self, page: int, per_page: int) -> list[Article]:
+    def replace_file_references(self, article_id: int, file_ids: set[str]) -> set[str]:
         """
-        Retrieves a paginated list of articles.
+        Replaces the set of uploaded files an article references.
+
+        IDs of files that do not exist are ignored.
 
         Args:
-            page (int): The page number (1-indexed).
-            per_page (int): The number of items per page.
+            article_id (int): The unique identifier of the article.
+            file_ids (set[str]): The UUIDs of the files its content references.
 
         Returns:
-            list[Article]: A list of Article domain entities for the given page.
+            set[str]: The UUIDs of the files the article stopped referencing
+                that no other article, and no account avatar, references.
         """
         pass
 
     @abstractmethod
-    def count_all(self) -> int:
+    def get_page(self, page: int, per_page: int, cursor: ArticleCursor | None = None) -> Page[ArticleSummary]:
         """
-        Retrieves the total number of articles.
+        Retrieves a page of articles with their authors, together with the
+        total number of articles.
 
-        Returns:
-            int: The total count of articles.
-        """
-        pass
-
-    @abstractmethod
-    def search(self, query: str, page: int, per_page: int) -> list[Article]:
-        """
-        Searches articles by title, description, or author username using a
-        case-insensitive substring match.
+        Implementations should fetch the page, its authors and the total in
+        a single round trip. The page is located by keyset when a cursor is
+        given, by OFFSET otherwise. Author names follow get_with_author().
 
         Args:
-            query: The search term to match against article titles,
-                descriptions, or author usernames.
-            page: The page number (1-indexed).
-            per_page: The number of items per page.
+            page (int): The page number (1-indexed), used when cursor is None.
+            per_page (int): The number of items per page.
+            cursor (ArticleCursor | None): Position of the last article already shown.
 
         Returns:
-            A list of Article domain entities matching the search query
-            for the given page, ordered by publication date descending.
+            Page[ArticleSummary]: The Read Models of the page, ordered by
+            publication date then ID, descending, and the total article count.
         """
         pass
 
     @abstractmethod
-    def count_search(self, query: str) -> int:
+    def search_page(self, query: str, page: int, per_page: int) -> Page[ArticleSummary]:
         """
-        Counts articles matching a search query across title, description,
-        or author username.
+        Searches articles by title, description, or author username and
+        returns the requested page with the authors and the total number
+        of matches, in a single round trip.
 
         Args:
             query: The search term to match against article titles,
                 descriptions, or author usernames.
+            page: The page number (1-indexed).
+            per_page: The number of items per page.
 
         Returns:
-            The total number of articles matching the query.
+            Page[ArticleSummary]: The matching Read Models of the page,
+            ordered by publication date descending, and the total number of matches.
         """
         pass
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 
-from src.application.domain.comment import Comment
+from src.application.domain.comment import Comment, CommentWithAuthor
 
 
 class CommentRepository(ABC):
@@ -45,6 +45,24 @@ class CommentRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_all_with_authors_by_article_id(self, article_id: int) -> list[CommentWithAuthor]:
+        """
+        Retrieves all comments of an article together with their authors'
+        usernames and avatars.
+
+        Implementations should read the comments and their authors in a
+        single round trip. The author name is "Anonymous" when the author
+        account was deleted or cannot be found.
+
+        Args:
+            article_id (int): ID of the article.
+
+        Returns:
+            list[CommentWithAuthor]: The Read Models of every comment of the article.
+        """
+        pass
+
     @abstractmethod
     def get_by_reply_to(self, comment_id: int) -> list[Comment]:
         """
@@ -59,6 +77,19 @@ class CommentRepository(ABC):
         pass
 
     @abstractmethod
+    def get_ancestors(self, comment_id: int) -> list[Comment]:
+        """
+        Retrieves the chain of comments a comment replies to.
+
+        Args:
+            comment_id (int): ID of the comment whose ancestors are requested.
+
+        Returns:
+            list[Comment]: The ancestors, nearest parent first and top-level
+                comment last. Empty for a top-level or unknown comment.
+        """
+        pass
+
     @abstractmethod
     def get_by_account_id(self, account_id: int) -> list[Comment]:
         """
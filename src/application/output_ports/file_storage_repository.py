@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from src.application.domain.file_record import FileRecord
+from src.application.domain.image_variant import ImageVariant
 
 
 class FileStorageRepository(ABC):
@@ -35,6 +36,69 @@ class FileStorageRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_metadata(self, file_id: str) -> FileRecord | None:
+        """
+        Retrieves a file record by its UUID without loading its content.
+
+        The record has no data, but carries the content digest and, when the
+        content is kept on disk, its path.
+
+        Args:
+            file_id (str): The UUID of the file.
+
+        Returns:
+            FileRecord | None: The file record if found, None otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def get_image_widths(self, file_ids: set[str]) -> dict[str, int]:
+        """
+        Retrieves the recorded widths of several uploaded images at once.
+
+        Args:
+            file_ids (set[str]): The UUIDs of the files.
+
+        Returns:
+            dict[str, int]: The image_width of each file, by UUID. Files that
+                do not exist or have no recorded width are left out.
+        """
+        pass
+
+    @abstractmethod
+    def get_variant(self, file_id: str, variant: ImageVariant) -> FileRecord | None:
+        """
+        Retrieves a stored rendition of an uploaded image.
+
+        Args:
+            file_id (str): The UUID of the original file.
+            variant (ImageVariant): The size and encoding of the rendition.
+
+        Returns:
+            FileRecord | None: The rendition if it has been stored, None otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def save_variant(self, file_id: str, variant: ImageVariant, file_record: FileRecord) -> FileRecord:
+        """
+        Stores a rendition alongside its original file.
+
+        Deleting the original deletes its renditions. Saving a rendition
+        that is already stored, e.g. by a concurrent request, does nothing.
+
+        Args:
+            file_id (str): The UUID of the original file.
+            variant (ImageVariant): The size and encoding of the rendition.
+            file_record (FileRecord): The rendition, carrying the original
+                file_id and the variant filename.
+
+        Returns:
+            FileRecord: The stored rendition.
+        """
+        pass
+
     @abstractmethod
     def delete(self, file_id: str) -> None:
         """
@@ -46,3 +110,15 @@ class FileStorageRepository(ABC):
             file_id (str): The UUID of the file to delete.
         """
         pass
+
+    @abstractmethod
+    def delete_many(self, file_ids: set[str]) -> None:
+        """
+        Deletes several file records by their UUIDs at once.
+
+        UUIDs of files that do not exist are ignored.
+
+        Args:
+            file_ids (set[str]): The UUIDs of the files to delete.
+        """
+        pass
@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+from typing import BinaryIO
+
+from src.application.domain.image_variant import ImageVariant
+
+
+class ImageProcessorRepository(ABC):
+    """
+    Output port defining how uploaded images are resized and re-encoded.
+    Any infrastructure adapter (Pillow, libvips, etc.) must implement
+    this interface.
+    """
+
+    @abstractmethod
+    def render(self, data: bytes, variant: ImageVariant) -> bytes | None:
+        """
+        Renders one variant of an image.
+
+        Args:
+            data (bytes): The content of the original image.
+            variant (ImageVariant): The size and encoding to produce.
+
+        Returns:
+            bytes | None: The encoded rendition, or None if the original is
+                not a raster image the processor can decode (e.g. SVG).
+        """
+        pass
+
+    @abstractmethod
+    def render_all(self, data: bytes, variants: list[ImageVariant]) -> list[bytes | None]:
+        """
+        Renders several variants of an image, possibly in parallel.
+
+        Args:
+            data (bytes): The content of the original image.
+            variants (list[ImageVariant]): The sizes and encodings to produce.
+
+        Returns:
+            list[bytes | None]: The renditions, in the order of variants.
+        """
+        pass
+
+    @abstractmethod
+    def get_width(self, content: BinaryIO) -> int | None:
+        """
+        Reads the width of an image, as displayed once its EXIF orientation is applied.
+
+        Only the header of the image is read, and the stream is left at its start.
+
+        Args:
+            content (BinaryIO): Seekable stream over the image, from its start.
+
+        Returns:
+            int | None: The width in pixels, or None if the content is not a
+                raster image the processor can decode (e.g. SVG).
+        """
+        pass
@@ -18,6 +18,9 @@ class PasswordHasherRepository(ABC):
 
         Returns:
             str: The resulting password hash string.
+
+        Raises:
+            PasswordHasherBusyError: If the hasher is saturated and rejects the work.
         """
         pass
 
@@ -32,6 +35,9 @@ class PasswordHasherRepository(ABC):
 
         Returns:
             bool: True if the password matches, False otherwise.
+
+        Raises:
+            PasswordHasherBusyError: If the hasher is saturated and rejects the work.
         """
         pass
 
@@ -3,10 +3,12 @@ import re
 from datetime import UTC, datetime
 
 from src.application.domain.account import Account, AccountRole
-from src.application.domain.article import Article, ArticleDetailView, ArticleWithAuthor
+from src.application.domain.article import Article, ArticleCursor, ArticleDetailView, ArticleSummary
+from src.application.domain.page import Page
 from src.application.input_ports.article_management import ArticleManagementPort
 from src.application.input_ports.file_management import FileManagementPort
 from src.application.output_ports.account_repository import AccountRepository
+from src.application.output_ports.article_renderer_repository import ArticleRendererRepository
 from src.application.output_ports.article_repository import ArticleRepository
 from src.application.output_ports.comment_repository import CommentRepository
 from src.application.services.service_utils import build_comment_nested_tree
@@ -18,8 +20,8 @@ def _extract_image_uuids(content: str) -> set[str]:
     Walks the BlockNote JSON tree recursively via _walk_blocks to find
     image blocks (type == "image"). Supports both BlockNote v0.51+
     (props.url) and legacy (attrs.url) attribute locations. Expects URLs
-    matching pattern /uploads/<uuid_v4>.<ext> where uuid_v4 is a
-    36-character hex string with hyphens.
+    matching pattern /uploads/<uuid>/<filename> where uuid is in its
+    canonical 8-4-4-4-12 hex form.
 
     Args:
         content: BlockNote JSON string or plain text.
@@ -35,7 +37,7 @@ def _extract_image_uuids(content: str) -> set[str]:
     except (json.JSONDecodeError, TypeError):
         return set()
     uuids: set[str] = set()
-    pattern = re.compile(r"/uploads/([a-f0-9\-]{36})")
+    pattern = re.compile(r"/uploads/([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})")
     _walk_blocks(data, uuids, pattern)
     return uuids
 
@@ -81,6 +83,7 @@ class ArticleService(ArticleManagementPort):
         account_repository: AccountRepository,
         comment_repository: CommentRepository,
         file_service: FileManagementPort | None = None,
+        renderer: ArticleRendererRepository | None = None,
     ):
         """
         Initialize the service via Dependency Injection.
@@ -90,11 +93,26 @@ class ArticleService(ArticleManagementPort):
             account_repository (AccountRepository): Port for account data access.
             comment_repository (CommentRepository): Port for comment data access.
             file_service (FileManagementPort | None): Optional port for file management cleanup.
+            renderer (ArticleRendererRepository | None): Optional port rendering
+                the content to HTML when an article is saved. Without it,
+                no HTML is stored and views render the content themselves.
         """
         self.article_repository = article_repository
         self.account_repository = account_repository
         self.comment_repository = comment_repository
         self.file_service = file_service
+        self.renderer = renderer
+
+    def _render(self, article: Article) -> None:
+        """
+        Stores the HTML of the article content and the renderer version on the entity.
+
+        Args:
+            article (Article): The article to render, modified in place.
+        """
+        if self.renderer:
+            article.article_content_html = self.renderer.render(article.article_content)
+            article.article_renderer_version = self.renderer.version
 
     def _get_account_if_author_or_admin(self, user_id: int) -> Account | str:
         """
@@ -148,16 +166,18 @@ class ArticleService(ArticleManagementPort):
             article_published_at=None,
             article_description=description,
         )
+        self._render(new_article)
 
         self.article_repository.save(new_article)
+        self.article_repository.replace_file_references(new_article.article_id, _extract_image_uuids(content))
         return new_article
 
-    def get_all_ordered_by_date_desc(self) -> list[Article]:
+    def get_all_ordered_by_date_desc(self) -> list[ArticleSummary]:
         """
         Retrieves all articles ordered by their publication date.
 
         Returns:
-            list[Article]: A list of Article domain entities.
+            list[ArticleSummary]: The summaries of every article.
         """
         return self.article_repository.get_all_ordered_by_date_desc()
 
@@ -177,6 +197,8 @@ class ArticleService(ArticleManagementPort):
         """
         Updates an existing article. Only the original author or an admin can edit
         (admins can also edit anonymous articles whose author account was deleted).
+        The uploaded images the new content no longer shows are deleted, unless
+        another article or an avatar still uses them.
 
         Args:
             article_id (int): ID of the article to update.
@@ -202,25 +224,24 @@ class ArticleService(ArticleManagementPort):
             # TODO: Raise OwnershipException
             return "Unauthorized : You are not the author of this article."
 
-        old_content = article.article_content
         article.article_title = title
         article.article_description = description
         article.article_content = content
         article.article_edited_at = datetime.now(UTC)
+        self._render(article)
         self.article_repository.save(article)
 
-        if self.file_service:
-            old_uuids = _extract_image_uuids(old_content)
-            new_uuids = _extract_image_uuids(content)
-            orphaned = old_uuids - new_uuids
-            for uuid in orphaned:
-                self.file_service.delete_file(uuid)
+        orphaned = self.article_repository.replace_file_references(article_id, _extract_image_uuids(content))
+        if self.file_service and orphaned:
+            self.file_service.delete_files(orphaned)
 
         return article
 
     def delete_article(self, article_id: int, user_id: int) -> bool | str:
         """
         Deletes an article. Only the original author or an admin can delete it.
+        Its uploaded images are deleted with it, unless another article or an
+        avatar still uses them.
 
         Args:
             article_id (int): ID of the article to delete.
@@ -243,47 +264,27 @@ class ArticleService(ArticleManagementPort):
             # TODO: Raise OwnershipException
             return "Unauthorized : Only authors or admins can delete articles."
 
-        if self.file_service:
-            for uuid in _extract_image_uuids(article.article_content):
-                self.file_service.delete_file(uuid)
-
+        orphaned = self.article_repository.replace_file_references(article_id, set())
         self.article_repository.delete(article)
+        if self.file_service and orphaned:
+            self.file_service.delete_files(orphaned)
         return True
 
-    def get_paginated_articles(self, page: int = 1, per_page: int = 10) -> list[ArticleWithAuthor]:
+    def get_article_page(
+        self, page: int = 1, per_page: int = 10, after: ArticleCursor | None = None,
+    ) -> Page[ArticleSummary]:
         """
-        Retrieves a paginated list of articles combined with their authors' usernames.
+        Retrieves a page of articles with their authors, together with the total article count.
 
         Args:
             page (int): The page number requested (1-indexed). Defaults to 1.
             per_page (int): The number of items to display per page. Defaults to 10.
+            after (ArticleCursor | None): Optional position of the last article already shown.
 
         Returns:
-            list[ArticleWithAuthor]: A list of Read Models combining articles and their authors.
+            Page[ArticleSummary]: The Read Models of the page and the total article count.
         """
-        min_page = 1
-        if page < min_page:
-            page = min_page
-
-        domain_articles = self.article_repository.get_paginated(page, per_page)
-        known_ids = {a.article_author_id for a in domain_articles if a.article_author_id is not None}
-        authors = self.account_repository.get_by_ids(list(known_ids))
-        author_map = {acc.account_id: acc.account_username for acc in authors}
-        avatar_map = {acc.account_id: acc.avatar_file_id for acc in authors}
-        return [ArticleWithAuthor(
-            article=a,
-            author_name=author_map.get(a.article_author_id, "Unknown") if a.article_author_id is not None else "Anonymous",
-            author_avatar_file_id=avatar_map.get(a.article_author_id) if a.article_author_id in avatar_map else None,
-        ) for a in domain_articles]
-
-    def get_total_count(self) -> int:
-        """
-        Retrieves the total number of articles.
-
-        Returns:
-            int: The total count of all articles.
-        """
-        return self.article_repository.count_all()
+        return self.article_repository.get_page(max(page, 1), per_page, after)
 
     def get_author_name(self, author_id: int | None) -> str:
         """
@@ -304,8 +305,12 @@ class ArticleService(ArticleManagementPort):
 
     def get_article_with_comments(self, article_id: int) -> ArticleDetailView | str:
         """
-        Orchestrates the retrieval of an article, its associated threaded comments,
-        and all involved author names in optimized batches.
+        Orchestrates the retrieval of an article and its associated threaded comments.
+
+        The article and its author come from one query, the comments and
+        their authors from a second one. The HTML stored with the article is
+        used as is; when it is missing or comes from another renderer
+        version, the content is rendered for this view only.
 
         Args:
             article_id (int): ID of the article to retrieve.
@@ -314,68 +319,27 @@ class ArticleService(ArticleManagementPort):
             ArticleDetailView | str: A Read Model for the complete article detail page,
             or an error message string if the article is not found.
         """
-        article = self.article_repository.get_by_id(article_id)
-        if not article:
+        article_with_author = self.article_repository.get_with_author(article_id)
+        if not article_with_author:
             return "Article not found."
+        article = article_with_author.article
+        if self.renderer and article.article_renderer_version != self.renderer.version:
+            self._render(article)
 
-        all_comments = self.comment_repository.get_all_by_article_id(article_id)
-        known_ids = {article.article_author_id} if article.article_author_id is not None else set()
-        known_ids.update(c.comment_written_account_id for c in all_comments if c.comment_written_account_id is not None)
-        authors = self.account_repository.get_by_ids(list(known_ids))
-        author_map = {acc.account_id: acc.account_username for acc in authors}
-        avatar_map = {acc.account_id: acc.avatar_file_id for acc in authors}
-        nested = build_comment_nested_tree(all_comments, author_map, avatar_map)
-        author_name = (
-            author_map.get(article.article_author_id, "Unknown")
-            if article.article_author_id is not None
-            else "Anonymous"
-        )
-        article_with_author = ArticleWithAuthor(
-            article=article,
-            author_name=author_name,
-            author_avatar_file_id=avatar_map.get(article.article_author_id) if article.article_author_id in avatar_map else None,
-        )
+        all_comments = self.comment_repository.get_all_with_authors_by_article_id(article_id)
+        nested = build_comment_nested_tree(all_comments)
         return ArticleDetailView(article_with_author=article_with_author, nested_comments=nested)
 
-    def search_articles(self, query: str, page: int, per_page: int) -> list[ArticleWithAuthor]:
+    def search_article_page(self, query: str, page: int, per_page: int) -> Page[ArticleSummary]:
         """
-        Searches articles by title or description.
-
-        Delegates to the repository's search method, then merges author
-        information (username and avatar) from the account repository.
+        Searches articles and returns the requested page with the total number of matches.
 
         Args:
-            query: The search term to match against article titles
-                and descriptions.
+            query: The search term.
             page: The page number (1-indexed).
             per_page: The number of items per page.
 
         Returns:
-            A list of ArticleWithAuthor read models matching the query
-            for the given page, ordered by publication date descending.
-        """
-        domain_articles = self.article_repository.search(query, page, per_page)
-        known_ids = {a.article_author_id for a in domain_articles if a.article_author_id is not None}
-        authors = self.account_repository.get_by_ids(list(known_ids))
-        author_map = {acc.account_id: acc.account_username for acc in authors}
-        avatar_map = {acc.account_id: acc.avatar_file_id for acc in authors}
-        return [ArticleWithAuthor(
-            article=a,
-            author_name=author_map.get(a.article_author_id, "Unknown") if a.article_author_id is not None else "Anonymous",
-            author_avatar_file_id=avatar_map.get(a.article_author_id) if a.article_author_id in avatar_map else None,
-        ) for a in domain_articles]
-
-    def count_search(self, query: str) -> int:
-        """
-        Counts articles matching a search query.
-
-        Delegates to the repository's count_search method.
-
-        Args:
-            query: The search term to match against article titles
-                and descriptions.
-
-        Returns:
-            The total number of matching articles.
+            Page[ArticleSummary]: The matching Read Models of the page and the total number of matches.
         """
-        return self.article_repository.count_search(query)
+        return self.article_repository.search_page(query, page, per_page)
@@ -53,19 +53,6 @@ class CommentService(CommentManagementPort):
             return "Account is banned."
         return account
 
-    @staticmethod
-    def _get_comment_depth(comment_id: int, comment_repo: CommentRepository) -> int:
-        depth = 0
-        current_id = comment_id
-        for _ in range(10):
-            parent = comment_repo.get_by_id(current_id)
-            if not parent or parent.comment_reply_to is None:
-                break
-            current_id = parent.comment_reply_to
-            depth += 1
-        return depth
-
-
     def create_comment(self, article_id: int, user_id: int, content: str) -> Comment | str:
         """
         Creates a new top-level comment on an article.
@@ -117,6 +104,8 @@ class CommentService(CommentManagementPort):
         Creates a reply to an existing comment.
 
         Validates parent comment exists, is not deleted, and respects max nesting depth.
+        The depth is read from the stored depth of the parent, so a single
+        lookup is needed whatever the nesting level.
 
         Args:
             parent_comment_id (int): ID of the parent comment to reply to.
@@ -139,8 +128,7 @@ class CommentService(CommentManagementPort):
         if parent_comment.is_deleted:
             return "Cannot reply to a deleted comment."
 
-        parent_depth = self._get_comment_depth(parent_comment.comment_id, self.comment_repository)
-        if parent_depth >= MAX_REPLY_DEPTH:
+        if parent_comment.comment_depth >= MAX_REPLY_DEPTH:
             return "Cannot reply to a comment at maximum nesting depth."
 
         sanitized = nh3.clean(
@@ -159,6 +147,7 @@ class CommentService(CommentManagementPort):
             comment_content=sanitized,
             comment_reply_to=parent_comment.comment_id,
             comment_posted_at=datetime.now(UTC),
+            comment_depth=parent_comment.comment_depth + 1,
         )
 
         self.comment_repository.save(new_reply)
@@ -179,12 +168,8 @@ class CommentService(CommentManagementPort):
         if not article:
             return "Article not found."
 
-        all_comments = self.comment_repository.get_all_by_article_id(article_id)
-        author_ids = {c.comment_written_account_id for c in all_comments if c.comment_written_account_id is not None}
-        authors = self.account_repository.get_by_ids(list(author_ids))
-        author_map = {acc.account_id: acc.account_username for acc in authors}
-        avatar_map = {acc.account_id: acc.avatar_file_id for acc in authors}
-        return build_comment_nested_tree(all_comments, author_map, avatar_map)
+        all_comments = self.comment_repository.get_all_with_authors_by_article_id(article_id)
+        return build_comment_nested_tree(all_comments)
 
     def mask_comments_by_account_id(self, account_id: int) -> None:
         """
@@ -1,26 +1,70 @@
+import hashlib
+import re
+import tempfile
+from contextlib import ExitStack
 from datetime import datetime
+from io import BytesIO
+from typing import BinaryIO
 from uuid import uuid4
 
 from src.application.application_exceptions import FileTooLargeError, FileTypeError
 from src.application.domain.file_record import FileRecord
+from src.application.domain.image_variant import IMAGE_VARIANTS, ImageVariant
 from src.application.input_ports.file_management import FileManagementPort
 from src.application.output_ports.file_storage_repository import FileStorageRepository
+from src.application.output_ports.image_processor_repository import ImageProcessorRepository
 
 
 class FileService(FileManagementPort):
     """
     Implements the FileManagementPort input port.
     Handles file validation (extension, MIME type, size) and delegates
-    persistence to a FileStorageRepository adapter.
+    persistence to a FileStorageRepository adapter. Uploads carry the SHA-256
+    digest of their content, under which the repository stores identical
+    contents once.
+
+    Uploads are read as a stream, chunk by chunk: the size limit is enforced
+    and the digest computed as the chunks arrive, and the image type is
+    sniffed from the first bytes, so that neither validation nor storage
+    holds a whole upload in memory.
+
+    With an ImageProcessorRepository, images are also served as resized
+    AVIF/WebP variants (IMAGE_VARIANTS). A variant is rendered on its first
+    request and stored alongside the original, or at upload when
+    eager_variants is set. The width of an image is read from its header at
+    upload and recorded with it, so that article images only offer the
+    variants the original is wide enough for.
     """
 
     _ALLOWED_EXTENSIONS: set[str] = {
         "jpg", "jpeg", "png", "gif", "webp", "avif", "svg", "bmp", "tiff", "tif",
     }
     _MAX_FILE_SIZE: int = 5 * 1024 * 1024  # 5 MB
+    _CHUNK_SIZE: int = 64 * 1024
+    _SNIFF_SIZE: int = 512
+    # Streams that cannot be rewound to their start are spooled to a
+    # temporary file, kept in memory up to this size.
+    _SPOOL_MEMORY_SIZE: int = 1024 * 1024
+    _IMAGE_SIGNATURES: tuple[tuple[re.Pattern[bytes], str], ...] = (
+        (re.compile(rb"\x89PNG\r\n\x1a\n"), "image/png"),
+        (re.compile(rb"\xff\xd8\xff"), "image/jpeg"),
+        (re.compile(rb"GIF8[79]a"), "image/gif"),
+        (re.compile(rb"RIFF.{4}WEBP", re.DOTALL), "image/webp"),
+        (re.compile(rb".{4}ftypavi[fs]", re.DOTALL), "image/avif"),
+        (re.compile(rb"BM"), "image/bmp"),
+        (re.compile(rb"II\*\x00|MM\x00\*"), "image/tiff"),
+        (re.compile(rb"(?:\xef\xbb\xbf)?\s*<(?:svg|.*?<svg)", re.DOTALL), "image/svg+xml"),
+    )
 
-    def __init__(self, file_storage_repository: FileStorageRepository):
+    def __init__(
+        self,
+        file_storage_repository: FileStorageRepository,
+        image_processor: ImageProcessorRepository | None = None,
+        eager_variants: bool = False,
+    ):
         self.file_storage_repository = file_storage_repository
+        self.image_processor = image_processor
+        self.eager_variants = eager_variants
 
     def _get_extension(self, filename: str) -> str:
         """Extract lowercase file extension from filename.
@@ -81,8 +125,25 @@ class FileService(FileManagementPort):
                 f"of {self._MAX_FILE_SIZE} bytes (5 MB)."
             )
 
+    def _sniff_mime_type(self, header: bytes) -> str:
+        """Identify the image type of a content from its first bytes.
+
+        Args:
+            header: The first bytes of the content (up to _SNIFF_SIZE).
+
+        Returns:
+            The MIME type matching the content signature.
+
+        Raises:
+            FileTypeError: If the content is not one of the allowed image types.
+        """
+        for signature, mime_type in self._IMAGE_SIGNATURES:
+            if signature.match(header):
+                return mime_type
+        raise FileTypeError("The file content is not a supported image.")
+
     def upload_file(self, filename: str, data: bytes, mime_type: str) -> FileRecord:
-        """Validate and persist an uploaded file.
+        """Validate and persist an uploaded file held in memory.
 
         Args:
             filename: Original filename with extension.
@@ -90,26 +151,114 @@ class FileService(FileManagementPort):
             mime_type: MIME type string.
 
         Returns:
-            FileRecord with assigned UUID and timestamp.
+            FileRecord with assigned UUID, timestamp and content digest.
 
         Raises:
-            FileTypeError: If extension or MIME type is not allowed.
+            FileTypeError: If extension, MIME type or content type is not allowed.
+            FileTooLargeError: If size exceeds 5 MB limit.
+        """
+        return self.upload_file_stream(filename, BytesIO(data), mime_type)
+
+    def upload_file_stream(self, filename: str, stream: BinaryIO, mime_type: str) -> FileRecord:
+        """Validate and persist an uploaded file read from a stream.
+
+        The stream is read once, in _CHUNK_SIZE chunks, and reading stops as
+        soon as the size limit is exceeded or the first bytes are not an
+        image. A seekable stream positioned at its start is then handed to
+        the repository as is; any other stream is spooled to a temporary
+        file first. With an image processor, the header of the image is
+        read once more to record its width.
+
+        Args:
+            filename: Original filename with extension.
+            stream: Binary stream over the content.
+            mime_type: MIME type string declared by the client. The stored
+                MIME type is the one sniffed from the content.
+
+        Returns:
+            FileRecord with assigned UUID, timestamp, content digest and image width.
+
+        Raises:
+            FileTypeError: If extension, MIME type or content type is not allowed.
             FileTooLargeError: If size exceeds 5 MB limit.
         """
         self._validate_extension(filename)
         self._validate_mime_type(mime_type)
-        self._validate_size(len(data))
 
-        file_record = FileRecord(
-            file_id=str(uuid4()),
-            original_filename=filename,
-            mime_type=mime_type,
+        with ExitStack() as stack:
+            content = stream
+            if not stream.seekable() or stream.tell() != 0:
+                content = stack.enter_context(tempfile.SpooledTemporaryFile(max_size=self._SPOOL_MEMORY_SIZE))
+            digest = hashlib.sha256()
+            size = 0
+            header = b""
+            sniffed_mime_type = None
+            while chunk := stream.read(self._CHUNK_SIZE):
+                size += len(chunk)
+                self._validate_size(size)
+                if sniffed_mime_type is None:
+                    header += chunk[:self._SNIFF_SIZE - len(header)]
+                    if len(header) == self._SNIFF_SIZE:
+                        sniffed_mime_type = self._sniff_mime_type(header)
+                digest.update(chunk)
+                if content is not stream:
+                    content.write(chunk)
+            if sniffed_mime_type is None:
+                sniffed_mime_type = self._sniff_mime_type(header)
+            content.seek(0)
+            image_width = self.image_processor.get_width(content) if self.image_processor else None
+
+            file_record = FileRecord(
+                file_id=str(uuid4()),
+                original_filename=filename,
+                mime_type=sniffed_mime_type,
+                size=size,
+                data=None,
+                created_at=datetime.now(),
+                content_sha256=digest.hexdigest(),
+                stream=content,
+                image_width=image_width,
+            )
+
+            saved = self.file_storage_repository.save(file_record)
+            if self.eager_variants:
+                self._render_variants(saved, sorted(IMAGE_VARIANTS, key=lambda v: (v.height, v.width, v.format)))
+            return saved
+
+    def _render_variants(self, original: FileRecord, variants: list[ImageVariant]) -> None:
+        """Render and store variants of an image, skipping those the processor cannot produce.
+
+        Args:
+            original: The stored original, with its content.
+            variants: The variants to render.
+        """
+        if self.image_processor is None:
+            return
+        renditions = self.image_processor.render_all(original.data, variants)
+        for variant, data in zip(variants, renditions, strict=True):
+            if data is not None:
+                self._save_variant(original, variant, data)
+
+    def _save_variant(self, original: FileRecord, variant: ImageVariant, data: bytes) -> FileRecord:
+        """Store a rendition of an image alongside it.
+
+        Args:
+            original: The original file.
+            variant: The size and encoding of the rendition.
+            data: The encoded rendition.
+
+        Returns:
+            FileRecord of the stored rendition.
+        """
+        rendition = FileRecord(
+            file_id=original.file_id,
+            original_filename=variant.filename,
+            mime_type=variant.mime_type,
             size=len(data),
             data=data,
             created_at=datetime.now(),
         )
-
-        return self.file_storage_repository.save(file_record)
+        return self.file_storage_repository.save_variant(original.file_id, variant, rendition)
 
     def get_file(self, file_id: str) -> FileRecord | None:
         """Retrieve a file record by UUID.
@@ -122,12 +271,61 @@ class FileService(FileManagementPort):
         """
         return self.file_storage_repository.get(file_id)
 
+    def get_file_metadata(self, file_id: str) -> FileRecord | None:
+        """Retrieve a file record by UUID without its content.
+
+        Args:
+            file_id: UUID string of the file.
+
+        Returns:
+            FileRecord if found, None otherwise.
+        """
+        return self.file_storage_repository.get_metadata(file_id)
+
+    def get_image_variant(self, file_id: str, width: int, height: int, fmt: str) -> FileRecord | None:
+        """Retrieve a resized rendition of an image, rendering it on first request.
+
+        Args:
+            file_id: UUID string of the original file.
+            width: Width of the rendition in pixels.
+            height: Height of the rendition in pixels, 0 to keep the aspect ratio.
+            fmt: Encoding of the rendition.
+
+        Returns:
+            FileRecord of the rendition; the original itself if it cannot be
+            rendered (e.g. SVG); None if the file does not exist, the variant
+            is not one of IMAGE_VARIANTS or no image processor is configured.
+        """
+        variant = ImageVariant(width, height, fmt)
+        if self.image_processor is None or variant not in IMAGE_VARIANTS:
+            return None
+        stored = self.file_storage_repository.get_variant(file_id, variant)
+        if stored is not None:
+            return stored
+        original = self.file_storage_repository.get(file_id)
+        if original is None:
+            return None
+        data = self.image_processor.render(original.data, variant)
+        if data is None:
+            return original
+        return self._save_variant(original, variant, data)
+
     def delete_file(self, file_id: str) -> None:
         """Delete a file record by UUID.
 
+        Its content is freed by the repository once no other file shares it.
         Idempotent — does nothing if the file does not exist.
 
         Args:
             file_id: UUID string of the file to delete.
         """
         self.file_storage_repository.delete(file_id)
+
+    def delete_files(self, file_ids: set[str]) -> None:
+        """Delete several file records by UUID at once.
+
+        Args:
+            file_ids: UUID strings of the files to delete.
+        """
+        if file_ids:
+            self.file_storage_repository.delete_many(file_ids)
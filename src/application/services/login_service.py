@@ -1,4 +1,5 @@
-from src.application.domain.account import Account, AccountRole
+from src.application.domain.account import Account, AccountCursor, AccountRole
+from src.application.domain.page import Page
 from src.application.input_ports.account_session_management import AccountSessionManagementPort
 from src.application.input_ports.login_management import LoginManagementPort
 from src.application.output_ports.account_repository import AccountRepository
@@ -47,6 +48,9 @@ class LoginService(LoginManagementPort, AccountSessionManagementPort):
         Returns:
             Account | str: The authenticated Account instance if
             credentials match, or an error message string if it fails.
+
+        Raises:
+            PasswordHasherBusyError: If the password hasher is saturated.
         """
 
         account = self.account_repository.find_by_username(username)
@@ -77,6 +81,21 @@ class LoginService(LoginManagementPort, AccountSessionManagementPort):
         """
         return self.session_repository.get_account()
 
+    def _refresh_session(self, account_id: int) -> None:
+        """
+        Stores the updated current account in the session.
+
+        Keeps a session holding a copy of the account in step with the
+        change just made, rather than serving the previous copy until it
+        is found out of date.
+
+        Args:
+            account_id: The ID of the current account.
+        """
+        account = self.account_repository.get_by_id(account_id)
+        if account is not None:
+            self.session_repository.save_account(account)
+
     def terminate_session(self) -> None:
         """
         Terminates the current active session, effectively logging the user out.
@@ -123,6 +142,7 @@ class LoginService(LoginManagementPort, AccountSessionManagementPort):
         if account is None:
             return
         self.account_repository.update_avatar(account.account_id, avatar_file_id)
+        self._refresh_session(account.account_id)
 
     def update_email(self, new_email: str) -> str | None:
         """
@@ -151,6 +171,7 @@ class LoginService(LoginManagementPort, AccountSessionManagementPort):
             return "This email is already taken."
 
         self.account_repository.update_email(account.account_id, new_email)
+        self._refresh_session(account.account_id)
         return None
 
     def update_password(self, new_password: str) -> str | None:
@@ -177,33 +198,30 @@ class LoginService(LoginManagementPort, AccountSessionManagementPort):
 
         new_hash = self.password_hasher_repository.hash(new_password)
         self.account_repository.update_password(account.account_id, new_hash)
+        self._refresh_session(account.account_id)
         return None
 
-    def get_all_accounts(self, page: int = 1, per_page: int = 20) -> list[Account]:
+    def get_account_page(self, page: int = 1, per_page: int = 20, after: AccountCursor | None = None) -> Page[Account]:
         """
-        Retrieves a paginated list of all registered accounts.
+        Retrieves a page of accounts together with the total account count.
+
+        Uses keyset pagination when a cursor is given, numbered (OFFSET)
+        pages otherwise.
 
         Args:
             page: The page number (1-indexed). Defaults to 1.
             per_page: The number of items per page. Defaults to 20.
+            after: Optional position of the last account already shown.
 
         Returns:
-            list[Account]: A list of Account domain entities for the given page.
-        """
-        return self.account_repository.get_all_paginated(page, per_page)
-
-    def count_all_accounts(self) -> int:
-        """
-        Returns the total number of registered accounts.
-
-        Returns:
-            int: The total count of accounts.
+            Page[Account]: The accounts of the page and the total account count.
         """
-        return self.account_repository.count_all()
+        return self.account_repository.get_page(page, per_page, after)
 
-    def search_accounts(self, query: str, page: int = 1, per_page: int = 20) -> list[Account]:
+    def search_account_page(self, query: str, page: int = 1, per_page: int = 20) -> Page[Account]:
         """
-        Searches accounts by username or email with pagination.
+        Searches accounts by username or email and returns the requested page
+        with the total number of matches.
 
         Args:
             query: The search string to match against username or email.
@@ -211,22 +229,22 @@ class LoginService(LoginManagementPort, AccountSessionManagementPort):
             per_page: The number of items per page. Defaults to 20.
 
         Returns:
-            list[Account]: A list of matching Account domain entities
-                for the given page.
+            Page[Account]: The matching accounts of the page and the total number of matches.
         """
-        return self.account_repository.search(query, page, per_page)
+        return self.account_repository.search_page(query, page, per_page)
 
-    def count_search_accounts(self, query: str) -> int:
+    def suggest_accounts(self, query: str, limit: int = 10) -> list[Account]:
         """
-        Returns the total number of accounts matching the search query.
+        Retrieves accounts whose username matches a partial input, for autocomplete.
 
         Args:
-            query: The search string to match against username or email.
+            query: The partial username typed by the user.
+            limit: The maximum number of accounts to return. Defaults to 10.
 
         Returns:
-            int: The total count of matching accounts.
+            list[Account]: At most limit matching accounts, prefix matches first.
         """
-        return self.account_repository.count_search(query)
+        return self.account_repository.suggest_by_username(query, limit)
 
     def delete_account(self, account_id: int) -> None:
         """
@@ -38,6 +38,9 @@ class RegistrationService(RegistrationManagementPort):
             Account | str: The newly created Account domain entity, or an
             error message string if the username or email is already taken
             (including race conditions detected at the database level).
+
+        Raises:
+            PasswordHasherBusyError: If the password hasher is saturated.
         """
 
         if self.account_repository.find_by_username(username):
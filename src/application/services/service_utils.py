@@ -1,50 +1,32 @@
 from collections import defaultdict
 
-from src.application.domain.comment import Comment, CommentNode, CommentWithAuthor
+from src.application.domain.comment import CommentNode, CommentWithAuthor
 
 
-def build_comment_nested_tree(
-    all_comments: list[Comment],
-    author_map: dict[int, str],
-    avatar_map: dict[int, str | None] | None = None,
-) -> list[CommentNode]:
+def build_comment_nested_tree(all_comments: list[CommentWithAuthor]) -> list[CommentNode]:
     """
-    Transforms a flat list of comment entities and author/avatar mappings into a recursive N-level tree.
+    Transforms a flat list of comment Read Models into a recursive N-level tree.
 
     Builds a parent_map from comment_reply_to, then recurses from roots (reply_to is None)
     to produce a nested CommentNode tree with sorted children.
 
     Args:
-        all_comments (list[Comment]): The flat list of domain comment entities to structure.
-        author_map (dict[int, str]): A mapping of account IDs to their usernames.
-        avatar_map (dict[int, str | None] | None): Optional mapping of account IDs
-            to their avatar file IDs. Defaults to None.
+        all_comments (list[CommentWithAuthor]): The flat list of comments, each
+            already combined with its author's username and avatar.
 
     Returns:
         list[CommentNode]: The tree root nodes, sorted most recent first.
     """
-    parent_map: dict[int | None, list[Comment]] = defaultdict(list)
+    parent_map: dict[int | None, list[CommentWithAuthor]] = defaultdict(list)
     for c in all_comments:
-        parent_map[c.comment_reply_to].append(c)
+        parent_map[c.comment.comment_reply_to].append(c)
 
     roots = parent_map.pop(None, [])
-    roots.sort(key=lambda c: c.comment_posted_at, reverse=True)
-
-    def _build_node(comment: Comment, depth: int) -> CommentNode:
-        author_id = comment.comment_written_account_id
-        author_name = author_map.get(author_id, "Anonymous") if author_id is not None else "Anonymous"  # type: ignore  # safe: None handled
-        author_avatar_file_id = (
-            avatar_map.get(author_id)
-            if avatar_map and author_id is not None
-            else None
-        )
-        cwa = CommentWithAuthor(
-            comment=comment,
-            author_name=author_name,
-            author_avatar_file_id=author_avatar_file_id,
-        )
-        children = parent_map.pop(comment.comment_id, [])
-        children.sort(key=lambda c: c.comment_posted_at, reverse=True)
+    roots.sort(key=lambda c: c.comment.comment_posted_at, reverse=True)
+
+    def _build_node(cwa: CommentWithAuthor, depth: int) -> CommentNode:
+        children = parent_map.pop(cwa.comment.comment_id, [])
+        children.sort(key=lambda c: c.comment.comment_posted_at, reverse=True)
         replies = [_build_node(child, depth + 1) for child in children]
         return CommentNode(comment=cwa, replies=replies, depth=depth)
 
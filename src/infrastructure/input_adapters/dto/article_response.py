@@ -21,6 +21,8 @@ class ArticleResponse(BaseModel):
         article_description (str): Short description displayed in article list.
             Empty string when no description was provided.
         article_content (str): JSON content for the BlockNote editor.
+        article_content_html (str | None): HTML of the content rendered by
+            the application, or None to render article_content in the template.
         article_published_at (datetime | None): Publication timestamp in UTC.
         meta_description (str): Alias for article_description, used for
             <meta name="description"> and list view excerpt.
@@ -36,6 +38,7 @@ class ArticleResponse(BaseModel):
     article_title: str
     article_description: str = ""
     article_content: str
+    article_content_html: str | None = None
     article_published_at: datetime | None = None
     meta_description: str = ""
     article_edited_at: datetime | None = None
@@ -62,7 +65,60 @@ class ArticleResponse(BaseModel):
             article_title=article.article_title,
             article_description=description,
             article_content=article.article_content,
+            article_content_html=article.article_content_html,
             article_published_at=article.article_published_at,
             meta_description=description,
             article_edited_at=article.article_edited_at,
         )
+
+
+class ArticleSummaryResponse(BaseModel):
+    """
+    Data Transfer Object used to send an article of a list view to the UI.
+
+    Carries the same metadata fields as ArticleResponse, without the
+    article content.
+
+    Attributes:
+        article_id (int): Unique identifier for the article.
+        article_author_id (int | None): Reference to the author's Account.
+            None when the author's account has been deleted.
+        author_username (str): Display name of the article author.
+        author_avatar_file_id (str | None): UUID of the author's avatar file, or None.
+        article_title (str): Title of the article.
+        article_published_at (datetime | None): Publication timestamp in UTC.
+        meta_description (str): The article description, used as the list view excerpt.
+        article_edited_at (datetime | None): Last edit timestamp in UTC.
+            None if never edited.
+    """
+    model_config = ConfigDict(from_attributes=True)
+
+    article_id: int
+    article_author_id: int | None = None
+    author_username: str = "Unknown"
+    author_avatar_file_id: str | None = None
+    article_title: str
+    article_published_at: datetime | None = None
+    meta_description: str = ""
+    article_edited_at: datetime | None = None
+
+    @classmethod
+    def from_domain(cls, summary) -> "ArticleSummaryResponse":
+        """Build an ArticleSummaryResponse from an ArticleSummary Read Model.
+
+        Args:
+            summary: The ArticleSummary to convert.
+
+        Returns:
+            ArticleSummaryResponse: The populated response DTO.
+        """
+        return cls(
+            article_id=summary.article_id,
+            article_author_id=summary.article_author_id,
+            author_username=summary.author_name,
+            author_avatar_file_id=summary.author_avatar_file_id,
+            article_title=summary.article_title,
+            article_published_at=summary.article_published_at,
+            meta_description=summary.article_description or "",
+            article_edited_at=summary.article_edited_at,
+        )
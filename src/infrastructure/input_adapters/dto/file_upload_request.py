@@ -6,9 +6,9 @@ class FileUploadRequest(BaseModel):
 
     Performs basic structural validation (types are correct). Business rule
     validation (extension whitelist, allowed MIME types, file size limit) is
-    delegated to FileService.
+    delegated to FileService. The content itself is not part of the DTO: it
+    is handed to FileService as a stream, without being read here.
     """
 
     filename: str
-    data: bytes
     mime_type: str
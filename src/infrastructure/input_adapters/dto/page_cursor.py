@@ -0,0 +1,109 @@
+import base64
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from src.application.domain.account import Account, AccountCursor
+from src.application.domain.article import Article, ArticleCursor, ArticleSummary
+
+
+class PageCursor(BaseModel):
+    """
+    Opaque keyset pagination token exchanged through the ``?after=`` query parameter.
+
+    The token is the URL-safe base64 encoding of the JSON fields below.
+    It is not signed: a tampered token only moves the reader to another
+    position in a public listing, and malformed tokens decode to None.
+
+    Attributes:
+        last_id (int): ID of the last item already shown.
+        last_published_at (datetime | None): Publication timestamp of the last
+            article already shown, for the article list.
+        last_created_at (datetime | None): Creation timestamp of the last
+            account already shown, for the account list.
+    """
+
+    last_id: int
+    last_published_at: datetime | None = None
+    last_created_at: datetime | None = None
+
+    def encode(self) -> str:
+        """
+        Serializes the cursor into a URL-safe token.
+
+        Returns:
+            str: The base64url token, without padding.
+        """
+        raw = self.model_dump_json(exclude_none=True).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str | None) -> "PageCursor | None":
+        """
+        Parses a token produced by encode().
+
+        Args:
+            token (str | None): The raw ``?after=`` value.
+
+        Returns:
+            PageCursor | None: The cursor, or None if the token is missing or malformed.
+        """
+        if not token:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            return cls.model_validate_json(raw)
+        except ValueError:
+            return None
+
+    @classmethod
+    def from_article(cls, article: Article | ArticleSummary) -> "PageCursor | None":
+        """
+        Builds the cursor pointing just after the given article.
+
+        Args:
+            article (Article | ArticleSummary): The last article of the current page.
+
+        Returns:
+            PageCursor | None: The cursor, or None if the article has no publication date.
+        """
+        if article.article_published_at is None:
+            return None
+        return cls(last_id=article.article_id, last_published_at=article.article_published_at)
+
+    def to_article_cursor(self) -> ArticleCursor | None:
+        """
+        Converts the token into the domain keyset position for articles.
+
+        Returns:
+            ArticleCursor | None: The position, or None if the token carries no publication date.
+        """
+        if self.last_published_at is None:
+            return None
+        return ArticleCursor(published_at=self.last_published_at, article_id=self.last_id)
+
+    @classmethod
+    def from_account(cls, account: Account) -> "PageCursor | None":
+        """
+        Builds the cursor pointing just after the given account.
+
+        Args:
+            account (Account): The last account of the current page.
+
+        Returns:
+            PageCursor | None: The cursor, or None if the account has no creation date.
+        """
+        if account.account_created_at is None:
+            return None
+        return cls(last_id=account.account_id, last_created_at=account.account_created_at)
+
+    def to_account_cursor(self) -> AccountCursor | None:
+        """
+        Converts the token into the domain keyset position for accounts.
+
+        Returns:
+            AccountCursor | None: The position, or None if the token carries no creation date.
+        """
+        if self.last_created_at is None:
+            return None
+        return AccountCursor(created_at=self.last_created_at, account_id=self.last_id)
@@ -5,6 +5,7 @@ from flask_babel import gettext as _
 
 from flask import abort, flash, jsonify, redirect, render_template, request, session, url_for
 from flask import g as global_request_context
+from flask.ctx import _AppCtxGlobals
 from flask.views import MethodView
 from src.application.application_exceptions import FileTooLargeError, FileTypeError
 from src.application.domain.account import AccountRole
@@ -12,10 +13,35 @@ from src.application.input_ports.account_session_management import AccountSessio
 from src.application.input_ports.comment_management import CommentManagementPort
 from src.application.input_ports.file_management import FileManagementPort
 from src.infrastructure.input_adapters.dto.account_response import AccountResponse
+from src.infrastructure.input_adapters.dto.page_cursor import PageCursor
 
 logger = logging.getLogger(__name__)
 
 
+class LazyIdentityGlobals(_AppCtxGlobals):
+    """
+    Request globals (flask.g) resolving 'current_user' on first read.
+
+    The before_request hook stores a loader rather than the account itself.
+    The first read of g.current_user, g.get("current_user") or
+    getattr(g, "current_user", None) calls it and keeps the account for the
+    rest of the request, so requests that never look at the user never load
+    it. Without a loader, current_user is None.
+    """
+
+    def __getattr__(self, name: str):
+        if name != "current_user":
+            return super().__getattr__(name)
+        loader = self.__dict__.pop("_current_user_loader", None)
+        self.current_user = loader() if loader else None
+        return self.current_user
+
+    def get(self, name: str, default=None):
+        if name == "current_user":
+            return self.current_user
+        return super().get(name, default)
+
+
 class AccountSessionAdapter(MethodView):
     """
     Flask Input Adapter for Account Session, Profile,
@@ -28,6 +54,10 @@ class AccountSessionAdapter(MethodView):
     - User profile display.
     """
 
+    # Endpoints that never need the user: static assets, uploaded files and
+    # CSP reports. Their requests skip identity resolution entirely.
+    ANONYMOUS_ENDPOINTS = frozenset({"static", "file.serve_file", "file.serve_image_variant", "csp.report"})
+
     def __init__(
         self,
         session_service: AccountSessionManagementPort,
@@ -47,8 +77,11 @@ class AccountSessionAdapter(MethodView):
         self.comment_service = comment_service
 
     def _identify_user(self):
-        """Injects the current user into the global request context."""
-        global_request_context.current_user = self.session_service.get_current_account()
+        """Injects a loader of the current user into the global request context."""
+        global_request_context.pop("current_user", None)
+        global_request_context.pop("_current_user_loader", None)
+        if request.endpoint not in self.ANONYMOUS_ENDPOINTS:
+            global_request_context._current_user_loader = self.session_service.get_current_account
 
     def register_before_request_handler(self, app):
         """
@@ -58,13 +91,17 @@ class AccountSessionAdapter(MethodView):
         - Registration: This method is called ONCE during the app bootstrap.
         - Execution: The internal '_identify_user' hook is called by Flask
           AUTOMATICALLY before EVERY SINGLE request.
-        - Persistence: It populates the 'global_request_context' (flask.g)
-          with the domain Account entity, making identity available
-          to all downstream adapters and templates.
+        - Persistence: It gives the 'global_request_context' (flask.g) a
+          loader of the domain Account entity, making identity available
+          to all downstream adapters and templates. The account is only
+          loaded when 'current_user' is first read, and never for the
+          ANONYMOUS_ENDPOINTS.
+        - Globals: The app's flask.g class is replaced by LazyIdentityGlobals.
 
         Args:
             app (Flask): The Flask application instance.
         """
+        app.app_ctx_globals_class = LazyIdentityGlobals
         app.before_request(self._identify_user)
 
     def logout(self):
@@ -170,11 +207,10 @@ class AccountSessionAdapter(MethodView):
         if not uploaded_file or not uploaded_file.filename:
             return jsonify({"error": _("No file provided.")}), 400
 
-        file_data = uploaded_file.read()
         try:
-            file_record = self.file_service.upload_file(
+            file_record = self.file_service.upload_file_stream(
                 filename=uploaded_file.filename,
-                data=file_data,
+                stream=uploaded_file.stream,
                 mime_type=uploaded_file.content_type or "application/octet-stream",
             )
         except (FileTooLargeError, FileTypeError) as e:
@@ -291,9 +327,14 @@ class AccountSessionAdapter(MethodView):
         and total account count.
 
         Access restricted to admin role. Non-admin users receive a 403.
-        Supports pagination via ?page=N query parameter and search via
-        ?q=query parameter. Displays up to 20 users per page with
-        username, email, role, join date, and action buttons. The
+        Supports pagination via ?page=N query parameter (optionally with an
+        opaque ?after= keyset cursor) and search via ?q=query parameter.
+        The "Next" link carries both: the cursor locates the rows, and the
+        page number only labels them and anchors the "Previous" link, which
+        goes back through OFFSET. Both follow the same order, so the keyset
+        page holds the same accounts as the numbered page of the same number.
+        Displays up to 20 users per page with username, email, role,
+        join date, and action buttons. The
         total_count reflects the number of accounts matching the current
         query (or all accounts when no search is active).
 
@@ -310,13 +351,18 @@ class AccountSessionAdapter(MethodView):
         query = request.args.get("q", "").strip()
         page = max(1, request.args.get("page", 1, type=int))
         per_page = 20
+        next_cursor = None
 
         if query:
-            accounts = self.session_service.search_accounts(query, page=page, per_page=per_page)
-            total = self.session_service.count_search_accounts(query)
+            result = self.session_service.search_account_page(query, page=page, per_page=per_page)
         else:
-            accounts = self.session_service.get_all_accounts(page=page, per_page=per_page)
-            total = self.session_service.count_all_accounts()
+            cursor = PageCursor.decode(request.args.get("after"))
+            after = cursor.to_account_cursor() if cursor else None
+            result = self.session_service.get_account_page(page=page, per_page=per_page, after=after)
+            if result.items:
+                next_cursor = PageCursor.from_account(result.items[-1])
+        accounts = result.items
+        total = result.total
 
         total_pages = max(1, math.ceil(total / per_page))
 
@@ -332,8 +378,36 @@ class AccountSessionAdapter(MethodView):
             query=query,
             current_user=current_account,
             total_count=total,
+            next_cursor=next_cursor.encode() if next_cursor else None,
         )
 
+    def api_suggest_users(self):
+        """
+        Returns username autocomplete suggestions as JSON (Admin only).
+
+        Reads the partial username from the ?q= query parameter and returns
+        up to 10 matching accounts, prefix matches first. A blank query
+        yields an empty list.
+
+        Returns:
+            Response: JSON list of {"account_id", "account_username",
+                "account_role"} objects, 403 if the user is not an admin.
+        """
+        current_account = self.session_service.get_current_account()
+        if not current_account or current_account.account_role != AccountRole.ADMIN:
+            return jsonify({"error": _("Insufficient permissions.")}), 403
+
+        query = request.args.get("q", "").strip()
+        accounts = self.session_service.suggest_accounts(query) if query else []
+        return jsonify([
+            {
+                "account_id": account.account_id,
+                "account_username": account.account_username,
+                "account_role": account.account_role.value,
+            }
+            for account in accounts
+        ])
+
     def delete_account(self):
         """
         Handles account deletion form submission.
@@ -10,8 +10,9 @@ from flask import g as global_request_context
 from src.application.domain.comment import CommentNode
 from src.application.input_ports.article_management import ArticleManagementPort
 from src.infrastructure.input_adapters.dto.article_request import ArticleRequest
-from src.infrastructure.input_adapters.dto.article_response import ArticleResponse
+from src.infrastructure.input_adapters.dto.article_response import ArticleResponse, ArticleSummaryResponse
 from src.infrastructure.input_adapters.dto.comment_response import CommentResponse
+from src.infrastructure.input_adapters.dto.page_cursor import PageCursor
 
 
 class ArticleAdapter:
@@ -57,6 +58,14 @@ class ArticleAdapter:
         Supports an optional "q" query parameter for searching articles
         by title or description.
 
+        Unfiltered listings follow an optional opaque "after" keyset cursor,
+        and the "Next" link always carries the cursor of the last article
+        shown, so sequential browsing never pays for an OFFSET. Numbered
+        page links remain available for jumping to an arbitrary page.
+        The "Next" link also carries the page number, which only labels the
+        keyset page and anchors the "Previous" link (an OFFSET page); both
+        follow the same order, so they show the same articles.
+
         Retrieves the current user from global_request_context for UI
         conditional rendering.
 
@@ -65,22 +74,19 @@ class ArticleAdapter:
         """
         query = request.args.get("q", "").strip()
         page = request.args.get("page", 1, type=int)
+        next_cursor = None
 
         if query:
-            domain_articles = self.article_service.search_articles(query, page=page, per_page=10)
-            total_count = self.article_service.count_search(query)
+            result = self.article_service.search_article_page(query, page=page, per_page=10)
         else:
-            domain_articles = self.article_service.get_paginated_articles(page=page, per_page=10)
-            total_count = self.article_service.get_total_count()
-
-        articles = []
+            cursor = PageCursor.decode(request.args.get("after"))
+            after = cursor.to_article_cursor() if cursor else None
+            result = self.article_service.get_article_page(page=page, per_page=10, after=after)
+            if result.items:
+                next_cursor = PageCursor.from_article(result.items[-1])
+        total_count = result.total
 
-        for item in domain_articles:
-            articles.append(ArticleResponse.from_domain(
-                item.article,
-                author_username=item.author_name,
-                author_avatar_file_id=item.author_avatar_file_id,
-            ))
+        articles = [ArticleSummaryResponse.from_domain(item) for item in result.items]
 
         has_next = (page * 10) < total_count
         has_prev = page > 1
@@ -96,6 +102,7 @@ class ArticleAdapter:
             has_prev=has_prev,
             total_pages=total_pages,
             query=query,
+            next_cursor=next_cursor.encode() if next_cursor else None,
         )
 
     def read_article(self, article_id: int) -> str | Response:
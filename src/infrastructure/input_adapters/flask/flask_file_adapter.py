@@ -1,9 +1,11 @@
 from io import BytesIO
 
 from flask_babel import gettext as _
+from werkzeug.http import is_resource_modified
 
-from flask import jsonify, request, send_file
+from flask import Response, jsonify, request, send_file
 from src.application.application_exceptions import FileTooLargeError, FileTypeError
+from src.application.domain.file_record import FileRecord
 from src.application.input_ports.file_management import FileManagementPort
 from src.infrastructure.input_adapters.dto.file_upload_request import FileUploadRequest
 
@@ -11,11 +13,17 @@ from src.infrastructure.input_adapters.dto.file_upload_request import FileUpload
 class FlaskFileAdapter:
     """Flask input adapter for file upload and retrieval.
 
-    Upload endpoint validates input via FileUploadRequest DTO, delegates to
-    FileService, and returns JSON with the serving URL.
-    Serve endpoint streams raw bytes from BYTEA storage with correct MIME type.
+    Upload endpoint validates input via FileUploadRequest DTO, hands the
+    uploaded stream to FileService without reading it, and returns JSON with
+    the serving URL.
+    Serve endpoint answers conditional requests from the file metadata,
+    sends files kept on disk from their path, so the WSGI server can use
+    sendfile(2), and streams BYTEA contents from memory, both with the
+    correct MIME type and Range support.
     """
 
+    _MAX_AGE = 365 * 24 * 60 * 60
+
     def __init__(self, file_service: FileManagementPort):
         self.file_service = file_service
 
@@ -32,21 +40,18 @@ class FlaskFileAdapter:
         if uploaded_file is None or not uploaded_file.filename:
             return jsonify({"error": _("No file provided")}), 400
 
-        file_data = uploaded_file.read()
-
         try:
             upload_request = FileUploadRequest(
                 filename=uploaded_file.filename or "",
-                data=file_data,
                 mime_type=uploaded_file.content_type or "application/octet-stream",
             )
         except Exception as e:
             return jsonify({"error": str(e)}), 400
 
         try:
-            file_record = self.file_service.upload_file(
+            file_record = self.file_service.upload_file_stream(
                 filename=upload_request.filename,
-                data=upload_request.data,
+                stream=uploaded_file.stream,
                 mime_type=upload_request.mime_type,
             )
         except (FileTooLargeError, FileTypeError) as e:
@@ -59,22 +64,78 @@ class FlaskFileAdapter:
     def serve_file(self, file_id: str, filename: str):
         """Handle GET /uploads/<uuid>/<filename>.
 
-        Retrieves a file record by UUID and streams the raw bytes.
+        Uploads are immutable under their UUID, so they are cached for a year
+        and revalidated with a strong ETag (the SHA-256 of the content) and
+        Last-Modified. A request matching them gets a 304 built from the
+        metadata alone, without reading the content. Otherwise the content is
+        sent, from its path on disk when the storage provides one, and Range
+        requests get a 206 with the requested bytes.
 
         Args:
             file_id: UUID of the uploaded file.
             filename: Original filename (URL compatibility, not used for lookup).
 
         Returns:
-            File stream with correct MIME type, or 404 JSON.
+            File stream with correct MIME type, 206 partial content, 304 Not
+            Modified, or 404 JSON.
         """
-        file_record = self.file_service.get_file(file_id)
+        file_record = self.file_service.get_file_metadata(file_id)
         if file_record is None:
             return jsonify({"error": _("File not found")}), 404
 
-        return send_file(
-            BytesIO(file_record.data),
+        if not is_resource_modified(
+            request.environ, etag=file_record.content_sha256, last_modified=file_record.created_at,
+        ):
+            not_modified = Response(status=304)
+            if file_record.content_sha256:
+                not_modified.set_etag(file_record.content_sha256)
+            not_modified.last_modified = file_record.created_at
+            return self._cache_forever(not_modified)
+
+        if file_record.content_path is None:
+            file_record = self.file_service.get_file(file_id)
+            if file_record is None:
+                return jsonify({"error": _("File not found")}), 404
+        return self._send(file_record)
+
+    def serve_image_variant(self, file_id: str, width: int, height: int, fmt: str):
+        """Handle GET /uploads/<uuid>/<w>x<h>.<fmt>.
+
+        Serves a resized AVIF/WebP rendition of an image, rendered on its
+        first request. A name that is not a known variant is an original
+        filename of that shape, and the original is served.
+
+        Args:
+            file_id: UUID of the uploaded file.
+            width: Width of the rendition in pixels.
+            height: Height of the rendition in pixels, 0 to keep the aspect ratio.
+            fmt: Encoding of the rendition.
+
+        Returns:
+            File stream of the rendition, or the response of serve_file.
+        """
+        file_record = self.file_service.get_image_variant(file_id, width, height, fmt)
+        if file_record is None:
+            return self.serve_file(file_id, f"{width}x{height}.{fmt}")
+        return self._send(file_record)
+
+    def _send(self, file_record: FileRecord) -> Response:
+        """Send a file with its validators, answering conditional and Range requests."""
+        response = send_file(
+            file_record.content_path or BytesIO(file_record.data),
             mimetype=file_record.mime_type,
             as_attachment=False,
             download_name=file_record.original_filename,
+            etag=file_record.content_sha256 or False,
+            last_modified=file_record.created_at,
+            conditional=True,
         )
+        return self._cache_forever(response)
+
+    @classmethod
+    def _cache_forever(cls, response: Response) -> Response:
+        """Mark an upload response as cacheable for a year without revalidation."""
+        response.cache_control.public = True
+        response.cache_control.max_age = cls._MAX_AGE
+        response.cache_control.immutable = True
+        return response
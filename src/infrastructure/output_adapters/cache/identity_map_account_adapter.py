@@ -0,0 +1,271 @@
+from flask import g, has_request_context, request
+
+from src.application.domain.account import Account, AccountCursor
+from src.application.domain.page import Page
+from src.application.output_ports.account_repository import AccountRepository
+
+_MAP_KEY = "_account_identity_map"
+
+
+class IdentityMapAccountAdapter(AccountRepository):
+    """
+    Caching decorator giving each HTTP request an identity map of accounts.
+
+    Wraps another AccountRepository. Within one request, get_by_id() and
+    get_by_ids() load an account at most once and then return the same
+    Account object, so the session adapter resolving the current user and
+    the services checking the acting account share a single query. Accounts
+    found by username or email join the map as well. Listings, searches and
+    get_version() always reach the wrapped repository.
+
+    Every write evicts the account it changes, so a later read in the same
+    request sees the change. Outside of a request (CLI commands, scripts),
+    the adapter simply forwards every call.
+
+    The map lives on flask.g next to the WSGI environ of the request it
+    belongs to, and is started afresh by the first lookup of every new
+    request, even when several requests share one application context.
+    """
+
+    def __init__(self, repository: AccountRepository):
+        """
+        Initializes the identity map around a repository.
+
+        Args:
+            repository (AccountRepository): The repository whose account lookups are shared.
+        """
+        self._repository = repository
+
+    def _identity_map(self) -> dict[int, Account | None] | None:
+        """
+        Returns the identity map of the current request.
+
+        Returns:
+            dict[int, Account | None] | None: Accounts (or None for missing
+                ones) by ID, or None outside of a request.
+        """
+        if not has_request_context():
+            return None
+        environ = request.environ
+        scope = g.get(_MAP_KEY)
+        if scope is None or scope[0] is not environ:
+            scope = (environ, {})
+            setattr(g, _MAP_KEY, scope)
+        return scope[1]
+
+    def _register(self, account: Account | None) -> Account | None:
+        """Adds a found account to the identity map and returns it."""
+        identity_map = self._identity_map()
+        if account is None or identity_map is None:
+            return account
+        mapped = identity_map.get(account.account_id)
+        if mapped is None:
+            identity_map[account.account_id] = mapped = account
+        return mapped
+
+    def _evict(self, account_id: int) -> None:
+        """Drops an account from the identity map after a write."""
+        identity_map = self._identity_map()
+        if identity_map is not None:
+            identity_map.pop(account_id, None)
+
+    def find_by_username(self, username: str) -> Account | None:
+        """
+        Retrieves an account by its username through the wrapped repository.
+
+        Args:
+            username (str): The username to search for.
+
+        Returns:
+            Account | None: The mapped Account if found, None otherwise.
+        """
+        return self._register(self._repository.find_by_username(username))
+
+    def get_by_id(self, account_id: int) -> Account | None:
+        """
+        Retrieves an account from the identity map, or from the wrapped repository.
+
+        Args:
+            account_id (int): The unique identifier of the account.
+
+        Returns:
+            Account | None: The Account domain entity if found, None otherwise.
+        """
+        identity_map = self._identity_map()
+        if identity_map is None:
+            return self._repository.get_by_id(account_id)
+        if account_id not in identity_map:
+            identity_map[account_id] = self._repository.get_by_id(account_id)
+        return identity_map[account_id]
+
+    def get_version(self, account_id: int) -> int | None:
+        """
+        Retrieves the current account_version from the wrapped repository.
+
+        Args:
+            account_id (int): The unique identifier of the account.
+
+        Returns:
+            int | None: The version counter, or None if the account does not exist.
+        """
+        return self._repository.get_version(account_id)
+
+    def get_by_ids(self, account_ids: list[int]) -> list[Account]:
+        """
+        Retrieves accounts by their IDs, loading only those not mapped yet.
+
+        Args:
+            account_ids (list[int]): A list of account identifiers.
+
+        Returns:
+            list[Account]: The found Account domain entities.
+        """
+        identity_map = self._identity_map()
+        if identity_map is None:
+            return self._repository.get_by_ids(account_ids)
+        missing = [account_id for account_id in dict.fromkeys(account_ids) if account_id not in identity_map]
+        if missing:
+            for account in self._repository.get_by_ids(missing):
+                identity_map[account.account_id] = account
+            for account_id in missing:
+                identity_map.setdefault(account_id, None)
+        found = (identity_map[account_id] for account_id in dict.fromkeys(account_ids))
+        return [account for account in found if account is not None]
+
+    def find_by_email(self, email: str) -> Account | None:
+        """
+        Retrieves an account by its email through the wrapped repository.
+
+        Args:
+            email (str): The email address to search for.
+
+        Returns:
+            Account | None: The mapped Account if found, None otherwise.
+        """
+        return self._register(self._repository.find_by_email(email))
+
+    def save(self, account: Account) -> None:
+        """
+        Saves an account through the wrapped repository and evicts it.
+
+        Args:
+            account (Account): The Account domain entity to save.
+        """
+        self._repository.save(account)
+        self._evict(account.account_id)
+
+    def update_avatar(self, account_id: int, avatar_file_id: str | None) -> None:
+        """
+        Updates the avatar_file_id through the wrapped repository and evicts the account.
+
+        Args:
+            account_id: The ID of the account to update.
+            avatar_file_id: The new avatar file UUID, or None to remove.
+        """
+        self._repository.update_avatar(account_id, avatar_file_id)
+        self._evict(account_id)
+
+    def update_email(self, account_id: int, new_email: str) -> None:
+        """
+        Updates the email address through the wrapped repository and evicts the account.
+
+        Args:
+            account_id: The ID of the account to update.
+            new_email: The new email address to set.
+        """
+        self._repository.update_email(account_id, new_email)
+        self._evict(account_id)
+
+    def update_password(self, account_id: int, new_hashed_password: str) -> None:
+        """
+        Updates the password hash through the wrapped repository and evicts the account.
+
+        Args:
+            account_id: The ID of the account to update.
+            new_hashed_password: The new Argon2 hash to store.
+        """
+        self._repository.update_password(account_id, new_hashed_password)
+        self._evict(account_id)
+
+    def update_role(self, account_id: int, new_role: str) -> None:
+        """
+        Updates the account_role through the wrapped repository and evicts the account.
+
+        Args:
+            account_id: The ID of the account to update.
+            new_role: The new role string ("user" or "author").
+        """
+        self._repository.update_role(account_id, new_role)
+        self._evict(account_id)
+
+    def get_all(self) -> list[Account]:
+        """
+        Retrieves all accounts from the wrapped repository.
+
+        Returns:
+            list[Account]: A list of all Account domain entities.
+        """
+        return self._repository.get_all()
+
+    def get_page(self, page: int = 1, per_page: int = 20, cursor: AccountCursor | None = None) -> Page[Account]:
+        """
+        Retrieves a page of accounts and the total from the wrapped repository.
+
+        Args:
+            page (int): The 1-based page number.
+            per_page (int): The number of accounts per page.
+            cursor (AccountCursor | None): Optional keyset cursor.
+
+        Returns:
+            Page[Account]: The accounts of the page and the total count.
+        """
+        return self._repository.get_page(page, per_page, cursor)
+
+    def search_page(self, query: str, page: int = 1, per_page: int = 20) -> Page[Account]:
+        """
+        Searches a page of accounts and the total through the wrapped repository.
+
+        Args:
+            query (str): The search text.
+            page (int): The 1-based page number.
+            per_page (int): The number of accounts per page.
+
+        Returns:
+            Page[Account]: The matching accounts of the page and their total.
+        """
+        return self._repository.search_page(query, page, per_page)
+
+    def suggest_by_username(self, query: str, limit: int = 10) -> list[Account]:
+        """
+        Suggests accounts by username through the wrapped repository.
+
+        Args:
+            query (str): The partial username.
+            limit (int): The maximum number of suggestions.
+
+        Returns:
+            list[Account]: At most limit matching Account domain entities.
+        """
+        return self._repository.suggest_by_username(query, limit)
+
+    def update_ban_status(self, account_id: int, is_banned: bool, ban_reason: str | None) -> None:
+        """
+        Sets or clears the ban status through the wrapped repository and evicts the account.
+
+        Args:
+            account_id: The ID of the account to update.
+            is_banned: True to ban, False to unban.
+            ban_reason: Optional reason for the ban, or None to clear.
+        """
+        self._repository.update_ban_status(account_id, is_banned, ban_reason)
+        self._evict(account_id)
+
+    def delete(self, account_id: int) -> None:
+        """
+        Deletes an account through the wrapped repository and evicts it.
+
+        Args:
+            account_id (int): The unique identifier of the account to delete.
+        """
+        self._repository.delete(account_id)
+        self._evict(account_id)
@@ -0,0 +1,234 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from src.application.domain.file_record import FileRecord
+from src.application.domain.image_variant import ImageVariant
+from src.application.output_ports.file_storage_repository import FileStorageRepository
+
+
+@dataclass(frozen=True)
+class FileCacheStats:
+    """
+    Snapshot of the counters of a LruFileStorageAdapter.
+
+    Attributes:
+        hits (int): Lookups answered from memory.
+        misses (int): Reads of get() and get_variant() forwarded to the
+            wrapped repository.
+        evictions (int): Entries dropped to stay within the byte budget.
+        entries (int): Files currently cached.
+        cached_bytes (int): Total size of the cached contents.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    cached_bytes: int
+
+
+class LruFileStorageAdapter(FileStorageRepository):
+    """
+    Caching decorator keeping recently read files in memory.
+
+    Wraps another FileStorageRepository and keeps the records returned by
+    get() and get_variant() in an LRU keyed by file_id and variant, within a
+    total byte budget. Files
+    larger than max_entry_bytes are never cached, and neither are files kept
+    on disk (content_path set), which are already served without loading
+    their content. get_metadata() is answered from a cached record too, so a
+    hot image is served without any database query.
+
+    Uploads are immutable under their UUID, so delete() is the only
+    invalidation. It evicts the file and its renditions in this process only; other worker
+    processes keep serving their copy until it is evicted.
+
+    Thread-safe: the LRU is guarded by a lock, while the wrapped repository
+    is called outside of it.
+    """
+
+    def __init__(self, repository: FileStorageRepository, max_bytes: int, max_entry_bytes: int):
+        """
+        Initializes the cache around a repository.
+
+        Args:
+            repository (FileStorageRepository): The repository whose reads are cached.
+            max_bytes (int): Total size of the cached contents.
+            max_entry_bytes (int): Size above which a file is not cached.
+        """
+        self._repository = repository
+        self._max_bytes = max_bytes
+        self._max_entry_bytes = min(max_entry_bytes, max_bytes)
+        self._entries: OrderedDict[tuple[str, ImageVariant | None], FileRecord] = OrderedDict()
+        self._cached_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def save(self, file_record: FileRecord) -> FileRecord:
+        """
+        Persists a file record through the wrapped repository.
+
+        Args:
+            file_record (FileRecord): The file record to save.
+
+        Returns:
+            FileRecord: The saved file record.
+        """
+        return self._repository.save(file_record)
+
+    def get(self, file_id: str) -> FileRecord | None:
+        """
+        Retrieves a file record from memory, or from the wrapped repository.
+
+        Args:
+            file_id (str): The UUID of the file.
+
+        Returns:
+            FileRecord | None: The file record if found, None otherwise.
+        """
+        cached = self._lookup((file_id, None))
+        if cached is not None:
+            return cached
+        file_record = self._repository.get(file_id)
+        if file_record is not None:
+            self._store((file_id, None), file_record)
+        return file_record
+
+    def get_metadata(self, file_id: str) -> FileRecord | None:
+        """
+        Retrieves a file record without its content, from memory when cached.
+
+        A cached record carries its content, which callers asking for the
+        metadata simply ignore. An uncached file is not counted as a miss,
+        since the get() serving its content right after counts it already.
+
+        Args:
+            file_id (str): The UUID of the file.
+
+        Returns:
+            FileRecord | None: The file record if found, None otherwise.
+        """
+        cached = self._lookup((file_id, None), count_miss=False)
+        if cached is not None:
+            return cached
+        return self._repository.get_metadata(file_id)
+
+    def get_image_widths(self, file_ids: set[str]) -> dict[str, int]:
+        """
+        Retrieves the recorded widths of several images from the wrapped repository.
+
+        Args:
+            file_ids (set[str]): The UUIDs of the files.
+
+        Returns:
+            dict[str, int]: The image_width of each measured file, by UUID.
+        """
+        return self._repository.get_image_widths(file_ids)
+
+    def get_variant(self, file_id: str, variant: ImageVariant) -> FileRecord | None:
+        """
+        Retrieves a stored rendition from memory, or from the wrapped repository.
+
+        Args:
+            file_id (str): The UUID of the original file.
+            variant (ImageVariant): The size and encoding of the rendition.
+
+        Returns:
+            FileRecord | None: The rendition if stored, None otherwise.
+        """
+        cached = self._lookup((file_id, variant))
+        if cached is not None:
+            return cached
+        file_record = self._repository.get_variant(file_id, variant)
+        if file_record is not None:
+            self._store((file_id, variant), file_record)
+        return file_record
+
+    def save_variant(self, file_id: str, variant: ImageVariant, file_record: FileRecord) -> FileRecord:
+        """
+        Stores a rendition through the wrapped repository and caches it.
+
+        Args:
+            file_id (str): The UUID of the original file.
+            variant (ImageVariant): The size and encoding of the rendition.
+            file_record (FileRecord): The rendition to store.
+
+        Returns:
+            FileRecord: The stored rendition.
+        """
+        saved = self._repository.save_variant(file_id, variant, file_record)
+        self._store((file_id, variant), saved)
+        return saved
+
+    def delete(self, file_id: str) -> None:
+        """
+        Evicts a file and its renditions from memory, and deletes them from
+        the wrapped repository.
+
+        Args:
+            file_id (str): The UUID of the file to delete.
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == file_id]:
+                self._discard(key)
+        self._repository.delete(file_id)
+
+    def delete_many(self, file_ids: set[str]) -> None:
+        """
+        Evicts several files and their renditions from memory, and deletes
+        them from the wrapped repository.
+
+        Args:
+            file_ids (set[str]): The UUIDs of the files to delete.
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key[0] in file_ids]:
+                self._discard(key)
+        self._repository.delete_many(file_ids)
+
+    @property
+    def stats(self) -> FileCacheStats:
+        """
+        Returns the current counters of the cache.
+
+        Returns:
+            FileCacheStats: Hits, misses, evictions and current occupation.
+        """
+        with self._lock:
+            return FileCacheStats(self._hits, self._misses, self._evictions, len(self._entries), self._cached_bytes)
+
+    def _lookup(self, key: tuple[str, ImageVariant | None], count_miss: bool = True) -> FileRecord | None:
+        """Return the cached record of a file or rendition and mark it as recently used."""
+        with self._lock:
+            file_record = self._entries.get(key)
+            if file_record is None:
+                if count_miss:
+                    self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return file_record
+
+    def _store(self, key: tuple[str, ImageVariant | None], file_record: FileRecord) -> None:
+        """Cache a record whose content is in memory, evicting the least recently used ones."""
+        if file_record.content_path is not None:
+            return
+        size = len(file_record.data)
+        if size > self._max_entry_bytes:
+            return
+        with self._lock:
+            self._discard(key)
+            while self._entries and self._cached_bytes + size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._cached_bytes -= len(evicted.data)
+                self._evictions += 1
+            self._entries[key] = file_record
+            self._cached_bytes += size
+
+    def _discard(self, key: tuple[str, ImageVariant | None]) -> None:
+        """Drop the entry of a file or rendition, if cached. The lock must be held."""
+        file_record = self._entries.pop(key, None)
+        if file_record is not None:
+            self._cached_bytes -= len(file_record.data)
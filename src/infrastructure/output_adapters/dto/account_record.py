@@ -11,7 +11,7 @@ class AccountRecord(BaseModel):
 
     This class faithfully mirrors the 'accounts' table schema and provides
     validation when loading data from the persistence layer, including
-    the optional avatar file reference and ban status fields.
+    the optional avatar file reference, ban status fields and version counter.
     """
 
     model_config = ConfigDict(from_attributes=True)
@@ -25,6 +25,7 @@ class AccountRecord(BaseModel):
     avatar_file_id: str | None = None
     is_banned: bool = False
     ban_reason: str | None = None
+    account_version: int = 0
 
     def to_domain(self) -> Account:
         """
@@ -33,7 +34,8 @@ class AccountRecord(BaseModel):
         Returns:
             Account: The corresponding domain entity, including the
             conversion of the 'account_role' string to an AccountRole enum,
-            the optional avatar_file_id reference, and the ban status fields.
+            the optional avatar_file_id reference, the ban status fields and
+            the version counter.
         """
         return Account(
             account_id=self.account_id,
@@ -45,4 +47,5 @@ class AccountRecord(BaseModel):
             avatar_file_id=self.avatar_file_id,
             is_banned=self.is_banned,
             ban_reason=self.ban_reason,
+            account_version=self.account_version,
         )
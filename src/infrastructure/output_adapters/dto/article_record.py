@@ -25,6 +25,8 @@ class ArticleRecord(BaseModel):
     article_content: str
     article_published_at: datetime | None = None
     article_edited_at: datetime | None = None
+    article_content_html: str | None = None
+    article_renderer_version: int | None = None
 
     def to_domain(self) -> Article:
         return Article(
@@ -35,4 +37,6 @@ class ArticleRecord(BaseModel):
             article_content=self.article_content,
             article_published_at=self.article_published_at,
             article_edited_at=self.article_edited_at,
+            article_content_html=self.article_content_html,
+            article_renderer_version=self.article_renderer_version,
         )
@@ -23,13 +23,14 @@ class CommentRecord(BaseModel):
     is_deleted: bool = False
     deleted_at: datetime | None = None
     edited_at: datetime | None = None
+    comment_depth: int = 0
 
     def to_domain(self) -> Comment:
         """
         Converts the database record into a domain Comment entity.
 
-        Maps all fields including is_deleted, deleted_at, and edited_at
-        to the domain Comment object.
+        Maps all fields including is_deleted, deleted_at, edited_at and
+        comment_depth to the domain Comment object.
 
         Returns:
             Comment: The corresponding domain entity.
@@ -44,4 +45,5 @@ class CommentRecord(BaseModel):
             is_deleted=self.is_deleted,
             deleted_at=self.deleted_at,
             edited_at=self.edited_at,
+            comment_depth=self.comment_depth,
         )
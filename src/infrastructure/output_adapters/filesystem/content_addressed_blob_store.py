@@ -0,0 +1,106 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO
+
+
+class ContentAddressedBlobStore:
+    """
+    Stores binary contents on local disk under their SHA-256 digest.
+
+    A blob lives at <root>/<aa>/<bb>/<digest>, where aa and bb are the first
+    two pairs of hex digits, so that no directory grows past 65,536 entries.
+    Blobs are immutable: identical contents share one file, and a blob is
+    written to a temporary file in its final directory and renamed into
+    place, so a reader never sees a partial blob.
+    """
+
+    def __init__(self, root: str | Path):
+        """
+        Initializes the store on a root directory, created on first write.
+
+        Args:
+            root (str | Path): Directory holding the sharded blobs.
+        """
+        self._root = Path(root)
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        """
+        Computes the key under which a content is stored.
+
+        Args:
+            data (bytes): The binary content.
+
+        Returns:
+            str: The hex SHA-256 digest of the content.
+        """
+        return hashlib.sha256(data).hexdigest()
+
+    def path_for(self, digest: str) -> Path:
+        """
+        Returns the path of the blob stored under a digest.
+
+        Args:
+            digest (str): The hex SHA-256 digest of the content.
+
+        Returns:
+            Path: The blob path, whether or not the blob exists.
+        """
+        return self._root / digest[:2] / digest[2:4] / digest
+
+    def put(self, data: bytes) -> str:
+        """
+        Writes a content to disk, unless a blob with the same digest exists.
+
+        Args:
+            data (bytes): The binary content.
+
+        Returns:
+            str: The hex SHA-256 digest the content is stored under.
+        """
+        digest = self.digest(data)
+        self.put_stream(BytesIO(data), digest)
+        return digest
+
+    def put_stream(self, stream: BinaryIO, digest: str) -> None:
+        """
+        Copies a content from a stream to disk, unless a blob with its digest exists.
+
+        The stream is copied in chunks, so the content is never held in
+        memory whole. Its digest is trusted, having been computed by the
+        caller while reading it.
+
+        Args:
+            stream (BinaryIO): Binary stream over the content, from its start.
+            digest (str): The hex SHA-256 digest of the content.
+        """
+        path = self.path_for(digest)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(descriptor, "wb") as temporary_file:
+                shutil.copyfileobj(stream, temporary_file)
+                temporary_file.flush()
+                os.fsync(temporary_file.fileno())
+            os.chmod(temporary_path, 0o644)
+            os.replace(temporary_path, path)
+        except BaseException:
+            Path(temporary_path).unlink(missing_ok=True)
+            raise
+
+    def remove(self, digest: str) -> None:
+        """
+        Deletes the blob stored under a digest.
+
+        Idempotent — does nothing if the blob does not exist.
+
+        Args:
+            digest (str): The hex SHA-256 digest of the content.
+        """
+        self.path_for(digest).unlink(missing_ok=True)
@@ -0,0 +1,138 @@
+import io
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO
+
+from PIL import ExifTags, Image, ImageOps, UnidentifiedImageError
+
+from src.application.domain.image_variant import ImageVariant
+from src.application.output_ports.image_processor_repository import ImageProcessorRepository
+
+_PIL_FORMATS = {"avif": "AVIF", "webp": "WEBP"}
+
+# EXIF orientations that rotate the image by a quarter turn, swapping its sides.
+_TRANSPOSED_ORIENTATIONS = frozenset({5, 6, 7, 8})
+
+_SAVE_OPTIONS: dict[str, dict] = {
+    "avif": {"quality": 60, "speed": 6},
+    "webp": {"quality": 80, "method": 4},
+}
+
+
+def _render(data: bytes, width: int, height: int, fmt: str) -> bytes | None:
+    """
+    Decodes an image, resizes it and encodes it in fmt.
+
+    Module-level so that it can run in a worker process.
+
+    Returns:
+        bytes | None: The rendition, or None if data is not a decodable raster image.
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as original:
+            # JPEG decoding can be scaled down by powers of two at no cost.
+            original.draft("RGB", (width, height or 1))
+            image = ImageOps.exif_transpose(original)
+            if height:
+                image = ImageOps.fit(image, (width, height), Image.Resampling.LANCZOS)
+            else:
+                image.thumbnail((width, image.height), Image.Resampling.LANCZOS)
+            if image.mode not in ("RGB", "RGBA"):
+                has_alpha = "A" in image.getbands() or "transparency" in image.info
+                image = image.convert("RGBA" if has_alpha else "RGB")
+            output = io.BytesIO()
+            image.save(output, format=_PIL_FORMATS[fmt], **_SAVE_OPTIONS[fmt])
+            return output.getvalue()
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError):
+        return None
+
+
+class PillowImageProcessorAdapter(ImageProcessorRepository):
+    """
+    Pillow-based implementation of the ImageProcessorRepository port.
+
+    Avatar variants are cropped to fill their square, content variants are
+    scaled down to their width and never upscaled. Only the first frame of
+    an animated image is kept.
+
+    render_all() encodes the variants in a pool of worker processes when
+    pool_size is positive, so that the CPU-bound AVIF and WebP encodings run
+    in parallel and outside of the request threads. The pool is started on
+    first use, with the spawn method so that no thread or database
+    connection of the web process is inherited.
+    """
+
+    def __init__(self, pool_size: int = 0) -> None:
+        """
+        Initializes the adapter.
+
+        Args:
+            pool_size (int): Number of worker processes of render_all(). 0
+                renders in the calling thread.
+        """
+        self._pool_size = pool_size
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+
+    def render(self, data: bytes, variant: ImageVariant) -> bytes | None:
+        """
+        Renders one variant of an image in the calling thread.
+
+        Args:
+            data (bytes): The content of the original image.
+            variant (ImageVariant): The size and encoding to produce.
+
+        Returns:
+            bytes | None: The encoded rendition, or None if the original is
+                not a raster image Pillow can decode.
+        """
+        return _render(data, variant.width, variant.height, variant.format)
+
+    def render_all(self, data: bytes, variants: list[ImageVariant]) -> list[bytes | None]:
+        """
+        Renders several variants of an image, in the worker pool if configured.
+
+        Args:
+            data (bytes): The content of the original image.
+            variants (list[ImageVariant]): The sizes and encodings to produce.
+
+        Returns:
+            list[bytes | None]: The renditions, in the order of variants.
+        """
+        if self._pool_size <= 0 or len(variants) < 2:
+            return [self.render(data, variant) for variant in variants]
+        return list(self._get_pool().map(
+            _render,
+            [data] * len(variants),
+            [variant.width for variant in variants],
+            [variant.height for variant in variants],
+            [variant.format for variant in variants],
+        ))
+
+    def get_width(self, content: BinaryIO) -> int | None:
+        """
+        Reads the width of an image from its header, as exif_transpose would leave it.
+
+        Args:
+            content (BinaryIO): Seekable stream over the image, from its start.
+
+        Returns:
+            int | None: The width in pixels, or None if the content is not a
+                raster image Pillow can decode.
+        """
+        try:
+            with Image.open(content) as image:
+                orientation = image.getexif().get(ExifTags.Base.Orientation)
+                return image.height if orientation in _TRANSPOSED_ORIENTATIONS else image.width
+        except (UnidentifiedImageError, OSError, Image.DecompressionBombError):
+            return None
+        finally:
+            content.seek(0)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Return the worker pool, starting it on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self._pool_size, mp_context=multiprocessing.get_context("spawn"))
+            return self._pool
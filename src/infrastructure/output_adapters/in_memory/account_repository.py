@@ -1,6 +1,7 @@
 from datetime import datetime
 
-from src.application.domain.account import Account, AccountRole
+from src.application.domain.account import Account, AccountCursor, AccountRole
+from src.application.domain.page import Page
 from src.application.output_ports.account_repository import AccountRepository
 
 
@@ -19,7 +20,8 @@ class InMemoryAccountRepository(AccountRepository):
 
     def save(self, account: Account) -> None:
         """
-        Saves a new account or updates an existing one. Assigns a new ID if 0.
+        Saves a new account or updates an existing one. Assigns a new ID if 0,
+        and increments the version of an existing account.
 
         Args:
             account (Account): The Account domain entity to save.
@@ -27,6 +29,8 @@ class InMemoryAccountRepository(AccountRepository):
         if account.account_id == 0:
             account.account_id = self._next_id
             self._next_id += 1
+        elif account.account_id in self._accounts:
+            account.account_version = self._accounts[account.account_id].account_version + 1
         self._accounts[account.account_id] = account
 
     def get_by_id(self, account_id: int) -> Account | None:
@@ -41,6 +45,19 @@ class InMemoryAccountRepository(AccountRepository):
         """
         return self._accounts.get(account_id)
 
+    def get_version(self, account_id: int) -> int | None:
+        """
+        Retrieves the current account_version of an account.
+
+        Args:
+            account_id (int): ID to look for.
+
+        Returns:
+            int | None: The version counter, or None if the account does not exist.
+        """
+        account = self._accounts.get(account_id)
+        return account.account_version if account else None
+
     def get_by_ids(self, account_ids: list[int]) -> list[Account]:
         """
         Retrieves multiple accounts by their IDs.
@@ -95,6 +112,7 @@ class InMemoryAccountRepository(AccountRepository):
         if account is None:
             return
         account.avatar_file_id = avatar_file_id
+        account.account_version += 1
 
     def update_email(self, account_id: int, new_email: str) -> None:
         """
@@ -108,6 +126,7 @@ class InMemoryAccountRepository(AccountRepository):
         if account is None:
             return
         account.account_email = new_email
+        account.account_version += 1
 
     def update_password(self, account_id: int, new_hashed_password: str) -> None:
         """
@@ -121,6 +140,7 @@ class InMemoryAccountRepository(AccountRepository):
         if account is None:
             return
         account.account_password = new_hashed_password
+        account.account_version += 1
 
     def update_role(self, account_id: int, new_role: str) -> None:
         """
@@ -134,6 +154,7 @@ class InMemoryAccountRepository(AccountRepository):
         if account is None:
             return
         account.account_role = AccountRole(new_role)
+        account.account_version += 1
 
     def get_all(self) -> list[Account]:
         """
@@ -144,38 +165,36 @@ class InMemoryAccountRepository(AccountRepository):
         """
         return list(self._accounts.values())
 
-    def get_all_paginated(self, page: int = 1, per_page: int = 20) -> list[Account]:
+    def get_page(self, page: int = 1, per_page: int = 20, cursor: AccountCursor | None = None) -> Page[Account]:
         """
-        Retrieves a paginated list of accounts, ordered by creation date desc.
+        Retrieves a page of accounts together with the total account count.
 
         Args:
-            page: The page number (1-indexed). Defaults to 1.
+            page: The page number (1-indexed), used when cursor is None. Defaults to 1.
             per_page: The number of items per page. Defaults to 20.
+            cursor: Position of the last account already shown.
 
         Returns:
-            list[Account]: A list of Account domain entities for the given page.
+            Page[Account]: The accounts of the page and the total account count.
         """
         sorted_accounts = sorted(
             self._accounts.values(),
-            key=lambda a: a.account_created_at or datetime.min,
+            key=lambda a: (a.account_created_at or datetime.min, a.account_id),
             reverse=True,
         )
-        start = (page - 1) * per_page
-        return sorted_accounts[start:start + per_page]
-
-    def count_all(self) -> int:
-        """
-        Returns the total number of accounts in the in-memory store.
-
-        Returns:
-            int: The total count of accounts.
-        """
-        return len(self._accounts)
+        if cursor is not None:
+            position = (cursor.created_at, cursor.account_id)
+            sorted_accounts = [
+                a for a in sorted_accounts
+                if (a.account_created_at or datetime.min, a.account_id) < position
+            ]
+        else:
+            sorted_accounts = sorted_accounts[(page - 1) * per_page:]
+        return Page(items=sorted_accounts[:per_page], total=len(self._accounts))
 
-    def search(self, query: str, page: int = 1, per_page: int = 20) -> list[Account]:
+    def search_page(self, query: str, page: int = 1, per_page: int = 20) -> Page[Account]:
         """
-        Searches accounts by username or email with pagination.
-        Case-insensitive substring match.
+        Searches accounts and returns the requested page with the total number of matches.
 
         Args:
             query: The search string to match against username or email.
@@ -183,8 +202,7 @@ class InMemoryAccountRepository(AccountRepository):
             per_page: The number of items per page. Defaults to 20.
 
         Returns:
-            list[Account]: A list of matching Account domain entities
-                for the given page.
+            Page[Account]: The matching accounts of the page and the total number of matches.
         """
         q = query.lower()
         matched = [
@@ -197,23 +215,27 @@ class InMemoryAccountRepository(AccountRepository):
             reverse=True,
         )
         start = (page - 1) * per_page
-        return sorted_matched[start:start + per_page]
+        return Page(items=sorted_matched[start:start + per_page], total=len(matched))
 
-    def count_search(self, query: str) -> int:
+    def suggest_by_username(self, query: str, limit: int = 10) -> list[Account]:
         """
-        Returns the total number of accounts matching the search query.
+        Retrieves accounts for username autocomplete, prefix matches first.
 
         Args:
-            query: The search string to match against username or email.
+            query: The partial username typed by the user.
+            limit: The maximum number of accounts to return. Defaults to 10.
 
         Returns:
-            int: The total count of matching accounts.
+            list[Account]: At most limit matching Account domain entities.
         """
         q = query.lower()
-        return sum(
-            1 for a in self._accounts.values()
-            if q in a.account_username.lower() or q in a.account_email.lower()
-        )
+        by_name = sorted(self._accounts.values(), key=lambda a: a.account_username.lower())
+        prefix = [a for a in by_name if a.account_username.lower().startswith(q)]
+        if len(prefix) >= limit or len(q) < 3:
+            return prefix[:limit]
+        contains = [a for a in by_name if q in a.account_username.lower() and a not in prefix]
+        contains.sort(key=lambda a: len(a.account_username))
+        return (prefix + contains)[:limit]
 
     def update_ban_status(self, account_id: int, is_banned: bool, ban_reason: str | None) -> None:
         """
@@ -232,6 +254,7 @@ class InMemoryAccountRepository(AccountRepository):
             raise ValueError(f"Account with id {account_id} not found.")
         account.is_banned = is_banned
         account.ban_reason = ban_reason
+        account.account_version += 1
 
     def delete(self, account_id: int) -> None:
         """
@@ -1,6 +1,8 @@
 from datetime import datetime
 
-from src.application.domain.article import Article
+from src.application.domain.article import Article, ArticleCursor, ArticleSummary, ArticleWithAuthor
+from src.application.domain.page import Page
+from src.application.output_ports.account_repository import AccountRepository
 from src.application.output_ports.article_repository import ArticleRepository
 
 
@@ -10,12 +12,84 @@ class InMemoryArticleRepository(ArticleRepository):
     Uses a dictionary to store articles, primarily for unit testing.
     """
 
-    def __init__(self):
+    def __init__(self, account_repository: AccountRepository | None = None):
         """
         Initializes the repository with an empty internal dictionary and ID counter.
+
+        Args:
+            account_repository (AccountRepository | None): Source of author
+                names and avatars for the Read Model methods. Without it,
+                every existing author is reported as "Unknown".
         """
         self._articles: dict[int, Article] = {}
         self._next_id = 1
+        self._account_repository = account_repository
+        self._file_references: dict[int, set[str]] = {}
+
+    def _with_author(self, article: Article) -> ArticleWithAuthor:
+        """
+        Combines an article with its author's username and avatar.
+
+        Args:
+            article (Article): The article to enrich.
+
+        Returns:
+            ArticleWithAuthor: The Read Model.
+        """
+        if article.article_author_id is None:
+            return ArticleWithAuthor(article=article, author_name="Anonymous")
+        account = self._account_repository.get_by_id(article.article_author_id) if self._account_repository else None
+        if account is None:
+            return ArticleWithAuthor(article=article, author_name="Unknown")
+        return ArticleWithAuthor(
+            article=article,
+            author_name=account.account_username,
+            author_avatar_file_id=account.avatar_file_id,
+        )
+
+    def _summarize(self, article: Article) -> ArticleSummary:
+        """
+        Builds the list-view Read Model of an article.
+
+        Args:
+            article (Article): The article to summarize.
+
+        Returns:
+            ArticleSummary: The article metadata and its author.
+        """
+        with_author = self._with_author(article)
+        return ArticleSummary(
+            article_id=article.article_id,
+            article_author_id=article.article_author_id,
+            article_title=article.article_title,
+            article_description=article.article_description,
+            article_published_at=article.article_published_at,
+            article_edited_at=article.article_edited_at,
+            author_name=with_author.author_name,
+            author_avatar_file_id=with_author.author_avatar_file_id,
+        )
+
+    def _sorted_by_date_desc(self) -> list[Article]:
+        """
+        Returns the stored articles ordered by publication date (descending).
+
+        Returns:
+            list[Article]: The sorted Article domain entities.
+        """
+        return sorted(self._articles.values(), key=lambda a: a.article_published_at or datetime.min, reverse=True)
+
+    def get_with_author(self, article_id: int) -> ArticleWithAuthor | None:
+        """
+        Retrieves a single article together with its author's username and avatar.
+
+        Args:
+            article_id (int): The unique identifier of the article.
+
+        Returns:
+            ArticleWithAuthor | None: The Read Model if found, None otherwise.
+        """
+        article = self._articles.get(article_id)
+        return self._with_author(article) if article else None
 
     def save(self, article: Article) -> None:
         """
@@ -42,39 +116,41 @@ class InMemoryArticleRepository(ArticleRepository):
         """
         return self._articles.get(article_id)
 
-    def get_all_ordered_by_date_desc(self) -> list[Article]:
+    def get_all_ordered_by_date_desc(self) -> list[ArticleSummary]:
         """
         Retrieves all articles ordered by publication date (descending).
 
         Returns:
-            list[Article]: A sorted list of Article domain entities.
+            list[ArticleSummary]: The summaries of every article.
         """
-        return sorted(list(self._articles.values()), key=lambda a: a.article_published_at or datetime.min, reverse=True)
+        return [self._summarize(a) for a in self._sorted_by_date_desc()]
 
-    def get_paginated(self, page: int, per_page: int) -> list[Article]:
+    def get_page(self, page: int, per_page: int, cursor: ArticleCursor | None = None) -> Page[ArticleSummary]:
         """
-        Retrieves a paginated list of articles, ordered by date descending.
+        Retrieves a page of articles with their authors, together with the total article count.
 
         Args:
-            page (int): The page number (1-indexed).
+            page (int): The page number (1-indexed), used when cursor is None.
             per_page (int): The number of items per page.
+            cursor (ArticleCursor | None): Position of the last article already shown.
 
         Returns:
-            list[Article]: A slice of the sorted Article list.
+            Page[ArticleSummary]: The Read Models of the page and the total article count.
         """
-        sorted_articles = self.get_all_ordered_by_date_desc()
-        start = (page - 1) * per_page
-        end = start + per_page
-        return sorted_articles[start:end]
-
-    def count_all(self) -> int:
-        """
-        Retrieves the total number of articles stored in memory.
-
-        Returns:
-            int: The total count of articles.
-        """
-        return len(self._articles)
+        sorted_articles = sorted(
+            self._articles.values(),
+            key=lambda a: (a.article_published_at or datetime.min, a.article_id),
+            reverse=True,
+        )
+        if cursor is not None:
+            position = (cursor.published_at, cursor.article_id)
+            sorted_articles = [
+                a for a in sorted_articles
+                if (a.article_published_at or datetime.min, a.article_id) < position
+            ]
+        else:
+            sorted_articles = sorted_articles[(page - 1) * per_page:]
+        return Page(items=[self._summarize(a) for a in sorted_articles[:per_page]], total=len(self._articles))
 
     def delete(self, article: Article) -> None:
         """
@@ -85,25 +161,45 @@ class InMemoryArticleRepository(ArticleRepository):
         """
         if article.article_id in self._articles:
             del self._articles[article.article_id]
+        self._file_references.pop(article.article_id, None)
+
+    def replace_file_references(self, article_id: int, file_ids: set[str]) -> set[str]:
+        """
+        Replaces the set of uploaded files an article references.
+
+        No file store backs this repository, so every ID is recorded.
+
+        Args:
+            article_id (int): The unique identifier of the article.
+            file_ids (set[str]): The UUIDs of the files its content references.
+
+        Returns:
+            set[str]: The UUIDs of the files the article stopped referencing
+                that no other article, and no account avatar, references.
+        """
+        removed = self._file_references.get(article_id, set()) - file_ids
+        self._file_references[article_id] = set(file_ids)
+        still_referenced = set().union(*self._file_references.values())
+        if self._account_repository:
+            still_referenced |= {a.avatar_file_id for a in self._account_repository.get_all() if a.avatar_file_id}
+        return removed - still_referenced
 
-    def search(self, query: str, page: int, per_page: int) -> list[Article]:
+    def search_page(self, query: str, page: int, per_page: int) -> Page[ArticleSummary]:
         """
-        Searches articles by title or description using a case-insensitive
-        substring match against the in-memory dictionary.
+        Searches articles and returns the requested page with the authors and the total number of matches.
 
         Note: This in-memory implementation does NOT search by author
         username. The production SQL adapter supports author search via
         a JOIN on the accounts table.
 
         Args:
-            query: The search term to match against article titles
-                and descriptions.
+            query: The search term to match against article titles or descriptions.
             page: The page number (1-indexed).
             per_page: The number of items per page.
 
         Returns:
-            A list of Article domain entities matching the search query
-            for the given page, ordered by publication date descending.
+            Page[ArticleSummary]: The matching Read Models of the page, ordered
+            by publication date descending, and the total number of matches.
         """
         q = query.lower()
         filtered = [
@@ -117,26 +213,4 @@ class InMemoryArticleRepository(ArticleRepository):
             reverse=True,
         )
         start = (page - 1) * per_page
-        return sorted_list[start:start + per_page]
-
-    def count_search(self, query: str) -> int:
-        """
-        Counts articles matching a search query by title or description.
-
-        Note: This in-memory implementation does NOT search by author
-        username. The production SQL adapter supports author search via
-        a JOIN on the accounts table.
-
-        Args:
-            query: The search term to match against article titles
-                and descriptions.
-
-        Returns:
-            The total number of matching articles.
-        """
-        q = query.lower()
-        return sum(
-            1 for a in self._articles.values()
-            if q in a.article_title.lower()
-            or (a.article_description and q in a.article_description.lower())
-        )
+        return Page(items=[self._summarize(a) for a in sorted_list[start:start + per_page]], total=len(filtered))
@@ -1,4 +1,5 @@
-from src.application.domain.comment import Comment
+from src.application.domain.comment import Comment, CommentWithAuthor
+from src.application.output_ports.account_repository import AccountRepository
 from src.application.output_ports.comment_repository import CommentRepository
 
 
@@ -8,12 +9,18 @@ class InMemoryCommentRepository(CommentRepository):
     Uses a dictionary to store comments, intended for unit tests and rapid prototyping.
     """
 
-    def __init__(self):
+    def __init__(self, account_repository: AccountRepository | None = None):
         """
         Initializes the repository with an empty internal dictionary and ID counter.
+
+        Args:
+            account_repository (AccountRepository | None): Source of author
+                names and avatars for the Read Model methods. Without it,
+                every author is reported as "Anonymous".
         """
         self._comments: dict[int, Comment] = {}
         self._next_id = 1
+        self._account_repository = account_repository
 
     def save(self, comment: Comment) -> None:
         """
@@ -52,6 +59,31 @@ class InMemoryCommentRepository(CommentRepository):
         """
         return [c for c in self._comments.values() if c.comment_article_id == article_id]
 
+    def get_all_with_authors_by_article_id(self, article_id: int) -> list[CommentWithAuthor]:
+        """
+        Retrieves all comments of an article together with their authors' usernames and avatars.
+
+        Args:
+            article_id (int): ID of the article.
+
+        Returns:
+            list[CommentWithAuthor]: The Read Models of every comment of the article.
+        """
+        result = []
+        for comment in self.get_all_by_article_id(article_id):
+            author_id = comment.comment_written_account_id
+            account = (
+                self._account_repository.get_by_id(author_id)
+                if self._account_repository and author_id is not None
+                else None
+            )
+            result.append(CommentWithAuthor(
+                comment=comment,
+                author_name=account.account_username if account else "Anonymous",
+                author_avatar_file_id=account.avatar_file_id if account else None,
+            ))
+        return result
+
     def get_by_reply_to(self, comment_id: int) -> list[Comment]:
         """
         Retrieves all direct child comments that reply to a given comment.
@@ -64,6 +96,24 @@ class InMemoryCommentRepository(CommentRepository):
         """
         return [c for c in self._comments.values() if c.comment_reply_to == comment_id]
 
+    def get_ancestors(self, comment_id: int) -> list[Comment]:
+        """
+        Retrieves the chain of comments a comment replies to.
+
+        Args:
+            comment_id (int): ID of the comment whose ancestors are requested.
+
+        Returns:
+            list[Comment]: The ancestors, nearest parent first.
+        """
+        ancestors: list[Comment] = []
+        comment = self._comments.get(comment_id)
+        while comment is not None and comment.comment_reply_to is not None:
+            comment = self._comments.get(comment.comment_reply_to)
+            if comment is not None:
+                ancestors.append(comment)
+        return ancestors
+
     def get_by_account_id(self, account_id: int) -> list[Comment]:
         """
         Retrieves all comments authored by a specific account.
@@ -0,0 +1,101 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from src.application.output_ports.article_renderer_repository import ArticleRendererRepository
+from src.application.output_ports.file_storage_repository import FileStorageRepository
+from utils.prosemirror_to_html import RENDERER_VERSION, prosemirror_to_html, uploaded_image_ids
+
+
+def _render(content: str, image_widths: dict[str, int] | None = None) -> str:
+    """
+    Renders a BlockNote document to HTML.
+
+    Module-level so that it can run in a worker process.
+    """
+    return str(prosemirror_to_html(content, image_widths=image_widths))
+
+
+class BlockNoteHtmlRendererAdapter(ArticleRendererRepository):
+    """
+    Implementation of the ArticleRendererRepository port backed by
+    prosemirror_to_html.
+
+    Image URLs are kept relative to the site, so that the stored HTML does
+    not depend on the host the article was saved from. Uploaded images are
+    offered in resized variants when their width is recorded in the file
+    storage, looked up once per call for all the rendered contents.
+
+    render_all() renders in a pool of worker processes when pool_size is
+    positive, started on first use with the spawn method, as the rendering
+    is CPU-bound pure Python.
+    """
+
+    def __init__(self, pool_size: int = 0, file_storage_repository: FileStorageRepository | None = None) -> None:
+        """
+        Initializes the adapter.
+
+        Args:
+            pool_size (int): Number of worker processes of render_all(). 0
+                renders in the calling thread.
+            file_storage_repository (FileStorageRepository | None): Source
+                of the widths of uploaded images. Without it, images are
+                rendered as a plain img.
+        """
+        self._pool_size = pool_size
+        self._file_storage_repository = file_storage_repository
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        """
+        The version of the rendered output.
+
+        Returns:
+            int: RENDERER_VERSION of prosemirror_to_html.
+        """
+        return RENDERER_VERSION
+
+    def render(self, content: str) -> str:
+        """
+        Renders the content of an article in the calling thread.
+
+        Args:
+            content (str): The serialized editor document, or plain text.
+
+        Returns:
+            str: The HTML of the article body.
+        """
+        return _render(content, self._image_widths([content])[0])
+
+    def render_all(self, contents: list[str]) -> list[str]:
+        """
+        Renders the contents of several articles, in the worker pool if configured.
+
+        Args:
+            contents (list[str]): The serialized editor documents.
+
+        Returns:
+            list[str]: The HTML of each article body, in the order of contents.
+        """
+        image_widths = self._image_widths(contents)
+        if self._pool_size <= 0 or len(contents) < 2:
+            return [_render(content, widths) for content, widths in zip(contents, image_widths, strict=True)]
+        chunksize = max(1, len(contents) // (self._pool_size * 4))
+        return list(self._get_pool().map(_render, contents, image_widths, chunksize=chunksize))
+
+    def _image_widths(self, contents: list[str]) -> list[dict[str, int]]:
+        """Return the widths of the uploaded images of each content, read in one lookup."""
+        if self._file_storage_repository is None:
+            return [{} for _ in contents]
+        upload_ids = [uploaded_image_ids(content) for content in contents]
+        widths = self._file_storage_repository.get_image_widths(set().union(*upload_ids))
+        return [{file_id: widths[file_id] for file_id in ids if file_id in widths} for ids in upload_ids]
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Return the worker pool, starting it on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self._pool_size, mp_context=multiprocessing.get_context("spawn"))
+            return self._pool
@@ -1,18 +1,59 @@
+import logging
 import secrets
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 from argon2 import PasswordHasher as Argon2Hasher
 from argon2.exceptions import InvalidHashError, VerifyMismatchError
 
+from src.application.application_exceptions import PasswordHasherBusyError
 from src.application.output_ports.password_hasher_repository import PasswordHasherRepository
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HasherPoolStats:
+    """
+    Snapshot of the counters of the Argon2PasswordHasherAdapter worker pool.
+
+    Attributes:
+        completed (int): Hashes and verifications run by the pool.
+        rejected (int): Hashes and verifications refused because the pool was full.
+        in_flight (int): Jobs currently running or queued.
+        queue_wait_seconds (float): Total time the completed jobs waited for a worker.
+        hash_seconds (float): Total time the completed jobs spent hashing.
+        max_queue_wait_seconds (float): Longest wait of a job for a worker.
+    """
+    completed: int
+    rejected: int
+    in_flight: int
+    queue_wait_seconds: float
+    hash_seconds: float
+    max_queue_wait_seconds: float
+
 
 class Argon2PasswordHasherAdapter(PasswordHasherRepository):
     """
     Argon2-based implementation of the PasswordHasherRepository port.
     Uses argon2-cffi for secure password hashing and verification.
+
+    With a positive pool_size, hash() and verify() run in a dedicated pool
+    of pool_size threads, so that at most pool_size × memory_cost is
+    allocated by Argon2 at any time whatever the number of concurrent
+    requests. argon2-cffi releases the GIL while hashing, so the threads
+    hash in parallel. At most max_queued jobs wait for a free worker;
+    beyond that the call fails at once with PasswordHasherBusyError rather
+    than holding the request thread. The time jobs spend waiting and
+    hashing is reported by stats.
     """
 
-    def __init__(self, time_cost: int, memory_cost: int, parallelism: int) -> None:
+    def __init__(
+        self, time_cost: int, memory_cost: int, parallelism: int, pool_size: int = 0, max_queued: int = 0,
+    ) -> None:
         """
         Initializes the adapter with an argon2-cffi Argon2Hasher instance.
 
@@ -20,8 +61,34 @@ class Argon2PasswordHasherAdapter(PasswordHasherRepository):
             time_cost (int): The number of iterations.
             memory_cost (int): The amount of memory usage in KiB.
             parallelism (int): The number of parallel threads.
+            pool_size (int): Number of worker threads hashing passwords. 0
+                hashes in the calling thread, without any limit.
+            max_queued (int): Number of jobs allowed to wait for a worker
+                before further ones are rejected.
         """
         self._hasher = Argon2Hasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+        self._pool = ThreadPoolExecutor(pool_size, thread_name_prefix="argon2") if pool_size > 0 else None
+        self._slots = threading.BoundedSemaphore(pool_size + max_queued) if pool_size > 0 else None
+        self._stats_lock = threading.Lock()
+        self._completed = 0
+        self._rejected = 0
+        self._in_flight = 0
+        self._queue_wait_seconds = 0.0
+        self._hash_seconds = 0.0
+        self._max_queue_wait_seconds = 0.0
+
+    @property
+    def stats(self) -> HasherPoolStats:
+        """Current counters of the worker pool."""
+        with self._stats_lock:
+            return HasherPoolStats(
+                self._completed,
+                self._rejected,
+                self._in_flight,
+                self._queue_wait_seconds,
+                self._hash_seconds,
+                self._max_queue_wait_seconds,
+            )
 
     def hash(self, password: str) -> str:
         """
@@ -32,8 +99,11 @@ class Argon2PasswordHasherAdapter(PasswordHasherRepository):
 
         Returns:
             str: The Argon2id hash string.
+
+        Raises:
+            PasswordHasherBusyError: If the worker pool and its queue are full.
         """
-        return self._hasher.hash(password)
+        return self._run(self._hasher.hash, password)
 
     def verify(self, password: str, hashed_password: str) -> bool:
         """
@@ -49,7 +119,14 @@ class Argon2PasswordHasherAdapter(PasswordHasherRepository):
 
         Returns:
             bool: True if the password matches, False otherwise.
+
+        Raises:
+            PasswordHasherBusyError: If the worker pool and its queue are full.
         """
+        return self._run(self._verify, password, hashed_password)
+
+    def _verify(self, password: str, hashed_password: str) -> bool:
+        """Verifies a password against a hash or a legacy plaintext password."""
         try:
             return self._hasher.verify(hashed_password, password)
         except VerifyMismatchError:
@@ -63,6 +140,8 @@ class Argon2PasswordHasherAdapter(PasswordHasherRepository):
         """
         Checks if the Argon2 hash needs re-hashing based on current parameters.
 
+        Only parses the hash, so it runs in the calling thread.
+
         Args:
             hashed_password (str): The stored Argon2id hash string.
 
@@ -73,3 +152,40 @@ class Argon2PasswordHasherAdapter(PasswordHasherRepository):
             return self._hasher.check_needs_rehash(hashed_password)
         except InvalidHashError:
             return True
+
+    def _run[T](self, job: Callable[..., T], *args) -> T:
+        """
+        Runs a hashing job in the worker pool, or in the calling thread without a pool.
+
+        Raises:
+            PasswordHasherBusyError: If pool_size + max_queued jobs are already in flight.
+        """
+        if self._pool is None or self._slots is None:
+            return job(*args)
+        if not self._slots.acquire(blocking=False):
+            with self._stats_lock:
+                self._rejected += 1
+            logger.warning("Password hasher saturated, rejecting request: %s", self.stats)
+            raise PasswordHasherBusyError("Too many sign-in attempts are being processed. Please try again shortly.")
+        with self._stats_lock:
+            self._in_flight += 1
+        try:
+            return self._pool.submit(self._timed, time.perf_counter(), job, *args).result()
+        finally:
+            with self._stats_lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+    def _timed[T](self, submitted_at: float, job: Callable[..., T], *args) -> T:
+        """Runs a job in a worker thread, recording its queue wait and hashing time."""
+        started_at = time.perf_counter()
+        try:
+            return job(*args)
+        finally:
+            finished_at = time.perf_counter()
+            with self._stats_lock:
+                waited = started_at - submitted_at
+                self._completed += 1
+                self._queue_wait_seconds += waited
+                self._hash_seconds += finished_at - started_at
+                self._max_queue_wait_seconds = max(self._max_queue_wait_seconds, waited)
@@ -1,6 +1,11 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
 from flask import session as flask_session
 
-from src.application.domain.account import Account
+from src.application.domain.account import Account, AccountRole
 from src.application.output_ports.account_repository import AccountRepository
 from src.application.output_ports.account_session_repository import AccountSessionRepository
 
@@ -9,20 +14,40 @@ class FlaskSessionAdapter(AccountSessionRepository):
     """
     Implementation of the AccountSessionRepository using Flask's internal cookies.
     Acts as an Output Adapter supporting AccountSessionRepository.
+
+    With a positive snapshot_ttl, the session also keeps a snapshot of the
+    account (every field but the password hash) with the account_version it
+    was taken at. The Flask session cookie is signed with the SECRET_KEY, so
+    the snapshot cannot be forged by the client. get_account() trusts the
+    snapshot while its version matches the current account_version, which
+    is looked up through a small per-process cache whose entries expire
+    after snapshot_ttl seconds. Bans, role changes and other account updates
+    therefore apply within snapshot_ttl seconds, while the steady state
+    needs no account query at all.
     """
 
     _KEY_USER_ID = "user_id"
     _KEY_USERNAME = "username"
     _KEY_ROLE = "role"
+    _KEY_SNAPSHOT = "account"
 
-    def __init__(self, account_repository: AccountRepository):
+    def __init__(self, account_repository: AccountRepository, snapshot_ttl: float = 0.0, max_cached_versions: int = 1024):
         """
         Initializes the session adapter.
 
         Args:
             account_repository (AccountRepository): Repository to fetch the domain Account from its ID.
+            snapshot_ttl (float): Seconds during which a looked-up account_version
+                is trusted. 0 (the default) disables snapshots and loads the
+                account on every call.
+            max_cached_versions (int): Number of accounts whose version is
+                cached; the least recently used entries are evicted first.
         """
         self.account_repository = account_repository
+        self._snapshot_ttl = snapshot_ttl
+        self._max_cached_versions = max_cached_versions
+        self._versions: OrderedDict[int, tuple[int | None, float]] = OrderedDict()
+        self._lock = threading.Lock()
 
     def save_account(self, account: Account) -> None:
         """
@@ -34,11 +59,26 @@ class FlaskSessionAdapter(AccountSessionRepository):
         flask_session[self._KEY_USER_ID] = account.account_id
         flask_session[self._KEY_USERNAME] = account.account_username
         flask_session[self._KEY_ROLE] = account.account_role.value
+        if self._snapshot_ttl > 0:
+            flask_session[self._KEY_SNAPSHOT] = {
+                "email": account.account_email,
+                "created_at": account.account_created_at.isoformat() if account.account_created_at else None,
+                "avatar_file_id": account.avatar_file_id,
+                "is_banned": account.is_banned,
+                "ban_reason": account.ban_reason,
+                "version": account.account_version,
+            }
+            self._remember_version(account.account_id, account.account_version)
 
     def get_account(self) -> Account | None:
         """
         Retrieves the currently connected domain Account.
 
+        In snapshot mode, the account is rebuilt from the session snapshot
+        when its version is still current, and loaded (then snapshotted
+        again) otherwise. An account built from the snapshot has an empty
+        account_password.
+
         Returns:
             Account | None: The domain account if a session is active, otherwise None.
         """
@@ -46,11 +86,82 @@ class FlaskSessionAdapter(AccountSessionRepository):
 
         if not account_id or not str(account_id).isdigit():
             return None
+        account_id = int(str(account_id))
 
-        return self.account_repository.get_by_id(int(str(account_id)))
+        if self._snapshot_ttl <= 0:
+            return self.account_repository.get_by_id(account_id)
+
+        snapshot = flask_session.get(self._KEY_SNAPSHOT)
+        if isinstance(snapshot, dict) and snapshot.get("version") == self._current_version(account_id, snapshot.get("version")):
+            account = self._from_snapshot(account_id, snapshot)
+            if account is not None:
+                return account
+
+        account = self.account_repository.get_by_id(account_id)
+        if account is None:
+            self._remember_version(account_id, None)
+            return None
+        self.save_account(account)
+        return account
 
     def clear(self) -> None:
         """
         Wipes the current session data, logging the user out.
         """
         flask_session.clear()
+
+    def _current_version(self, account_id: int, expected: object) -> int | None:
+        """
+        Returns the current account_version of an account, from the cache when possible.
+
+        A cached version is used while it has not expired and matches the
+        expected one; otherwise the version is looked up again, so that a
+        snapshot newer than the cache is not taken for a stale one.
+
+        Args:
+            account_id: The ID of the account.
+            expected: The version stored in the session snapshot.
+
+        Returns:
+            int | None: The version counter, or None if the account does not exist.
+        """
+        with self._lock:
+            entry = self._versions.get(account_id)
+            if entry is not None and entry[1] > time.monotonic() and entry[0] == expected:
+                self._versions.move_to_end(account_id)
+                return entry[0]
+        version = self.account_repository.get_version(account_id)
+        self._remember_version(account_id, version)
+        return version
+
+    def _remember_version(self, account_id: int, version: int | None) -> None:
+        """Caches the version of an account for snapshot_ttl seconds."""
+        with self._lock:
+            self._versions[account_id] = (version, time.monotonic() + self._snapshot_ttl)
+            self._versions.move_to_end(account_id)
+            while len(self._versions) > self._max_cached_versions:
+                self._versions.popitem(last=False)
+
+    def _from_snapshot(self, account_id: int, snapshot: dict) -> Account | None:
+        """
+        Rebuilds the domain Account from the session snapshot.
+
+        Returns:
+            Account | None: The account, or None if the snapshot is incomplete.
+        """
+        try:
+            created_at = snapshot["created_at"]
+            return Account(
+                account_id=account_id,
+                account_username=flask_session[self._KEY_USERNAME],
+                account_password="",
+                account_email=snapshot["email"],
+                account_role=AccountRole(flask_session[self._KEY_ROLE]),
+                account_created_at=datetime.fromisoformat(created_at) if created_at else None,
+                avatar_file_id=snapshot["avatar_file_id"],
+                is_banned=snapshot["is_banned"],
+                ban_reason=snapshot["ban_reason"],
+                account_version=snapshot["version"],
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
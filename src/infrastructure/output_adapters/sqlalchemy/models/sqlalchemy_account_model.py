@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import TIMESTAMP, Boolean, Integer, String, Text, func
+from sqlalchemy import TIMESTAMP, Boolean, Index, Integer, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_registry import SqlAlchemyModel
@@ -12,11 +12,25 @@ class AccountModel(SqlAlchemyModel):
 
     This class defines the database schema for user profiles, including
     authentication credentials, contact information, roles, ban status,
-    and an optional reference to the user's avatar image
-    in the ``uploaded_files`` table via ``avatar_file_id``.
+    an optional reference to the user's avatar image
+    in the ``uploaded_files`` table via ``avatar_file_id``, and the
+    ``account_version`` counter bumped by every change to the account.
+
+    The lower(account_username) text_pattern_ops index serves the prefix
+    lookups of username autocomplete. The pg_trgm GIN indexes serving
+    substring search on username and email require the extension and are
+    created by migration V19 only. The avatar_file_id index serves the
+    lookups of the account using a file as its avatar. The
+    (account_created_at, account_id) index serves the account list, by
+    keyset and by OFFSET.
     """
 
     __tablename__ = "accounts"
+    __table_args__ = (
+        Index("idx_accounts_username_lower_prefix", text("lower(account_username) text_pattern_ops")),
+        Index("idx_accounts_avatar_file_id", "avatar_file_id"),
+        Index("idx_accounts_created_at_id", "account_created_at", "account_id"),
+    )
 
     account_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     account_username: Mapped[str] = mapped_column(Text, unique=True, nullable=False)
@@ -27,3 +41,4 @@ class AccountModel(SqlAlchemyModel):
     avatar_file_id: Mapped[str | None] = mapped_column(Text, nullable=True, default=None)
     is_banned: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     ban_reason: Mapped[str | None] = mapped_column(String(150), nullable=True, default=None)
+    account_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default=text("0"))
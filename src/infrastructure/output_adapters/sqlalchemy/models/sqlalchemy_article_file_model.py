@@ -0,0 +1,27 @@
+from sqlalchemy import ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_registry import SqlAlchemyModel
+
+
+class ArticleFileModel(SqlAlchemyModel):
+    """
+    SQLAlchemy ORM model for the 'article_files' table.
+
+    One row per uploaded file referenced by an article's content. Rows go
+    away with their article or their file (ON DELETE CASCADE on both sides).
+    The file_id index serves the lookups of the other articles referencing a
+    file, and the cascade from uploaded_files.
+    """
+
+    __tablename__ = "article_files"
+    __table_args__ = (
+        Index("idx_article_files_file_id", "file_id"),
+    )
+
+    article_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("articles.article_id", ondelete="CASCADE"), primary_key=True,
+    )
+    file_id: Mapped[str] = mapped_column(
+        String, ForeignKey("uploaded_files.file_id", ondelete="CASCADE"), primary_key=True,
+    )
@@ -1,6 +1,7 @@
 from datetime import datetime
 
-from sqlalchemy import TIMESTAMP, ForeignKey, Integer, String, Text, func
+from sqlalchemy import TIMESTAMP, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_registry import SqlAlchemyModel
@@ -14,9 +15,26 @@ class ArticleModel(SqlAlchemyModel):
     when the author account is deleted (author becomes "Anonymous").
     article_description is a VARCHAR(300) short summary displayed
     in the article list view.
+    The (article_published_at, article_id) index serves keyset pagination
+    of the article list, scanned backwards for the descending order.
+    The article_author_id index serves the ON DELETE SET NULL from accounts.
+    article_search_vector holds the weighted full-text document (title,
+    description, plain text of the content) built with the text search
+    configuration stored in article_search_config. It is written by
+    SqlAlchemyFullTextArticleAdapter, served by a GIN index and deferred
+    so that regular article loads never fetch it.
+    article_content_html caches the HTML rendered from article_content on
+    save, and article_renderer_version the version of the renderer that
+    produced it, so that articles rendered by an older renderer can be
+    found and rendered again.
     """
 
     __tablename__ = "articles"
+    __table_args__ = (
+        Index("idx_articles_published_at_id", "article_published_at", "article_id"),
+        Index("idx_articles_search_vector", "article_search_vector", postgresql_using="gin"),
+        Index("idx_articles_author_id", "article_author_id"),
+    )
 
     article_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     article_author_id: Mapped[int | None] = mapped_column(
@@ -30,3 +48,9 @@ class ArticleModel(SqlAlchemyModel):
     article_content: Mapped[str] = mapped_column(Text, nullable=False)
     article_published_at: Mapped[datetime] = mapped_column(TIMESTAMP, server_default=func.now())
     article_edited_at: Mapped[datetime | None] = mapped_column(TIMESTAMP, nullable=True)
+    article_content_html: Mapped[str | None] = mapped_column(Text, nullable=True)
+    article_renderer_version: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    article_search_config: Mapped[str] = mapped_column(
+        REGCONFIG, nullable=False, server_default="french",
+    )
+    article_search_vector: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True, deferred=True)
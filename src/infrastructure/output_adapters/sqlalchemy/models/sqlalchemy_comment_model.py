@@ -4,6 +4,7 @@ from sqlalchemy import (
     TIMESTAMP,
     Boolean,
     ForeignKey,
+    Index,
     Integer,
     String,
     func,
@@ -18,11 +19,23 @@ class CommentModel(SqlAlchemyModel):
     SQLAlchemy ORM model for comments.
 
     comment_reply_to uses ON DELETE CASCADE so that hard-deleting a parent
-    comment automatically removes all its replies.
+    comment automatically removes all its replies. comment_depth stores the
+    nesting level of the comment (0 for top-level comments) so that replies
+    can be depth-checked without walking the reply chain.
+
+    Every foreign key is indexed, so that the comment lookups and the ON
+    DELETE actions of articles, parent comments and accounts never scan the
+    table. The article index also covers comment_posted_at, the order in
+    which the comments of an article are read.
     """
 
     __tablename__ = "comments"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        Index("idx_comments_article_id_posted_at", "comment_article_id", "comment_posted_at"),
+        Index("idx_comments_reply_to", "comment_reply_to"),
+        Index("idx_comments_written_account_id", "comment_written_account_id"),
+        {"extend_existing": True},
+    )
 
     comment_id: Mapped[int] = mapped_column(
         name="comment_id", type_=Integer, primary_key=True, autoincrement=True
@@ -60,3 +73,6 @@ class CommentModel(SqlAlchemyModel):
     edited_at: Mapped[datetime | None] = mapped_column(
         name="edited_at", type_=TIMESTAMP, nullable=True,
     )
+    comment_depth: Mapped[int] = mapped_column(
+        name="comment_depth", type_=Integer, default=0, server_default="0", nullable=False,
+    )
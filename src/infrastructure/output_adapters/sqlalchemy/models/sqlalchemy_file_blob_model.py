@@ -0,0 +1,25 @@
+from sqlalchemy import CheckConstraint, Column, DateTime, Integer, LargeBinary, String
+from sqlalchemy.orm import deferred
+from sqlalchemy.sql import func
+
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_registry import SqlAlchemyModel
+
+
+class FileBlobModel(SqlAlchemyModel):
+    """
+    SQLAlchemy ORM model for the de-duplicated contents of uploaded files.
+
+    One row per distinct content, keyed by its SHA-256 digest. ref_count is
+    the number of uploaded_files rows sharing it. file_data is deferred, and
+    is NULL when the content is kept on disk under content_sha256.
+    """
+
+    __tablename__ = "file_blobs"
+    __table_args__ = (
+        CheckConstraint("ref_count >= 0", name="file_blobs_ref_count_check"),
+    )
+
+    content_sha256 = Column(String(64), primary_key=True)
+    file_data = deferred(Column(LargeBinary, nullable=True))
+    ref_count = Column(Integer, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
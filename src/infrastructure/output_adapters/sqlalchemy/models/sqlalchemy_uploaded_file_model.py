@@ -1,15 +1,36 @@
-from sqlalchemy import Column, DateTime, Integer, LargeBinary, String
+from sqlalchemy import CheckConstraint, Column, DateTime, Index, Integer, LargeBinary, String
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 
 from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_registry import SqlAlchemyModel
 
 
 class UploadedFileModel(SqlAlchemyModel):
+    """
+    SQLAlchemy ORM model for uploaded files.
+
+    file_data is deferred: loading a model reads only the metadata columns,
+    and the bytes are fetched when they are explicitly requested.
+
+    The content of a file is stored once per digest in file_blobs, and
+    content_sha256 holds the digest of its blob. Only files uploaded before
+    de-duplication still carry their own file_data.
+
+    image_width is the width of a raster image, NULL for other files and
+    for images that have not been measured yet.
+    """
+
     __tablename__ = "uploaded_files"
+    __table_args__ = (
+        CheckConstraint("file_data IS NOT NULL OR content_sha256 IS NOT NULL", name="uploaded_files_content_check"),
+        Index("idx_uploaded_files_content_sha256", "content_sha256"),
+    )
 
     file_id = Column(String, primary_key=True)
     original_filename = Column(String, nullable=False)
     mime_type = Column(String, nullable=False)
     file_size = Column(Integer, nullable=False)
-    file_data = Column(LargeBinary, nullable=False)
+    file_data = deferred(Column(LargeBinary, nullable=True))
+    content_sha256 = Column(String(64), nullable=True)
+    image_width = Column(Integer, nullable=True)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
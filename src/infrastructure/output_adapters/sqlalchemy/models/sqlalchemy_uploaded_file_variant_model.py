@@ -0,0 +1,31 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, LargeBinary, String
+from sqlalchemy.orm import deferred
+from sqlalchemy.sql import func
+
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_registry import SqlAlchemyModel
+
+
+class UploadedFileVariantModel(SqlAlchemyModel):
+    """
+    SQLAlchemy ORM model for the renditions of uploaded images.
+
+    A rendition is identified by its original file and its width, height
+    and format, and is deleted along with the original. As for the original,
+    file_data is deferred, and is NULL when the content is kept on disk under
+    content_sha256.
+    """
+
+    __tablename__ = "uploaded_file_variants"
+    __table_args__ = (
+        Index("idx_uploaded_file_variants_content_sha256", "content_sha256"),
+    )
+
+    file_id = Column(String, ForeignKey("uploaded_files.file_id", ondelete="CASCADE"), primary_key=True)
+    width = Column(Integer, primary_key=True)
+    height = Column(Integer, primary_key=True)
+    format = Column(String(8), primary_key=True)
+    mime_type = Column(String, nullable=False)
+    file_size = Column(Integer, nullable=False)
+    file_data = deferred(Column(LargeBinary, nullable=True))
+    content_sha256 = Column(String(64), nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
@@ -1,15 +1,21 @@
-from typing import cast
+from typing import Any, cast
 
 from psycopg2.errors import UniqueViolation
-from sqlalchemy import or_
+from sqlalchemy import ColumnElement, Row, func, or_, tuple_
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session
 
 from src.application.application_exceptions import AccountAlreadyExistsError
-from src.application.domain.account import Account
+from src.application.domain.account import Account, AccountCursor
+from src.application.domain.page import Page
 from src.application.output_ports.account_repository import AccountRepository
 from src.infrastructure.output_adapters.dto.account_record import AccountRecord
 from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_account_model import AccountModel
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_page_utils import rows_to_page, table_total
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_query_utils import escape_like
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_row_mappers import ACCOUNT_COLUMNS, account_from_row
+
+TRIGRAM_MIN_LENGTH = 3
 
 
 class SqlAlchemyAccountAdapter(AccountRepository):
@@ -17,30 +23,52 @@ class SqlAlchemyAccountAdapter(AccountRepository):
     SQLAlchemy-based implementation of the AccountRepository port.
 
     This adapter manages the persistence and retrieval of Account domain entities
-    using SQLAlchemy ORM and the PostgreSQL database.
+    using SQLAlchemy ORM and the PostgreSQL database. Reads select
+    ACCOUNT_COLUMNS and map the rows straight into Account entities. Writes
+    increment account_version in the same UPDATE statement.
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, approximate_count_threshold: int = 0, validate_rows: bool = False):
         """
         Initializes the adapter with a SQLAlchemy session.
 
         Args:
             session (Session): An active SQLAlchemy database session.
+            approximate_count_threshold (int): Estimated table size from which
+                get_page() reports the planner estimate instead of an exact
+                count. 0 (the default) always counts exactly.
+            validate_rows (bool): When True, every row read is validated
+                through AccountRecord before being mapped. Meant for debugging.
         """
         self._session = session
+        self._approximate_count_threshold = approximate_count_threshold
+        self._validate_rows = validate_rows
 
-    def _to_domain(self, model: AccountModel) -> Account:
+    def _query(self, *extra_columns: ColumnElement) -> Query:
         """
-        Maps a SQLAlchemy ORM model to a Domain Entity via a DTO.
+        Starts a query selecting the columns of an Account entity.
 
         Args:
-            model (AccountModel): The database record to convert.
+            *extra_columns: Columns selected after ACCOUNT_COLUMNS.
+
+        Returns:
+            Query: A query returning rows of ACCOUNT_COLUMNS.
+        """
+        return self._session.query(*ACCOUNT_COLUMNS, *extra_columns)
+
+    def _to_domain(self, row: Row[Any]) -> Account:
+        """
+        Maps a row starting with ACCOUNT_COLUMNS to a Domain Entity.
+
+        Args:
+            row (Row): The database row to convert.
 
         Returns:
             Account: The converted Domain Entity.
         """
-        record = AccountRecord.model_validate(model)
-        return record.to_domain()
+        if self._validate_rows:
+            return AccountRecord.model_validate(row).to_domain()
+        return account_from_row(row)
 
     def find_by_username(self, username: str) -> Account | None:
         """
@@ -52,10 +80,10 @@ class SqlAlchemyAccountAdapter(AccountRepository):
         Returns:
             Account | None: The domain account if found, otherwise None.
         """
-        model = self._session.query(AccountModel).filter_by(account_username=username).first()
-        if model is None:
+        row = self._query().filter(AccountModel.account_username == username).first()
+        if row is None:
             return None
-        return self._to_domain(model)
+        return self._to_domain(row)
 
     def get_by_id(self, account_id: int) -> Account | None:
         """
@@ -67,10 +95,25 @@ class SqlAlchemyAccountAdapter(AccountRepository):
         Returns:
             Account | None: The domain account if found, otherwise None.
         """
-        model = self._session.get(AccountModel, account_id)
-        if model is None:
+        row = self._query().filter(AccountModel.account_id == account_id).one_or_none()
+        if row is None:
             return None
-        return self._to_domain(model)
+        return self._to_domain(row)
+
+    def get_version(self, account_id: int) -> int | None:
+        """
+        Retrieves the current account_version of an account.
+
+        Selects the single column by primary key, far cheaper than the
+        full account row.
+
+        Args:
+            account_id (int): The unique identifier of the account.
+
+        Returns:
+            int | None: The version counter, or None if the account does not exist.
+        """
+        return self._session.query(AccountModel.account_version).filter(AccountModel.account_id == account_id).scalar()
 
     def get_by_ids(self, account_ids: list[int]) -> list[Account]:
         """
@@ -85,12 +128,8 @@ class SqlAlchemyAccountAdapter(AccountRepository):
         if not account_ids:
             return []
 
-        models = (
-            self._session.query(AccountModel)
-            .filter(AccountModel.account_id.in_(account_ids))
-            .all()
-        )
-        return [self._to_domain(model) for model in models]
+        rows = self._query().filter(AccountModel.account_id.in_(account_ids)).all()
+        return [self._to_domain(row) for row in rows]
 
     def find_by_email(self, email: str) -> Account | None:
         """
@@ -102,18 +141,18 @@ class SqlAlchemyAccountAdapter(AccountRepository):
         Returns:
             Account | None: The domain account if found, otherwise None.
         """
-        model = self._session.query(AccountModel).filter_by(account_email=email).first()
-        if model is None:
+        row = self._query().filter(AccountModel.account_email == email).first()
+        if row is None:
             return None
-        return self._to_domain(model)
+        return self._to_domain(row)
 
     def save(self, account: Account) -> None:
         """
         Saves a domain account entity to the database.
 
         If the account has an existing positive ID, updates the corresponding
-        record; otherwise creates a new one. The account ID is updated in place
-        after insertion.
+        record and increments its version; otherwise creates a new one. The
+        account ID and version are updated in place after the commit.
 
         Args:
             account (Account): The domain entity to save.
@@ -125,7 +164,9 @@ class SqlAlchemyAccountAdapter(AccountRepository):
         """
         if account.account_id and account.account_id > 0:
             model = self._session.get(AccountModel, account.account_id)
-            if not model:
+            if model:
+                model.account_version = AccountModel.account_version + 1
+            else:
                 model = AccountModel()
         else:
             model = AccountModel()
@@ -154,6 +195,7 @@ class SqlAlchemyAccountAdapter(AccountRepository):
                     f"Unexpected unique constraint violation: {constraint_name}"
                 ) from None
         account.account_id = model.account_id
+        account.account_version = model.account_version
 
     def update_avatar(self, account_id: int, avatar_file_id: str | None) -> None:
         """
@@ -171,6 +213,7 @@ class SqlAlchemyAccountAdapter(AccountRepository):
         if model is None:
             return
         model.avatar_file_id = avatar_file_id
+        model.account_version = AccountModel.account_version + 1
         self._session.commit()
 
     def update_email(self, account_id: int, new_email: str) -> None:
@@ -192,6 +235,7 @@ class SqlAlchemyAccountAdapter(AccountRepository):
         if model is None:
             return
         model.account_email = new_email
+        model.account_version = AccountModel.account_version + 1
         try:
             self._session.commit()
         except IntegrityError as e:
@@ -215,6 +259,7 @@ class SqlAlchemyAccountAdapter(AccountRepository):
         if model is None:
             return
         model.account_password = new_hashed_password
+        model.account_version = AccountModel.account_version + 1
         self._session.commit()
 
     def update_ban_status(self, account_id: int, is_banned: bool, ban_reason: str | None) -> None:
@@ -235,6 +280,7 @@ class SqlAlchemyAccountAdapter(AccountRepository):
             return
         model.is_banned = is_banned
         model.ban_reason = ban_reason
+        model.account_version = AccountModel.account_version + 1
         self._session.commit()
 
     def update_role(self, account_id: int, new_role: str) -> None:
@@ -249,6 +295,7 @@ class SqlAlchemyAccountAdapter(AccountRepository):
         if model is None:
             return
         model.account_role = new_role
+        model.account_version = AccountModel.account_version + 1
         self._session.commit()
 
     def get_all(self) -> list[Account]:
@@ -258,30 +305,48 @@ class SqlAlchemyAccountAdapter(AccountRepository):
         Returns:
             list[Account]: A list of all Account domain entities.
         """
-        models = self._session.query(AccountModel).all()
-        return [self._to_domain(model) for model in models]
+        return [self._to_domain(row) for row in self._query().all()]
 
-    def get_all_paginated(self, page: int = 1, per_page: int = 20) -> list[Account]:
+    def _after(self, query: Query, cursor: AccountCursor | None) -> Query:
         """
-        Retrieves a paginated list of accounts, ordered by creation date desc.
+        Restricts and orders a query to the accounts following a keyset cursor.
 
         Args:
-            page: The page number (1-indexed). Defaults to 1.
+            query: The query selecting account columns.
+            cursor: Position of the last account already shown.
+
+        Returns:
+            Query: The query filtered past the cursor and ordered newest first.
+        """
+        if cursor is not None:
+            query = query.filter(
+                tuple_(AccountModel.account_created_at, AccountModel.account_id)
+                < tuple_(cursor.created_at, cursor.account_id)
+            )
+        return query.order_by(AccountModel.account_created_at.desc(), AccountModel.account_id.desc())
+
+    def get_page(self, page: int = 1, per_page: int = 20, cursor: AccountCursor | None = None) -> Page[Account]:
+        """
+        Retrieves a page of accounts and the total account count in one query.
+
+        The total is selected as an uncorrelated scalar subquery next to the
+        page rows (see table_total). Keyset and OFFSET pages share the
+        (account_created_at, account_id) order, served by the matching index.
+
+        Args:
+            page: The page number (1-indexed), used when cursor is None. Defaults to 1.
             per_page: The number of items per page. Defaults to 20.
+            cursor: Position of the last account already shown.
 
         Returns:
-            list[Account]: A list of Account domain entities for the given page.
+            Page[Account]: The accounts of the page and the total account count.
         """
-        models = (
-            self._session.query(AccountModel)
-            .order_by(AccountModel.account_created_at.desc())
-            .limit(per_page)
-            .offset((page - 1) * per_page)
-            .all()
-        )
-        return [self._to_domain(model) for model in models]
+        query = self._after(self._query(table_total(AccountModel, self._approximate_count_threshold)), cursor)
+        if cursor is None:
+            query = query.offset((page - 1) * per_page)
+        return rows_to_page(query.limit(per_page).all(), self._to_domain, self._count_all)
 
-    def count_all(self) -> int:
+    def _count_all(self) -> int:
         """
         Returns the total number of accounts in the database.
 
@@ -290,10 +355,42 @@ class SqlAlchemyAccountAdapter(AccountRepository):
         """
         return self._session.query(AccountModel).count()
 
-    def search(self, query: str, page: int = 1, per_page: int = 20) -> list[Account]:
+    def _search_filter(self, query: str) -> ColumnElement[bool]:
+        """
+        Builds the username/email substring predicate.
+
+        Substring ILIKE patterns are answered by the pg_trgm GIN indexes on
+        account_username and account_email (see migration V19).
+
+        Args:
+            query: The search string to match against username or email.
+
+        Returns:
+            ColumnElement[bool]: The filter expression.
         """
-        Searches accounts by username or email with pagination.
-        Uses case-insensitive ILIKE on PostgreSQL.
+        pattern = f"%{escape_like(query)}%"
+        return or_(
+            AccountModel.account_username.ilike(pattern, escape="\\"),
+            AccountModel.account_email.ilike(pattern, escape="\\"),
+        )
+
+    def _count_search(self, query: str) -> int:
+        """
+        Returns the total number of accounts matching the search query.
+
+        Args:
+            query: The search string to match against username or email.
+
+        Returns:
+            int: The total count of matching accounts.
+        """
+        return self._session.query(AccountModel).filter(self._search_filter(query)).count()
+
+    def search_page(self, query: str, page: int = 1, per_page: int = 20) -> Page[Account]:
+        """
+        Searches accounts and returns the page with the total number of matches in one query.
+
+        The total is a COUNT(*) OVER () window computed over the matches.
 
         Args:
             query: The search string to match against username or email.
@@ -301,46 +398,56 @@ class SqlAlchemyAccountAdapter(AccountRepository):
             per_page: The number of items per page. Defaults to 20.
 
         Returns:
-            list[Account]: A list of matching Account domain entities
-                for the given page.
-        """
-        like = f"%{query}%"
-        models = (
-            self._session.query(AccountModel)
-            .filter(
-                or_(
-                    AccountModel.account_username.ilike(like),
-                    AccountModel.account_email.ilike(like),
-                )
-            )
-            .order_by(AccountModel.account_created_at.desc())
+            Page[Account]: The matching accounts of the page and the total number of matches.
+        """
+        rows = (
+            self._query(func.count().over())
+            .filter(self._search_filter(query))
+            .order_by(AccountModel.account_created_at.desc(), AccountModel.account_id.desc())
             .limit(per_page)
             .offset((page - 1) * per_page)
             .all()
         )
-        return [self._to_domain(model) for model in models]
+        return rows_to_page(rows, self._to_domain, lambda: self._count_search(query))
 
-    def count_search(self, query: str) -> int:
+    def suggest_by_username(self, query: str, limit: int = 10) -> list[Account]:
         """
-        Returns the total number of accounts matching the search query.
+        Retrieves accounts for username autocomplete.
+
+        Prefix matches are looked up first on the lower(account_username)
+        text_pattern_ops index, which is a short B-tree range scan. Only
+        when they do not fill the limit, and the query is long enough to
+        produce trigrams, are substring matches fetched through the
+        pg_trgm GIN index, shortest usernames first.
 
         Args:
-            query: The search string to match against username or email.
+            query: The partial username typed by the user.
+            limit: The maximum number of accounts to return. Defaults to 10.
 
         Returns:
-            int: The total count of matching accounts.
-        """
-        like = f"%{query}%"
-        return (
-            self._session.query(AccountModel)
-            .filter(
-                or_(
-                    AccountModel.account_username.ilike(like),
-                    AccountModel.account_email.ilike(like),
+            list[Account]: At most limit matching Account domain entities.
+        """
+        escaped = escape_like(query.lower())
+        lowered_username = func.lower(AccountModel.account_username)
+        rows = (
+            self._query()
+            .filter(lowered_username.like(f"{escaped}%", escape="\\"))
+            .order_by(lowered_username)
+            .limit(limit)
+            .all()
+        )
+        if len(rows) < limit and len(query) >= TRIGRAM_MIN_LENGTH:
+            rows += (
+                self._query()
+                .filter(
+                    AccountModel.account_username.ilike(f"%{escaped}%", escape="\\"),
+                    ~lowered_username.like(f"{escaped}%", escape="\\"),
                 )
+                .order_by(func.length(AccountModel.account_username), lowered_username)
+                .limit(limit - len(rows))
+                .all()
             )
-            .count()
-        )
+        return [self._to_domain(row) for row in rows]
 
     def delete(self, account_id: int) -> None:
         """
@@ -1,11 +1,43 @@
-from sqlalchemy import desc, or_
-from sqlalchemy.orm import Session
+from collections.abc import Callable
+from typing import Any
 
-from src.application.domain.article import Article
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Text,
+    bindparam,
+    cast,
+    delete,
+    desc,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Query, Session, aliased
+
+from src.application.domain.article import Article, ArticleCursor, ArticleSummary, ArticleWithAuthor
+from src.application.domain.page import Page
+from src.application.output_ports.article_renderer_repository import ArticleRendererRepository
 from src.application.output_ports.article_repository import ArticleRepository
 from src.infrastructure.output_adapters.dto.article_record import ArticleRecord
 from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_account_model import AccountModel
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_article_file_model import ArticleFileModel
 from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_article_model import ArticleModel
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_uploaded_file_model import UploadedFileModel
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_page_utils import rows_to_page, table_total
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_query_utils import escape_like
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_row_mappers import (
+    ARTICLE_COLUMNS,
+    ARTICLE_SUMMARY_COLUMNS,
+    article_from_row,
+)
+
+_Author = aliased(AccountModel, name="author")
 
 
 class SqlAlchemyArticleAdapter(ArticleRepository):
@@ -13,44 +45,135 @@ class SqlAlchemyArticleAdapter(ArticleRepository):
     SQLAlchemy-based implementation of the ArticleRepository port.
 
     This adapter manages the persistence and retrieval of Article domain entities
-    using SQLAlchemy ORM and the PostgreSQL database.
+    using SQLAlchemy ORM and the PostgreSQL database. Reads select
+    ARTICLE_COLUMNS and map the rows straight into Article entities. List
+    reads select ARTICLE_SUMMARY_COLUMNS only, so article_content never
+    leaves the database for a list view.
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, approximate_count_threshold: int = 0, validate_rows: bool = False):
         """
         Initializes the adapter with a SQLAlchemy session.
 
         Args:
             session (Session): An active SQLAlchemy database session.
+            approximate_count_threshold (int): Estimated table size from which
+                get_page() reports the planner estimate instead of an exact
+                count. 0 (the default) always counts exactly.
+            validate_rows (bool): When True, every row read is validated
+                through ArticleRecord before being mapped. Meant for debugging.
         """
         self._session = session
+        self._approximate_count_threshold = approximate_count_threshold
+        self._validate_rows = validate_rows
+
+    def _query(self) -> Query:
+        """
+        Starts a query selecting the columns of an Article entity.
 
-    def _to_domain(self, model: ArticleModel) -> Article:
+        Returns:
+            Query: A query returning rows of ARTICLE_COLUMNS.
+        """
+        return self._session.query(*ARTICLE_COLUMNS)
+
+    def _to_domain(self, row: Row[Any]) -> Article:
         """
-        Maps a SQLAlchemy ORM model to a Domain Entity via a DTO.
+        Maps a row starting with ARTICLE_COLUMNS to a Domain Entity.
 
         Args:
-            model (ArticleModel): The database record to convert.
+            row (Row): The database row to convert.
 
         Returns:
             Article: The converted Domain Entity.
         """
-        record = ArticleRecord.model_validate(model)
-        return record.to_domain()
+        if self._validate_rows:
+            return ArticleRecord.model_validate(row).to_domain()
+        return article_from_row(row)
 
-    def get_all_ordered_by_date_desc(self) -> list[Article]:
+    def _summary_query(self) -> Query:
         """
-        Retrieves all articles ordered by publication date (descending).
+        Starts a query selecting the list-view columns of articles and their authors.
 
         Returns:
-            list[Article]: A list of all Article domain entities.
+            Query: A query returning ARTICLE_SUMMARY_COLUMNS followed by the
+            author username and avatar_file_id.
         """
-        models = (
-            self._session.query(ArticleModel)
-            .order_by(desc(ArticleModel.article_published_at))
-            .all()
+        return self._with_author(self._session.query(*ARTICLE_SUMMARY_COLUMNS))
+
+    def _with_author(self, query: Query) -> Query:
+        """
+        Joins the author of each article and selects only the username and
+        avatar columns from accounts.
+
+        Args:
+            query (Query): The query selecting article columns.
+
+        Returns:
+            Query: The query returning the same columns followed by the username and avatar_file_id.
+        """
+        return query.outerjoin(_Author, ArticleModel.article_author_id == _Author.account_id).add_columns(
+            _Author.account_username, _Author.avatar_file_id,
+        )
+
+    def _to_read_model(self, row: Row[Any]) -> ArticleWithAuthor:
+        """
+        Maps a row produced by a query built with _with_author to a Read Model.
+
+        Args:
+            row (Row): ARTICLE_COLUMNS, the username and avatar_file_id, then any extra column.
+
+        Returns:
+            ArticleWithAuthor: The article with its author's name and avatar.
+        """
+        article = self._to_domain(row)
+        return ArticleWithAuthor(
+            article=article,
+            author_name=self._author_name(article.article_author_id, row.account_username),
+            author_avatar_file_id=row.avatar_file_id,
+        )
+
+    def _to_summary(self, row: Row[Any]) -> ArticleSummary:
+        """
+        Maps a row produced by _summary_query to a Read Model.
+
+        Args:
+            row (Row): ARTICLE_SUMMARY_COLUMNS, the username and avatar_file_id, then any extra column.
+
+        Returns:
+            ArticleSummary: The article metadata with its author's name and avatar.
+        """
+        return ArticleSummary(
+            row[0], row[1], row[2], row[3], row[4], row[5],
+            self._author_name(row[1], row[6]),
+            row[7],
         )
-        return [self._to_domain(model) for model in models]
+
+    @staticmethod
+    def _author_name(author_id: int | None, username: str | None) -> str:
+        """
+        Resolves the displayed author name of an article.
+
+        Args:
+            author_id (int | None): The article_author_id of the article.
+            username (str | None): The joined username, None if no account matched.
+
+        Returns:
+            str: The username, "Anonymous" if the author account was deleted,
+            or "Unknown" if it cannot be found.
+        """
+        if author_id is None:
+            return "Anonymous"
+        return username if username is not None else "Unknown"
+
+    def get_all_ordered_by_date_desc(self) -> list[ArticleSummary]:
+        """
+        Retrieves all articles ordered by publication date (descending).
+
+        Returns:
+            list[ArticleSummary]: The summaries of every article.
+        """
+        rows = self._summary_query().order_by(desc(ArticleModel.article_published_at)).all()
+        return [self._to_summary(row) for row in rows]
 
     def get_by_id(self, article_id: int) -> Article | None:
         """
@@ -62,10 +185,29 @@ class SqlAlchemyArticleAdapter(ArticleRepository):
         Returns:
             Article | None: The Article domain entity if found, None otherwise.
         """
-        model = self._session.get(ArticleModel, article_id)
-        if model is None:
+        row = self._query().filter(ArticleModel.article_id == article_id).one_or_none()
+        if row is None:
+            return None
+        return self._to_domain(row)
+
+    def get_with_author(self, article_id: int) -> ArticleWithAuthor | None:
+        """
+        Retrieves a single article and its author's username and avatar in one query.
+
+        Args:
+            article_id (int): The unique identifier of the article.
+
+        Returns:
+            ArticleWithAuthor | None: The Read Model if found, None otherwise.
+        """
+        row = (
+            self._with_author(self._query())
+            .filter(ArticleModel.article_id == article_id)
+            .one_or_none()
+        )
+        if row is None:
             return None
-        return self._to_domain(model)
+        return self._to_read_model(row)
 
     def save(self, article: Article) -> None:
         """
@@ -76,6 +218,7 @@ class SqlAlchemyArticleAdapter(ArticleRepository):
         Args:
             article (Article): The Article domain entity to persist.
         """
+        search_values = self._search_values(article)
         if article.article_id and article.article_id > 0:
             self._session.query(ArticleModel).filter_by(
                 article_id=article.article_id,
@@ -84,6 +227,9 @@ class SqlAlchemyArticleAdapter(ArticleRepository):
                 ArticleModel.article_description: article.article_description,
                 ArticleModel.article_content: article.article_content,
                 ArticleModel.article_edited_at: article.article_edited_at,
+                ArticleModel.article_content_html: article.article_content_html,
+                ArticleModel.article_renderer_version: article.article_renderer_version,
+                **search_values,
             })
             self._session.commit()
             return
@@ -94,10 +240,29 @@ class SqlAlchemyArticleAdapter(ArticleRepository):
         model.article_description = article.article_description
         model.article_content = article.article_content
         model.article_edited_at = article.article_edited_at
+        model.article_content_html = article.article_content_html
+        model.article_renderer_version = article.article_renderer_version
+        for column, value in search_values.items():
+            setattr(model, column.key, value)
         self._session.add(model)
         self._session.commit()
         article.article_id = model.article_id
 
+    def _search_values(self, article: Article) -> dict:
+        """
+        Returns the extra column values written alongside an article on save.
+
+        This adapter searches with ILIKE and maintains no search columns;
+        subclasses backed by a search index override this hook.
+
+        Args:
+            article (Article): The Article domain entity being persisted.
+
+        Returns:
+            dict: A mapping of ArticleModel columns to values or SQL expressions.
+        """
+        return {}
+
     def delete(self, article: Article) -> None:
         """
         Deletes a given article from the database.
@@ -110,29 +275,150 @@ class SqlAlchemyArticleAdapter(ArticleRepository):
         ).delete()
         self._session.commit()
 
-    def get_paginated(self, page: int, per_page: int) -> list[Article]:
+    def replace_file_references(self, article_id: int, file_ids: set[str]) -> set[str]:
         """
-        Retrieves a paginated list of articles.
+        Replaces the article_files rows of an article.
+
+        The rows of the files no longer referenced are deleted, the new ones
+        inserted for the files that exist, and the deleted rows are checked
+        against the remaining references, all in set-based statements
+        committed together.
 
         Args:
-            page (int): The requested page number (1-indexed).
-            per_page (int): The number of articles to return per page.
+            article_id (int): The unique identifier of the article.
+            file_ids (set[str]): The UUIDs of the files its content references.
 
         Returns:
-            list[Article]: A list of Article domain entities for the specified page.
+            set[str]: The UUIDs of the files the article stopped referencing
+                that no other article, and no account avatar, references.
         """
-        offset = (page - 1) * per_page
-        models = (
-            self._session.query(ArticleModel)
-            .order_by(desc(ArticleModel.article_published_at))
-            .offset(offset)
-            .limit(per_page)
-            .all()
+        removed = self._session.scalars(
+            delete(ArticleFileModel)
+            .where(ArticleFileModel.article_id == article_id, ArticleFileModel.file_id.not_in(file_ids))
+            .returning(ArticleFileModel.file_id)
+        ).all()
+        if file_ids:
+            self._session.execute(
+                insert(ArticleFileModel)
+                .from_select(
+                    [ArticleFileModel.article_id, ArticleFileModel.file_id],
+                    select(literal(article_id), UploadedFileModel.file_id).where(UploadedFileModel.file_id.in_(file_ids)),
+                )
+                .on_conflict_do_nothing()
+            )
+        orphaned: set[str] = set()
+        if removed:
+            orphaned = {
+                str(file_id)
+                for file_id in self._session.scalars(
+                    select(UploadedFileModel.file_id).where(
+                        UploadedFileModel.file_id.in_(removed),
+                        ~exists().where(ArticleFileModel.file_id == UploadedFileModel.file_id),
+                        ~exists().where(AccountModel.avatar_file_id == cast(UploadedFileModel.file_id, Text)),
+                    )
+                )
+            }
+        self._session.commit()
+        return orphaned
+
+    def render_stale(
+        self,
+        renderer: ArticleRendererRepository,
+        batch_size: int = 100,
+        on_batch: Callable[[int], None] | None = None,
+    ) -> int:
+        """
+        Renders again the articles whose stored HTML is missing or was
+        produced by another version of the renderer.
+
+        Articles are read batch_size at a time, in order of ID, rendered
+        together through renderer.render_all() and written back in one
+        statement per batch. An article saved in the meantime already holds
+        HTML of the current version and is left untouched.
+
+        Args:
+            renderer (ArticleRendererRepository): The renderer whose version
+                the stored HTML must match.
+            batch_size (int): Number of articles rendered and committed at once.
+            on_batch (Callable[[int], None] | None): Called with the number
+                of articles rendered after each batch.
+
+        Returns:
+            int: The number of articles rendered.
+        """
+        version = renderer.version
+        stale = ArticleModel.article_renderer_version.is_distinct_from(version)
+        write = (
+            update(ArticleModel.__table__)
+            .where(ArticleModel.article_id == bindparam("b_article_id"), stale)
+            .values(article_content_html=bindparam("b_html"), article_renderer_version=version)
         )
+        rendered = 0
+        last_id = 0
+        while True:
+            rows = (
+                self._session.query(ArticleModel.article_id, ArticleModel.article_content)
+                .filter(stale, ArticleModel.article_id > last_id)
+                .order_by(ArticleModel.article_id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                self._session.rollback()
+                return rendered
+            htmls = renderer.render_all([content for _, content in rows])
+            self._session.execute(write, [
+                {"b_article_id": article_id, "b_html": html}
+                for (article_id, _), html in zip(rows, htmls, strict=True)
+            ])
+            self._session.commit()
+            rendered += len(rows)
+            last_id = rows[-1][0]
+            if on_batch is not None:
+                on_batch(len(rows))
+
+    def _after(self, query: Query, cursor: ArticleCursor | None) -> Query:
+        """
+        Restricts and orders a query to the articles following a keyset cursor.
+
+        Args:
+            query (Query): The query selecting article columns.
+            cursor (ArticleCursor | None): Position of the last article already shown.
+
+        Returns:
+            Query: The query filtered past the cursor and ordered newest first.
+        """
+        if cursor is not None:
+            query = query.filter(
+                tuple_(ArticleModel.article_published_at, ArticleModel.article_id)
+                < tuple_(cursor.published_at, cursor.article_id)
+            )
+        return query.order_by(desc(ArticleModel.article_published_at), desc(ArticleModel.article_id))
+
+    def get_page(self, page: int, per_page: int, cursor: ArticleCursor | None = None) -> Page[ArticleSummary]:
+        """
+        Retrieves a page of articles, their authors and the total article count in one query.
+
+        The total is selected as an uncorrelated scalar subquery next to the
+        page rows (see table_total), so the page is still read from the
+        (article_published_at, article_id) index up to the LIMIT, and each
+        author is then found by primary key.
 
-        return [self._to_domain(model) for model in models]
+        Args:
+            page (int): The page number (1-indexed), used when cursor is None.
+            per_page (int): The number of items per page.
+            cursor (ArticleCursor | None): Position of the last article already shown.
+
+        Returns:
+            Page[ArticleSummary]: The Read Models of the page and the total article count.
+        """
+        query = self._summary_query().add_columns(table_total(ArticleModel, self._approximate_count_threshold))
+        query = self._after(query, cursor).limit(per_page)
+        if cursor is None:
+            query = query.offset((page - 1) * per_page)
+        return rows_to_page(query.all(), self._to_summary, self._count_all)
 
-    def count_all(self) -> int:
+    def _count_all(self) -> int:
         """
         Retrieves the total number of articles.
 
@@ -141,44 +427,42 @@ class SqlAlchemyArticleAdapter(ArticleRepository):
         """
         return self._session.query(ArticleModel).count()
 
-    def search(self, query: str, page: int, per_page: int) -> list[Article]:
+    def _search_query(self, query: str) -> Query:
         """
-        Searches articles by title, description, or author username using a
-        case-insensitive ILIKE match on the database.
+        Builds the query selecting the articles matching a search string.
+
+        Matches title, description, or author username with a
+        case-insensitive ILIKE, with the LIKE wildcards of the query
+        matched literally.
 
         Args:
-            query: The search term to match against article titles,
-                descriptions, or author usernames.
-            page: The page number (1-indexed).
-            per_page: The number of items per page.
+            query: The search term.
 
         Returns:
-            A list of Article domain entities matching the search query
-            for the given page, ordered by publication date descending.
+            Query: The filtered _summary_query.
         """
-        like = f"%{query}%"
-        offset = (page - 1) * per_page
-        models = (
-            self._session.query(ArticleModel)
-            .outerjoin(
-                AccountModel,
-                ArticleModel.article_author_id == AccountModel.account_id,
-            )
-            .filter(
-                or_(
-                    ArticleModel.article_title.ilike(like),
-                    ArticleModel.article_description.ilike(like),
-                    AccountModel.account_username.ilike(like),
-                )
+        like = f"%{escape_like(query)}%"
+        return self._summary_query().filter(
+            or_(
+                ArticleModel.article_title.ilike(like, escape="\\"),
+                ArticleModel.article_description.ilike(like, escape="\\"),
+                _Author.account_username.ilike(like, escape="\\"),
             )
-            .order_by(desc(ArticleModel.article_published_at))
-            .offset(offset)
-            .limit(per_page)
-            .all()
         )
-        return [self._to_domain(model) for model in models]
 
-    def count_search(self, query: str) -> int:
+    def _search_order(self, query: str) -> list[ColumnElement]:
+        """
+        Returns the ORDER BY clauses of search results.
+
+        Args:
+            query: The search term.
+
+        Returns:
+            list[ColumnElement]: Publication date then ID, descending.
+        """
+        return [desc(ArticleModel.article_published_at), desc(ArticleModel.article_id)]
+
+    def _count_search(self, query: str) -> int:
         """
         Counts articles matching a search query across title, description,
         or author username.
@@ -190,19 +474,31 @@ class SqlAlchemyArticleAdapter(ArticleRepository):
         Returns:
             The total number of articles matching the query.
         """
-        like = f"%{query}%"
-        return (
-            self._session.query(ArticleModel)
-            .outerjoin(
-                AccountModel,
-                ArticleModel.article_author_id == AccountModel.account_id,
-            )
-            .filter(
-                or_(
-                    ArticleModel.article_title.ilike(like),
-                    ArticleModel.article_description.ilike(like),
-                    AccountModel.account_username.ilike(like),
-                )
-            )
-            .count()
+        return self._search_query(query).count()
+
+    def search_page(self, query: str, page: int, per_page: int) -> Page[ArticleSummary]:
+        """
+        Searches articles and returns the page with the authors and the
+        total number of matches in one query.
+
+        The total is a COUNT(*) OVER () window: every match has to be
+        found and sorted for the ORDER BY anyway, so counting them in the
+        same pass is free.
+
+        Args:
+            query: The search term.
+            page: The page number (1-indexed).
+            per_page: The number of items per page.
+
+        Returns:
+            Page[ArticleSummary]: The matching Read Models of the page and the total number of matches.
+        """
+        rows = (
+            self._search_query(query)
+            .add_columns(func.count().over())
+            .order_by(*self._search_order(query))
+            .offset((page - 1) * per_page)
+            .limit(per_page)
+            .all()
         )
+        return rows_to_page(rows, self._to_summary, lambda: self._count_search(query))
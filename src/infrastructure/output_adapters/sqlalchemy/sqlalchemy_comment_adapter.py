@@ -1,9 +1,14 @@
-from sqlalchemy.orm import Session
+from typing import Any
 
-from src.application.domain.comment import Comment
+from sqlalchemy import Row, literal, select
+from sqlalchemy.orm import Query, Session, aliased
+
+from src.application.domain.comment import Comment, CommentWithAuthor
 from src.application.output_ports.comment_repository import CommentRepository
 from src.infrastructure.output_adapters.dto.comment_record import CommentRecord
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_account_model import AccountModel
 from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_comment_model import CommentModel
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_row_mappers import COMMENT_COLUMNS, comment_from_row
 
 
 class SqlAlchemyCommentAdapter(CommentRepository):
@@ -11,30 +16,45 @@ class SqlAlchemyCommentAdapter(CommentRepository):
     SQLAlchemy-based implementation of the CommentRepository port.
 
     This adapter manages the persistence and retrieval of Comment domain entities
-    using SQLAlchemy ORM and the database.
+    using SQLAlchemy ORM and the database. Reads select COMMENT_COLUMNS and
+    map the rows straight into Comment entities.
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, validate_rows: bool = False):
         """
         Initializes the adapter with a SQLAlchemy session.
 
         Args:
             session (Session): An active SQLAlchemy database session.
+            validate_rows (bool): When True, every row read is validated
+                through CommentRecord before being mapped. Meant for debugging;
+                off by default since it dominates the cost of large threads.
         """
         self._session = session
+        self._validate_rows = validate_rows
+
+    def _query(self) -> Query:
+        """
+        Starts a query selecting the columns of a Comment entity.
+
+        Returns:
+            Query: A query returning rows of COMMENT_COLUMNS.
+        """
+        return self._session.query(*COMMENT_COLUMNS)
 
-    def _to_domain(self, model: CommentModel) -> Comment:
+    def _to_domain(self, row: Row[Any]) -> Comment:
         """
-        Maps a SQLAlchemy ORM model to a Domain Entity via a DTO.
+        Maps a row starting with COMMENT_COLUMNS to a Domain Entity.
 
         Args:
-            model (CommentModel): The database record to convert.
+            row (Row): The database row to convert.
 
         Returns:
             Comment: The converted Domain Entity.
         """
-        record = CommentRecord.model_validate(model)
-        return record.to_domain()
+        if self._validate_rows:
+            return CommentRecord.model_validate(row).to_domain()
+        return comment_from_row(row)
 
     def save(self, comment: Comment) -> None:
         """
@@ -56,6 +76,7 @@ class SqlAlchemyCommentAdapter(CommentRepository):
                 CommentModel.is_deleted: comment.is_deleted,
                 CommentModel.deleted_at: comment.deleted_at,
                 CommentModel.edited_at: comment.edited_at,
+                CommentModel.comment_depth: comment.comment_depth,
             })
             self._session.commit()
             return
@@ -69,6 +90,7 @@ class SqlAlchemyCommentAdapter(CommentRepository):
         model.is_deleted = comment.is_deleted
         model.deleted_at = comment.deleted_at
         model.edited_at = comment.edited_at
+        model.comment_depth = comment.comment_depth
         self._session.commit()
 
     def get_by_id(self, comment_id: int) -> Comment | None:
@@ -81,10 +103,10 @@ class SqlAlchemyCommentAdapter(CommentRepository):
         Returns:
             Comment | None: The Comment domain entity if found, None otherwise.
         """
-        model = self._session.get(CommentModel, comment_id)
-        if model is None:
+        row = self._query().filter(CommentModel.comment_id == comment_id).one_or_none()
+        if row is None:
             return None
-        return self._to_domain(model)
+        return self._to_domain(row)
 
     def get_all_by_article_id(self, article_id: int) -> list[Comment]:
         """
@@ -94,10 +116,43 @@ class SqlAlchemyCommentAdapter(CommentRepository):
             article_id (int): The unique identifier of the article.
 
         Returns:
-            list[Comment]: A list of Comment domain entities.
+            list[Comment]: A list of Comment domain entities, oldest first.
+        """
+        rows = (
+            self._query()
+            .filter(CommentModel.comment_article_id == article_id)
+            .order_by(CommentModel.comment_posted_at)
+            .all()
+        )
+        return [self._to_domain(row) for row in rows]
+
+    def get_all_with_authors_by_article_id(self, article_id: int) -> list[CommentWithAuthor]:
         """
-        models = self._session.query(CommentModel).filter_by(comment_article_id=article_id).all()
-        return [self._to_domain(model) for model in models]
+        Retrieves all comments of an article with their authors in a single
+        joined SELECT, reading only the username and avatar columns of accounts.
+
+        Args:
+            article_id (int): The unique identifier of the article.
+
+        Returns:
+            list[CommentWithAuthor]: The Read Models of every comment of the article, oldest first.
+        """
+        rows = (
+            self._query()
+            .add_columns(AccountModel.account_username, AccountModel.avatar_file_id)
+            .outerjoin(AccountModel, CommentModel.comment_written_account_id == AccountModel.account_id)
+            .filter(CommentModel.comment_article_id == article_id)
+            .order_by(CommentModel.comment_posted_at)
+            .all()
+        )
+        return [
+            CommentWithAuthor(
+                comment=self._to_domain(row),
+                author_name=row.account_username if row.account_username is not None else "Anonymous",
+                author_avatar_file_id=row.avatar_file_id,
+            )
+            for row in rows
+        ]
 
     def get_by_reply_to(self, comment_id: int) -> list[Comment]:
         """
@@ -109,10 +164,37 @@ class SqlAlchemyCommentAdapter(CommentRepository):
         Returns:
             list[Comment]: A list of direct child Comment domain entities.
         """
-        models = self._session.query(CommentModel).filter_by(
-            comment_reply_to=comment_id,
-        ).all()
-        return [self._to_domain(model) for model in models]
+        rows = self._query().filter(CommentModel.comment_reply_to == comment_id).all()
+        return [self._to_domain(row) for row in rows]
+
+    def get_ancestors(self, comment_id: int) -> list[Comment]:
+        """
+        Retrieves the chain of comments a comment replies to with a single
+        recursive CTE walking comment_reply_to up to the top-level comment.
+
+        Args:
+            comment_id (int): ID of the comment whose ancestors are requested.
+
+        Returns:
+            list[Comment]: The ancestors, nearest parent first.
+        """
+        chain = (
+            select(CommentModel.comment_reply_to.label("ancestor_id"), literal(1).label("distance"))
+            .where(CommentModel.comment_id == comment_id)
+            .cte("comment_ancestors", recursive=True)
+        )
+        parent = aliased(CommentModel)
+        chain = chain.union_all(
+            select(parent.comment_reply_to, chain.c.distance + 1)
+            .where(parent.comment_id == chain.c.ancestor_id)
+        )
+        rows = (
+            self._query()
+            .join(chain, CommentModel.comment_id == chain.c.ancestor_id)
+            .order_by(chain.c.distance)
+            .all()
+        )
+        return [self._to_domain(row) for row in rows]
 
     def get_by_account_id(self, account_id: int) -> list[Comment]:
         """
@@ -124,10 +206,8 @@ class SqlAlchemyCommentAdapter(CommentRepository):
         Returns:
             list[Comment]: A list of Comment domain entities for this author.
         """
-        models = self._session.query(CommentModel).filter_by(
-            comment_written_account_id=account_id,
-        ).all()
-        return [self._to_domain(model) for model in models]
+        rows = self._query().filter(CommentModel.comment_written_account_id == account_id).all()
+        return [self._to_domain(row) for row in rows]
 
     def delete(self, comment_id: int) -> None:
         """
@@ -1,17 +1,37 @@
-from datetime import datetime
-from typing import cast
+import hashlib
+from collections import Counter
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from io import BytesIO
+from typing import BinaryIO, cast
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Integer, String, Text, column, delete, exists, func, select, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, undefer
 
 from src.application.domain.file_record import FileRecord
+from src.application.domain.image_variant import ImageVariant
 from src.application.output_ports.file_storage_repository import FileStorageRepository
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_account_model import AccountModel
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_article_file_model import ArticleFileModel
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_file_blob_model import FileBlobModel
 from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_uploaded_file_model import UploadedFileModel
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_uploaded_file_variant_model import (
+    UploadedFileVariantModel,
+)
 
 
 class SqlAlchemyFileStorageAdapter(FileStorageRepository):
     """SQLAlchemy-based implementation of FileStorageRepository.
 
-    Persists uploaded files as BYTEA in the uploaded_files table.
+    Persists the metadata of uploaded files in the uploaded_files table, and
+    their contents as BYTEA in the file_blobs table, once per SHA-256 digest:
+    uploading a content already stored adds a reference to its blob, and the
+    blob is deleted with its last reference. Image renditions are stored in
+    the uploaded_file_variants table.
+
+    Rows uploaded before de-duplication keep their own file_data until
+    deduplicate_database_blobs has moved it to file_blobs.
     Maps directly between UploadedFileModel (ORM) and FileRecord (domain).
     No DTO needed — FileRecord has no enums or complex conversions.
     """
@@ -27,24 +47,101 @@ class SqlAlchemyFileStorageAdapter(FileStorageRepository):
     def save(self, file_record: FileRecord) -> FileRecord:
         """Persist a file record to the database.
 
+        The content is stored only if no blob has its digest yet; otherwise
+        the existing blob gains a reference, and a streamed content is not
+        even read.
+
         Args:
-            file_record: Domain entity to persist.
+            file_record: Domain entity to persist. Its content_sha256 is
+                computed when it is not set.
 
         Returns:
-            FileRecord with assigned ID and timestamp.
+            FileRecord with assigned ID, timestamp and content digest.
         """
+        if file_record.content_sha256 is None:
+            file_record.content_sha256 = hashlib.sha256(file_record.data).hexdigest()
+        self._acquire_blob(file_record.content_sha256, self._open_content(file_record))
         model = UploadedFileModel(
             file_id=file_record.file_id,
             original_filename=file_record.original_filename,
             mime_type=file_record.mime_type,
             file_size=file_record.size,
-            file_data=file_record.data,
+            content_sha256=file_record.content_sha256,
+            image_width=file_record.image_width,
             created_at=file_record.created_at,
         )
         self._session.add(model)
         self._session.commit()
         return file_record
 
+    @staticmethod
+    def _open_content(file_record: FileRecord) -> BinaryIO:
+        """Return a stream over the content of a record being saved, from its start."""
+        if file_record.stream is None:
+            return BytesIO(file_record.data)
+        file_record.stream.seek(0)
+        return file_record.stream
+
+    def _acquire_blob(self, digest: str, content: BinaryIO) -> bool:
+        """Add a reference to the blob of a content, storing it if it is new.
+
+        The reference count is incremented first, so that the content is
+        neither sent to the database nor written when it is already stored.
+        The blob row stays locked until the transaction ends, which orders
+        this call after, or before, a concurrent release of the same blob.
+
+        Args:
+            digest: Hex SHA-256 digest of the content.
+            content: Stream over the content, read only if the blob is new.
+
+        Returns:
+            bool: Whether the blob keeps its content as BYTEA.
+        """
+        in_database = self._session.execute(
+            update(FileBlobModel)
+            .where(FileBlobModel.content_sha256 == digest)
+            .values(ref_count=FileBlobModel.ref_count + 1)
+            .returning(FileBlobModel.file_data.isnot(None))
+        ).scalar()
+        if in_database is not None:
+            return in_database
+        statement = insert(FileBlobModel).values(
+            content_sha256=digest, file_data=self._store_content(digest, content), ref_count=1,
+        ).on_conflict_do_update(
+            index_elements=[FileBlobModel.content_sha256],
+            set_={"ref_count": FileBlobModel.ref_count + 1},
+        ).returning(FileBlobModel.file_data.isnot(None))
+        return self._session.execute(statement).scalar_one()
+
+    def _store_content(self, digest: str, content: BinaryIO) -> bytes | None:
+        """Return the file_data of a new blob: here, the content itself, read whole for the BYTEA parameter."""
+        return content.read()
+
+    def _release_blobs(self, references: Counter[str]) -> set[str]:
+        """Remove references to blobs, and delete the blobs left without any.
+
+        Args:
+            references: Number of references removed, by blob digest.
+
+        Returns:
+            set[str]: The digests of the deleted blobs.
+        """
+        if not references:
+            return set()
+        released = values(
+            column("content_sha256", String), column("count", Integer), name="released",
+        ).data(sorted(references.items()))
+        remaining = self._session.execute(
+            update(FileBlobModel)
+            .where(FileBlobModel.content_sha256 == released.c.content_sha256)
+            .values(ref_count=FileBlobModel.ref_count - released.c.count)
+            .returning(FileBlobModel.content_sha256, FileBlobModel.ref_count)
+        ).all()
+        freed = {digest for digest, ref_count in remaining if ref_count <= 0}
+        if freed:
+            self._session.execute(delete(FileBlobModel).where(FileBlobModel.content_sha256.in_(freed)))
+        return freed
+
     def get(self, file_id: str) -> FileRecord | None:
         """Retrieve a file record by UUID.
 
@@ -54,28 +151,322 @@ class SqlAlchemyFileStorageAdapter(FileStorageRepository):
         Returns:
             FileRecord if found, None otherwise.
         """
+        row = (
+            self._session.query(UploadedFileModel, func.coalesce(UploadedFileModel.file_data, FileBlobModel.file_data))
+            .outerjoin(FileBlobModel, FileBlobModel.content_sha256 == UploadedFileModel.content_sha256)
+            .filter(UploadedFileModel.file_id == file_id)
+            .one_or_none()
+        )
+        if row is None:
+            return None
+        model, data = row
+        return self._to_domain(model, data=data)
+
+    def get_metadata(self, file_id: str) -> FileRecord | None:
+        """Retrieve a file record by UUID without loading file_data.
+
+        Args:
+            file_id: UUID string.
+
+        Returns:
+            FileRecord without data if found, None otherwise.
+        """
         model = self._session.get(UploadedFileModel, file_id)
         if model is None:
             return None
+        return self._to_domain(model)
+
+    @staticmethod
+    def _to_domain(model: UploadedFileModel, data: bytes | None = None, content_path: str | None = None) -> FileRecord:
+        """Map an uploaded_files model to a FileRecord.
+
+        Args:
+            model: The ORM model, whose file_data is not read.
+            data: The content, when it has been loaded.
+            content_path: The path of the content, when it is kept on disk.
+
+        Returns:
+            FileRecord: The domain entity.
+        """
         return FileRecord(
             file_id=str(cast(str, model.file_id)),
             original_filename=cast(str, model.original_filename),
             mime_type=cast(str, model.mime_type),
             size=cast(int, model.file_size),
-            data=cast(bytes, model.file_data),
+            data=data,
             created_at=cast(datetime, model.created_at),
+            content_path=content_path,
+            content_sha256=cast(str | None, model.content_sha256),
+            image_width=cast(int | None, model.image_width),
+        )
+
+    def get_image_widths(self, file_ids: set[str]) -> dict[str, int]:
+        """Retrieve the recorded widths of several images, in one query.
+
+        Args:
+            file_ids: UUID strings.
+
+        Returns:
+            dict[str, int]: The image_width of each measured file, by UUID.
+        """
+        if not file_ids:
+            return {}
+        rows = self._session.execute(
+            select(UploadedFileModel.file_id, UploadedFileModel.image_width)
+            .where(UploadedFileModel.file_id.in_(file_ids), UploadedFileModel.image_width.isnot(None))
+        ).all()
+        return {str(file_id): width for file_id, width in rows}
+
+    def get_variant(self, file_id: str, variant: ImageVariant) -> FileRecord | None:
+        """Retrieve a stored rendition of an image.
+
+        Args:
+            file_id: UUID string of the original file.
+            variant: Size and encoding of the rendition.
+
+        Returns:
+            FileRecord of the rendition if stored, None otherwise.
+        """
+        model = self._session.get(
+            UploadedFileVariantModel,
+            (file_id, variant.width, variant.height, variant.format),
+            options=[undefer(UploadedFileVariantModel.file_data)],
+        )
+        if model is None:
+            return None
+        return self._variant_to_domain(model, variant, data=cast(bytes, model.file_data))
+
+    def save_variant(self, file_id: str, variant: ImageVariant, file_record: FileRecord) -> FileRecord:
+        """Persist a rendition of an image as BYTEA.
+
+        Args:
+            file_id: UUID string of the original file.
+            variant: Size and encoding of the rendition.
+            file_record: The rendition to persist.
+
+        Returns:
+            FileRecord with its content digest assigned.
+        """
+        file_record.content_sha256 = hashlib.sha256(file_record.data).hexdigest()
+        self._insert_variant(file_id, variant, file_record, file_data=file_record.data)
+        return file_record
+
+    def _insert_variant(self, file_id: str, variant: ImageVariant, file_record: FileRecord, file_data: bytes | None) -> None:
+        """Insert a rendition row, unless a concurrent request stored it first."""
+        statement = insert(UploadedFileVariantModel).values(
+            file_id=file_id,
+            width=variant.width,
+            height=variant.height,
+            format=variant.format,
+            mime_type=file_record.mime_type,
+            file_size=file_record.size,
+            file_data=file_data,
+            content_sha256=file_record.content_sha256,
+            created_at=file_record.created_at,
+        ).on_conflict_do_nothing()
+        self._session.execute(statement)
+        self._session.commit()
+
+    @staticmethod
+    def _variant_to_domain(
+        model: UploadedFileVariantModel, variant: ImageVariant, data: bytes | None = None, content_path: str | None = None,
+    ) -> FileRecord:
+        """Map an uploaded_file_variants model to a FileRecord named after its variant."""
+        return FileRecord(
+            file_id=str(cast(str, model.file_id)),
+            original_filename=variant.filename,
+            mime_type=cast(str, model.mime_type),
+            size=cast(int, model.file_size),
+            data=data,
+            created_at=cast(datetime, model.created_at),
+            content_path=content_path,
+            content_sha256=cast(str, model.content_sha256),
         )
 
     def delete(self, file_id: str) -> None:
         """Delete a file record by UUID.
 
-        Idempotent — does nothing if the file does not exist.
+        Idempotent — does nothing if the file does not exist. The row is
+        deleted without loading file_data, and its renditions cascade. Its
+        blob is deleted only if no other file references it.
 
         Args:
             file_id: UUID string.
         """
-        model = self._session.get(UploadedFileModel, file_id)
-        if model is None:
-            return
-        self._session.delete(model)
+        self.delete_many({file_id})
+
+    def delete_many(self, file_ids: set[str]) -> None:
+        """Delete several file records by UUID, in one statement.
+
+        As with delete, the blobs are deleted along with their last reference.
+
+        Args:
+            file_ids: UUID strings.
+        """
+        self._delete_file_rows(file_ids)
         self._session.commit()
+
+    def _delete_file_rows(self, file_ids: set[str]) -> set[str]:
+        """Delete uploaded_files rows and release their blobs, without committing.
+
+        Returns:
+            set[str]: The digests of the blobs deleted with their last reference.
+        """
+        if not file_ids:
+            return set()
+        rows = self._session.execute(
+            delete(UploadedFileModel)
+            .where(UploadedFileModel.file_id.in_(file_ids))
+            .returning(UploadedFileModel.content_sha256, UploadedFileModel.file_data.is_(None))
+            .execution_options(synchronize_session=False)
+        ).all()
+        return self._release_blobs(Counter(digest for digest, counted in rows if counted))
+
+    def deduplicate_database_blobs(self, batch_size: int = 100, on_batch: Callable[[int], None] | None = None) -> int:
+        """Move the contents still held by uploaded_files rows to file_blobs.
+
+        Rows uploaded before de-duplication are processed batch_size at a
+        time: each one gains a reference to the blob of its content, created
+        on its first occurrence, and its own file_data is cleared in the same
+        transaction. Identical contents thus collapse into one blob. At most
+        one batch of contents is held in memory, and an interrupted run
+        resumes where it stopped.
+
+        Args:
+            batch_size: Number of rows read and committed at once.
+            on_batch: Called with the number of rows processed after each batch.
+
+        Returns:
+            int: The number of files processed.
+        """
+        processed = 0
+        while True:
+            rows = (
+                self._session.query(UploadedFileModel.file_id, UploadedFileModel.file_data)
+                .filter(UploadedFileModel.file_data.isnot(None))
+                .order_by(UploadedFileModel.file_id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                return processed
+            for file_id, data in rows:
+                digest = hashlib.sha256(data).hexdigest()
+                self._acquire_blob(digest, BytesIO(data))
+                self._session.query(UploadedFileModel).filter(UploadedFileModel.file_id == file_id).update(
+                    {UploadedFileModel.content_sha256: digest, UploadedFileModel.file_data: None},
+                    synchronize_session=False,
+                )
+            self._session.commit()
+            processed += len(rows)
+            if on_batch is not None:
+                on_batch(len(rows))
+
+    def measure_image_widths(
+        self,
+        get_width: Callable[[BinaryIO], int | None],
+        batch_size: int = 100,
+        on_batch: Callable[[int], None] | None = None,
+    ) -> int:
+        """Record the width of the images uploaded before widths were recorded.
+
+        Files without image_width are read batch_size at a time, in order of
+        UUID, measured with get_width and committed per batch. Files that
+        are not raster images keep a NULL width.
+
+        Args:
+            get_width: Reads the width of an image from a stream over it,
+                e.g. ImageProcessorRepository.get_width.
+            batch_size: Number of files read and committed at once.
+            on_batch: Called with the number of files read after each batch.
+
+        Returns:
+            int: The number of files given a width.
+        """
+        unmeasured = (
+            select(UploadedFileModel.file_id)
+            .where(UploadedFileModel.image_width.is_(None))
+            .order_by(UploadedFileModel.file_id)
+            .limit(batch_size)
+        )
+        measured = 0
+        last_id = None
+        while True:
+            statement = unmeasured if last_id is None else unmeasured.where(UploadedFileModel.file_id > last_id)
+            file_ids = self._session.execute(statement).scalars().all()
+            if not file_ids:
+                self._session.rollback()
+                return measured
+            for file_id in file_ids:
+                file_record = self.get(str(file_id))
+                width = get_width(BytesIO(file_record.data)) if file_record is not None else None
+                if width is not None:
+                    self._session.query(UploadedFileModel).filter(UploadedFileModel.file_id == file_id).update(
+                        {UploadedFileModel.image_width: width}, synchronize_session=False,
+                    )
+                    measured += 1
+            self._session.commit()
+            last_id = file_ids[-1]
+            if on_batch is not None:
+                on_batch(len(file_ids))
+
+    def collect_orphans(
+        self,
+        grace_period: timedelta,
+        batch_size: int = 100,
+        dry_run: bool = False,
+        on_batch: Callable[[int, int], None] | None = None,
+    ) -> tuple[int, int]:
+        """Delete the uploaded files that nothing references anymore.
+
+        A file is an orphan when no article_files row and no account avatar
+        points to it, and it was uploaded more than grace_period ago, which
+        leaves the editor time to save the article an image was uploaded
+        for. Orphans are found and deleted batch_size at a time, in order of
+        UUID, and each batch is committed before the next one is read.
+
+        The rows of a batch are locked while it is deleted, and rows locked
+        by another transaction are skipped, so that an article saving a
+        reference to one of them either commits first, and the file is no
+        longer an orphan, or waits and fails on the foreign key instead of
+        losing its reference to the ON DELETE CASCADE.
+
+        Args:
+            grace_period: Minimum age of the files to delete, measured
+                against the database clock.
+            batch_size: Number of files deleted and committed at once.
+            dry_run: Only count the orphans, without deleting them.
+            on_batch: Called with the number of files and their total size
+                in bytes after each batch.
+
+        Returns:
+            tuple[int, int]: The number of orphans and their total size in bytes.
+        """
+        orphans = (
+            select(UploadedFileModel.file_id, UploadedFileModel.file_size)
+            .where(
+                UploadedFileModel.created_at < func.now() - grace_period,
+                ~exists().where(ArticleFileModel.file_id == UploadedFileModel.file_id),
+                ~exists().where(AccountModel.avatar_file_id == UploadedFileModel.file_id.cast(Text)),
+            )
+            .order_by(UploadedFileModel.file_id)
+            .limit(batch_size)
+        )
+        if not dry_run:
+            orphans = orphans.with_for_update(of=UploadedFileModel, skip_locked=True)
+        count = size = 0
+        last_id = None
+        while True:
+            statement = orphans if last_id is None else orphans.where(UploadedFileModel.file_id > last_id)
+            rows = self._session.execute(statement).all()
+            if not rows:
+                self._session.rollback()
+                return count, size
+            batch_bytes = sum(file_size for _, file_size in rows)
+            if not dry_run:
+                self.delete_many({file_id for file_id, _ in rows})
+            count += len(rows)
+            size += batch_bytes
+            last_id = rows[-1][0]
+            if on_batch is not None:
+                on_batch(len(rows), batch_bytes)
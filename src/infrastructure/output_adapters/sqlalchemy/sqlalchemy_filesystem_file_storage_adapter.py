@@ -0,0 +1,246 @@
+from collections.abc import Callable
+from typing import BinaryIO, cast
+
+from sqlalchemy import and_, inspect, select
+from sqlalchemy.orm import Session
+
+from src.application.domain.file_record import FileRecord
+from src.application.domain.image_variant import ImageVariant
+from src.infrastructure.output_adapters.filesystem.content_addressed_blob_store import ContentAddressedBlobStore
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_file_blob_model import FileBlobModel
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_uploaded_file_model import UploadedFileModel
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_uploaded_file_variant_model import (
+    UploadedFileVariantModel,
+)
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_file_storage_adapter import SqlAlchemyFileStorageAdapter
+
+
+class SqlAlchemyFilesystemFileStorageAdapter(SqlAlchemyFileStorageAdapter):
+    """FileStorageRepository keeping metadata in PostgreSQL and contents on disk.
+
+    The file_blobs and uploaded_file_variants rows hold the SHA-256 digest
+    of the content, whose bytes live in a ContentAddressedBlobStore. As with
+    the BYTEA adapter, files sharing a content share one reference-counted
+    file_blobs row, and so one blob on disk. Records read back carry the blob
+    path in content_path and no data, so the content is served from disk
+    without passing through PostgreSQL or Python.
+
+    Contents still stored as BYTEA are read from the database, so the store
+    can be switched on before migrate_database_blobs has run.
+    """
+
+    def __init__(self, session: Session, blob_store: ContentAddressedBlobStore):
+        """Initialize with SQLAlchemy session and blob store.
+
+        Args:
+            session: Active DB session.
+            blob_store: Store holding the file contents.
+        """
+        super().__init__(session)
+        self._blob_store = blob_store
+
+    def save(self, file_record: FileRecord) -> FileRecord:
+        """Persist the metadata row, copying the content to disk if no blob has its digest yet.
+
+        Args:
+            file_record: Domain entity to persist.
+
+        Returns:
+            FileRecord with its content digest, and its content path when the
+            content is on disk, assigned.
+        """
+        if file_record.content_sha256 is None:
+            file_record.content_sha256 = self._blob_store.digest(file_record.data)
+        in_database = self._acquire_blob(file_record.content_sha256, self._open_content(file_record))
+        model = UploadedFileModel(
+            file_id=file_record.file_id,
+            original_filename=file_record.original_filename,
+            mime_type=file_record.mime_type,
+            file_size=file_record.size,
+            content_sha256=file_record.content_sha256,
+            image_width=file_record.image_width,
+            created_at=file_record.created_at,
+        )
+        self._session.add(model)
+        self._session.commit()
+        if not in_database:
+            file_record.content_path = str(self._blob_store.path_for(file_record.content_sha256))
+        return file_record
+
+    def _store_content(self, digest: str, content: BinaryIO) -> bytes | None:
+        """Copy the content of a new blob to disk, leaving its file_data NULL."""
+        self._blob_store.put_stream(content, digest)
+        return None
+
+    def get(self, file_id: str) -> FileRecord | None:
+        """Retrieve a file record by UUID, without reading a content kept on disk.
+
+        Args:
+            file_id: UUID string.
+
+        Returns:
+            FileRecord pointing to its blob if found, None otherwise.
+        """
+        file_record = self.get_metadata(file_id)
+        if file_record is None or file_record.content_path is not None:
+            return file_record
+        return super().get(file_id)
+
+    def get_metadata(self, file_id: str) -> FileRecord | None:
+        """Retrieve a file record by UUID without loading its content.
+
+        Args:
+            file_id: UUID string.
+
+        Returns:
+            FileRecord without data, pointing to its blob when the content is
+            on disk, if found; None otherwise.
+        """
+        on_disk = and_(UploadedFileModel.file_data.is_(None), FileBlobModel.file_data.is_(None))
+        row = (
+            self._session.query(UploadedFileModel, on_disk)
+            .outerjoin(FileBlobModel, FileBlobModel.content_sha256 == UploadedFileModel.content_sha256)
+            .filter(UploadedFileModel.file_id == file_id)
+            .one_or_none()
+        )
+        if row is None:
+            return None
+        model, on_disk = row
+        if not on_disk:
+            return self._to_domain(model)
+        return self._to_domain(model, content_path=str(self._blob_store.path_for(cast(str, model.content_sha256))))
+
+    def get_variant(self, file_id: str, variant: ImageVariant) -> FileRecord | None:
+        """Retrieve a stored rendition, without reading a content kept on disk.
+
+        Args:
+            file_id: UUID string of the original file.
+            variant: Size and encoding of the rendition.
+
+        Returns:
+            FileRecord of the rendition pointing to its blob if stored, None otherwise.
+        """
+        row = (
+            self._session.query(UploadedFileVariantModel, UploadedFileVariantModel.file_data.is_(None))
+            .filter(
+                UploadedFileVariantModel.file_id == file_id,
+                UploadedFileVariantModel.width == variant.width,
+                UploadedFileVariantModel.height == variant.height,
+                UploadedFileVariantModel.format == variant.format,
+            )
+            .one_or_none()
+        )
+        if row is None:
+            return None
+        model, on_disk = row
+        if not on_disk:
+            return super().get_variant(file_id, variant)
+        path = str(self._blob_store.path_for(cast(str, model.content_sha256)))
+        return self._variant_to_domain(model, variant, content_path=path)
+
+    def save_variant(self, file_id: str, variant: ImageVariant, file_record: FileRecord) -> FileRecord:
+        """Write a rendition to disk, then persist its metadata row.
+
+        Args:
+            file_id: UUID string of the original file.
+            variant: Size and encoding of the rendition.
+            file_record: The rendition to persist.
+
+        Returns:
+            FileRecord with its content path assigned.
+        """
+        digest = self._blob_store.put(file_record.data)
+        file_record.content_sha256 = digest
+        self._insert_variant(file_id, variant, file_record, file_data=None)
+        file_record.content_path = str(self._blob_store.path_for(digest))
+        return file_record
+
+    def delete_many(self, file_ids: set[str]) -> None:
+        """Delete several file records by UUID, and the blobs nothing references anymore.
+
+        The blob of a file is removed from disk along with its last
+        reference, and the blobs of its renditions with them. The blobs are
+        removed before the deletion is committed, while the rows of their
+        digests are still locked, so that a concurrent upload of the same
+        content waits and writes its blob again.
+        UUIDs of files that do not exist are ignored.
+
+        Args:
+            file_ids: UUID strings.
+        """
+        digests = set(
+            self._session.scalars(
+                select(UploadedFileVariantModel.content_sha256).where(
+                    UploadedFileVariantModel.file_id.in_(file_ids), UploadedFileVariantModel.file_data.is_(None),
+                )
+            )
+        )
+        digests |= self._delete_file_rows(file_ids)
+        for digest in digests:
+            if not self._is_referenced(digest):
+                self._blob_store.remove(digest)
+        self._session.commit()
+
+    def _is_referenced(self, digest: str) -> bool:
+        """Return whether a file blob or a rendition row still points to a blob on disk."""
+        return any(
+            self._session.query(
+                self._session.query(model.content_sha256)
+                .filter(model.content_sha256 == digest, model.file_data.is_(None))
+                .exists()
+            ).scalar()
+            for model in (FileBlobModel, UploadedFileVariantModel)
+        )
+
+    def migrate_database_blobs(self, batch_size: int = 100, on_batch: Callable[[int], None] | None = None) -> int:
+        """Move the contents of files and renditions still stored as BYTEA to the blob store.
+
+        The contents still held by uploaded_files rows are de-duplicated
+        first (see deduplicate_database_blobs), their new blobs going straight
+        to disk. The file_blobs and uploaded_file_variants rows are then
+        processed batch_size at a time: each content is written to disk first,
+        then its row is updated with the digest and its file_data cleared,
+        and the batch is committed. At most one batch of contents is held in
+        memory, and an interrupted run resumes where it stopped.
+
+        Args:
+            batch_size: Number of rows read and committed at once.
+            on_batch: Called with the number of rows moved after each batch.
+
+        Returns:
+            int: The number of files, blobs and renditions moved out of the database.
+        """
+        return self.deduplicate_database_blobs(batch_size, on_batch) + sum(
+            self._migrate_table(model, batch_size, on_batch) for model in (FileBlobModel, UploadedFileVariantModel)
+        )
+
+    def _migrate_table(
+        self,
+        model: type[FileBlobModel] | type[UploadedFileVariantModel],
+        batch_size: int,
+        on_batch: Callable[[int], None] | None,
+    ) -> int:
+        """Move the BYTEA contents of one table to the blob store, batch by batch."""
+        key_columns = list(inspect(model).primary_key)
+        moved = 0
+        while True:
+            rows = (
+                self._session.query(*key_columns, model.file_data)
+                .filter(model.file_data.isnot(None))
+                .order_by(*key_columns)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                return moved
+            for *key, data in rows:
+                digest = self._blob_store.put(data)
+                row_filter = [column == value for column, value in zip(key_columns, key, strict=True)]
+                self._session.query(model).filter(*row_filter).update(
+                    {model.content_sha256: digest, model.file_data: None},
+                    synchronize_session=False,
+                )
+            self._session.commit()
+            moved += len(rows)
+            if on_batch is not None:
+                on_batch(len(rows))
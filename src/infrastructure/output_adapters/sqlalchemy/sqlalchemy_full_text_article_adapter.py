@@ -0,0 +1,196 @@
+import json
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import ColumnElement, and_, any_, cast, desc, func, or_, select
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.orm import Query, Session
+
+from src.application.domain.article import Article
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_account_model import AccountModel
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_article_model import ArticleModel
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_article_adapter import SqlAlchemyArticleAdapter
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_query_utils import escape_like
+
+SEARCH_CONFIGS = {"fr": "french", "en": "english"}
+DEFAULT_SEARCH_CONFIG = "french"
+
+
+def extract_plain_text(content: str | None) -> str:
+    """
+    Extracts the plain text of a BlockNote/ProseMirror JSON document.
+
+    Every string stored under a "text" key is collected in document order.
+    Content that is not valid JSON is returned unchanged, matching the
+    raw-text fallback of prosemirror_to_html.
+
+    Args:
+        content: The serialized editor document.
+
+    Returns:
+        str: The space-separated text of the document.
+    """
+    if not content:
+        return ""
+    try:
+        document = json.loads(content)
+    except (json.JSONDecodeError, TypeError):
+        return content
+
+    texts: list[str] = []
+    stack: list[Any] = [document]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            text = node.get("text")
+            if isinstance(text, str):
+                texts.append(text)
+            stack.extend(reversed([value for key, value in node.items() if key != "text"]))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return " ".join(texts)
+
+
+class SqlAlchemyFullTextArticleAdapter(SqlAlchemyArticleAdapter):
+    """
+    ArticleRepository adapter searching through PostgreSQL full-text search.
+
+    Each save writes a weighted tsvector (title A, description B, plain
+    text of the content C) built with the text search configuration of
+    the current locale, and records that configuration on the row.
+    Searches (search_page, inherited) parse the query with
+    websearch_to_tsquery in the configuration recorded on each row, so an
+    article matches and ranks the same whatever the language of the
+    reader. The GIN index on article_search_vector first narrows the rows
+    to those matching the query in any supported configuration.
+    Articles whose author username contains the query still match, as
+    with the ILIKE adapter.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        locale_provider: Callable[[], str | None],
+        approximate_count_threshold: int = 0,
+        validate_rows: bool = False,
+    ):
+        """
+        Initializes the adapter with a SQLAlchemy session and a locale source.
+
+        Args:
+            session (Session): An active SQLAlchemy database session.
+            locale_provider (Callable[[], str | None]): Returns the current
+                locale code ("fr", "en"), used to pick the text search configuration.
+            approximate_count_threshold (int): See SqlAlchemyArticleAdapter.
+            validate_rows (bool): See SqlAlchemyArticleAdapter.
+        """
+        super().__init__(session, approximate_count_threshold, validate_rows)
+        self._locale_provider = locale_provider
+
+    def _search_config(self) -> str:
+        """
+        Resolves the text search configuration for the current locale.
+
+        Returns:
+            str: The PostgreSQL text search configuration name.
+        """
+        return SEARCH_CONFIGS.get(self._locale_provider() or "", DEFAULT_SEARCH_CONFIG)
+
+    def _search_values(self, article: Article) -> dict:
+        """
+        Builds the search configuration and weighted document vector of an article.
+
+        Args:
+            article (Article): The Article domain entity being persisted.
+
+        Returns:
+            dict: The article_search_config and article_search_vector values.
+        """
+        config = self._search_config()
+        regconfig = cast(config, REGCONFIG)
+        vector = (
+            func.setweight(func.to_tsvector(regconfig, article.article_title or ""), "A")
+            .op("||")(func.setweight(func.to_tsvector(regconfig, article.article_description or ""), "B"))
+            .op("||")(func.setweight(func.to_tsvector(regconfig, extract_plain_text(article.article_content)), "C"))
+        )
+        return {
+            ArticleModel.article_search_config: config,
+            ArticleModel.article_search_vector: vector,
+        }
+
+    @staticmethod
+    def _ts_query(query: str) -> ColumnElement:
+        """
+        Parses a user search string in the text search configuration of each row.
+
+        Args:
+            query: The raw search string.
+
+        Returns:
+            ColumnElement: The websearch_to_tsquery expression.
+        """
+        return func.websearch_to_tsquery(ArticleModel.article_search_config, query)
+
+    @staticmethod
+    def _any_config_ts_query(query: str) -> ColumnElement:
+        """
+        Parses a user search string in every supported configuration and ORs the tsqueries.
+
+        Unlike _ts_query, the expression does not depend on the row, so the
+        GIN index on article_search_vector can answer it. Any row matching
+        _ts_query matches it too.
+
+        Args:
+            query: The raw search string.
+
+        Returns:
+            ColumnElement: The combined tsquery expression.
+        """
+        configs = sorted(set(SEARCH_CONFIGS.values()) | {DEFAULT_SEARCH_CONFIG})
+        ts_queries = [func.websearch_to_tsquery(cast(config, REGCONFIG), query) for config in configs]
+        combined = ts_queries[0]
+        for ts_query in ts_queries[1:]:
+            combined = combined.op("||")(ts_query)
+        return combined
+
+    def _search_query(self, query: str) -> Query:
+        """
+        Builds the query selecting articles matching a search string.
+
+        The text condition matches each row in its own configuration,
+        behind a match of the query in every configuration that the GIN
+        index can answer. The author condition compares against an array
+        computed once, so both branches of the OR can be answered from
+        indexes.
+
+        Args:
+            query: The raw search string.
+
+        Returns:
+            Query: The filtered _summary_query.
+        """
+        author_ids = select(AccountModel.account_id).where(
+            AccountModel.account_username.ilike(f"%{escape_like(query)}%", escape="\\"),
+        ).scalar_subquery()
+        return self._summary_query().filter(
+            or_(
+                and_(
+                    ArticleModel.article_search_vector.op("@@")(self._any_config_ts_query(query)),
+                    ArticleModel.article_search_vector.op("@@")(self._ts_query(query)),
+                ),
+                ArticleModel.article_author_id == any_(func.array(author_ids)),
+            )
+        )
+
+    def _search_order(self, query: str) -> list[ColumnElement]:
+        """
+        Orders search results by ts_rank, then publication date and ID.
+
+        Args:
+            query: The raw search string.
+
+        Returns:
+            list[ColumnElement]: The ORDER BY clauses. Author-only matches rank 0.
+        """
+        rank = func.coalesce(func.ts_rank(ArticleModel.article_search_vector, self._ts_query(query)), 0)
+        return [desc(rank), desc(ArticleModel.article_published_at), desc(ArticleModel.article_id)]
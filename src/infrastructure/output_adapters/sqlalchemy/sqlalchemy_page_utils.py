@@ -0,0 +1,64 @@
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from sqlalchemy import BigInteger, ColumnElement, Row, case, cast, column, func, select, table
+from sqlalchemy.dialects.postgresql import REGCLASS
+
+from src.application.domain.page import Page
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_registry import SqlAlchemyModel
+
+_pg_class = table("pg_class", column("oid"), column("reltuples"))
+
+
+def table_total(model: type[SqlAlchemyModel], approximate_count_threshold: int = 0) -> ColumnElement[int]:
+    """Build a scalar expression counting every row of a model's table.
+
+    The expression is meant to be selected next to the page rows, so that
+    the page and the total come back in one round trip. It is uncorrelated,
+    so PostgreSQL evaluates it once per statement and still serves the page
+    itself from an index scan stopping at the LIMIT.
+
+    When approximate_count_threshold is positive and the planner statistics
+    (pg_class.reltuples) estimate at least that many rows, the estimate is
+    returned instead of running COUNT(*) over the whole table.
+
+    Args:
+        model: The mapped model whose table is counted.
+        approximate_count_threshold: Estimated size from which the estimate
+            replaces the exact count. 0 always counts exactly.
+
+    Returns:
+        ColumnElement[int]: The total row count expression.
+    """
+    exact = select(func.count()).select_from(model).scalar_subquery()
+    if approximate_count_threshold <= 0:
+        return exact
+    estimate = (
+        select(cast(_pg_class.c.reltuples, BigInteger))
+        .where(_pg_class.c.oid == cast(model.__tablename__, REGCLASS))
+        .scalar_subquery()
+    )
+    return case((estimate >= approximate_count_threshold, estimate), else_=exact)
+
+
+def rows_to_page[T](
+    rows: Sequence[Row[Any]],
+    to_domain: Callable[[Row[Any]], T],
+    count_fallback: Callable[[], int],
+) -> Page[T]:
+    """Split result rows ending with a total column into a domain Page.
+
+    A page past the end has no rows to carry the total, so count_fallback is
+    called in that case only.
+
+    Args:
+        rows: Result rows whose last element is the total.
+        to_domain: Maps a result row to its domain entity or Read Model.
+        count_fallback: Computes the total when rows is empty.
+
+    Returns:
+        Page[T]: The domain entities and the total.
+    """
+    if not rows:
+        return Page(items=[], total=count_fallback())
+    return Page(items=[to_domain(row) for row in rows], total=int(rows[0][-1]))
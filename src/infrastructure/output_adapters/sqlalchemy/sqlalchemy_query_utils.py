@@ -0,0 +1,13 @@
+def escape_like(value: str) -> str:
+    """
+    Escapes LIKE wildcards so that user input is matched literally.
+
+    The result must be used with escape="\\" on like()/ilike().
+
+    Args:
+        value: The raw user input.
+
+    Returns:
+        str: The input with backslash, percent and underscore escaped.
+    """
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
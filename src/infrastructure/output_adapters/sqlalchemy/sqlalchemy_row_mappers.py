@@ -0,0 +1,99 @@
+from typing import Any
+
+from sqlalchemy import Row
+
+from src.application.domain.account import Account, AccountRole
+from src.application.domain.article import Article
+from src.application.domain.comment import Comment
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_account_model import AccountModel
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_article_model import ArticleModel
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_comment_model import CommentModel
+
+# Explicit column lists selected by the read queries, in the positional
+# order of the domain constructors. Rows made of plain columns skip the ORM
+# identity map and instance state, and are mapped straight into domain
+# entities below. Extra columns (authors, totals) may follow them in a row.
+
+ACCOUNT_COLUMNS = (
+    AccountModel.account_id,
+    AccountModel.account_username,
+    AccountModel.account_password,
+    AccountModel.account_email,
+    AccountModel.account_role,
+    AccountModel.account_created_at,
+    AccountModel.avatar_file_id,
+    AccountModel.is_banned,
+    AccountModel.ban_reason,
+    AccountModel.account_version,
+)
+
+ARTICLE_COLUMNS = (
+    ArticleModel.article_id,
+    ArticleModel.article_author_id,
+    ArticleModel.article_title,
+    ArticleModel.article_content,
+    ArticleModel.article_published_at,
+    ArticleModel.article_description,
+    ArticleModel.article_edited_at,
+    ArticleModel.article_content_html,
+    ArticleModel.article_renderer_version,
+)
+
+# The list-view columns of an article: everything but article_content.
+ARTICLE_SUMMARY_COLUMNS = (
+    ArticleModel.article_id,
+    ArticleModel.article_author_id,
+    ArticleModel.article_title,
+    ArticleModel.article_description,
+    ArticleModel.article_published_at,
+    ArticleModel.article_edited_at,
+)
+
+COMMENT_COLUMNS = (
+    CommentModel.comment_id,
+    CommentModel.comment_article_id,
+    CommentModel.comment_written_account_id,
+    CommentModel.comment_reply_to,
+    CommentModel.comment_content,
+    CommentModel.comment_posted_at,
+    CommentModel.is_deleted,
+    CommentModel.deleted_at,
+    CommentModel.edited_at,
+    CommentModel.comment_depth,
+)
+
+
+def account_from_row(row: Row[Any]) -> Account:
+    """Map a row starting with ACCOUNT_COLUMNS to an Account entity.
+
+    Args:
+        row: A result row of a query selecting ACCOUNT_COLUMNS first.
+
+    Returns:
+        Account: The domain entity, with the role string converted to AccountRole.
+    """
+    return Account(row[0], row[1], row[2], row[3], AccountRole(row[4]), row[5], row[6], row[7], row[8], row[9])
+
+
+def article_from_row(row: Row[Any]) -> Article:
+    """Map a row starting with ARTICLE_COLUMNS to an Article entity.
+
+    Args:
+        row: A result row of a query selecting ARTICLE_COLUMNS first.
+
+    Returns:
+        Article: The domain entity.
+    """
+    return Article(row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8])
+
+
+def comment_from_row(row: Row[Any]) -> Comment:
+    """Map a row starting with COMMENT_COLUMNS to a Comment entity.
+
+    Args:
+        row: A result row of a query selecting COMMENT_COLUMNS first.
+
+    Returns:
+        Comment: The domain entity.
+    """
+    return Comment(row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9])
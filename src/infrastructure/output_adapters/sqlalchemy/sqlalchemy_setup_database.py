@@ -1,24 +1,89 @@
 import os
+import weakref
+from typing import cast
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
 
 from config.env_config import env_config
 
+_fork_safe_engines: weakref.WeakSet[Engine] = weakref.WeakSet()
+
+
+def _discard_inherited_connections() -> None:
+    """Drop the pooled connections a forked child inherited from its parent.
+
+    They are discarded without being closed, so the parent's sockets stay
+    valid, and the child opens its own connections on first use.
+    """
+    for engine in list(_fork_safe_engines):
+        engine.dispose(close=False)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_discard_inherited_connections)
+
+
+def create_database_engine(db_url: str) -> Engine:
+    """Create a pooled SQLAlchemy engine configured from the environment.
+
+    Pool sizing, overflow, pre-ping and recycling are read from EnvConfig.
+
+    Args:
+        db_url: The database connection URL.
+
+    Returns:
+        Engine: The configured SQLAlchemy engine.
+    """
+    engine = create_engine(
+        db_url,
+        pool_size=env_config.db_pool_size,
+        max_overflow=env_config.db_max_overflow,
+        pool_pre_ping=env_config.db_pool_pre_ping,
+        pool_recycle=env_config.db_pool_recycle,
+    )
+    return engine
+
 
 def setup_database(db_session: Session | None = None) -> Session:
-    """Initialize database engine and return a configured SQLAlchemy session.
+    """Initialize database engine and return a request-scoped SQLAlchemy session.
+
+    The returned object is a scoped_session registry: every attribute access
+    (query, get, commit, ...) is forwarded to the session bound to the calling
+    thread, so adapters holding it resolve their session at call time and
+    concurrent requests never share a connection. Call remove_session() when
+    the request ends to return the connection to the pool.
+
+    The engine created here is made fork-safe: a child process created by a
+    pre-forking WSGI server discards the connections inherited from its
+    parent and opens its own. The engine is only weakly referenced for
+    that, so it is released with its session.
 
     Args:
         db_session: Optional pre-existing session for dependency injection
             (used in tests to inject a mock or transaction-bound session).
 
     Returns:
-        Session: A configured SQLAlchemy database session connected to the engine.
+        Session: A session proxy connected to the pooled engine.
     """
     if db_session is None:
         db_url = env_config.test_database_url if os.getenv("FLASK_ENV") == "test" else env_config.database_url
-        engine = create_engine(db_url)
+        engine = create_database_engine(db_url)
+        _fork_safe_engines.add(engine)
         session_factory = sessionmaker(bind=engine)
-        db_session = session_factory()
+        db_session = cast(Session, scoped_session(session_factory))
     return db_session
+
+
+def remove_session(db_session: Session) -> None:
+    """Close the session bound to the current scope and release its connection.
+
+    Any transaction left open by a failed request is rolled back, so it cannot
+    leak into the next request served by the same thread. Plain (non-scoped)
+    sessions are left untouched.
+
+    Args:
+        db_session: The session returned by setup_database().
+    """
+    if isinstance(db_session, scoped_session):
+        db_session.remove()
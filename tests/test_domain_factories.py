@@ -1,7 +1,7 @@
 from datetime import datetime
 
 from src.application.domain.account import Account, AccountRole
-from src.application.domain.article import Article
+from src.application.domain.article import Article, ArticleSummary
 from src.application.domain.comment import Comment
 
 
@@ -53,6 +53,24 @@ def create_test_article(
     )
 
 
+def summarize_test_article(
+    article: Article,
+    author_name: str = "leia",
+    author_avatar_file_id: str | None = None,
+) -> ArticleSummary:
+    """Factory to create the ArticleSummary Read Model of a test Article."""
+    return ArticleSummary(
+        article_id=article.article_id,
+        article_author_id=article.article_author_id,
+        article_title=article.article_title,
+        article_description=article.article_description,
+        article_published_at=article.article_published_at,
+        article_edited_at=article.article_edited_at,
+        author_name=author_name,
+        author_avatar_file_id=author_avatar_file_id,
+    )
+
+
 def create_test_comment(
     comment_id: int = 1,
     comment_article_id: int = 1,
@@ -63,6 +81,7 @@ def create_test_comment(
     is_deleted: bool = False,
     deleted_at: datetime | None = None,
     edited_at: datetime | None = None,
+    comment_depth: int = 0,
 ) -> Comment:
     """Factory to create a test Comment entity with sensible defaults."""
     if comment_posted_at is None:
@@ -78,4 +97,5 @@ def create_test_comment(
         is_deleted=is_deleted,
         deleted_at=deleted_at,
         edited_at=edited_at,
+        comment_depth=comment_depth,
     )
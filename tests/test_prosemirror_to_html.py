@@ -1,6 +1,6 @@
 from markupsafe import Markup
 
-from utils.prosemirror_to_html import prosemirror_to_html
+from utils.prosemirror_to_html import prosemirror_to_html, uploaded_image_ids
 
 
 class TestProsemirrorToHtml:
@@ -189,6 +189,60 @@ class TestProsemirrorToHtml:
         )
         assert 'src="/uploads/photo.jpg"' in str(result)
 
+    def test_uploaded_image_offers_resized_variants(self):
+        result = str(prosemirror_to_html(
+            '[{"type":"image","props":{"url":"/uploads/123e4567-e89b-12d3-a456-426614174000/photo.jpg","alt":"Photo"}}]',
+            image_widths={"123e4567-e89b-12d3-a456-426614174000": 2000},
+        ))
+        base = "/uploads/123e4567-e89b-12d3-a456-426614174000"
+        assert result.startswith("<figure>\n<picture>\n")
+        assert (
+            f'<source type="image/avif" srcset="{base}/480x0.avif 480w, {base}/960x0.avif 960w, {base}/1440x0.avif 1440w"'
+        ) in result
+        assert f'<source type="image/webp" srcset="{base}/480x0.webp 480w' in result
+        assert f'<img src="{base}/photo.jpg" alt="Photo">\n</picture>' in result
+
+    def test_small_uploaded_image_declares_its_real_width(self):
+        result = str(prosemirror_to_html(
+            '[{"type":"image","props":{"url":"/uploads/123e4567-e89b-12d3-a456-426614174000/photo.jpg"}}]',
+            image_widths={"123e4567-e89b-12d3-a456-426614174000": 600},
+        ))
+        base = "/uploads/123e4567-e89b-12d3-a456-426614174000"
+        assert f'srcset="{base}/480x0.avif 480w, {base}/960x0.avif 600w"' in result
+        assert "1440x0" not in result
+        assert "960w" not in result
+
+    def test_uploaded_image_narrower_than_every_variant(self):
+        result = str(prosemirror_to_html(
+            '[{"type":"image","props":{"url":"/uploads/123e4567-e89b-12d3-a456-426614174000/icon.png"}}]',
+            image_widths={"123e4567-e89b-12d3-a456-426614174000": 120},
+        ))
+        base = "/uploads/123e4567-e89b-12d3-a456-426614174000"
+        assert f'srcset="{base}/480x0.webp 120w"' in result
+
+    def test_uploaded_image_of_unknown_width_is_a_plain_img(self):
+        result = str(prosemirror_to_html(
+            '[{"type":"image","props":{"url":"/uploads/123e4567-e89b-12d3-a456-426614174000/photo.jpg"}}]',
+            image_widths={"223e4567-e89b-12d3-a456-426614174000": 600},
+        ))
+        assert result == '<figure>\n<img src="/uploads/123e4567-e89b-12d3-a456-426614174000/photo.jpg" alt="">\n</figure>'
+
+    def test_uploaded_image_variants_use_base_url(self):
+        result = str(prosemirror_to_html(
+            '[{"type":"image","props":{"url":"/uploads/123e4567-e89b-12d3-a456-426614174000/photo.jpg"}}]',
+            base_url="http://example.com/",
+            image_widths={"123e4567-e89b-12d3-a456-426614174000": 2000},
+        ))
+        assert "http://example.com/uploads/123e4567-e89b-12d3-a456-426614174000/480x0.webp 480w" in result
+
+    def test_uploaded_image_ids_are_found_without_parsing(self):
+        content = (
+            '[{"type":"image","props":{"url":"/uploads/123e4567-e89b-12d3-a456-426614174000/a.png"}},'
+            '{"type":"image","props":{"url":"/legacy/b.png"}}]'
+        )
+        assert uploaded_image_ids(content) == {"123e4567-e89b-12d3-a456-426614174000"}
+        assert uploaded_image_ids(None) == set()
+
     def test_image_attrs_fallback_preserves_backward_compat(self):
         result = prosemirror_to_html(
             '[{"type":"image","attrs":{"url":"/legacy/img.jpg","alt":"Legacy"}}]'
@@ -298,3 +352,18 @@ class TestProsemirrorToHtml:
             '[{"type":"quote","content":[{"type":"text","text":"BlockNote quote"}]}]'
         )
         assert result == Markup("<blockquote>\nBlockNote quote\n</blockquote>")
+
+    def test_deeply_nested_lists_do_not_recurse(self):
+        depth = 300
+        item = '{"type":"listItem","content":[{"type":"text","text":"leaf"}]}'
+        for _ in range(depth):
+            item = '{"type":"listItem","content":[{"type":"bulletList","content":[' + item + "]}]}"
+        result = prosemirror_to_html('[{"type":"bulletList","content":[' + item + "]}]")
+        assert result.count("<ul>") == depth + 1
+        assert "<li>\nleaf\n</li>" in result
+
+    def test_text_is_escaped_like_markupsafe(self):
+        result = prosemirror_to_html(
+            '[{"type":"paragraph","content":[{"type":"text","text":"<a href=\\"x\\">\'&\'</a>"}]}]'
+        )
+        assert result == Markup("<p>&lt;a href=&#34;x&#34;&gt;&#39;&amp;&#39;&lt;/a&gt;</p>")
@@ -1,3 +1,5 @@
+import json
+import os
 from datetime import UTC, datetime
 
 import pytest
@@ -5,7 +7,8 @@ from flask import render_template_string
 from jinja2.exceptions import TemplateNotFound
 from markupsafe import Markup
 
-from utils.template_helpers import date_iso_filter, nl2br_filter
+from utils import template_helpers
+from utils.template_helpers import ViteManifest, date_iso_filter, inject_vite_assets, nl2br_filter
 
 
 class TestIconMacro:
@@ -40,6 +43,68 @@ class TestIconMacro:
                 )
 
 
+class TestViteManifest:
+    """Tests for the cached Vite manifest and the inject_vite_assets context processor."""
+
+    @pytest.fixture(autouse=True)
+    def manifest_dir(self, tmp_path, monkeypatch):
+        saved = (ViteManifest._manifest_path, ViteManifest._reload, ViteManifest._cache)
+        self.loads = 0
+        real_load = json.load
+
+        def counting_load(f):
+            self.loads += 1
+            return real_load(f)
+
+        monkeypatch.setattr(template_helpers.json, "load", counting_load)
+        (tmp_path / ".vite").mkdir()
+        self.path = tmp_path / ".vite" / "manifest.json"
+        yield tmp_path
+        ViteManifest._manifest_path, ViteManifest._reload, ViteManifest._cache = saved
+
+    def _write(self, js: str, mtime_ns: int) -> None:
+        self.path.write_text(json.dumps({
+            "core/entry.jsx": {"file": js, "css": ["assets/entry.css"], "imports": ["_vendor.js"]},
+            "_vendor.js": {"file": "assets/vendor-1.js", "css": ["assets/vendor.css"]},
+        }))
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_manifest_is_parsed_once(self, manifest_dir):
+        self._write("assets/entry-1.js", 1_000_000_000)
+        ViteManifest.init(str(manifest_dir))
+        first = inject_vite_assets()
+        assert inject_vite_assets() is first
+        assert ViteManifest.get_css() == ["assets/entry.css", "assets/vendor.css"]
+        assert first == {
+            "vite_js_url": "dist/assets/entry-1.js",
+            "vite_css_urls": ["dist/assets/entry.css", "dist/assets/vendor.css"],
+            "vite_vendor_js_url": "dist/assets/vendor-1.js",
+        }
+        assert self.loads == 1
+
+    def test_manifest_is_reloaded_when_file_changes(self, manifest_dir):
+        self._write("assets/entry-1.js", 1_000_000_000)
+        ViteManifest.init(str(manifest_dir))
+        assert inject_vite_assets()["vite_js_url"] == "dist/assets/entry-1.js"
+        self._write("assets/entry-2.js", 2_000_000_000)
+        assert inject_vite_assets()["vite_js_url"] == "dist/assets/entry-2.js"
+        assert self.loads == 2
+
+    def test_manifest_is_kept_when_reload_is_disabled(self, manifest_dir):
+        self._write("assets/entry-1.js", 1_000_000_000)
+        ViteManifest.init(str(manifest_dir), reload=False)
+        inject_vite_assets()
+        self._write("assets/entry-2.js", 2_000_000_000)
+        assert inject_vite_assets()["vite_js_url"] == "dist/assets/entry-1.js"
+        assert self.loads == 1
+
+    def test_missing_manifest_injects_no_assets_until_built(self, manifest_dir):
+        ViteManifest.init(str(manifest_dir))
+        assert inject_vite_assets() == {"vite_js_url": None, "vite_css_urls": [], "vite_vendor_js_url": None}
+        self._write("assets/entry-1.js", 1_000_000_000)
+        assert inject_vite_assets()["vite_js_url"] == "dist/assets/entry-1.js"
+
+
 class TestNl2brFilter:
     """Unit tests for the nl2br Jinja2 filter."""
 
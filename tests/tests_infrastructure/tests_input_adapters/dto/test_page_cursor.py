@@ -0,0 +1,54 @@
+from datetime import datetime
+
+import pytest
+
+from src.application.domain.account import AccountCursor
+from src.application.domain.article import ArticleCursor
+from src.infrastructure.input_adapters.dto.page_cursor import PageCursor
+from tests.test_domain_factories import create_test_account, create_test_article
+
+
+class TestPageCursor:
+    """
+    Unit tests for the PageCursor keyset pagination token.
+    """
+
+    def test_encode_decode_round_trip(self):
+        cursor = PageCursor(last_id=12, last_published_at=datetime(2024, 5, 1, 10, 30))
+        token = cursor.encode()
+        assert "=" not in token
+        assert PageCursor.decode(token) == cursor
+
+    def test_round_trip_without_timestamp(self):
+        cursor = PageCursor(last_id=3)
+        assert PageCursor.decode(cursor.encode()) == cursor
+
+    @pytest.mark.parametrize("token", [None, "", "not-base64!", "e30", "bm90IGpzb24"])
+    def test_decode_invalid_token_returns_none(self, token):
+        assert PageCursor.decode(token) is None
+
+    def test_from_article_and_to_article_cursor(self):
+        published_at = datetime(2024, 5, 1, 10, 30)
+        article = create_test_article(article_id=8, article_published_at=published_at)
+        cursor = PageCursor.from_article(article)
+        assert cursor is not None
+        assert cursor.to_article_cursor() == ArticleCursor(published_at=published_at, article_id=8)
+
+    def test_from_unpublished_article_returns_none(self):
+        article = create_test_article(article_id=8)
+        article.article_published_at = None
+        assert PageCursor.from_article(article) is None
+
+    def test_to_article_cursor_without_timestamp_returns_none(self):
+        assert PageCursor(last_id=8).to_article_cursor() is None
+
+    def test_from_account_and_to_account_cursor(self):
+        created_at = datetime(2024, 5, 1, 10, 30)
+        account = create_test_account(account_id=4, account_created_at=created_at)
+        cursor = PageCursor.from_account(account)
+        assert cursor is not None
+        assert PageCursor.decode(cursor.encode()) == cursor
+        assert cursor.to_account_cursor() == AccountCursor(created_at=created_at, account_id=4)
+
+    def test_to_account_cursor_without_timestamp_returns_none(self):
+        assert PageCursor(last_id=4).to_account_cursor() is None
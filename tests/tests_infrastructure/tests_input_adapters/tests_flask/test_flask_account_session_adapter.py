@@ -1,8 +1,10 @@
+from datetime import datetime
 from unittest.mock import Mock
 
 from flask import g as global_request_context
 
-from src.application.domain.account import Account, AccountRole
+from src.application.domain.account import Account, AccountCursor, AccountRole
+from src.application.domain.page import Page
 from src.application.input_ports.account_session_management import AccountSessionManagementPort
 from src.application.input_ports.comment_management import CommentManagementPort
 from src.application.input_ports.file_management import FileManagementPort
@@ -17,9 +19,8 @@ class TestAccountSessionAdapter(FlaskInputAdapterTestBase):
     def setup_method(self):
         super().setup_method()
         self.mock_session_service = Mock(spec=AccountSessionManagementPort, autospec=True)
-        self.mock_session_service.count_all_accounts.return_value = 0
-        self.mock_session_service.search_accounts.return_value = []
-        self.mock_session_service.count_search_accounts.return_value = 0
+        self.mock_session_service.get_account_page.return_value = Page(items=[], total=0)
+        self.mock_session_service.search_account_page.return_value = Page(items=[], total=0)
         self.mock_file_service = Mock(spec=FileManagementPort, autospec=True)
         self.mock_comment_service = Mock(spec=CommentManagementPort, autospec=True)
         self.adapter = AccountSessionAdapter(
@@ -46,6 +47,13 @@ class TestAccountSessionAdapter(FlaskInputAdapterTestBase):
         self._register_dummy_route("/register", "registration.register", "registration")
         self._register_dummy_route("/articles/new", "article.render_create_page", "new_article")
 
+        self.app.add_url_rule(
+            "/api/users/suggest",
+            view_func=self.adapter.api_suggest_users,
+            methods=["GET"],
+            endpoint="auth.api_suggest_users",
+        )
+
         self.app.add_url_rule(
             "/account/delete",
             view_func=self.adapter.delete_account,
@@ -72,6 +80,12 @@ class TestAccountSessionAdapter(FlaskInputAdapterTestBase):
             "file_serve",
         )
 
+        self._register_dummy_route(
+            "/uploads/<string:file_id>/<int:width>x<int:height>.<string:fmt>",
+            "file.serve_image_variant",
+            "file_serve_variant",
+        )
+
         self.app.add_url_rule(
             "/profile/photo/delete",
             view_func=self.adapter.remove_profile_photo,
@@ -205,7 +219,7 @@ class TestAccountSessionAdapter(FlaskInputAdapterTestBase):
             data=b"fake-image-data",
             created_at=datetime.now(),
         )
-        self.mock_file_service.upload_file.return_value = fake_file
+        self.mock_file_service.upload_file_stream.return_value = fake_file
 
         response = self.client.post(
             "/api/profile/photo",
@@ -215,7 +229,7 @@ class TestAccountSessionAdapter(FlaskInputAdapterTestBase):
         assert response.status_code == 200
         data = response.get_json()
         assert data["avatar_url"] == "/uploads/abc-123/avatar"
-        self.mock_file_service.upload_file.assert_called_once()
+        self.mock_file_service.upload_file_stream.assert_called_once()
         self.mock_session_service.update_avatar.assert_called_once_with("abc-123")
 
     def test_upload_profile_photo_replaces_old_avatar(self):
@@ -234,7 +248,7 @@ class TestAccountSessionAdapter(FlaskInputAdapterTestBase):
             data=b"new-image-data",
             created_at=datetime.now(),
         )
-        self.mock_file_service.upload_file.return_value = fake_file
+        self.mock_file_service.upload_file_stream.return_value = fake_file
 
         response = self.client.post(
             "/api/profile/photo",
@@ -274,8 +288,7 @@ class TestAccountSessionAdapter(FlaskInputAdapterTestBase):
             create_test_account(account_id=i, account_username=f"user{i}")
             for i in range(1, 26)
         ]
-        self.mock_session_service.get_all_accounts.return_value = fake_users[:20]
-        self.mock_session_service.count_all_accounts.return_value = 25
+        self.mock_session_service.get_account_page.return_value = Page(items=fake_users[:20], total=25)
 
         response = self.client.get("/admin/users")
         assert response.status_code == 200
@@ -291,8 +304,7 @@ class TestAccountSessionAdapter(FlaskInputAdapterTestBase):
             create_test_account(account_id=i, account_username=f"user{i}")
             for i in range(21, 26)
         ]
-        self.mock_session_service.get_all_accounts.return_value = fake_users_page2
-        self.mock_session_service.count_all_accounts.return_value = 25
+        self.mock_session_service.get_account_page.return_value = Page(items=fake_users_page2, total=25)
 
         response = self.client.get("/admin/users?page=2")
         assert response.status_code == 200
@@ -301,6 +313,48 @@ class TestAccountSessionAdapter(FlaskInputAdapterTestBase):
         assert b"page-link-num" in response.data
         assert b"jump-modal" in response.data
 
+    def test_list_all_users_follows_after_cursor(self):
+        from src.infrastructure.input_adapters.dto.page_cursor import PageCursor
+
+        fake_admin = create_test_account(account_role=AccountRole.ADMIN)
+        self.mock_session_service.get_current_account.return_value = fake_admin
+        created_at = datetime(2024, 5, 1, 10, 30)
+        self.mock_session_service.get_account_page.return_value = Page(
+            items=[create_test_account(account_id=21, account_username="user21", account_created_at=created_at)], total=45,
+        )
+
+        token = PageCursor(last_id=22, last_created_at=created_at).encode()
+        response = self.client.get(f"/admin/users?page=2&after={token}")
+        assert response.status_code == 200
+        self.mock_session_service.get_account_page.assert_called_once_with(
+            page=2, per_page=20, after=AccountCursor(created_at, 22),
+        )
+        assert f"after={PageCursor(last_id=21, last_created_at=created_at).encode()}".encode() in response.data
+
+    def test_api_suggest_users_as_admin(self):
+        fake_admin = create_test_account(account_role=AccountRole.ADMIN)
+        self.mock_session_service.get_current_account.return_value = fake_admin
+        self.mock_session_service.suggest_accounts.return_value = [
+            create_test_account(account_id=4, account_username="alice", account_role=AccountRole.AUTHOR),
+        ]
+        response = self.client.get("/api/users/suggest?q=ali")
+        assert response.status_code == 200
+        assert response.get_json() == [{"account_id": 4, "account_username": "alice", "account_role": "author"}]
+        self.mock_session_service.suggest_accounts.assert_called_once_with("ali")
+
+    def test_api_suggest_users_blank_query(self):
+        fake_admin = create_test_account(account_role=AccountRole.ADMIN)
+        self.mock_session_service.get_current_account.return_value = fake_admin
+        response = self.client.get("/api/users/suggest?q=%20")
+        assert response.get_json() == []
+        self.mock_session_service.suggest_accounts.assert_not_called()
+
+    def test_api_suggest_users_forbidden_for_non_admin(self):
+        self.mock_session_service.get_current_account.return_value = create_test_account(account_role=AccountRole.USER)
+        response = self.client.get("/api/users/suggest?q=ali")
+        assert response.status_code == 403
+        self.mock_session_service.suggest_accounts.assert_not_called()
+
     def test_list_all_users_with_search(self):
         fake_admin = create_test_account(account_role=AccountRole.ADMIN)
         self.mock_session_service.get_current_account.return_value = fake_admin
@@ -308,8 +362,7 @@ class TestAccountSessionAdapter(FlaskInputAdapterTestBase):
             create_test_account(account_id=i, account_username=f"user{i}")
             for i in range(1, 26)
         ]
-        self.mock_session_service.search_accounts.return_value = fake_results[:20]
-        self.mock_session_service.count_search_accounts.return_value = 25
+        self.mock_session_service.search_account_page.return_value = Page(items=fake_results[:20], total=25)
 
         response = self.client.get("/admin/users?q=user")
         assert response.status_code == 200
@@ -317,8 +370,7 @@ class TestAccountSessionAdapter(FlaskInputAdapterTestBase):
         assert b"user20" in response.data
         assert b"page-link-num" in response.data
         assert b"jump-modal" in response.data
-        self.mock_session_service.search_accounts.assert_called_once_with("user", page=1, per_page=20)
-        self.mock_session_service.count_search_accounts.assert_called_once_with("user")
+        self.mock_session_service.search_account_page.assert_called_once_with("user", page=1, per_page=20)
 
     def test_list_all_users_search_no_results(self):
         fake_admin = create_test_account(account_role=AccountRole.ADMIN)
@@ -326,14 +378,12 @@ class TestAccountSessionAdapter(FlaskInputAdapterTestBase):
         response = self.client.get("/admin/users?q=zzz")
         assert response.status_code == 200
         assert b"Manage Users (0 users)" in response.data
-        self.mock_session_service.search_accounts.assert_called_once_with("zzz", page=1, per_page=20)
-        self.mock_session_service.count_search_accounts.assert_called_once_with("zzz")
+        self.mock_session_service.search_account_page.assert_called_once_with("zzz", page=1, per_page=20)
 
     def test_list_all_users_page_invalid(self):
         fake_admin = create_test_account(account_role=AccountRole.ADMIN)
         self.mock_session_service.get_current_account.return_value = fake_admin
-        self.mock_session_service.get_all_accounts.return_value = []
-        self.mock_session_service.count_all_accounts.return_value = 25
+        self.mock_session_service.get_account_page.return_value = Page(items=[], total=25)
 
         response = self.client.get("/admin/users?page=-1")
         assert response.status_code == 200
@@ -344,17 +394,15 @@ class TestAccountSessionAdapter(FlaskInputAdapterTestBase):
         Verifies that the admin user list page displays the total
         account count in the page title.
 
-        The count_all_accounts mock is set to 47 and the assertion
+        The get_account_page mock reports a total of 47 and the assertion
         checks that the rendered HTML contains "Manage Users (47 users)".
         """
         fake_admin = create_test_account(account_role=AccountRole.ADMIN)
         self.mock_session_service.get_current_account.return_value = fake_admin
 
-        self.mock_session_service.get_all_accounts.return_value = [
-            create_test_account(account_id=i) for i in range(1, 21)
-        ]
-
-        self.mock_session_service.count_all_accounts.return_value = 47
+        self.mock_session_service.get_account_page.return_value = Page(
+            items=[create_test_account(account_id=i) for i in range(1, 21)], total=47,
+        )
         response = self.client.get("/admin/users")
         assert response.status_code == 200
         assert b"Manage Users (47 users)" in response.data
@@ -398,7 +446,7 @@ class TestAccountSessionAdapter(FlaskInputAdapterTestBase):
         self.set_current_user(admin)
         self.mock_session_service.get_current_account.return_value = admin
         self.mock_session_service.get_account_by_id.return_value = target
-        self.mock_session_service.get_all_accounts.return_value = []
+        self.mock_session_service.get_account_page.return_value = Page(items=[], total=0)
         self.mock_session_service.delete_account.return_value = None
         response = self.client.post("/account/delete", data={"account_id": 2}, follow_redirects=True)
         assert response.status_code == 200
@@ -410,7 +458,7 @@ class TestAccountSessionAdapter(FlaskInputAdapterTestBase):
         self.set_current_user(admin)
         self.mock_session_service.get_current_account.return_value = admin
         self.mock_session_service.get_account_by_id.return_value = None
-        self.mock_session_service.get_all_accounts.return_value = []
+        self.mock_session_service.get_account_page.return_value = Page(items=[], total=0)
         response = self.client.post("/account/delete", data={"account_id": 999}, follow_redirects=True)
         assert response.status_code == 200
         assert b"not found" in response.data or b"Account not found" in response.data
@@ -646,6 +694,12 @@ class TestAccountSessionBeforeRequestHook(FlaskInputAdapterTestBase):
             file_service=self.mock_file_service,
             comment_service=self.mock_comment_service,
         )
+        # The hook replaces the app's flask.g class, which only applies to
+        # the contexts pushed after its registration.
+        self.app_context.pop()
+        self.adapter.register_before_request_handler(self.app)
+        self.app_context = self.app.test_request_context()
+        self.app_context.push()
 
     def _capture_handler(self, **kwargs):
         """Route handler that captures the current_user from flask.g."""
@@ -658,10 +712,16 @@ class TestAccountSessionBeforeRequestHook(FlaskInputAdapterTestBase):
         self.client.get(f"/{endpoint}")
         return self._captured_user
 
+    def _capture_twice_handler(self):
+        """Route handler reading the current_user through both accessors of flask.g."""
+        first = global_request_context.current_user
+        self._captured_user = getattr(global_request_context, "current_user", None)
+        assert first is self._captured_user
+        return "OK", 200
+
     def test_before_request_injects_authenticated_user(self):
         test_account = create_test_account(account_username="AgentSmith", account_role=AccountRole.ADMIN)
         self.mock_session_service.get_current_account.return_value = test_account
-        self.adapter.register_before_request_handler(self.app)
         captured_user = self._capture_user_via_route("test-authenticated")
         assert captured_user is not None
         assert isinstance(captured_user, Account)
@@ -671,14 +731,12 @@ class TestAccountSessionBeforeRequestHook(FlaskInputAdapterTestBase):
     def test_before_request_injects_author_user(self):
         test_account = create_test_account(account_username="AuthorWriter", account_role=AccountRole.AUTHOR)
         self.mock_session_service.get_current_account.return_value = test_account
-        self.adapter.register_before_request_handler(self.app)
         captured_user = self._capture_user_via_route("test-author")
         assert captured_user is not None
         assert captured_user.account_role == AccountRole.AUTHOR
 
     def test_before_request_injects_none_when_anonymous(self):
         self.mock_session_service.get_current_account.return_value = None
-        self.adapter.register_before_request_handler(self.app)
         captured_user = self._capture_user_via_route("test-anonymous")
         assert captured_user is None
 
@@ -690,7 +748,6 @@ class TestAccountSessionBeforeRequestHook(FlaskInputAdapterTestBase):
         self._register_dummy_route("/articles", "article.list_articles", "articles")
         admin_account = create_test_account(account_username="Admin", account_role=AccountRole.ADMIN)
         self.mock_session_service.get_current_account.return_value = admin_account
-        self.adapter.register_before_request_handler(self.app)
         self.client.get("/req1")
         user1 = self._captured_user
         assert user1 is not None and user1.account_username == "Admin"
@@ -698,3 +755,24 @@ class TestAccountSessionBeforeRequestHook(FlaskInputAdapterTestBase):
         self.client.get("/req2")
         user2 = self._captured_user
         assert user2 is None
+
+    def test_before_request_defers_loading_until_user_is_read(self):
+        self.app.add_url_rule("/no-user", view_func=lambda: "OK", endpoint="no-user")
+        self.client.get("/no-user")
+        self.mock_session_service.get_current_account.assert_not_called()
+
+    def test_before_request_loads_user_once_per_request(self):
+        self.mock_session_service.get_current_account.return_value = create_test_account()
+        self.app.add_url_rule("/twice", view_func=self._capture_twice_handler, endpoint="twice")
+        self.client.get("/twice")
+        assert self._captured_user is not None
+        self.mock_session_service.get_current_account.assert_called_once()
+
+    def test_before_request_skips_anonymous_endpoints(self):
+        self.mock_session_service.get_current_account.return_value = create_test_account()
+        self.app.add_url_rule(
+            "/uploads/<string:file_id>/<string:filename>", view_func=self._capture_handler, endpoint="file.serve_file"
+        )
+        self.client.get("/uploads/abc/photo.png")
+        assert self._captured_user is None
+        self.mock_session_service.get_current_account.assert_not_called()
@@ -2,12 +2,20 @@ import json
 from unittest.mock import Mock
 
 from src.application.domain.account import AccountRole
+from src.application.domain.article import ArticleWithAuthor
+from src.application.domain.comment import CommentWithAuthor
+from src.application.domain.page import Page
 from src.application.output_ports.account_repository import AccountRepository
 from src.application.output_ports.article_repository import ArticleRepository
 from src.application.output_ports.comment_repository import CommentRepository
 from src.application.services.article_service import ArticleService
 from src.infrastructure.input_adapters.flask.flask_article_adapter import ArticleAdapter
-from tests.test_domain_factories import create_test_account, create_test_article, create_test_comment
+from tests.test_domain_factories import (
+    create_test_account,
+    create_test_article,
+    create_test_comment,
+    summarize_test_article,
+)
 from tests.tests_infrastructure.tests_input_adapters.tests_flask.flask_test_utils import (
     FlaskInputAdapterTestBase,
 )
@@ -17,12 +25,12 @@ class ArticleAdapterTestBase(FlaskInputAdapterTestBase):
     def setup_method(self):
         super().setup_method()
         self.mock_article_repo = Mock(spec=ArticleRepository, autospec=True)
-        self.mock_article_repo.count_all.return_value = 0
-        self.mock_article_repo.get_paginated.return_value = []
+        self.mock_article_repo.get_page.return_value = Page(items=[], total=0)
+        self.mock_article_repo.search_page.return_value = Page(items=[], total=0)
         self.mock_account_repo = Mock(spec=AccountRepository, autospec=True)
         self.mock_account_repo.get_by_ids.return_value = []
         self.mock_comment_repo = Mock(spec=CommentRepository, autospec=True)
-        self.mock_comment_repo.get_all_by_article_id.return_value = []
+        self.mock_comment_repo.get_all_with_authors_by_article_id.return_value = []
 
         self.article_service = ArticleService(
             article_repository=self.mock_article_repo,
@@ -103,18 +111,14 @@ class ArticleAdapterTestBase(FlaskInputAdapterTestBase):
 class TestArticleAnonymousAccess(ArticleAdapterTestBase):
     def test_list_articles_as_anonymous(self):
         article = create_test_article(article_title="Hexagonal Secrets", article_author_id=1)
-        self.mock_article_repo.get_paginated.return_value = [article]
-        self.mock_article_repo.count_all.return_value = 1
-        self.mock_account_repo.get_by_ids.return_value = [create_test_account(account_id=1, account_username="Author")]
+        self.mock_article_repo.get_page.return_value = Page(items=[summarize_test_article(article, "Author")], total=1)
         response = self.client.get("/")
         assert response.status_code == 200
         assert b"Hexagonal Secrets" in response.data
 
     def test_read_article_as_anonymous(self):
         article = create_test_article(article_title="Public View", article_author_id=1)
-        self.mock_article_repo.get_by_id.return_value = article
-        self.mock_comment_repo.get_all_by_article_id.return_value = []
-        self.mock_account_repo.get_by_id.return_value = create_test_account(account_id=1, account_username="Author")
+        self.mock_article_repo.get_with_author.return_value = ArticleWithAuthor(article, "Author")
         response = self.client.get("/articles/1")
         assert response.status_code == 200
         assert b"Public View" in response.data
@@ -130,9 +134,7 @@ class TestArticleAnonymousAccess(ArticleAdapterTestBase):
             article_published_at=publication_date
         )
 
-        self.mock_article_repo.get_paginated.return_value = [article]
-        self.mock_article_repo.count_all.return_value = 1
-        self.mock_account_repo.get_by_ids.return_value = [create_test_account(account_id=1, account_username="Author")]
+        self.mock_article_repo.get_page.return_value = Page(items=[summarize_test_article(article, "Author")], total=1)
         response = self.client.get("/")
         assert response.status_code == 200
         assert b"29 April 2026" in response.data
@@ -146,16 +148,42 @@ class TestArticleAnonymousAccess(ArticleAdapterTestBase):
         )
 
         article.article_published_at = None
-        self.mock_article_repo.get_paginated.return_value = [article]
-        self.mock_article_repo.count_all.return_value = 1
-        self.mock_account_repo.get_by_ids.return_value = [create_test_account(account_id=1, account_username="Author")]
+        self.mock_article_repo.get_page.return_value = Page(items=[summarize_test_article(article, "Author")], total=1)
         response = self.client.get("/")
         assert response.status_code == 200
         assert b"meta-date" not in response.data
 
+    def test_list_articles_next_link_carries_keyset_cursor(self):
+        from datetime import datetime
+
+        from src.infrastructure.input_adapters.dto.page_cursor import PageCursor
+
+        published_at = datetime(2026, 4, 29, 12, 0)
+        article = create_test_article(article_id=5, article_author_id=1, article_published_at=published_at)
+        self.mock_article_repo.get_page.return_value = Page(items=[summarize_test_article(article, "Author")], total=20)
+        response = self.client.get("/")
+        token = PageCursor(last_id=5, last_published_at=published_at).encode()
+        assert f"after={token}".encode() in response.data
+
+    def test_list_articles_follows_after_cursor(self):
+        from datetime import datetime
+
+        from src.application.domain.article import ArticleCursor
+        from src.infrastructure.input_adapters.dto.page_cursor import PageCursor
+
+        published_at = datetime(2026, 4, 29, 12, 0)
+        token = PageCursor(last_id=5, last_published_at=published_at).encode()
+        response = self.client.get(f"/?page=2&after={token}")
+        assert response.status_code == 200
+        self.mock_article_repo.get_page.assert_called_once_with(2, 10, ArticleCursor(published_at, 5))
+
+    def test_list_articles_invalid_cursor_falls_back_to_offset(self):
+        response = self.client.get("/?page=2&after=garbage!")
+        assert response.status_code == 200
+        self.mock_article_repo.get_page.assert_called_once_with(2, 10, None)
+
     def test_list_articles_contains_jump_modal(self):
-        self.mock_article_repo.get_paginated.return_value = []
-        self.mock_article_repo.count_all.return_value = 0
+        self.mock_article_repo.get_page.return_value = Page(items=[], total=0)
         response = self.client.get("/")
         assert response.status_code == 200
         assert b'<dialog id="jump-modal"' in response.data
@@ -190,27 +218,19 @@ class TestArticleAnonymousAccess(ArticleAdapterTestBase):
 
     def test_read_article_comment_count_zero(self):
         article = create_test_article(article_title="Count Test", article_author_id=1)
-        self.mock_article_repo.get_by_id.return_value = article
-        self.mock_comment_repo.get_all_by_article_id.return_value = []
-
-        self.mock_account_repo.get_by_ids.return_value = [
-            create_test_account(account_id=1, account_username="Author"),
-        ]
+        self.mock_article_repo.get_with_author.return_value = ArticleWithAuthor(article, "Author")
 
         response = self.client.get("/articles/1")
         assert b"Comments (0)" in response.data
 
     def test_read_article_comment_count_with_nested(self):
         article = create_test_article(article_title="Count Test", article_author_id=1)
-        self.mock_article_repo.get_by_id.return_value = article
+        self.mock_article_repo.get_with_author.return_value = ArticleWithAuthor(article, "Author")
         root = create_test_comment(comment_id=1, comment_written_account_id=2)
         reply1 = create_test_comment(comment_id=2, comment_written_account_id=2, comment_reply_to=1)
         reply2 = create_test_comment(comment_id=3, comment_written_account_id=2, comment_reply_to=1)
-        self.mock_comment_repo.get_all_by_article_id.return_value = [root, reply1, reply2]
-
-        self.mock_account_repo.get_by_ids.return_value = [
-            create_test_account(account_id=1, account_username="Author"),
-            create_test_account(account_id=2, account_username="Commenter"),
+        self.mock_comment_repo.get_all_with_authors_by_article_id.return_value = [
+            CommentWithAuthor(c, "Commenter") for c in (root, reply1, reply2)
         ]
 
         response = self.client.get("/articles/1")
@@ -218,7 +238,7 @@ class TestArticleAnonymousAccess(ArticleAdapterTestBase):
 
     def test_read_article_comment_count_includes_soft_deleted(self):
         article = create_test_article(article_title="Count Test", article_author_id=1)
-        self.mock_article_repo.get_by_id.return_value = article
+        self.mock_article_repo.get_with_author.return_value = ArticleWithAuthor(article, "Author")
 
         deleted = create_test_comment(
             comment_id=1,
@@ -226,11 +246,7 @@ class TestArticleAnonymousAccess(ArticleAdapterTestBase):
             comment_content="<em>Comment removed</em>",
         )
 
-        self.mock_comment_repo.get_all_by_article_id.return_value = [deleted]
-        self.mock_account_repo.get_by_ids.return_value = [
-            create_test_account(account_id=1, account_username="Author"),
-            create_test_account(account_id=2, account_username="Anonymous"),
-        ]
+        self.mock_comment_repo.get_all_with_authors_by_article_id.return_value = [CommentWithAuthor(deleted, "Anonymous")]
 
         response = self.client.get("/articles/1")
         assert b"Comments (1)" in response.data
@@ -349,7 +365,7 @@ class TestArticleAuthorAccess(ArticleAdapterTestBase):
     def test_read_article_not_found(self):
         author = create_test_account(account_id=10, account_role=AccountRole.AUTHOR)
         self._prepare_user_context(author)
-        self.mock_article_repo.get_by_id.return_value = None
+        self.mock_article_repo.get_with_author.return_value = None
         response = self.client.get("/articles/999", follow_redirects=True)
         assert b"Error: Article not found." in response.data
         assert b"alert-error" in response.data
@@ -449,10 +465,8 @@ class TestArticleLegacyContent(ArticleAdapterTestBase):
 
 class TestArticlePagination(ArticleAdapterTestBase):
     def test_pagination_multiple_pages(self):
-        self.mock_article_repo.count_all.return_value = 11
         articles = [create_test_article(article_id=i, article_author_id=1) for i in range(10)]
-        self.mock_article_repo.get_paginated.return_value = articles
-        self.mock_account_repo.get_by_ids.return_value = [create_test_account(account_id=1)]
+        self.mock_article_repo.get_page.return_value = Page(items=[summarize_test_article(a) for a in articles], total=11)
         response = self.client.get("/")
         assert response.status_code == 200
         assert b'class="page-link-num' in response.data
@@ -462,28 +476,23 @@ class TestArticlePagination(ArticleAdapterTestBase):
         assert b'class="editorial-pagination top' in response.data
 
     def test_pagination_exact_single_page(self):
-        self.mock_article_repo.count_all.return_value = 10
         articles = [create_test_article(article_id=i, article_author_id=1) for i in range(10)]
-        self.mock_article_repo.get_paginated.return_value = articles
-        self.mock_account_repo.get_by_ids.return_value = [create_test_account(account_id=1)]
+        self.mock_article_repo.get_page.return_value = Page(items=[summarize_test_article(a) for a in articles], total=10)
         response = self.client.get("/")
         assert response.status_code == 200
         assert b"pagination-link--hidden" in response.data
         assert response.data.count(b'class="page-link-num') == 2
 
     def test_pagination_empty_state(self):
-        self.mock_article_repo.count_all.return_value = 0
-        self.mock_article_repo.get_paginated.return_value = []
+        self.mock_article_repo.get_page.return_value = Page(items=[], total=0)
         response = self.client.get("/")
         assert response.status_code == 200
         assert b"No articles found in the database." in response.data
         assert b'class="page-link-num' not in response.data
 
     def test_pagination_truncated_start(self):
-        self.mock_article_repo.count_all.return_value = 150
         articles = [create_test_article(article_id=i, article_author_id=1) for i in range(10)]
-        self.mock_article_repo.get_paginated.return_value = articles
-        self.mock_account_repo.get_by_ids.return_value = [create_test_account(account_id=1)]
+        self.mock_article_repo.get_page.return_value = Page(items=[summarize_test_article(a) for a in articles], total=150)
         response = self.client.get("/")
         assert response.status_code == 200
         assert b'page=1"' in response.data
@@ -495,10 +504,8 @@ class TestArticlePagination(ArticleAdapterTestBase):
         assert b'page=15"' in response.data
 
     def test_pagination_truncated_middle(self):
-        self.mock_article_repo.count_all.return_value = 1200
         articles = [create_test_article(article_id=i, article_author_id=1) for i in range(10)]
-        self.mock_article_repo.get_paginated.return_value = articles
-        self.mock_account_repo.get_by_ids.return_value = [create_test_account(account_id=1)]
+        self.mock_article_repo.get_page.return_value = Page(items=[summarize_test_article(a) for a in articles], total=1200)
         response = self.client.get("/?page=50")
         assert response.status_code == 200
         assert b'page=1"' in response.data
@@ -509,10 +516,8 @@ class TestArticlePagination(ArticleAdapterTestBase):
         assert b'page=120"' in response.data
 
     def test_pagination_prev_next_visibility_bound(self):
-        self.mock_account_repo.get_by_ids.return_value = [create_test_account(account_id=1)]
         articles = [create_test_article(article_id=i, article_author_id=1) for i in range(10)]
-        self.mock_article_repo.count_all.return_value = 50
-        self.mock_article_repo.get_paginated.return_value = articles
+        self.mock_article_repo.get_page.return_value = Page(items=[summarize_test_article(a) for a in articles], total=50)
         response = self.client.get("/")
         assert response.data.count(b"pagination-link--hidden") == 2
         response = self.client.get("/?page=3")
@@ -1,3 +1,4 @@
+from datetime import datetime
 from io import BytesIO
 from unittest.mock import Mock
 
@@ -29,6 +30,13 @@ class FlaskFileAdapterTest(FlaskInputAdapterTestBase):
             endpoint="file.serve_file",
         )
 
+        self.app.add_url_rule(
+            "/uploads/<file_id>/<int:width>x<int:height>.<any(avif, webp):fmt>",
+            view_func=self.adapter.serve_image_variant,
+            methods=["GET"],
+            endpoint="file.serve_image_variant",
+        )
+
 
 class TestFileUpload(FlaskFileAdapterTest):
     def test_upload_image_success(self):
@@ -39,7 +47,13 @@ class TestFileUpload(FlaskFileAdapterTest):
             data=b"fake_image_data",
             size=len(b"fake_image_data"),
         )
-        self.mock_file_service.upload_file.return_value = record
+        received = []
+
+        def upload(filename, stream, mime_type):
+            received.append((filename, stream.read(), mime_type))
+            return record
+
+        self.mock_file_service.upload_file_stream.side_effect = upload
 
         data = {"file": (BytesIO(b"fake_image_data"), "photo.jpg")}
         response = self.client.post(
@@ -51,11 +65,7 @@ class TestFileUpload(FlaskFileAdapterTest):
         assert response.status_code == 201
         assert response.json is not None
         assert response.json["url"] == "/uploads/uuid-123/photo.jpg"
-        self.mock_file_service.upload_file.assert_called_once_with(
-            filename="photo.jpg",
-            data=b"fake_image_data",
-            mime_type="image/jpeg",
-        )
+        assert received == [("photo.jpg", b"fake_image_data", "image/jpeg")]
 
     def test_upload_image_no_file_provided(self):
         response = self.client.post(
@@ -66,7 +76,7 @@ class TestFileUpload(FlaskFileAdapterTest):
 
         assert response.status_code == 400
         assert b"No file provided" in response.data
-        self.mock_file_service.upload_file.assert_not_called()
+        self.mock_file_service.upload_file_stream.assert_not_called()
 
     def test_upload_image_without_filename(self):
         data = {"file": (BytesIO(b"data"), "")}
@@ -78,32 +88,164 @@ class TestFileUpload(FlaskFileAdapterTest):
 
         assert response.status_code == 400
         assert b"No file provided" in response.data
-        self.mock_file_service.upload_file.assert_not_called()
+        self.mock_file_service.upload_file_stream.assert_not_called()
 
 
 class TestFileServe(FlaskFileAdapterTest):
-    def test_serve_file_success(self):
+    DIGEST = "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+
+    def _serve_from_database(self, data: bytes = b"fake_image_data") -> FileRecord:
+        metadata = FileRecord(
+            file_id="uuid-456",
+            original_filename="photo.jpg",
+            mime_type="image/jpeg",
+            data=None,
+            size=len(data),
+            created_at=datetime(2024, 1, 1, 12, 0),
+            content_sha256=self.DIGEST,
+        )
         record = FileRecord(
             file_id="uuid-456",
             original_filename="photo.jpg",
             mime_type="image/jpeg",
-            data=b"fake_image_data",
-            size=len(b"fake_image_data"),
+            data=data,
+            size=len(data),
+            created_at=datetime(2024, 1, 1, 12, 0),
+            content_sha256=self.DIGEST,
         )
+        self.mock_file_service.get_file_metadata.return_value = metadata
         self.mock_file_service.get_file.return_value = record
+        return record
+
+    def test_serve_file_success(self):
+        self._serve_from_database()
 
         response = self.client.get("/uploads/uuid-456/photo.jpg")
 
         assert response.status_code == 200
         assert response.mimetype == "image/jpeg"
         assert response.data == b"fake_image_data"
+        assert response.headers["ETag"] == f'"{self.DIGEST}"'
+        assert response.headers["Accept-Ranges"] == "bytes"
+        assert response.cache_control.immutable
+        self.mock_file_service.get_file_metadata.assert_called_once_with("uuid-456")
         self.mock_file_service.get_file.assert_called_once_with("uuid-456")
 
+    def test_serve_file_from_content_path(self, tmp_path):
+        path = tmp_path / "blob"
+        path.write_bytes(b"image_on_disk")
+        record = FileRecord(
+            file_id="uuid-789",
+            original_filename="photo.png",
+            mime_type="image/png",
+            data=None,
+            size=len(b"image_on_disk"),
+            content_path=str(path),
+            content_sha256=self.DIGEST,
+        )
+        self.mock_file_service.get_file_metadata.return_value = record
+
+        response = self.client.get("/uploads/uuid-789/photo.png")
+
+        assert response.status_code == 200
+        assert response.mimetype == "image/png"
+        assert response.data == b"image_on_disk"
+        self.mock_file_service.get_file.assert_not_called()
+
+    def test_matching_etag_returns_304_without_loading_content(self):
+        self._serve_from_database()
+
+        response = self.client.get("/uploads/uuid-456/photo.jpg", headers={"If-None-Match": f'"{self.DIGEST}"'})
+
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["ETag"] == f'"{self.DIGEST}"'
+        self.mock_file_service.get_file.assert_not_called()
+
+    def test_unmodified_since_returns_304_without_loading_content(self):
+        self._serve_from_database()
+
+        response = self.client.get(
+            "/uploads/uuid-456/photo.jpg", headers={"If-Modified-Since": "Mon, 01 Jan 2024 12:00:00 GMT"},
+        )
+
+        assert response.status_code == 304
+        self.mock_file_service.get_file.assert_not_called()
+
+    def test_stale_etag_returns_content(self):
+        self._serve_from_database()
+
+        response = self.client.get("/uploads/uuid-456/photo.jpg", headers={"If-None-Match": '"other"'})
+
+        assert response.status_code == 200
+        assert response.data == b"fake_image_data"
+
+    def test_range_request_returns_partial_content(self):
+        self._serve_from_database(b"0123456789")
+
+        response = self.client.get("/uploads/uuid-456/photo.jpg", headers={"Range": "bytes=2-5"})
+
+        assert response.status_code == 206
+        assert response.data == b"2345"
+        assert response.headers["Content-Range"] == "bytes 2-5/10"
+
+    def test_range_request_on_content_path(self, tmp_path):
+        path = tmp_path / "blob"
+        path.write_bytes(b"0123456789")
+        self.mock_file_service.get_file_metadata.return_value = FileRecord(
+            file_id="uuid-789", original_filename="photo.png", mime_type="image/png", data=None, size=10,
+            content_path=str(path), content_sha256=self.DIGEST,
+        )
+
+        response = self.client.get("/uploads/uuid-789/photo.png", headers={"Range": "bytes=-3"})
+
+        assert response.status_code == 206
+        assert response.data == b"789"
+
     def test_serve_file_not_found(self):
-        self.mock_file_service.get_file.return_value = None
+        self.mock_file_service.get_file_metadata.return_value = None
 
         response = self.client.get("/uploads/uuid-999/missing.jpg")
 
         assert response.status_code == 404
         assert b"File not found" in response.data
-        self.mock_file_service.get_file.assert_called_once_with("uuid-999")
+        self.mock_file_service.get_file_metadata.assert_called_once_with("uuid-999")
+        self.mock_file_service.get_file.assert_not_called()
+
+
+class TestImageVariantServe(FlaskFileAdapterTest):
+    def test_serve_variant(self):
+        self.mock_file_service.get_image_variant.return_value = FileRecord(
+            file_id="uuid-456", original_filename="64x64.webp", mime_type="image/webp", data=b"webp", size=4,
+            content_sha256="abc",
+        )
+
+        response = self.client.get("/uploads/uuid-456/64x64.webp")
+
+        assert response.status_code == 200
+        assert response.mimetype == "image/webp"
+        assert response.data == b"webp"
+        assert response.headers["ETag"] == '"abc"'
+        self.mock_file_service.get_image_variant.assert_called_once_with("uuid-456", 64, 64, "webp")
+
+    def test_unknown_variant_falls_back_to_original(self):
+        self.mock_file_service.get_image_variant.return_value = None
+        self.mock_file_service.get_file_metadata.return_value = FileRecord(
+            file_id="uuid-456", original_filename="800x600.webp", mime_type="image/webp", data=None, size=4,
+        )
+        self.mock_file_service.get_file.return_value = FileRecord(
+            file_id="uuid-456", original_filename="800x600.webp", mime_type="image/webp", data=b"orig", size=4,
+        )
+
+        response = self.client.get("/uploads/uuid-456/800x600.webp")
+
+        assert response.status_code == 200
+        assert response.data == b"orig"
+
+    def test_other_filenames_are_served_as_originals(self):
+        self.mock_file_service.get_file_metadata.return_value = None
+
+        response = self.client.get("/uploads/uuid-456/64x64.png")
+
+        assert response.status_code == 404
+        self.mock_file_service.get_image_variant.assert_not_called()
@@ -1,4 +1,11 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
 from config.env_config import env_config
+from src.application.application_exceptions import PasswordHasherBusyError
 from src.infrastructure.output_adapters.security.argon2_password_hasher_adapter import (
     Argon2PasswordHasherAdapter,
 )
@@ -38,3 +45,54 @@ class TestArgon2PasswordHasherAdapter:
 
     def test_check_needs_rehash_on_legacy_plaintext(self):
         assert self.hasher.check_needs_rehash("plaintext") is True
+
+
+class TestArgon2PasswordHasherPool:
+    def _hasher(self, pool_size: int, max_queued: int) -> Argon2PasswordHasherAdapter:
+        return Argon2PasswordHasherAdapter(
+            time_cost=env_config.test_argon2_time_cost,
+            memory_cost=env_config.test_argon2_memory_cost,
+            parallelism=env_config.test_argon2_parallelism,
+            pool_size=pool_size,
+            max_queued=max_queued,
+        )
+
+    def test_pool_hashes_and_verifies(self):
+        hasher = self._hasher(pool_size=2, max_queued=2)
+        hashed = hasher.hash("password123")
+        assert hasher.verify("password123", hashed) is True
+        assert hasher.verify("wrong", hashed) is False
+        stats = hasher.stats
+        assert stats.completed == 3
+        assert stats.rejected == 0
+        assert stats.in_flight == 0
+        assert stats.hash_seconds > 0
+
+    def test_saturated_pool_rejects_at_once(self):
+        hasher = self._hasher(pool_size=1, max_queued=1)
+        started, release = threading.Event(), threading.Event()
+        real_hasher = hasher._hasher
+
+        def blocking_hash(password):
+            started.set()
+            release.wait(5)
+            return real_hasher.hash(password)
+
+        hasher._hasher = Mock(spec=real_hasher)
+        hasher._hasher.hash.side_effect = blocking_hash
+        running = threading.Thread(target=hasher.hash, args=("running",))
+        queued = threading.Thread(target=hasher.hash, args=("queued",))
+        running.start()
+        assert started.wait(5)
+        queued.start()
+        while hasher.stats.in_flight < 2:
+            time.sleep(0.01)
+        with pytest.raises(PasswordHasherBusyError):
+            hasher.hash("rejected")
+        release.set()
+        running.join(5)
+        queued.join(5)
+        stats = hasher.stats
+        assert stats.rejected == 1
+        assert stats.completed == 2
+        assert stats.max_queue_wait_seconds > 0
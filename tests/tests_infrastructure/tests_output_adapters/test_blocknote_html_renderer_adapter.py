@@ -0,0 +1,50 @@
+import json
+from unittest.mock import MagicMock
+
+from src.application.output_ports.file_storage_repository import FileStorageRepository
+from src.infrastructure.output_adapters.rendering.blocknote_html_renderer_adapter import BlockNoteHtmlRendererAdapter
+from utils.prosemirror_to_html import RENDERER_VERSION, prosemirror_to_html
+
+_FILE_ID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+def _document(text: str) -> str:
+    return json.dumps([{"type": "paragraph", "content": [{"type": "text", "text": text}]}])
+
+
+def _image_document(file_id: str) -> str:
+    return json.dumps([{"type": "image", "props": {"url": f"/uploads/{file_id}/photo.png"}}])
+
+
+class TestBlockNoteHtmlRendererAdapter:
+    def test_render_matches_prosemirror_to_html(self):
+        content = json.dumps([{"type": "image", "props": {"url": "/uploads/a.png"}}])
+        assert BlockNoteHtmlRendererAdapter().render(content) == str(prosemirror_to_html(content))
+
+    def test_version_is_renderer_version(self):
+        assert BlockNoteHtmlRendererAdapter().version == RENDERER_VERSION
+
+    def test_render_all_in_worker_pool_keeps_order(self):
+        contents = [_document(f"Article {i}") for i in range(5)]
+        renderer = BlockNoteHtmlRendererAdapter(pool_size=2)
+        assert renderer.render_all(contents) == [f"<p>Article {i}</p>" for i in range(5)]
+
+    def test_render_looks_up_image_widths(self):
+        repository = MagicMock(spec=FileStorageRepository, autospec=True)
+        repository.get_image_widths.return_value = {_FILE_ID: 600}
+        content = _image_document(_FILE_ID)
+        result = BlockNoteHtmlRendererAdapter(file_storage_repository=repository).render(content)
+        assert result == str(prosemirror_to_html(content, image_widths={_FILE_ID: 600}))
+        repository.get_image_widths.assert_called_once_with({_FILE_ID})
+
+    def test_render_all_looks_up_widths_once(self):
+        other_id = "223e4567-e89b-12d3-a456-426614174000"
+        repository = MagicMock(spec=FileStorageRepository, autospec=True)
+        repository.get_image_widths.return_value = {_FILE_ID: 600}
+        contents = [_image_document(_FILE_ID), _image_document(other_id)]
+        results = BlockNoteHtmlRendererAdapter(pool_size=2, file_storage_repository=repository).render_all(contents)
+        assert results == [
+            str(prosemirror_to_html(contents[0], image_widths={_FILE_ID: 600})),
+            str(prosemirror_to_html(contents[1])),
+        ]
+        repository.get_image_widths.assert_called_once_with({_FILE_ID, other_id})
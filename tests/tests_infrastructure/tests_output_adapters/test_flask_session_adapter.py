@@ -200,3 +200,77 @@ class TestFlaskSessionAdapterEdgeCases(BaseTestFlaskSessionAdapter):
             retrieved = self.adapter.get_account()
             if retrieved:
                 assert retrieved.account_username == long_username
+
+
+class TestFlaskSessionAdapterSnapshot(BaseTestFlaskSessionAdapter):
+    def setup_method(self):
+        super().setup_method()
+        self.adapter = FlaskSessionAdapter(account_repository=self.mock_repo, snapshot_ttl=60)
+
+    def test_snapshot_serves_account_without_query(self):
+        account = create_test_account(account_role=AccountRole.AUTHOR, account_avatar_file_id="avatar-1")
+        with self.app.test_request_context():
+            self.adapter.save_account(account)
+            retrieved = self.adapter.get_account()
+        assert retrieved is not None
+        assert retrieved.account_username == account.account_username
+        assert retrieved.account_email == account.account_email
+        assert retrieved.account_role == AccountRole.AUTHOR
+        assert retrieved.account_created_at == account.account_created_at
+        assert retrieved.avatar_file_id == "avatar-1"
+        assert retrieved.account_password == ""
+        self.mock_repo.get_by_id.assert_not_called()
+        self.mock_repo.get_version.assert_not_called()
+
+    def test_snapshot_checks_version_once_per_ttl(self):
+        account = create_test_account()
+        self.mock_repo.get_version.return_value = 0
+        with self.app.test_request_context():
+            self.adapter.save_account(account)
+            self.adapter._versions.clear()
+            for _ in range(3):
+                assert self.adapter.get_account() is not None
+        self.mock_repo.get_version.assert_called_once_with(account.account_id)
+        self.mock_repo.get_by_id.assert_not_called()
+
+    def test_changed_version_reloads_and_resnapshots_account(self):
+        account = create_test_account(account_role=AccountRole.USER)
+        banned = create_test_account(account_role=AccountRole.USER, is_banned=True, ban_reason="spam")
+        banned.account_version = 1
+        self.mock_repo.get_version.return_value = 1
+        self.mock_repo.get_by_id.return_value = banned
+        with self.app.test_request_context():
+            self.adapter.save_account(account)
+            self.adapter._versions.clear()
+            retrieved = self.adapter.get_account()
+            assert retrieved is banned
+            again = self.adapter.get_account()
+        assert again is not None and again.is_banned and again.ban_reason == "spam"
+        self.mock_repo.get_by_id.assert_called_once_with(account.account_id)
+
+    def test_deleted_account_returns_none(self):
+        account = create_test_account()
+        self.mock_repo.get_version.return_value = None
+        self.mock_repo.get_by_id.return_value = None
+        with self.app.test_request_context():
+            self.adapter.save_account(account)
+            self.adapter._versions.clear()
+            assert self.adapter.get_account() is None
+
+    def test_expired_version_is_looked_up_again(self):
+        adapter = FlaskSessionAdapter(account_repository=self.mock_repo, snapshot_ttl=1e-9)
+        self.mock_repo.get_version.return_value = 0
+        with self.app.test_request_context():
+            adapter.save_account(create_test_account())
+            adapter.get_account()
+            adapter.get_account()
+        assert self.mock_repo.get_version.call_count == 2
+
+    def test_session_without_snapshot_loads_account(self):
+        from flask import session as flask_session
+        account = create_test_account()
+        self.mock_repo.get_by_id.return_value = account
+        with self.app.test_request_context():
+            flask_session[FlaskSessionAdapter._KEY_USER_ID] = account.account_id
+            assert self.adapter.get_account() is account
+            assert flask_session[FlaskSessionAdapter._KEY_SNAPSHOT]["version"] == account.account_version
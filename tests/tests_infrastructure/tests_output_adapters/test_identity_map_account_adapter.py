@@ -0,0 +1,67 @@
+from unittest.mock import MagicMock
+
+from flask import Flask
+
+from src.application.output_ports.account_repository import AccountRepository
+from src.infrastructure.output_adapters.cache.identity_map_account_adapter import IdentityMapAccountAdapter
+from tests.test_domain_factories import create_test_account
+
+
+class TestIdentityMapAccountAdapter:
+    def setup_method(self):
+        self.app = Flask(__name__)
+        self.accounts = {
+            1: create_test_account(account_id=1, account_username="leia", account_email="leia@galaxy.com"),
+            2: create_test_account(account_id=2, account_username="luke", account_email="luke@galaxy.com"),
+        }
+        self.mock_repo = MagicMock(spec=AccountRepository, autospec=True)
+        self.mock_repo.get_by_id.side_effect = self.accounts.get
+        self.mock_repo.get_by_ids.side_effect = lambda ids: [self.accounts[i] for i in ids if i in self.accounts]
+        self.mock_repo.find_by_username.side_effect = lambda name: next(
+            (a for a in self.accounts.values() if a.account_username == name), None,
+        )
+        self.adapter = IdentityMapAccountAdapter(self.mock_repo)
+
+    def test_account_is_loaded_once_per_request(self):
+        with self.app.test_request_context():
+            first = self.adapter.get_by_id(1)
+            assert self.adapter.get_by_id(1) is first
+            assert self.adapter.get_by_id(99) is None
+            assert self.adapter.get_by_id(99) is None
+        assert self.mock_repo.get_by_id.call_count == 2
+
+    def test_each_request_starts_a_new_map(self):
+        with self.app.app_context():
+            with self.app.test_request_context():
+                self.adapter.get_by_id(1)
+            with self.app.test_request_context():
+                self.adapter.get_by_id(1)
+        assert self.mock_repo.get_by_id.call_count == 2
+
+    def test_write_evicts_the_account(self):
+        with self.app.test_request_context():
+            self.adapter.get_by_id(1)
+            self.adapter.update_ban_status(1, True, "spam")
+            self.adapter.get_by_id(1)
+        assert self.mock_repo.get_by_id.call_count == 2
+        self.mock_repo.update_ban_status.assert_called_once_with(1, True, "spam")
+
+    def test_get_by_ids_loads_only_unmapped_accounts(self):
+        with self.app.test_request_context():
+            self.adapter.get_by_id(1)
+            found = self.adapter.get_by_ids([1, 2, 3])
+            assert self.adapter.get_by_id(2) is self.accounts[2]
+        assert [a.account_id for a in found] == [1, 2]
+        self.mock_repo.get_by_ids.assert_called_once_with([2, 3])
+        self.mock_repo.get_by_id.assert_called_once_with(1)
+
+    def test_account_found_by_username_joins_the_map(self):
+        with self.app.test_request_context():
+            account = self.adapter.find_by_username("luke")
+            assert self.adapter.get_by_id(2) is account
+        self.mock_repo.get_by_id.assert_not_called()
+
+    def test_calls_are_forwarded_outside_of_a_request(self):
+        self.adapter.get_by_id(1)
+        self.adapter.get_by_id(1)
+        assert self.mock_repo.get_by_id.call_count == 2
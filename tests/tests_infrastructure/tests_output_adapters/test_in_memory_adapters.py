@@ -1,7 +1,7 @@
 from datetime import datetime
 
-from src.application.domain.account import Account, AccountRole
-from src.application.domain.article import Article
+from src.application.domain.account import Account, AccountCursor, AccountRole
+from src.application.domain.article import Article, ArticleCursor
 from src.application.domain.comment import Comment
 from src.infrastructure.output_adapters.in_memory.account_repository import InMemoryAccountRepository
 from src.infrastructure.output_adapters.in_memory.account_session_repository import InMemoryAccountSessionRepository
@@ -15,7 +15,7 @@ class TestInMemoryArticleRepository:
         article = Article(0, 1, "Title", "Content", datetime.now())
         repo.save(article)
         assert article.article_id == 1
-        assert repo.count_all() == 1
+        assert repo.get_page(1, 10).total == 1
         assert repo.get_by_id(1) == article
 
     def test_save_existing_article(self):
@@ -29,7 +29,7 @@ class TestInMemoryArticleRepository:
         fetched_article = repo.get_by_id(5)
         assert fetched_article is not None
         assert fetched_article.article_title == "New Title"
-        assert repo.count_all() == 1
+        assert repo.get_page(1, 10).total == 1
 
     def test_delete_article(self):
         repo = InMemoryArticleRepository()
@@ -37,7 +37,14 @@ class TestInMemoryArticleRepository:
         repo.save(article)
         repo.delete(article)
         assert repo.get_by_id(1) is None
-        assert repo.count_all() == 0
+        assert repo.get_page(1, 10).total == 0
+
+    def test_replace_file_references_returns_unshared_removals(self):
+        repo = InMemoryArticleRepository()
+        repo.replace_file_references(1, {"a", "b"})
+        repo.replace_file_references(2, {"b"})
+        assert repo.replace_file_references(1, {"c"}) == {"a"}
+        assert repo.replace_file_references(2, set()) == {"b"}
 
     def test_get_all_ordered_and_paginated(self):
         repo = InMemoryArticleRepository()
@@ -49,7 +56,7 @@ class TestInMemoryArticleRepository:
         repo.save(account_3)
         ordered = repo.get_all_ordered_by_date_desc()
         assert [articles.article_id for articles in ordered] == [2, 3, 1]
-        paginated = repo.get_paginated(1, 2)
+        paginated = repo.get_page(1, 2).items
         assert [articles.article_id for articles in paginated] == [2, 3]
 
     def test_get_by_id_not_found(self):
@@ -60,12 +67,51 @@ class TestInMemoryArticleRepository:
         repo = InMemoryArticleRepository()
         ghost = Article(999, 1, "Ghost", "C", datetime.now())
         repo.delete(ghost)
-        assert repo.count_all() == 0
+        assert repo.get_page(1, 10).total == 0
 
-    def test_get_paginated_out_of_range(self):
+    def test_get_page_after_cursor(self):
+        repo = InMemoryArticleRepository()
+        repo.save(Article(1, 1, "A1", "C", datetime(2023, 1, 1)))
+        repo.save(Article(2, 1, "A2", "C", datetime(2023, 1, 3)))
+        repo.save(Article(3, 1, "A3", "C", datetime(2023, 1, 2)))
+        first_page = repo.get_page(1, per_page=2).items
+        assert [a.article_id for a in first_page] == [2, 3]
+        next_page = repo.get_page(1, per_page=2, cursor=ArticleCursor(datetime(2023, 1, 2), 3)).items
+        assert [a.article_id for a in next_page] == [1]
+
+    def test_get_page_and_search_page(self):
+        repo = InMemoryArticleRepository()
+        repo.save(Article(1, 1, "Python A", "C", datetime(2023, 1, 1)))
+        repo.save(Article(2, 1, "Python B", "C", datetime(2023, 1, 3)))
+        repo.save(Article(3, 1, "Rust", "C", datetime(2023, 1, 2)))
+        page = repo.get_page(1, 2)
+        assert [i.article_id for i in page.items] == [2, 3]
+        assert page.total == 3
+        assert [i.article_id for i in repo.get_page(9, 2, ArticleCursor(datetime(2023, 1, 2), 3)).items] == [1]
+        result = repo.search_page("Python", page=2, per_page=1)
+        assert [i.article_id for i in result.items] == [1]
+        assert result.total == 2
+
+    def test_read_models_resolve_authors(self):
+        accounts = InMemoryAccountRepository()
+        author = Account(0, "writer", "pass", "w@t.com", AccountRole.AUTHOR, datetime.now())
+        accounts.save(author)
+        repo = InMemoryArticleRepository(accounts)
+        repo.save(Article(1, author.account_id, "Signed", "C", datetime(2023, 1, 2)))
+        repo.save(Article(2, None, "Orphan", "C", datetime(2023, 1, 1)))
+        repo.save(Article(3, 999, "Lost", "C", datetime(2023, 1, 3)))
+        signed = repo.get_with_author(1)
+        assert signed is not None
+        assert signed.author_name == "writer"
+        assert [i.author_name for i in repo.get_page(1, 10).items] == ["Unknown", "writer", "Anonymous"]
+        assert repo.get_with_author(42) is None
+
+    def test_get_page_out_of_range(self):
         repo = InMemoryArticleRepository()
         repo.save(Article(1, 1, "A1", "C", datetime.now()))
-        assert repo.get_paginated(page=99, per_page=10) == []
+        page = repo.get_page(page=99, per_page=10)
+        assert page.items == []
+        assert page.total == 1
 
     def test_auto_increment_after_multiple_saves(self):
         repo = InMemoryArticleRepository()
@@ -78,14 +124,14 @@ class TestInMemoryArticleRepository:
         assert account_1.article_id == 1
         assert account_2.article_id == 2
         assert account_3.article_id == 3
-        assert repo.count_all() == 3
+        assert repo.get_page(1, 10).total == 3
 
     def test_search_by_title(self):
         repo = InMemoryArticleRepository()
         repo.save(Article(1, 1, "Learning BlockNote", "Content", datetime(2023, 1, 3)))
         repo.save(Article(2, 1, "Python Tips", "Some python content", datetime(2023, 1, 2)))
         repo.save(Article(3, 1, "Advanced BlockNote", "More content", datetime(2023, 1, 1)))
-        results = repo.search("BlockNote", page=1, per_page=10)
+        results = repo.search_page("BlockNote", page=1, per_page=10).items
         assert len(results) == 2
         assert [a.article_id for a in results] == [1, 3]
 
@@ -93,7 +139,7 @@ class TestInMemoryArticleRepository:
         repo = InMemoryArticleRepository()
         repo.save(Article(1, 1, "Title A", "Content", datetime(2023, 1, 2), article_description="This is a great tutorial"))
         repo.save(Article(2, 1, "Title B", "Content", datetime(2023, 1, 1)))
-        results = repo.search("tutorial", page=1, per_page=10)
+        results = repo.search_page("tutorial", page=1, per_page=10).items
         assert len(results) == 1
         assert results[0].article_id == 1
 
@@ -102,14 +148,14 @@ class TestInMemoryArticleRepository:
         repo.save(Article(1, 1, "Python Guide", "Learn python", datetime(2023, 1, 3)))
         repo.save(Article(2, 1, "JS Guide", "Learn javascript", datetime(2023, 1, 2)))
         repo.save(Article(3, 1, "Rust Guide", "Learn rust", datetime(2023, 1, 1)))
-        assert repo.count_search("Guide") == 3
-        assert repo.count_search("Python") == 1
-        assert repo.count_search("Nonexistent") == 0
+        assert repo.search_page("Guide", page=1, per_page=10).total == 3
+        assert repo.search_page("Python", page=1, per_page=10).total == 1
+        assert repo.search_page("Nonexistent", page=1, per_page=10).total == 0
 
     def test_search_no_match(self):
         repo = InMemoryArticleRepository()
         repo.save(Article(1, 1, "Title", "Content", datetime.now()))
-        assert repo.search("xyznonexistent", page=1, per_page=10) == []
+        assert repo.search_page("xyznonexistent", page=1, per_page=10).items == []
 
 
 class TestInMemoryAccountRepository:
@@ -143,6 +189,14 @@ class TestInMemoryAccountRepository:
         repo = InMemoryAccountRepository()
         assert repo.get_by_id(999) is None
 
+    def test_updates_increment_version(self):
+        repo = InMemoryAccountRepository()
+        repo.save(Account(1, "user", "pass", "em", AccountRole.USER, datetime.now()))
+        repo.update_role(1, "author")
+        repo.update_ban_status(1, True, "spam")
+        assert repo.get_version(1) == 2
+        assert repo.get_version(999) is None
+
     def test_get_by_ids_empty_list(self):
         repo = InMemoryAccountRepository()
         repo.save(Account(1, "user", "pass", "em", AccountRole.USER, datetime.now()))
@@ -159,43 +213,64 @@ class TestInMemoryAccountRepository:
         assert a1 in results
         assert a2 in results
 
-    def test_get_all_paginated_page_1(self):
+    def test_get_page_page_1(self):
         repo = InMemoryAccountRepository()
         for i in range(5):
             repo.save(Account(0, f"user{i}", "pass", f"em{i}@t.com", AccountRole.USER, datetime(2024, 1, 1, 0, 0, i)))
-        results = repo.get_all_paginated(page=1, per_page=2)
+        results = repo.get_page(page=1, per_page=2).items
         assert len(results) == 2
         assert results[0].account_username == "user4"
         assert results[1].account_username == "user3"
 
-    def test_get_all_paginated_page_2(self):
+    def test_get_page_page_2(self):
         repo = InMemoryAccountRepository()
         for i in range(5):
             repo.save(Account(0, f"user{i}", "pass", f"em{i}@t.com", AccountRole.USER, datetime(2024, 1, 1, 0, 0, i)))
-        results = repo.get_all_paginated(page=2, per_page=2)
+        results = repo.get_page(page=2, per_page=2).items
         assert len(results) == 2
         assert results[0].account_username == "user2"
         assert results[1].account_username == "user1"
 
-    def test_get_all_paginated_empty_page(self):
+    def test_get_page_and_search_page(self):
+        repo = InMemoryAccountRepository()
+        for i in range(5):
+            repo.save(Account(0, f"user{i}", "pass", f"em{i}@t.com", AccountRole.USER, datetime(2024, 1, 1, 0, 0, i)))
+        page = repo.get_page(page=1, per_page=2)
+        assert [a.account_username for a in page.items] == ["user4", "user3"]
+        assert page.total == 5
+        cursor = AccountCursor(datetime(2024, 1, 1, 0, 0, 3), 4)
+        assert [a.account_username for a in repo.get_page(per_page=2, cursor=cursor).items] == ["user2", "user1"]
+        result = repo.search_page("user3")
+        assert [a.account_username for a in result.items] == ["user3"]
+        assert result.total == 1
+
+    def test_get_page_empty_page(self):
         repo = InMemoryAccountRepository()
         for i in range(3):
             repo.save(Account(0, f"user{i}", "pass", f"em{i}@t.com", AccountRole.USER, datetime(2024, 1, 1, 0, 0, i)))
-        results = repo.get_all_paginated(page=2, per_page=3)
+        results = repo.get_page(page=2, per_page=3).items
         assert len(results) == 0
 
-    def test_count_all_accounts(self):
+    def test_suggest_by_username_prefix_first(self):
         repo = InMemoryAccountRepository()
-        assert repo.count_all() == 0
+        for name in ["bobalice", "alicia", "Alice", "malice", "bob"]:
+            repo.save(Account(0, name, "pass", f"{name}@t.com", AccountRole.USER, datetime.now()))
+        assert [a.account_username for a in repo.suggest_by_username("ali")] == ["Alice", "alicia", "malice", "bobalice"]
+        assert [a.account_username for a in repo.suggest_by_username("ali", limit=2)] == ["Alice", "alicia"]
+        assert [a.account_username for a in repo.suggest_by_username("al")] == ["Alice", "alicia"]
+
+    def test_get_page_counts_all_accounts(self):
+        repo = InMemoryAccountRepository()
+        assert repo.get_page().total == 0
         repo.save(Account(0, "u1", "p", "e1@t.com", AccountRole.USER, datetime.now()))
         repo.save(Account(0, "u2", "p", "e2@t.com", AccountRole.USER, datetime.now()))
-        assert repo.count_all() == 2
+        assert repo.get_page().total == 2
 
     def test_search_accounts_by_username(self):
         repo = InMemoryAccountRepository()
         for i in range(5):
             repo.save(Account(0, f"user{i}", "pass", f"em{i}@t.com", AccountRole.USER, datetime(2024, 1, 1, 0, 0, i)))
-        results = repo.search("user3", page=1, per_page=10)
+        results = repo.search_page("user3", page=1, per_page=10).items
         assert len(results) == 1
         assert results[0].account_username == "user3"
 
@@ -203,21 +278,21 @@ class TestInMemoryAccountRepository:
         repo = InMemoryAccountRepository()
         for i in range(5):
             repo.save(Account(0, f"user{i}", "pass", f"em{i}@t.com", AccountRole.USER, datetime(2024, 1, 1, 0, 0, i)))
-        results = repo.search("@t.com", page=1, per_page=10)
+        results = repo.search_page("@t.com", page=1, per_page=10).items
         assert len(results) == 5
 
     def test_search_accounts_no_match(self):
         repo = InMemoryAccountRepository()
         repo.save(Account(0, "user1", "pass", "em1@t.com", AccountRole.USER, datetime.now()))
-        results = repo.search("zzz", page=1, per_page=10)
+        results = repo.search_page("zzz", page=1, per_page=10).items
         assert len(results) == 0
 
     def test_search_accounts_count(self):
         repo = InMemoryAccountRepository()
         for i in range(5):
             repo.save(Account(0, f"user{i}", "pass", f"em{i}@t.com", AccountRole.USER, datetime.now()))
-        assert repo.count_search("user") == 5
-        assert repo.count_search("zzz") == 0
+        assert repo.search_page("user").total == 5
+        assert repo.search_page("zzz").total == 0
 
     def test_update_email_changes_email(self):
         repo = InMemoryAccountRepository()
@@ -298,6 +373,26 @@ class TestInMemoryCommentRepository:
         repo.delete(comment.comment_id)
         assert repo.get_by_id(1) is None
 
+    def test_get_ancestors(self):
+        repo = InMemoryCommentRepository()
+        repo.save(Comment(1, 10, 5, None, "root", datetime.now()))
+        repo.save(Comment(2, 10, 5, 1, "reply", datetime.now(), comment_depth=1))
+        repo.save(Comment(3, 10, 5, 2, "nested", datetime.now(), comment_depth=2))
+        assert [c.comment_id for c in repo.get_ancestors(3)] == [2, 1]
+        assert repo.get_ancestors(1) == []
+        assert repo.get_ancestors(999) == []
+
+    def test_get_all_with_authors_by_article_id(self):
+        accounts = InMemoryAccountRepository()
+        author = Account(0, "commenter", "pass", "c@t.com", AccountRole.USER, datetime.now())
+        accounts.save(author)
+        repo = InMemoryCommentRepository(accounts)
+        repo.save(Comment(1, 10, author.account_id, None, "signed", datetime.now()))
+        repo.save(Comment(2, 10, None, None, "orphan", datetime.now()))
+        repo.save(Comment(3, 20, author.account_id, None, "elsewhere", datetime.now()))
+        found = {c.comment.comment_content: c.author_name for c in repo.get_all_with_authors_by_article_id(10)}
+        assert found == {"signed": "commenter", "orphan": "Anonymous"}
+
     def test_get_all_by_article_id_empty(self):
         repo = InMemoryCommentRepository()
         assert repo.get_all_by_article_id(999) == []
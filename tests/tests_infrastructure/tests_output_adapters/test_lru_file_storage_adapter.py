@@ -0,0 +1,118 @@
+from unittest.mock import MagicMock
+
+from src.application.domain.file_record import FileRecord
+from src.application.domain.image_variant import ImageVariant
+from src.application.output_ports.file_storage_repository import FileStorageRepository
+from src.infrastructure.output_adapters.cache.lru_file_storage_adapter import FileCacheStats, LruFileStorageAdapter
+
+
+def _record(file_id: str, size: int) -> FileRecord:
+    return FileRecord(file_id=file_id, original_filename="a.png", mime_type="image/png", size=size, data=b"x" * size)
+
+
+class TestLruFileStorageAdapter:
+    def setup_method(self):
+        self.records = {file_id: _record(file_id, 40) for file_id in ("a", "b", "c")}
+        self.records["big"] = _record("big", 80)
+        self.mock_repo = MagicMock(spec=FileStorageRepository, autospec=True)
+        self.mock_repo.get.side_effect = self.records.get
+        self.mock_repo.get_metadata.side_effect = self.records.get
+        self.cache = LruFileStorageAdapter(self.mock_repo, max_bytes=100, max_entry_bytes=50)
+
+    def test_second_read_is_served_from_memory(self):
+        first = self.cache.get("a")
+        second = self.cache.get("a")
+        assert second is first
+        self.mock_repo.get.assert_called_once_with("a")
+        assert self.cache.stats == FileCacheStats(hits=1, misses=1, evictions=0, entries=1, cached_bytes=40)
+
+    def test_metadata_of_cached_file_skips_repository(self):
+        self.cache.get("a")
+        assert self.cache.get_metadata("a") is self.records["a"]
+        self.mock_repo.get_metadata.assert_not_called()
+
+    def test_metadata_miss_is_not_cached(self):
+        self.cache.get_metadata("a")
+        self.cache.get_metadata("a")
+        assert self.mock_repo.get_metadata.call_count == 2
+        assert self.cache.stats.entries == 0
+
+    def test_cold_metadata_then_content_read_counts_one_miss(self):
+        self.cache.get_metadata("a")
+        self.cache.get("a")
+        assert self.cache.stats == FileCacheStats(hits=0, misses=1, evictions=0, entries=1, cached_bytes=40)
+
+    def test_least_recently_used_file_is_evicted_over_budget(self):
+        self.cache.get("a")
+        self.cache.get("b")
+        self.cache.get("a")
+        self.cache.get("c")
+        assert self.cache.stats.evictions == 1
+        assert self.cache.stats.cached_bytes == 80
+        self.cache.get("a")
+        self.cache.get("b")
+        assert [call.args[0] for call in self.mock_repo.get.call_args_list] == ["a", "b", "c", "b"]
+
+    def test_file_above_entry_cap_is_not_cached(self):
+        self.cache.get("big")
+        self.cache.get("big")
+        assert self.mock_repo.get.call_count == 2
+        assert self.cache.stats.entries == 0
+
+    def test_file_on_disk_is_not_cached(self):
+        self.records["disk"] = FileRecord(
+            file_id="disk", original_filename="a.png", mime_type="image/png", size=3, data=None, content_path="/tmp/x",
+        )
+        self.cache.get("disk")
+        assert self.cache.stats.entries == 0
+
+    def test_missing_file_is_not_cached(self):
+        assert self.cache.get("missing") is None
+        assert self.cache.get("missing") is None
+        assert self.mock_repo.get.call_count == 2
+
+    def test_delete_invalidates_entry(self):
+        self.cache.get("a")
+        self.cache.delete("a")
+        self.mock_repo.delete.assert_called_once_with("a")
+        assert self.cache.stats.entries == 0
+        assert self.cache.stats.cached_bytes == 0
+        self.cache.get("a")
+        assert self.mock_repo.get.call_count == 2
+
+    def test_delete_many_invalidates_entries(self):
+        self.cache.get("a")
+        self.cache.get("b")
+        self.cache.delete_many({"a", "b"})
+        self.mock_repo.delete_many.assert_called_once_with({"a", "b"})
+        assert self.cache.stats.entries == 0
+
+    def test_save_is_delegated(self):
+        record = _record("new", 10)
+        self.mock_repo.save.return_value = record
+        assert self.cache.save(record) is record
+        self.mock_repo.save.assert_called_once_with(record)
+
+    def test_image_widths_are_delegated(self):
+        self.mock_repo.get_image_widths.return_value = {"a": 600}
+        assert self.cache.get_image_widths({"a", "b"}) == {"a": 600}
+        self.mock_repo.get_image_widths.assert_called_once_with({"a", "b"})
+
+    def test_variants_are_cached_and_invalidated_with_their_file(self):
+        variant = ImageVariant(64, 64, "webp")
+        self.mock_repo.get_variant.return_value = _record("a", 10)
+        self.cache.get("a")
+        self.cache.get_variant("a", variant)
+        self.cache.get_variant("a", variant)
+        self.mock_repo.get_variant.assert_called_once_with("a", variant)
+        assert self.cache.stats.entries == 2
+        self.cache.delete("a")
+        assert self.cache.stats.entries == 0
+
+    def test_saved_variant_is_cached(self):
+        variant = ImageVariant(64, 64, "webp")
+        rendition = _record("a", 10)
+        self.mock_repo.save_variant.return_value = rendition
+        self.cache.save_variant("a", variant, rendition)
+        assert self.cache.get_variant("a", variant) is rendition
+        self.mock_repo.get_variant.assert_not_called()
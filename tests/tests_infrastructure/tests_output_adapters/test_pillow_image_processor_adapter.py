@@ -0,0 +1,65 @@
+import io
+
+from PIL import Image
+
+from src.application.domain.image_variant import ImageVariant
+from src.infrastructure.output_adapters.imaging.pillow_image_processor_adapter import PillowImageProcessorAdapter
+
+
+def _png(width: int, height: int, mode: str = "RGB") -> bytes:
+    output = io.BytesIO()
+    Image.new(mode, (width, height), (255, 0, 0, 128) if mode == "RGBA" else "red").save(output, format="PNG")
+    return output.getvalue()
+
+
+def _decode(data: bytes | None) -> Image.Image:
+    assert data is not None
+    return Image.open(io.BytesIO(data))
+
+
+class TestPillowImageProcessorAdapter:
+    def setup_method(self):
+        self.processor = PillowImageProcessorAdapter()
+
+    def test_avatar_variant_is_cropped_to_square(self):
+        image = _decode(self.processor.render(_png(300, 200), ImageVariant(64, 64, "webp")))
+        assert image.format == "WEBP"
+        assert image.size == (64, 64)
+
+    def test_content_variant_keeps_aspect_ratio(self):
+        image = _decode(self.processor.render(_png(1000, 500), ImageVariant(480, 0, "avif")))
+        assert image.format == "AVIF"
+        assert image.size == (480, 240)
+
+    def test_content_variant_is_never_upscaled(self):
+        image = _decode(self.processor.render(_png(200, 100), ImageVariant(960, 0, "webp")))
+        assert image.size == (200, 100)
+
+    def test_width_is_read_and_stream_rewound(self):
+        stream = io.BytesIO(_png(300, 200))
+        assert self.processor.get_width(stream) == 300
+        assert stream.tell() == 0
+
+    def test_width_follows_exif_orientation(self):
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        output = io.BytesIO()
+        Image.new("RGB", (300, 200), "red").save(output, format="JPEG", exif=exif)
+        assert self.processor.get_width(io.BytesIO(output.getvalue())) == 200
+
+    def test_width_of_non_raster_content_is_none(self):
+        assert self.processor.get_width(io.BytesIO(b"<svg xmlns='http://www.w3.org/2000/svg'/>")) is None
+
+    def test_transparency_is_kept(self):
+        image = _decode(self.processor.render(_png(100, 100, "RGBA"), ImageVariant(32, 32, "webp")))
+        assert image.mode == "RGBA"
+
+    def test_non_raster_image_returns_none(self):
+        svg = b'<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"></svg>'
+        assert self.processor.render(svg, ImageVariant(64, 64, "webp")) is None
+
+    def test_render_all_in_worker_pool_keeps_order(self):
+        processor = PillowImageProcessorAdapter(pool_size=2)
+        variants = [ImageVariant(32, 32, "webp"), ImageVariant(480, 0, "webp"), ImageVariant(64, 64, "avif")]
+        renditions = processor.render_all(_png(600, 300), variants)
+        assert [_decode(data).size for data in renditions] == [(32, 32), (480, 240), (64, 64)]
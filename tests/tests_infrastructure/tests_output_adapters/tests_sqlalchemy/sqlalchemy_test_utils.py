@@ -44,12 +44,15 @@ class AccountDataBuilder:
         password="password123",
         email="test@example.com",
         role="user",
+        created_at=None,
     ) -> AccountModel:
         model = AccountModel()
         model.account_username = username
         model.account_password = password
         model.account_email = email
         model.account_role = role
+        if created_at:
+            model.account_created_at = created_at
         self._session.add(model)
         self._session.commit()
         return model
@@ -91,11 +94,13 @@ class CommentDataBuilder:
         author_id: int,
         content: str = "Test Comment",
         reply_to: int | None = None,
+        depth: int = 0,
     ) -> CommentModel:
         model = CommentModel()
         model.comment_article_id = article_id
         model.comment_written_account_id = author_id
         model.comment_reply_to = reply_to
+        model.comment_depth = depth
         model.comment_content = content
         self._session.add(model)
         self._session.commit()
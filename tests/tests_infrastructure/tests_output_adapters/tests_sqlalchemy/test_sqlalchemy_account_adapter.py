@@ -1,7 +1,7 @@
 import pytest
 
 from src.application.application_exceptions import AccountAlreadyExistsError
-from src.application.domain.account import AccountRole
+from src.application.domain.account import AccountCursor, AccountRole
 from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_account_model import AccountModel
 from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_account_adapter import SqlAlchemyAccountAdapter
 from tests.test_domain_factories import create_test_account
@@ -166,6 +166,35 @@ class TestAccountUpdatePassword(SqlAlchemyAccountAdapterTestBase):
         assert result.account_password == "new_hash"
 
 
+
+class TestAccountVersion(SqlAlchemyAccountAdapterTestBase):
+    def test_new_account_starts_at_version_zero(self):
+        account = self.account_builder.create(username="fresh")
+        assert self.repository.get_version(account.account_id) == 0
+
+    def test_get_version_of_missing_account_returns_none(self):
+        assert self.repository.get_version(99999) is None
+
+    def test_every_update_increments_version(self):
+        account = self.account_builder.create(username="versioned", email="v@test.com")
+        self.repository.update_role(account.account_id, "author")
+        self.repository.update_ban_status(account.account_id, True, "spam")
+        self.repository.update_password(account.account_id, "new_hash")
+        self.repository.update_email(account.account_id, "w@test.com")
+        self.repository.update_avatar(account.account_id, None)
+        result = self.repository.get_by_id(account.account_id)
+        assert result is not None
+        assert result.account_version == 5
+        assert self.repository.get_version(account.account_id) == 5
+
+    def test_save_of_existing_account_increments_version(self):
+        account = self.account_builder.create(username="saved")
+        loaded = self.repository.get_by_id(account.account_id)
+        assert loaded is not None
+        self.repository.save(loaded)
+        assert loaded.account_version == 1
+        assert self.repository.get_version(account.account_id) == 1
+
 class TestAccountGetAll(SqlAlchemyAccountAdapterTestBase):
     def test_get_all_returns_all_accounts(self):
         self.account_builder.create(username="user_one", email="one@test.com")
@@ -176,57 +205,96 @@ class TestAccountGetAll(SqlAlchemyAccountAdapterTestBase):
         assert usernames == {"user_one", "user_two"}
 
 
-class TestAccountGetAllPaginated(SqlAlchemyAccountAdapterTestBase):
-    def test_get_all_paginated_page_1(self):
+class TestAccountGetPage(SqlAlchemyAccountAdapterTestBase):
+    def test_get_page_page_1(self):
         for i in range(5):
             self.account_builder.create(username=f"user{i}", email=f"user{i}@t.com")
-        results = self.repository.get_all_paginated(page=1, per_page=2)
+        results = self.repository.get_page(page=1, per_page=2).items
         assert len(results) == 2
 
-    def test_get_all_paginated_page_2(self):
+    def test_get_page_page_2(self):
         for i in range(5):
             self.account_builder.create(username=f"user{i}", email=f"user{i}@t.com")
-        results = self.repository.get_all_paginated(page=2, per_page=2)
+        results = self.repository.get_page(page=2, per_page=2).items
         assert len(results) == 2
 
-    def test_get_all_paginated_empty_page(self):
+    def test_get_page_empty_page(self):
         for i in range(3):
             self.account_builder.create(username=f"user{i}", email=f"user{i}@t.com")
-        results = self.repository.get_all_paginated(page=2, per_page=3)
+        results = self.repository.get_page(page=2, per_page=3).items
         assert len(results) == 0
 
-    def test_count_all(self):
-        assert self.repository.count_all() == 0
+    def test_get_page_returns_items_and_total(self):
+        for i in range(5):
+            self.account_builder.create(username=f"user{i}", email=f"user{i}@t.com")
+        result = self.repository.get_page(page=2, per_page=2)
+        assert [a.account_username for a in result.items] == ["user2", "user1"]
+        assert result.total == 5
+
+    def test_get_page_follows_cursor(self):
+        created = [self.account_builder.create(username=f"user{i}", email=f"user{i}@t.com") for i in range(5)]
+        cursor = AccountCursor(created[3].account_created_at, created[3].account_id)
+        result = self.repository.get_page(page=3, per_page=2, cursor=cursor)
+        assert [a.account_username for a in result.items] == ["user2", "user1"]
+        assert result.total == 5
+
+    def test_cursor_matches_offset_pages_when_creation_order_differs_from_ids(self):
+        from datetime import datetime, timedelta
+
+        base_time = datetime(2024, 1, 1)
+        for i, hours in enumerate([3, 0, 4, 1, 2]):
+            created_at = base_time + timedelta(hours=hours)
+            self.account_builder.create(username=f"user{i}", email=f"user{i}@t.com", created_at=created_at)
+
+        offset_pages = [self.repository.get_page(page, per_page=2).items for page in (1, 2, 3)]
+        keyset_pages = [offset_pages[0]]
+        for _ in range(2):
+            last = keyset_pages[-1][-1]
+            assert last.account_created_at is not None
+            cursor = AccountCursor(last.account_created_at, last.account_id)
+            keyset_pages.append(self.repository.get_page(per_page=2, cursor=cursor).items)
+
+        assert [[a.account_username for a in p] for p in offset_pages] == [["user2", "user0"], ["user4", "user3"], ["user1"]]
+        assert [[a.account_id for a in p] for p in keyset_pages] == [[a.account_id for a in p] for p in offset_pages]
+
+    def test_get_page_past_the_end_still_reports_total(self):
+        self.account_builder.create(username="u1", email="u1@t.com")
+        result = self.repository.get_page(page=2, per_page=20)
+        assert result.items == []
+        assert result.total == 1
+
+    def test_get_page_counts_all_accounts(self):
+        assert self.repository.get_page().total == 0
         self.account_builder.create(username="u1", email="u1@t.com")
         self.account_builder.create(username="u2", email="u2@t.com")
-        assert self.repository.count_all() == 2
+        assert self.repository.get_page().total == 2
 
 
 class TestAccountSearch(SqlAlchemyAccountAdapterTestBase):
     def test_search_by_username(self):
         self.account_builder.create(username="alice", email="alice@t.com")
         self.account_builder.create(username="bob", email="bob@t.com")
-        results = self.repository.search("alice", page=1, per_page=10)
+        results = self.repository.search_page("alice", page=1, per_page=10).items
         assert len(results) == 1
         assert results[0].account_username == "alice"
 
     def test_search_by_email(self):
         self.account_builder.create(username="alice", email="alice@test.com")
         self.account_builder.create(username="bob", email="bob@test.com")
-        results = self.repository.search("@test.com", page=1, per_page=10)
+        results = self.repository.search_page("@test.com", page=1, per_page=10).items
         assert len(results) == 2
 
     def test_search_no_match(self):
         self.account_builder.create(username="alice", email="alice@t.com")
-        results = self.repository.search("zzz", page=1, per_page=10)
+        results = self.repository.search_page("zzz", page=1, per_page=10).items
         assert len(results) == 0
 
     def test_search_count(self):
         self.account_builder.create(username="alice", email="alice@t.com")
         self.account_builder.create(username="bob", email="bob@t.com")
-        assert self.repository.count_search("alice") == 1
-        assert self.repository.count_search("@t.com") == 2
-        assert self.repository.count_search("zzz") == 0
+        assert self.repository.search_page("alice").total == 1
+        assert self.repository.search_page("@t.com").total == 2
+        assert self.repository.search_page("zzz").total == 0
 
 
 class TestAccountUpdateBanStatus(SqlAlchemyAccountAdapterTestBase):
@@ -246,3 +314,44 @@ class TestAccountUpdateBanStatus(SqlAlchemyAccountAdapterTestBase):
         assert result is not None
         assert result.is_banned is False
         assert result.ban_reason is None
+
+
+class TestAccountSuggestByUsername(SqlAlchemyAccountAdapterTestBase):
+    def _create(self, *usernames: str) -> None:
+        for name in usernames:
+            self.account_builder.create(username=name, email=f"{name}@t.com")
+
+    def test_prefix_matches_come_first(self):
+        self._create("bobalice", "alicia", "Alice", "malice", "bob")
+        results = self.repository.suggest_by_username("ali")
+        assert [r.account_username for r in results] == ["Alice", "alicia", "malice", "bobalice"]
+
+    def test_prefix_matches_filling_the_limit_skip_substring_lookup(self):
+        self._create("alice", "alicia", "malice")
+        results = self.repository.suggest_by_username("ali", limit=2)
+        assert [r.account_username for r in results] == ["alice", "alicia"]
+
+    def test_short_query_only_matches_prefix(self):
+        self._create("alice", "malice")
+        results = self.repository.suggest_by_username("al")
+        assert [r.account_username for r in results] == ["alice"]
+
+    def test_wildcards_are_matched_literally(self):
+        self._create("a_b", "axb")
+        assert [r.account_username for r in self.repository.suggest_by_username("a_")] == ["a_b"]
+        assert [r.account_username for r in self.repository.search_page("a_b").items] == ["a_b"]
+        assert self.repository.search_page("%").total == 0
+
+    def test_search_page_returns_items_and_total(self):
+        for i in range(3):
+            self.account_builder.create(username=f"alice{i}", email=f"alice{i}@t.com")
+        self.account_builder.create(username="bob", email="bob@t.com")
+        result = self.repository.search_page("alice", page=1, per_page=2)
+        assert len(result.items) == 2
+        assert result.total == 3
+
+    def test_search_page_no_match(self):
+        self.account_builder.create(username="alice", email="alice@t.com")
+        result = self.repository.search_page("zzz")
+        assert result.items == []
+        assert result.total == 0
@@ -1,7 +1,13 @@
+from uuid import uuid4
+
 import pytest
+from sqlalchemy import event
 
-from src.application.domain.article import Article
+from src.application.domain.article import Article, ArticleCursor, ArticleSummary
+from src.infrastructure.output_adapters.rendering.blocknote_html_renderer_adapter import BlockNoteHtmlRendererAdapter
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_article_file_model import ArticleFileModel
 from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_article_model import ArticleModel
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_uploaded_file_model import UploadedFileModel
 from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_article_adapter import SqlAlchemyArticleAdapter
 from tests.test_domain_factories import create_test_article
 from tests.tests_infrastructure.tests_output_adapters.tests_sqlalchemy.sqlalchemy_test_utils import (
@@ -33,6 +39,19 @@ class TestArticleGetById(SqlAlchemyArticleAdapterTestBase):
         assert result is None
 
 
+class TestArticleGetWithAuthor(SqlAlchemyArticleAdapterTestBase):
+    def test_get_with_author_returns_read_model(self):
+        account = self.account_builder.create(username="writer", email="writer@test.com")
+        inserted = self.article_builder.create(author_id=account.account_id)
+        result = self.repository.get_with_author(inserted.article_id)
+        assert result is not None
+        assert result.article.article_id == inserted.article_id
+        assert result.author_name == "writer"
+
+    def test_get_with_author_returns_none_if_not_found(self):
+        assert self.repository.get_with_author(9999) is None
+
+
 class TestArticleSave(SqlAlchemyArticleAdapterTestBase):
     def test_save_persists_article_to_database(self):
         account = self.account_builder.create()
@@ -73,6 +92,37 @@ class TestArticleSave(SqlAlchemyArticleAdapterTestBase):
         assert result.article_content == "Updated Content"
 
 
+class TestArticleRendering(SqlAlchemyArticleAdapterTestBase):
+    def test_save_persists_rendered_html(self):
+        account = self.account_builder.create()
+        article = create_test_article(article_id=0, article_author_id=account.account_id)
+        article.article_content_html, article.article_renderer_version = "<p>Content</p>", 3
+        self.repository.save(article)
+        result = self.repository.get_by_id(article.article_id)
+        assert result is not None
+        assert (result.article_content_html, result.article_renderer_version) == ("<p>Content</p>", 3)
+
+    def test_render_stale_renders_only_outdated_articles(self):
+        account = self.account_builder.create()
+        renderer = BlockNoteHtmlRendererAdapter()
+        stale = [self.article_builder.create(author_id=account.account_id, content=f"Body {i}") for i in range(3)]
+        current = self.article_builder.create(author_id=account.account_id, content="Current")
+        current.article_content_html, current.article_renderer_version = "<p>Kept</p>", renderer.version
+        self.session.commit()
+        batches = []
+
+        assert self.repository.render_stale(renderer, batch_size=2, on_batch=batches.append) == 3
+        assert batches == [2, 1]
+        for model in stale:
+            result = self.repository.get_by_id(model.article_id)
+            assert result is not None
+            assert result.article_content_html == renderer.render(result.article_content)
+            assert result.article_renderer_version == renderer.version
+        kept = self.repository.get_by_id(current.article_id)
+        assert kept is not None and kept.article_content_html == "<p>Kept</p>"
+        assert self.repository.render_stale(renderer) == 0
+
+
 class TestArticleDelete(SqlAlchemyArticleAdapterTestBase):
     def test_delete_removes_article_from_database(self):
         account = self.account_builder.create()
@@ -84,26 +134,199 @@ class TestArticleDelete(SqlAlchemyArticleAdapterTestBase):
         assert check is None
 
 
+class TestArticleFileReferences(SqlAlchemyArticleAdapterTestBase):
+    @pytest.fixture(autouse=True)
+    def seed(self, setup_adapter):
+        self.account = self.account_builder.create()
+        self.first = self.article_builder.create(author_id=self.account.account_id)
+        self.second = self.article_builder.create(author_id=self.account.account_id)
+        self.file_ids = [str(uuid4()) for _ in range(3)]
+        for file_id in self.file_ids:
+            self.session.add(UploadedFileModel(
+                file_id=file_id, original_filename="a.png", mime_type="image/png", file_size=1, file_data=b"x",
+            ))
+        self.session.commit()
+
+    def _references(self, article_id: int) -> set[str]:
+        rows = self.session.query(ArticleFileModel.file_id).filter(ArticleFileModel.article_id == article_id)
+        return {file_id for (file_id,) in rows}
+
+    def test_replace_records_existing_files_only(self):
+        missing = str(uuid4())
+        orphaned = self.repository.replace_file_references(self.first.article_id, {self.file_ids[0], missing})
+        assert orphaned == set()
+        assert self._references(self.first.article_id) == {self.file_ids[0]}
+
+    def test_replace_returns_files_no_longer_referenced(self):
+        self.repository.replace_file_references(self.first.article_id, set(self.file_ids[:2]))
+        orphaned = self.repository.replace_file_references(self.first.article_id, {self.file_ids[1], self.file_ids[2]})
+        assert orphaned == {self.file_ids[0]}
+        assert self._references(self.first.article_id) == {self.file_ids[1], self.file_ids[2]}
+
+    def test_files_shared_with_another_article_are_not_orphaned(self):
+        self.repository.replace_file_references(self.first.article_id, {self.file_ids[0]})
+        self.repository.replace_file_references(self.second.article_id, {self.file_ids[0]})
+        assert self.repository.replace_file_references(self.first.article_id, set()) == set()
+        assert self.repository.replace_file_references(self.second.article_id, set()) == {self.file_ids[0]}
+
+    def test_avatar_files_are_not_orphaned(self):
+        self.account.avatar_file_id = self.file_ids[0]
+        self.session.commit()
+        self.repository.replace_file_references(self.first.article_id, {self.file_ids[0]})
+        assert self.repository.replace_file_references(self.first.article_id, set()) == set()
+
+    def test_references_go_away_with_the_article(self):
+        self.repository.replace_file_references(self.first.article_id, {self.file_ids[0]})
+        target = self.repository.get_by_id(self.first.article_id)
+        assert target is not None
+        self.repository.delete(target)
+        assert self._references(self.first.article_id) == set()
+
+
 class TestArticlePagination(SqlAlchemyArticleAdapterTestBase):
-    def test_get_paginated_returns_correct_chunk(self):
+    def test_get_page_returns_correct_chunk(self):
         account = self.account_builder.create()
 
         for i in range(1, 4):
             self.article_builder.create(author_id=account.account_id, title=f"Title {i}")
 
-        page1 = self.repository.get_paginated(page=1, per_page=2)
-        assert len(page1) == 2
-        page2 = self.repository.get_paginated(page=2, per_page=2)
-        assert len(page2) == 1
+        page1 = self.repository.get_page(page=1, per_page=2)
+        assert len(page1.items) == 2
+        page2 = self.repository.get_page(page=2, per_page=2)
+        assert len(page2.items) == 1
 
-    def test_count_all_returns_total(self):
+    def test_get_page_counts_all_articles(self):
         account = self.account_builder.create()
         self.article_builder.create(author_id=account.account_id)
         self.article_builder.create(author_id=account.account_id)
-        total = self.repository.count_all()
+        total = self.repository.get_page(page=1, per_page=1).total
         assert total == 2
 
 
+class TestArticleKeysetPagination(SqlAlchemyArticleAdapterTestBase):
+    def test_cursor_walks_pages_without_overlap(self):
+        from datetime import datetime, timedelta
+
+        account = self.account_builder.create()
+        base_time = datetime.now()
+        for i in range(5):
+            published_at = base_time + timedelta(hours=i)
+            self.article_builder.create(author_id=account.account_id, title=f"Title {i}", published_at=published_at)
+
+        page1 = self.repository.get_page(1, per_page=2).items
+        last = page1[-1]
+        assert last.article_published_at is not None
+        page2 = self.repository.get_page(1, 2, ArticleCursor(last.article_published_at, last.article_id)).items
+        assert [a.article_title for a in page1] == ["Title 4", "Title 3"]
+        assert [a.article_title for a in page2] == ["Title 2", "Title 1"]
+
+    def test_cursor_breaks_timestamp_ties_by_id(self):
+        from datetime import datetime
+
+        account = self.account_builder.create()
+        same_time = datetime.now()
+        first = self.article_builder.create(author_id=account.account_id, title="First", published_at=same_time)
+        second = self.article_builder.create(author_id=account.account_id, title="Second", published_at=same_time)
+
+        results = self.repository.get_page(1, 10, ArticleCursor(same_time, second.article_id)).items
+        assert [a.article_id for a in results] == [first.article_id]
+
+    def test_cursor_matches_offset_pages(self):
+        account = self.account_builder.create()
+        for i in range(4):
+            self.article_builder.create(author_id=account.account_id, title=f"Title {i}")
+
+        offset_page1 = self.repository.get_page(page=1, per_page=2).items
+        offset_page2 = self.repository.get_page(page=2, per_page=2).items
+        last = offset_page1[-1]
+        assert last.article_published_at is not None
+        keyset_page2 = self.repository.get_page(1, 2, ArticleCursor(last.article_published_at, last.article_id)).items
+        assert [a.article_id for a in keyset_page2] == [a.article_id for a in offset_page2]
+
+
+class TestArticleGetPage(SqlAlchemyArticleAdapterTestBase):
+    def test_list_queries_do_not_read_article_content(self):
+        account = self.account_builder.create()
+        self.article_builder.create(author_id=account.account_id, title="Listed")
+        statements: list[str] = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = self.session.get_bind()
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            page = self.repository.get_page(1, 10)
+            self.repository.get_all_ordered_by_date_desc()
+            self.repository.search_page("Listed", 1, 10)
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        assert isinstance(page.items[0], ArticleSummary)
+        assert page.items[0].article_title == "Listed"
+        assert statements
+        assert not any("article_content" in statement for statement in statements)
+
+    def test_get_page_returns_items_and_total(self):
+        account = self.account_builder.create()
+        for i in range(3):
+            self.article_builder.create(author_id=account.account_id, title=f"Title {i}")
+
+        page1 = self.repository.get_page(1, 2)
+        page2 = self.repository.get_page(2, 2)
+        assert len(page1.items) == 2
+        assert [i.article_title for i in page2.items] == ["Title 0"]
+        assert page1.total == page2.total == 3
+
+    def test_get_page_follows_cursor(self):
+        account = self.account_builder.create()
+        for i in range(4):
+            self.article_builder.create(author_id=account.account_id, title=f"Title {i}")
+
+        first = self.repository.get_page(1, 2)
+        last = first.items[-1]
+        assert last.article_published_at is not None
+        cursor = ArticleCursor(last.article_published_at, last.article_id)
+        second = self.repository.get_page(5, 2, cursor)
+        assert [i.article_id for i in second.items] == [a.article_id for a in self.repository.get_page(2, 2).items]
+        assert second.total == 4
+
+    def test_get_page_includes_authors(self):
+        account = self.account_builder.create(username="writer", email="writer@test.com")
+        account.avatar_file_id = "avatar-uuid"
+        self.session.commit()
+        self.article_builder.create(author_id=account.account_id, title="Signed")
+        orphan = self.article_builder.create(author_id=account.account_id, title="Orphan")
+        orphan.article_author_id = None
+        self.session.commit()
+
+        by_title = {i.article_title: i for i in self.repository.get_page(1, 10).items}
+        assert by_title["Signed"].author_name == "writer"
+        assert by_title["Signed"].author_avatar_file_id == "avatar-uuid"
+        assert by_title["Orphan"].author_name == "Anonymous"
+        assert by_title["Orphan"].author_avatar_file_id is None
+
+    def test_get_page_past_the_end_still_reports_total(self):
+        account = self.account_builder.create()
+        self.article_builder.create(author_id=account.account_id)
+        result = self.repository.get_page(3, 10)
+        assert result.items == []
+        assert result.total == 1
+
+    def test_get_page_uses_planner_estimate_above_threshold(self):
+        from sqlalchemy import text
+
+        account = self.account_builder.create()
+        for _ in range(3):
+            self.article_builder.create(author_id=account.account_id)
+        self.session.execute(text("ANALYZE articles"))
+        self.article_builder.create(author_id=account.account_id)
+
+        assert SqlAlchemyArticleAdapter(self.session, approximate_count_threshold=1).get_page(1, 10).total == 3
+        assert SqlAlchemyArticleAdapter(self.session, approximate_count_threshold=100).get_page(1, 10).total == 4
+        assert self.repository.get_page(1, 10).total == 4
+
+
 class TestArticleGetAllOrderedByDateDesc(SqlAlchemyArticleAdapterTestBase):
     def test_returns_all_articles_sorted_newest_first(self):
         from datetime import datetime, timedelta
@@ -134,33 +357,59 @@ class TestArticleSearch(SqlAlchemyArticleAdapterTestBase):
         self.article_builder.create(author_id=author.account_id, title="Post Two")
         other = self.account_builder.create(username="jane_doe", email="jane@test.com")
         self.article_builder.create(author_id=other.account_id, title="Jane Post")
-        results = self.repository.search("john", page=1, per_page=10)
+        results = self.repository.search_page("john", page=1, per_page=10).items
         assert len(results) == 2
         assert all("Post" in a.article_title for a in results)
 
     def test_search_by_author_case_insensitive(self):
         author = self.account_builder.create(username="JohnDoe", email="johncase@test.com")
         self.article_builder.create(author_id=author.account_id, title="Some Post")
-        results = self.repository.search("johndoe", page=1, per_page=10)
+        results = self.repository.search_page("johndoe", page=1, per_page=10).items
         assert len(results) == 1
 
     def test_search_by_author_no_match(self):
         author = self.account_builder.create(username="alice", email="alice@test.com")
         self.article_builder.create(author_id=author.account_id, title="Post")
-        results = self.repository.search("inexistant", page=1, per_page=10)
+        results = self.repository.search_page("inexistant", page=1, per_page=10).items
         assert results == []
 
+    def test_search_matches_wildcards_literally(self):
+        author = self.account_builder.create(username="john_doe", email="john@test.com")
+        self.article_builder.create(author_id=author.account_id, title="100% Python")
+        self.article_builder.create(author_id=author.account_id, title="1000 Python")
+        assert [a.article_title for a in self.repository.search_page("0%", page=1, per_page=10).items] == ["100% Python"]
+        assert self.repository.search_page("n_d", page=1, per_page=10).total == 2
+        assert self.repository.search_page("jo_n", page=1, per_page=10).total == 0
+
     def test_search_title_still_works_with_join(self):
         author = self.account_builder.create(username="someauthor", email="some@test.com")
         self.article_builder.create(author_id=author.account_id, title="Unique Title")
         self.article_builder.create(author_id=author.account_id, title="Other")
-        results = self.repository.search("Unique", page=1, per_page=10)
+        results = self.repository.search_page("Unique", page=1, per_page=10).items
         assert len(results) == 1
         assert results[0].article_title == "Unique Title"
 
-    def test_count_search_by_author(self):
+    def test_search_page_counts_author_matches(self):
         author = self.account_builder.create(username="bob", email="bob@test.com")
         self.article_builder.create(author_id=author.account_id, title="Post 1")
         self.article_builder.create(author_id=author.account_id, title="Post 2")
-        assert self.repository.count_search("bob") == 2
-        assert self.repository.count_search("alice") == 0
+        assert self.repository.search_page("bob", page=1, per_page=10).total == 2
+        assert self.repository.search_page("alice", page=1, per_page=10).total == 0
+
+    def test_search_page_returns_items_and_total(self):
+        author = self.account_builder.create(username="carol", email="carol@test.com")
+        for i in range(3):
+            self.article_builder.create(author_id=author.account_id, title=f"Post {i}")
+        self.article_builder.create(author_id=author.account_id, title="Other")
+
+        result = self.repository.search_page("Post", page=2, per_page=2)
+        assert all(i.author_name == "carol" for i in result.items)
+        assert [i.article_title for i in result.items] == ["Post 0"]
+        assert result.total == 3
+
+    def test_search_page_past_the_end_still_reports_total(self):
+        author = self.account_builder.create(username="dave", email="dave@test.com")
+        self.article_builder.create(author_id=author.account_id, title="Post")
+        result = self.repository.search_page("Post", page=4, per_page=2)
+        assert result.items == []
+        assert result.total == 1
@@ -56,6 +56,51 @@ class TestCommentSave(SqlAlchemyCommentAdapterTestBase):
         assert model.comment_article_id == article.article_id
         assert model.comment_written_account_id == account.account_id
 
+    def test_save_persists_comment_depth(self):
+        account = self.account_builder.create()
+        article = self.article_builder.create(author_id=account.account_id)
+        parent = self.comment_builder.create(article_id=article.article_id, author_id=account.account_id)
+
+        reply = create_test_comment(
+            comment_id=0,
+            comment_article_id=article.article_id,
+            comment_written_account_id=account.account_id,
+            comment_reply_to=parent.comment_id,
+            comment_content="A reply",
+            comment_depth=1,
+        )
+
+        self.repository.save(reply)
+        model = self.session.query(CommentModel).filter_by(comment_content="A reply").one()
+        assert model.comment_depth == 1
+        loaded = self.repository.get_by_id(model.comment_id)
+        assert loaded is not None
+        assert loaded.comment_depth == 1
+
+
+class TestCommentGetAncestors(SqlAlchemyCommentAdapterTestBase):
+    def test_get_ancestors_returns_chain_nearest_first(self):
+        account = self.account_builder.create()
+        article = self.article_builder.create(author_id=account.account_id)
+        root = self.comment_builder.create(article_id=article.article_id, author_id=account.account_id)
+        reply = self.comment_builder.create(
+            article_id=article.article_id, author_id=account.account_id, reply_to=root.comment_id, depth=1,
+        )
+        nested = self.comment_builder.create(
+            article_id=article.article_id, author_id=account.account_id, reply_to=reply.comment_id, depth=2,
+        )
+        self.comment_builder.create(article_id=article.article_id, author_id=account.account_id, reply_to=root.comment_id)
+
+        results = self.repository.get_ancestors(nested.comment_id)
+        assert [c.comment_id for c in results] == [reply.comment_id, root.comment_id]
+
+    def test_get_ancestors_of_top_level_comment_is_empty(self):
+        account = self.account_builder.create()
+        article = self.article_builder.create(author_id=account.account_id)
+        root = self.comment_builder.create(article_id=article.article_id, author_id=account.account_id)
+        assert self.repository.get_ancestors(root.comment_id) == []
+        assert self.repository.get_ancestors(9999) == []
+
 
 class TestCommentDelete(SqlAlchemyCommentAdapterTestBase):
     def test_delete_removes_comment_from_database(self):
@@ -86,3 +131,25 @@ class TestCommentGetAllByArticleId(SqlAlchemyCommentAdapterTestBase):
         article = self.article_builder.create(author_id=account.account_id)
         results = self.repository.get_all_by_article_id(article.article_id)
         assert results == []
+
+
+class TestCommentGetAllWithAuthorsByArticleId(SqlAlchemyCommentAdapterTestBase):
+    def test_returns_comments_with_author_names_and_avatars(self):
+        account = self.account_builder.create(username="commenter", email="commenter@test.com")
+        account.avatar_file_id = "avatar-uuid"
+        self.session.commit()
+        article = self.article_builder.create(author_id=account.account_id)
+        other = self.article_builder.create(author_id=account.account_id, title="Other")
+        self.comment_builder.create(article_id=article.article_id, author_id=account.account_id, content="Signed")
+        orphan = self.comment_builder.create(article_id=article.article_id, author_id=account.account_id, content="Orphan")
+        orphan.comment_written_account_id = None
+        self.session.commit()
+        self.comment_builder.create(article_id=other.article_id, author_id=account.account_id)
+
+        comments = self.repository.get_all_with_authors_by_article_id(article.article_id)
+        by_content = {c.comment.comment_content: c for c in comments}
+        assert set(by_content) == {"Signed", "Orphan"}
+        assert by_content["Signed"].author_name == "commenter"
+        assert by_content["Signed"].author_avatar_file_id == "avatar-uuid"
+        assert by_content["Orphan"].author_name == "Anonymous"
+        assert by_content["Orphan"].author_avatar_file_id is None
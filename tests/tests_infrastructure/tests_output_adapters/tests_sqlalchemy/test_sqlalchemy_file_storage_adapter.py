@@ -1,10 +1,24 @@
+from datetime import timedelta
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import func, update
 
 from src.application.domain.file_record import FileRecord
+from src.application.domain.image_variant import ImageVariant
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_article_file_model import ArticleFileModel
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_file_blob_model import FileBlobModel
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_uploaded_file_model import UploadedFileModel
 from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_file_storage_adapter import SqlAlchemyFileStorageAdapter
-from tests.tests_infrastructure.tests_output_adapters.tests_sqlalchemy.sqlalchemy_test_utils import SqlAlchemyTestBase
+from tests.tests_infrastructure.tests_output_adapters.tests_sqlalchemy.sqlalchemy_test_utils import (
+    AccountDataBuilder,
+    ArticleDataBuilder,
+    SqlAlchemyTestBase,
+)
+
+
+def _record(data: bytes) -> FileRecord:
+    return FileRecord(file_id=str(uuid4()), original_filename="a.png", mime_type="image/png", size=len(data), data=data)
 
 
 class TestSqlAlchemyFileStorageAdapter(SqlAlchemyTestBase):
@@ -54,3 +68,215 @@ class TestSqlAlchemyFileStorageAdapter(SqlAlchemyTestBase):
         assert retrieved is not None
         assert retrieved.data == binary_data
         assert retrieved.size == len(binary_data)
+
+    def test_metadata_loads_do_not_fetch_file_data(self):
+        file_record = FileRecord(
+            file_id=str(uuid4()), original_filename="a.png", mime_type="image/png", size=3, data=b"abc",
+        )
+        self.repository.save(file_record)
+        self.session.expire_all()
+        model = self.session.get(UploadedFileModel, file_record.file_id)
+        assert model is not None
+        assert "file_data" not in model.__dict__
+
+    def test_save_records_content_digest(self):
+        file_record = FileRecord(
+            file_id=str(uuid4()), original_filename="a.png", mime_type="image/png", size=3, data=b"abc",
+        )
+        self.repository.save(file_record)
+        retrieved = self.repository.get(file_record.file_id)
+        assert retrieved is not None
+        assert retrieved.content_sha256 == "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+
+    def test_get_metadata_does_not_fetch_file_data(self):
+        file_record = FileRecord(
+            file_id=str(uuid4()), original_filename="a.png", mime_type="image/png", size=3, data=b"abc",
+        )
+        self.repository.save(file_record)
+        self.session.expire_all()
+        metadata = self.repository.get_metadata(file_record.file_id)
+        assert metadata is not None
+        assert metadata.size == 3
+        assert metadata.content_sha256 == file_record.content_sha256
+        model = self.session.get(UploadedFileModel, file_record.file_id)
+        assert model is not None
+        assert "file_data" not in model.__dict__
+        assert self.repository.get_metadata("00000000-0000-0000-0000-000000000000") is None
+
+    def test_delete_removes_file(self):
+        file_record = FileRecord(
+            file_id=str(uuid4()), original_filename="a.png", mime_type="image/png", size=3, data=b"abc",
+        )
+        self.repository.save(file_record)
+        self.repository.delete(file_record.file_id)
+        assert self.repository.get(file_record.file_id) is None
+        self.repository.delete(file_record.file_id)
+
+    def test_save_and_get_variant(self):
+        original = FileRecord(
+            file_id=str(uuid4()), original_filename="a.png", mime_type="image/png", size=3, data=b"abc",
+        )
+        self.repository.save(original)
+        variant = ImageVariant(64, 64, "webp")
+        rendition = FileRecord(
+            file_id=original.file_id, original_filename="64x64.webp", mime_type="image/webp", size=2, data=b"v1",
+        )
+        self.repository.save_variant(original.file_id, variant, rendition)
+        self.repository.save_variant(original.file_id, variant, rendition)
+
+        retrieved = self.repository.get_variant(original.file_id, variant)
+        assert retrieved is not None
+        assert retrieved.data == b"v1"
+        assert retrieved.mime_type == "image/webp"
+        assert retrieved.original_filename == "64x64.webp"
+        assert retrieved.content_sha256 == rendition.content_sha256
+        assert self.repository.get_variant(original.file_id, ImageVariant(32, 32, "webp")) is None
+
+    def test_delete_removes_variants(self):
+        original = FileRecord(
+            file_id=str(uuid4()), original_filename="a.png", mime_type="image/png", size=3, data=b"abc",
+        )
+        self.repository.save(original)
+        variant = ImageVariant(64, 64, "webp")
+        self.repository.save_variant(original.file_id, variant, FileRecord(
+            file_id=original.file_id, original_filename="64x64.webp", mime_type="image/webp", size=1, data=b"v",
+        ))
+        self.repository.delete(original.file_id)
+        assert self.repository.get_variant(original.file_id, variant) is None
+
+    def _blob_ref_counts(self) -> dict[str, int]:
+        self.session.expire_all()
+        return {blob.content_sha256: blob.ref_count for blob in self.session.query(FileBlobModel)}
+
+    def test_identical_contents_share_one_blob(self):
+        first = self.repository.save(_record(b"same"))
+        second = self.repository.save(_record(b"same"))
+        assert self._blob_ref_counts() == {first.content_sha256: 2}
+        for record in (first, second):
+            retrieved = self.repository.get(record.file_id)
+            assert retrieved is not None and retrieved.data == b"same"
+            model = self.session.get(UploadedFileModel, record.file_id)
+            assert model is not None and model.file_data is None
+
+    def test_delete_frees_blob_with_its_last_reference(self):
+        first = self.repository.save(_record(b"same"))
+        second = self.repository.save(_record(b"same"))
+        self.repository.delete(first.file_id)
+        assert self._blob_ref_counts() == {second.content_sha256: 1}
+        retrieved = self.repository.get(second.file_id)
+        assert retrieved is not None and retrieved.data == b"same"
+        self.repository.delete(second.file_id)
+        assert self._blob_ref_counts() == {}
+
+    def test_save_uses_digest_set_by_caller(self):
+        record = _record(b"abc")
+        record.content_sha256 = "0" * 64
+        self.repository.save(record)
+        assert self._blob_ref_counts() == {"0" * 64: 1}
+
+    def test_deduplicate_database_blobs_collapses_legacy_rows(self):
+        contents = [b"same", b"same", b"other"]
+        file_ids = [str(uuid4()) for _ in contents]
+        for file_id, data in zip(file_ids, contents, strict=True):
+            self.session.add(UploadedFileModel(
+                file_id=file_id, original_filename="a.png", mime_type="image/png", file_size=len(data), file_data=data,
+            ))
+        self.session.commit()
+        uploaded = self.repository.save(_record(b"other"))
+        batches = []
+
+        assert self.repository.deduplicate_database_blobs(batch_size=2, on_batch=batches.append) == 3
+        assert batches == [2, 1]
+        assert sorted(self._blob_ref_counts().values()) == [2, 2]
+        for file_id, data in zip(file_ids, contents, strict=True):
+            retrieved = self.repository.get(file_id)
+            assert retrieved is not None and retrieved.data == data
+            model = self.session.get(UploadedFileModel, file_id)
+            assert model is not None and model.file_data is None
+        assert self.repository.deduplicate_database_blobs() == 0
+
+        self.repository.delete(uploaded.file_id)
+        self.repository.delete(file_ids[2])
+        assert list(self._blob_ref_counts().values()) == [2]
+
+    def test_image_width_is_saved_and_read(self):
+        record = _record(b"image")
+        record.image_width = 600
+        self.repository.save(record)
+        retrieved = self.repository.get_metadata(record.file_id)
+        assert retrieved is not None and retrieved.image_width == 600
+
+    def test_get_image_widths_leaves_out_unmeasured_and_missing_files(self):
+        measured = _record(b"measured")
+        measured.image_width = 600
+        unmeasured = _record(b"unmeasured")
+        self.repository.save(measured)
+        self.repository.save(unmeasured)
+        missing = str(uuid4())
+        widths = self.repository.get_image_widths({measured.file_id, unmeasured.file_id, missing})
+        assert widths == {measured.file_id: 600}
+        assert self.repository.get_image_widths(set()) == {}
+
+    def test_measure_image_widths_records_widths_in_batches(self):
+        records = [_record(data) for data in (b"wide image", b"svg", b"image")]
+        for record in records:
+            self.repository.save(record)
+        batches = []
+
+        def get_width(content):
+            data = content.read()
+            return None if data == b"svg" else len(data)
+
+        assert self.repository.measure_image_widths(get_width, batch_size=2, on_batch=batches.append) == 2
+        assert batches == [2, 1]
+        assert self.repository.get_image_widths({record.file_id for record in records}) == {
+            records[0].file_id: len(b"wide image"),
+            records[2].file_id: len(b"image"),
+        }
+        assert self.repository.measure_image_widths(get_width) == 0
+
+    def test_delete_many_releases_each_reference(self):
+        first = self.repository.save(_record(b"same"))
+        second = self.repository.save(_record(b"same"))
+        kept = self.repository.save(_record(b"same"))
+        other = self.repository.save(_record(b"other"))
+        self.repository.delete_many({first.file_id, second.file_id, other.file_id, str(uuid4())})
+        assert self._blob_ref_counts() == {kept.content_sha256: 1}
+        assert self.repository.get(first.file_id) is None
+        assert self.repository.get(other.file_id) is None
+
+    def test_delete_of_legacy_row_leaves_blobs_untouched(self):
+        uploaded = self.repository.save(_record(b"same"))
+        legacy_id = str(uuid4())
+        self.session.add(UploadedFileModel(
+            file_id=legacy_id, original_filename="a.png", mime_type="image/png", file_size=4, file_data=b"same",
+            content_sha256=uploaded.content_sha256,
+        ))
+        self.session.commit()
+        self.repository.delete(legacy_id)
+        assert self._blob_ref_counts() == {uploaded.content_sha256: 1}
+
+    def test_collect_orphans_deletes_old_unreferenced_files(self):
+        account = AccountDataBuilder(self.session).create()
+        article = ArticleDataBuilder(self.session).create(author_id=account.account_id)
+        in_article = self.repository.save(_record(b"article"))
+        avatar = self.repository.save(_record(b"avatar"))
+        orphans = [self.repository.save(_record(b"orphan")) for _ in range(3)]
+        recent = self.repository.save(_record(b"recent"))
+        self.session.add(ArticleFileModel(article_id=article.article_id, file_id=in_article.file_id))
+        account.avatar_file_id = avatar.file_id
+        self.session.execute(
+            update(UploadedFileModel)
+            .where(UploadedFileModel.file_id != recent.file_id)
+            .values(created_at=func.now() - timedelta(days=2))
+        )
+        self.session.commit()
+        batches = []
+
+        assert self.repository.collect_orphans(timedelta(days=1), dry_run=True) == (3, 18)
+        assert self.repository.get_metadata(orphans[0].file_id) is not None
+        assert self.repository.collect_orphans(timedelta(days=1), batch_size=2, on_batch=lambda *b: batches.append(b)) == (3, 18)
+        assert batches == [(2, 12), (1, 6)]
+        assert all(self.repository.get_metadata(orphan.file_id) is None for orphan in orphans)
+        assert {in_article.content_sha256, avatar.content_sha256, recent.content_sha256} == set(self._blob_ref_counts())
+        assert self.repository.collect_orphans(timedelta(days=1)) == (0, 0)
@@ -0,0 +1,209 @@
+from io import BytesIO
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from src.application.domain.file_record import FileRecord
+from src.application.domain.image_variant import ImageVariant
+from src.infrastructure.output_adapters.filesystem.content_addressed_blob_store import ContentAddressedBlobStore
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_uploaded_file_model import UploadedFileModel
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_file_storage_adapter import SqlAlchemyFileStorageAdapter
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_filesystem_file_storage_adapter import (
+    SqlAlchemyFilesystemFileStorageAdapter,
+)
+from tests.tests_infrastructure.tests_output_adapters.tests_sqlalchemy.sqlalchemy_test_utils import SqlAlchemyTestBase
+
+
+def _record(data: bytes, filename: str = "a.png") -> FileRecord:
+    return FileRecord(file_id=str(uuid4()), original_filename=filename, mime_type="image/png", size=len(data), data=data)
+
+
+class TestContentAddressedBlobStore:
+    def test_put_writes_sharded_blob_under_digest(self, tmp_path):
+        store = ContentAddressedBlobStore(tmp_path)
+        digest = store.put(b"abc")
+        assert digest == ContentAddressedBlobStore.digest(b"abc")
+        assert store.path_for(digest) == tmp_path / digest[:2] / digest[2:4] / digest
+        assert store.path_for(digest).read_bytes() == b"abc"
+        assert [p.name for p in store.path_for(digest).parent.iterdir()] == [digest]
+
+    def test_identical_contents_share_one_blob(self, tmp_path):
+        store = ContentAddressedBlobStore(tmp_path)
+        assert store.put(b"abc") == store.put(b"abc")
+        assert len([p for p in tmp_path.rglob("*") if p.is_file()]) == 1
+
+    def test_put_stream_copies_content_under_given_digest(self, tmp_path):
+        store = ContentAddressedBlobStore(tmp_path)
+        digest = ContentAddressedBlobStore.digest(b"streamed")
+        store.put_stream(BytesIO(b"streamed"), digest)
+        assert store.path_for(digest).read_bytes() == b"streamed"
+
+    def test_remove_is_idempotent(self, tmp_path):
+        store = ContentAddressedBlobStore(tmp_path)
+        digest = store.put(b"abc")
+        store.remove(digest)
+        store.remove(digest)
+        assert not store.path_for(digest).exists()
+
+
+class TestSqlAlchemyFilesystemFileStorageAdapter(SqlAlchemyTestBase):
+    @pytest.fixture(autouse=True)
+    def setup_adapter(self, db_context, tmp_path):
+        self.blob_store = ContentAddressedBlobStore(tmp_path)
+        self.repository = SqlAlchemyFilesystemFileStorageAdapter(self.session, self.blob_store)
+
+    def test_save_writes_content_to_disk_and_not_to_database(self):
+        saved = self.repository.save(_record(b"\x89PNG data"))
+        model = self.session.get(UploadedFileModel, saved.file_id)
+        assert model is not None
+        assert model.file_data is None
+        assert model.content_sha256 == ContentAddressedBlobStore.digest(b"\x89PNG data")
+        assert Path(saved.content_path or "").read_bytes() == b"\x89PNG data"
+
+    def test_measure_image_widths_reads_contents_from_disk(self):
+        record = self.repository.save(_record(b"\x89PNG data"))
+        assert self.repository.measure_image_widths(lambda content: len(content.read())) == 1
+        assert self.repository.get_image_widths({record.file_id}) == {record.file_id: len(b"\x89PNG data")}
+
+    def test_get_returns_blob_path_and_reads_content_lazily(self):
+        record = _record(b"\x89PNG data", "tiny.png")
+        self.repository.save(record)
+        retrieved = self.repository.get(record.file_id)
+        assert retrieved is not None
+        assert retrieved.original_filename == "tiny.png"
+        assert retrieved.size == len(b"\x89PNG data")
+        assert retrieved.content_path == str(self.blob_store.path_for(ContentAddressedBlobStore.digest(b"\x89PNG data")))
+        assert retrieved.data == b"\x89PNG data"
+
+    def test_get_metadata_of_database_content_has_no_path(self):
+        record = _record(b"legacy")
+        SqlAlchemyFileStorageAdapter(self.session).save(record)
+        metadata = self.repository.get_metadata(record.file_id)
+        assert metadata is not None
+        assert metadata.content_path is None
+        assert metadata.content_sha256 == ContentAddressedBlobStore.digest(b"legacy")
+
+    def test_get_falls_back_to_database_content(self):
+        record = _record(b"legacy")
+        SqlAlchemyFileStorageAdapter(self.session).save(record)
+        retrieved = self.repository.get(record.file_id)
+        assert retrieved is not None
+        assert retrieved.content_path is None
+        assert retrieved.data == b"legacy"
+
+    def test_get_not_found_returns_none(self):
+        assert self.repository.get("00000000-0000-0000-0000-000000000000") is None
+
+    def test_delete_keeps_blob_shared_with_another_file(self):
+        first = self.repository.save(_record(b"same"))
+        second = self.repository.save(_record(b"same"))
+        blob = Path(second.content_path or "")
+        self.repository.delete(first.file_id)
+        assert self.repository.get(first.file_id) is None
+        assert blob.exists()
+        self.repository.delete(second.file_id)
+        assert not blob.exists()
+        self.repository.delete(second.file_id)
+
+    def test_save_copies_streamed_content_without_loading_it(self):
+        record = FileRecord(
+            file_id=str(uuid4()), original_filename="a.png", mime_type="image/png", size=8, data=None,
+            content_sha256=ContentAddressedBlobStore.digest(b"streamed"), stream=BytesIO(b"streamed"),
+        )
+        saved = self.repository.save(record)
+        assert Path(saved.content_path or "").read_bytes() == b"streamed"
+        assert record._data is None
+
+    def test_identical_contents_are_written_once(self):
+        self.repository.save(_record(b"same"))
+        self.blob_store.remove(ContentAddressedBlobStore.digest(b"same"))
+        second = self.repository.save(_record(b"same"))
+        assert not Path(second.content_path or "").exists()
+
+    def test_blob_shared_with_a_rendition_is_kept(self):
+        original = self.repository.save(_record(b"original"))
+        other = self.repository.save(_record(b"rendition"))
+        rendition = FileRecord(
+            file_id=original.file_id, original_filename="64x64.webp", mime_type="image/webp", size=9, data=b"rendition",
+        )
+        self.repository.save_variant(original.file_id, ImageVariant(64, 64, "webp"), rendition)
+        self.repository.delete(other.file_id)
+        assert Path(other.content_path or "").exists()
+
+    def test_delete_many_removes_unreferenced_blobs(self):
+        first = self.repository.save(_record(b"first"))
+        second = self.repository.save(_record(b"second"))
+        shared = self.repository.save(_record(b"second"))
+        self.repository.delete_many({first.file_id, second.file_id})
+        assert not Path(first.content_path or "").exists()
+        assert Path(shared.content_path or "").exists()
+
+    def test_variant_is_written_to_disk(self):
+        original = self.repository.save(_record(b"original"))
+        variant = ImageVariant(64, 64, "webp")
+        rendition = FileRecord(
+            file_id=original.file_id, original_filename="64x64.webp", mime_type="image/webp", size=7, data=b"variant",
+        )
+        self.repository.save_variant(original.file_id, variant, rendition)
+        retrieved = self.repository.get_variant(original.file_id, variant)
+        assert retrieved is not None
+        assert retrieved.content_path == str(self.blob_store.path_for(ContentAddressedBlobStore.digest(b"variant")))
+        assert retrieved.data == b"variant"
+
+    def test_delete_removes_variant_blobs(self):
+        original = self.repository.save(_record(b"original"))
+        rendition = FileRecord(
+            file_id=original.file_id, original_filename="64x64.webp", mime_type="image/webp", size=7, data=b"variant",
+        )
+        saved = self.repository.save_variant(original.file_id, ImageVariant(64, 64, "webp"), rendition)
+        self.repository.delete(original.file_id)
+        assert not Path(saved.content_path or "").exists()
+        assert not Path(original.content_path or "").exists()
+
+    def test_migrate_database_blobs_moves_contents_in_batches(self):
+        database_repository = SqlAlchemyFileStorageAdapter(self.session)
+        records = [_record(f"content {i}".encode()) for i in range(5)]
+        for record in records:
+            database_repository.save(record)
+        batches = []
+        moved = self.repository.migrate_database_blobs(batch_size=2, on_batch=batches.append)
+        assert moved == 5
+        assert batches == [2, 2, 1]
+        self.session.expire_all()
+        for i, record in enumerate(records):
+            retrieved = self.repository.get(record.file_id)
+            assert retrieved is not None and retrieved.content_path is not None
+            assert retrieved.data == f"content {i}".encode()
+            model = self.session.get(UploadedFileModel, record.file_id)
+            assert model is not None and model.file_data is None
+        assert self.repository.migrate_database_blobs(batch_size=2) == 0
+
+    def test_migrate_database_blobs_collapses_legacy_duplicates(self):
+        file_ids = [str(uuid4()) for _ in range(2)]
+        for file_id in file_ids:
+            self.session.add(UploadedFileModel(
+                file_id=file_id, original_filename="a.png", mime_type="image/png", file_size=4, file_data=b"same",
+            ))
+        self.session.commit()
+        assert self.repository.migrate_database_blobs() == 2
+        blob = self.blob_store.path_for(ContentAddressedBlobStore.digest(b"same"))
+        assert blob.read_bytes() == b"same"
+        self.repository.delete(file_ids[0])
+        assert blob.exists()
+        self.repository.delete(file_ids[1])
+        assert not blob.exists()
+
+    def test_migrate_database_blobs_moves_variants(self):
+        database_repository = SqlAlchemyFileStorageAdapter(self.session)
+        original = _record(b"original")
+        database_repository.save(original)
+        variant = ImageVariant(64, 64, "webp")
+        database_repository.save_variant(original.file_id, variant, FileRecord(
+            file_id=original.file_id, original_filename="64x64.webp", mime_type="image/webp", size=7, data=b"variant",
+        ))
+        assert self.repository.migrate_database_blobs() == 2
+        self.session.expire_all()
+        retrieved = self.repository.get_variant(original.file_id, variant)
+        assert retrieved is not None and retrieved.content_path is not None
+        assert retrieved.data == b"variant"
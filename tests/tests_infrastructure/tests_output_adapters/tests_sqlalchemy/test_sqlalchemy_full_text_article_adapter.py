@@ -0,0 +1,166 @@
+import json
+
+import pytest
+from sqlalchemy import text
+
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_article_model import ArticleModel
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_full_text_article_adapter import (
+    SqlAlchemyFullTextArticleAdapter,
+    extract_plain_text,
+)
+from tests.test_domain_factories import create_test_article
+from tests.tests_infrastructure.tests_output_adapters.tests_sqlalchemy.sqlalchemy_test_utils import (
+    AccountDataBuilder,
+    SqlAlchemyTestBase,
+)
+
+
+def _blocknote(*paragraphs: str) -> str:
+    return json.dumps([
+        {"type": "paragraph", "props": {}, "content": [{"type": "text", "text": p, "styles": {}}], "children": []}
+        for p in paragraphs
+    ])
+
+
+class TestExtractPlainText:
+    def test_collects_text_nodes_in_document_order(self):
+        content = json.dumps([
+            {"type": "heading", "content": [{"type": "text", "text": "Intro"}]},
+            {"type": "bulletListItem", "content": [{"type": "text", "text": "first"}],
+             "children": [{"type": "paragraph", "content": [{"type": "text", "text": "nested"}]}]},
+            {"type": "paragraph", "content": [{"type": "text", "text": "last"}]},
+        ])
+        assert extract_plain_text(content) == "Intro first nested last"
+
+    def test_returns_raw_text_for_invalid_json(self):
+        assert extract_plain_text("plain legacy content") == "plain legacy content"
+
+    def test_empty_content(self):
+        assert extract_plain_text("") == ""
+        assert extract_plain_text(None) == ""
+
+
+class SqlAlchemyFullTextArticleAdapterTestBase(SqlAlchemyTestBase):
+    @pytest.fixture(autouse=True)
+    def setup_adapter(self):
+        self.locale = "fr"
+        self.repository = SqlAlchemyFullTextArticleAdapter(self.session, lambda: self.locale)
+        self.author = AccountDataBuilder(self.session).create(username="johndoe", email="john@test.com")
+
+    def _save(self, title: str, content: str = "", description: str = "") -> int:
+        article = create_test_article(
+            article_id=0,
+            article_author_id=self.author.account_id,
+            article_title=title,
+            article_content=content or _blocknote("Contenu"),
+        )
+        article.article_description = description
+        self.repository.save(article)
+        return article.article_id
+
+
+class TestFullTextSave(SqlAlchemyFullTextArticleAdapterTestBase):
+    def test_save_writes_vector_with_locale_config(self):
+        article_id = self._save("Les chats du quartier", _blocknote("Un texte sur les animaux"))
+        row = self.session.execute(
+            text("SELECT article_search_config::text, article_search_vector::text FROM articles WHERE article_id = :id"),
+            {"id": article_id},
+        ).one()
+        assert row[0] == "french"
+        assert "'chat':2A" in row[1]
+        assert "'animal':" in row[1]
+
+    def test_save_uses_english_config_for_english_locale(self):
+        self.locale = "en"
+        article_id = self._save("Running cats")
+        config = self.session.execute(
+            text("SELECT article_search_config::text FROM articles WHERE article_id = :id"), {"id": article_id},
+        ).scalar()
+        assert config == "english"
+
+    def test_unknown_locale_falls_back_to_french(self):
+        self.locale = None
+        article_id = self._save("Titre")
+        config = self.session.execute(
+            text("SELECT article_search_config::text FROM articles WHERE article_id = :id"), {"id": article_id},
+        ).scalar()
+        assert config == "french"
+
+    def test_update_reindexes_article(self):
+        article_id = self._save("Ancien titre")
+        article = self.repository.get_by_id(article_id)
+        assert article is not None
+        article.article_title = "Nouveau sujet"
+        self.repository.save(article)
+        assert self.repository.search_page("sujet", page=1, per_page=10).total == 1
+        assert self.repository.search_page("ancien", page=1, per_page=10).total == 0
+
+    def test_regular_loads_do_not_fetch_the_vector(self):
+        article_id = self._save("Titre")
+        self.session.expire_all()
+        model = self.session.get(ArticleModel, article_id)
+        assert model is not None
+        assert "article_search_vector" not in model.__dict__
+
+
+class TestFullTextSearch(SqlAlchemyFullTextArticleAdapterTestBase):
+    def test_search_matches_stemmed_content(self):
+        self._save("Sans rapport", _blocknote("Nos chats adorent dormir"))
+        results = self.repository.search_page("chat", page=1, per_page=10).items
+        assert [a.article_title for a in results] == ["Sans rapport"]
+
+    def test_search_ranks_title_above_body(self):
+        self._save("Autre sujet", _blocknote("On parle de jardinage ici"))
+        self._save("Jardinage facile", _blocknote("Conseils"))
+        results = self.repository.search_page("jardinage", page=1, per_page=10).items
+        assert [a.article_title for a in results] == ["Jardinage facile", "Autre sujet"]
+
+    def test_search_matches_description(self):
+        self._save("Titre", description="Un guide complet")
+        assert self.repository.search_page("guide", page=1, per_page=10).total == 1
+
+    def test_search_supports_web_search_syntax(self):
+        self._save("Recette de tarte aux pommes")
+        self._save("Recette de tarte aux poires")
+        results = self.repository.search_page("tarte -poires", page=1, per_page=10).items
+        assert [a.article_title for a in results] == ["Recette de tarte aux pommes"]
+
+    def test_search_matches_author_username(self):
+        self._save("Sans rapport")
+        results = self.repository.search_page("john", page=1, per_page=10).items
+        assert len(results) == 1
+        assert self.repository.search_page("john", page=1, per_page=10).total == 1
+
+    def test_search_matches_each_article_in_its_own_language(self):
+        self._save("Sans rapport", _blocknote("Un texte sur les animaux"))
+        self.locale = "en"
+        self._save("Running dogs")
+        results = self.repository.search_page("animaux", page=1, per_page=10).items
+        assert [a.article_title for a in results] == ["Sans rapport"]
+        self.locale = "fr"
+        results = self.repository.search_page("running", page=1, per_page=10).items
+        assert [a.article_title for a in results] == ["Running dogs"]
+
+    def test_search_ranks_in_the_language_of_each_article(self):
+        self._save("Autre sujet", _blocknote("On parle des animaux ici"))
+        self._save("Les animaux du quartier")
+        self.locale = "en"
+        results = self.repository.search_page("animaux", page=1, per_page=10).items
+        assert [a.article_title for a in results] == ["Les animaux du quartier", "Autre sujet"]
+
+    def test_search_matches_author_wildcards_literally(self):
+        self._save("Sans rapport")
+        assert self.repository.search_page("j_hn", page=1, per_page=10).total == 0
+        assert self.repository.search_page("j%", page=1, per_page=10).total == 0
+
+    def test_search_paginates(self):
+        for i in range(3):
+            self._save(f"Article numéro {i}")
+        assert len(self.repository.search_page("article", page=1, per_page=2).items) == 2
+        assert len(self.repository.search_page("article", page=2, per_page=2).items) == 1
+        assert self.repository.search_page("article", page=1, per_page=10).total == 3
+
+    def test_search_no_match(self):
+        self._save("Titre")
+        assert self.repository.search_page("inexistant", page=1, per_page=10).items == []
+        assert self.repository.search_page("inexistant", page=1, per_page=10).total == 0
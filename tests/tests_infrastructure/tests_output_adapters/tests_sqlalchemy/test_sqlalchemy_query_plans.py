@@ -0,0 +1,170 @@
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, insert, text
+
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_account_model import AccountModel
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_article_model import ArticleModel
+from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_comment_model import CommentModel
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_article_adapter import SqlAlchemyArticleAdapter
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_comment_adapter import SqlAlchemyCommentAdapter
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_full_text_article_adapter import (
+    SqlAlchemyFullTextArticleAdapter,
+)
+from tests.tests_infrastructure.tests_output_adapters.tests_sqlalchemy.sqlalchemy_test_utils import SqlAlchemyTestBase
+
+_INDEX_SCANS = {"Index Scan", "Index Only Scan", "Bitmap Index Scan"}
+
+
+def _walk(plan: dict) -> Iterator[dict]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+class TestQueryPlans(SqlAlchemyTestBase):
+    """
+    EXPLAIN checks that the repository queries and the ON DELETE actions of
+    the foreign keys are served by an index rather than a sequential scan.
+
+    Sequential scans are disabled for each statement, so that the planner
+    falls back to them only when no index can serve the query.
+    """
+
+    @pytest.fixture(autouse=True)
+    def seed(self, db_context):
+        base = datetime(2024, 1, 1)
+        account_ids = self.session.execute(
+            insert(AccountModel).returning(AccountModel.account_id),
+            [
+                {
+                    "account_username": f"user{i}",
+                    "account_password": "x",
+                    "account_email": f"user{i}@test.com",
+                    "account_role": "author",
+                }
+                for i in range(20)
+            ],
+        ).scalars().all()
+        article_ids = self.session.execute(
+            insert(ArticleModel).returning(ArticleModel.article_id),
+            [
+                {
+                    "article_author_id": account_ids[i % len(account_ids)],
+                    "article_title": f"Title {i}",
+                    "article_content": "Content",
+                    "article_published_at": base + timedelta(hours=i),
+                }
+                for i in range(100)
+            ],
+        ).scalars().all()
+        root_ids = self.session.execute(
+            insert(CommentModel).returning(CommentModel.comment_id),
+            [
+                {
+                    "comment_article_id": article_ids[i % len(article_ids)],
+                    "comment_written_account_id": account_ids[i % len(account_ids)],
+                    "comment_content": f"Comment {i}",
+                }
+                for i in range(1000)
+            ],
+        ).scalars().all()
+        self.session.execute(
+            insert(CommentModel),
+            [
+                {
+                    "comment_article_id": article_ids[i % len(article_ids)],
+                    "comment_written_account_id": account_ids[i % len(account_ids)],
+                    "comment_reply_to": root_id,
+                    "comment_content": f"Reply {i}",
+                    "comment_depth": 1,
+                }
+                for i, root_id in enumerate(root_ids)
+            ],
+        )
+        self.session.commit()
+        self.session.execute(text("ANALYZE accounts, articles, comments"))
+        self.session.commit()
+        self.account_id = account_ids[0]
+        self.article_id = article_ids[0]
+        self.comment_id = root_ids[0]
+
+    def _explain(self, statement: str, parameters) -> dict:
+        connection = self.session.connection()
+        connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        result = connection.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters).scalar_one()
+        return result[0]["Plan"]
+
+    def _explain_call(self, call: Callable[[], object]) -> dict:
+        """Run a repository call and EXPLAIN the last statement it sent."""
+        captured = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            captured.append((statement, parameters))
+
+        bind = self.session.get_bind()
+        event.listen(bind, "before_cursor_execute", capture)
+        try:
+            self.session.connection().exec_driver_sql("SET LOCAL enable_seqscan = off")
+            call()
+        finally:
+            event.remove(bind, "before_cursor_execute", capture)
+        return self._explain(*captured[-1])
+
+    def _explain_sql(self, statement: str, **parameters) -> dict:
+        compiled = text(statement).bindparams(**parameters).compile(self.session.get_bind())
+        return self._explain(str(compiled), compiled.params)
+
+    @staticmethod
+    def _assert_uses_index(plan: dict, index_name: str, relation: str):
+        nodes = list(_walk(plan))
+        assert any(node["Node Type"] in _INDEX_SCANS and node.get("Index Name") == index_name for node in nodes), nodes
+        assert not any(node["Node Type"] == "Seq Scan" and node.get("Relation Name") == relation for node in nodes), nodes
+
+    def test_comments_of_article_use_article_index(self):
+        plan = self._explain_call(lambda: SqlAlchemyCommentAdapter(self.session).get_all_by_article_id(self.article_id))
+        self._assert_uses_index(plan, "idx_comments_article_id_posted_at", "comments")
+
+    def test_comments_with_authors_of_article_use_article_index(self):
+        adapter = SqlAlchemyCommentAdapter(self.session)
+        plan = self._explain_call(lambda: adapter.get_all_with_authors_by_article_id(self.article_id))
+        self._assert_uses_index(plan, "idx_comments_article_id_posted_at", "comments")
+
+    def test_replies_use_reply_to_index(self):
+        plan = self._explain_call(lambda: SqlAlchemyCommentAdapter(self.session).get_by_reply_to(self.comment_id))
+        self._assert_uses_index(plan, "idx_comments_reply_to", "comments")
+
+    def test_comments_of_account_use_account_index(self):
+        plan = self._explain_call(lambda: SqlAlchemyCommentAdapter(self.session).get_by_account_id(self.account_id))
+        self._assert_uses_index(plan, "idx_comments_written_account_id", "comments")
+
+    def test_article_page_uses_published_at_index(self):
+        plan = self._explain_call(lambda: SqlAlchemyArticleAdapter(self.session).get_page(2, 10))
+        self._assert_uses_index(plan, "idx_articles_published_at_id", "articles")
+
+    def test_full_text_search_uses_search_vector_index(self):
+        adapter = SqlAlchemyFullTextArticleAdapter(self.session, lambda: "en")
+        plan = self._explain_call(lambda: adapter.search_page("title", 1, 10))
+        self._assert_uses_index(plan, "idx_articles_search_vector", "articles")
+
+    def test_account_deletion_set_null_on_articles_uses_author_index(self):
+        plan = self._explain_sql(
+            "UPDATE articles SET article_author_id = NULL WHERE article_author_id = :id", id=self.account_id,
+        )
+        self._assert_uses_index(plan, "idx_articles_author_id", "articles")
+
+    def test_account_deletion_set_null_on_comments_uses_account_index(self):
+        plan = self._explain_sql(
+            "UPDATE comments SET comment_written_account_id = NULL WHERE comment_written_account_id = :id",
+            id=self.account_id,
+        )
+        self._assert_uses_index(plan, "idx_comments_written_account_id", "comments")
+
+    def test_article_deletion_cascade_uses_article_index(self):
+        plan = self._explain_sql("DELETE FROM comments WHERE comment_article_id = :id", id=self.article_id)
+        self._assert_uses_index(plan, "idx_comments_article_id_posted_at", "comments")
+
+    def test_comment_deletion_cascade_uses_reply_to_index(self):
+        plan = self._explain_sql("DELETE FROM comments WHERE comment_reply_to = :id", id=self.comment_id)
+        self._assert_uses_index(plan, "idx_comments_reply_to", "comments")
@@ -0,0 +1,46 @@
+from src.application.domain.account import AccountRole
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_account_adapter import SqlAlchemyAccountAdapter
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_article_adapter import SqlAlchemyArticleAdapter
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_comment_adapter import SqlAlchemyCommentAdapter
+from tests.tests_infrastructure.tests_output_adapters.tests_sqlalchemy.sqlalchemy_test_utils import (
+    AccountDataBuilder,
+    ArticleDataBuilder,
+    CommentDataBuilder,
+    SqlAlchemyTestBase,
+)
+
+
+class TestRowMappers(SqlAlchemyTestBase):
+    """
+    The fast row mappers must build the same entities as the validated Pydantic path.
+    """
+
+    def test_account_rows_match_validated_mapping(self):
+        account = AccountDataBuilder(self.session).create(username="writer", email="writer@test.com", role="author")
+        fast = SqlAlchemyAccountAdapter(self.session).get_by_id(account.account_id)
+        validated = SqlAlchemyAccountAdapter(self.session, validate_rows=True).get_by_id(account.account_id)
+        assert fast is not None and validated is not None
+        assert vars(fast) == vars(validated)
+        assert fast.account_role is AccountRole.AUTHOR
+
+    def test_article_rows_match_validated_mapping(self):
+        account = AccountDataBuilder(self.session).create()
+        article = ArticleDataBuilder(self.session).create(author_id=account.account_id)
+        fast = SqlAlchemyArticleAdapter(self.session).get_with_author(article.article_id)
+        validated = SqlAlchemyArticleAdapter(self.session, validate_rows=True).get_with_author(article.article_id)
+        assert fast is not None and validated is not None
+        assert vars(fast.article) == vars(validated.article)
+        assert fast.article.article_content == "Test Content"
+
+    def test_comment_rows_match_validated_mapping(self):
+        account = AccountDataBuilder(self.session).create()
+        article = ArticleDataBuilder(self.session).create(author_id=account.account_id)
+        builder = CommentDataBuilder(self.session)
+        parent = builder.create(article_id=article.article_id, author_id=account.account_id)
+        builder.create(article.article_id, account.account_id, "Reply", parent.comment_id, depth=1)
+        fast = SqlAlchemyCommentAdapter(self.session).get_all_with_authors_by_article_id(article.article_id)
+        validated = SqlAlchemyCommentAdapter(self.session, validate_rows=True).get_all_with_authors_by_article_id(
+            article.article_id,
+        )
+        assert {c.comment.comment_id: vars(c.comment) for c in fast} == {c.comment.comment_id: vars(c.comment) for c in validated}
+        assert sorted(c.comment.comment_depth for c in fast) == [0, 1]
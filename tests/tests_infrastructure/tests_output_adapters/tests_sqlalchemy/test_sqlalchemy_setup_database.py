@@ -0,0 +1,110 @@
+import threading
+from typing import Any, cast
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session, scoped_session
+
+from blog_comment_application import create_app
+from config.env_config import env_config
+from src.infrastructure.output_adapters.sqlalchemy import sqlalchemy_setup_database
+from src.infrastructure.output_adapters.sqlalchemy.sqlalchemy_setup_database import (
+    create_database_engine,
+    remove_session,
+    setup_database,
+)
+
+
+class TestCreateDatabaseEngine:
+    def test_pool_settings_are_read_from_environment(self, monkeypatch):
+        monkeypatch.setenv("DB_POOL_SIZE", "7")
+        monkeypatch.setenv("DB_MAX_OVERFLOW", "3")
+        monkeypatch.setenv("DB_POOL_RECYCLE", "60")
+        monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+        engine = create_database_engine(env_config.test_database_url)
+        pool = cast(Any, engine.pool)
+        assert pool.size() == 7
+        assert pool._max_overflow == 3
+        assert pool._recycle == 60
+        assert pool._pre_ping is False
+        engine.dispose()
+
+    def test_pool_settings_have_defaults(self, monkeypatch):
+        for name in ("DB_POOL_SIZE", "DB_MAX_OVERFLOW", "DB_POOL_RECYCLE", "DB_POOL_PRE_PING"):
+            monkeypatch.delenv(name, raising=False)
+        engine = create_database_engine(env_config.test_database_url)
+        pool = cast(Any, engine.pool)
+        assert pool.size() == 5
+        assert pool._max_overflow == 10
+        assert pool._recycle == 1800
+        assert pool._pre_ping is True
+        engine.dispose()
+
+    def test_engine_is_not_tracked_for_fork(self):
+        engine = create_database_engine(env_config.test_database_url)
+        assert engine not in sqlalchemy_setup_database._fork_safe_engines
+        engine.dispose()
+
+
+class TestSetupDatabase:
+    def test_injected_session_is_returned_unchanged(self, db_session):
+        assert setup_database(db_session) is db_session
+
+    def test_created_session_is_scoped_per_thread(self, monkeypatch):
+        monkeypatch.setenv("FLASK_ENV", "test")
+        db_session = setup_database()
+        assert isinstance(db_session, scoped_session)
+
+        other_thread_sessions: list[Session] = []
+        worker = threading.Thread(target=lambda: other_thread_sessions.append(db_session()))
+        worker.start()
+        worker.join()
+
+        assert other_thread_sessions[0] is not db_session()
+        remove_session(db_session)
+
+    def test_created_engine_discards_connections_after_fork(self, monkeypatch):
+        monkeypatch.setenv("FLASK_ENV", "test")
+        db_session = setup_database()
+        engine = cast(scoped_session, db_session)().get_bind()
+        assert engine in sqlalchemy_setup_database._fork_safe_engines
+        db_session.execute(text("SELECT 1"))
+        remove_session(db_session)
+        pool = engine.pool
+
+        sqlalchemy_setup_database._discard_inherited_connections()
+
+        assert engine.pool is not pool
+
+    def test_remove_session_rolls_back_failed_transaction(self, monkeypatch):
+        monkeypatch.setenv("FLASK_ENV", "test")
+        db_session = setup_database()
+        failed = cast(scoped_session, db_session)()
+        failed.execute(text("SELECT 1"))
+        assert failed.in_transaction()
+
+        remove_session(db_session)
+
+        assert not failed.in_transaction()
+        assert cast(scoped_session, db_session)() is not failed
+
+    def test_app_removes_owned_session_on_teardown(self, monkeypatch, db_setup):
+        monkeypatch.setenv("FLASK_ENV", "test")
+        removed: list[Session] = []
+        monkeypatch.setattr("blog_comment_application.remove_session", removed.append)
+        app = create_app()
+        app.config["TESTING"] = True
+
+        response = app.test_client().get("/")
+
+        assert response.status_code == 200
+        assert len(removed) == 1
+        assert isinstance(removed[0], scoped_session)
+        remove_session(removed[0])
+
+    def test_app_keeps_injected_session_on_teardown(self, monkeypatch, app_with_db):
+        removed: list[Session] = []
+        monkeypatch.setattr("blog_comment_application.remove_session", removed.append)
+
+        app_with_db.test_client().get("/")
+
+        assert removed == []
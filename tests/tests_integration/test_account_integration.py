@@ -1,6 +1,9 @@
+import re
 from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
+from src.application.application_exceptions import PasswordHasherBusyError
+from src.infrastructure.output_adapters.security.argon2_password_hasher_adapter import Argon2PasswordHasherAdapter
 from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_account_model import AccountModel
 from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_article_model import ArticleModel
 from src.infrastructure.output_adapters.sqlalchemy.models.sqlalchemy_uploaded_file_model import UploadedFileModel
@@ -41,6 +44,26 @@ class TestRegistration:
 
         assert b"already taken" in response_email.data.lower()
 
+    def test_saturated_password_hasher_returns_503_integ(self, client, db_session, monkeypatch):
+        """
+        Verifies that a registration rejected by the saturated password hasher
+        answers 503 with a Retry-After header and creates no account.
+        """
+        def busy(self, password):
+            raise PasswordHasherBusyError("busy")
+
+        monkeypatch.setattr(Argon2PasswordHasherAdapter, "hash", busy)
+        response = client.post("/register", data={
+            "username": "burst_user",
+            "email": "burst@test.com",
+            "password": "password",
+            "confirm_password": "password"
+        })
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "5"
+        assert db_session.query(AccountModel).filter_by(account_username="burst_user").count() == 0
+
 class TestProfile:
     """Grouped tests for profile management and session persistence."""
 
@@ -102,7 +125,7 @@ class TestProfilePhoto:
 
         upload_resp = client.post(
             "/api/profile/photo",
-            data={"file": (BytesIO(b"new-image-data"), "new_avatar.jpg", "image/jpeg")},
+            data={"file": (BytesIO(b"\xff\xd8\xff\xe0new-image-data"), "new_avatar.jpg", "image/jpeg")},
             content_type="multipart/form-data",
         )
         assert upload_resp.status_code == 200
@@ -241,14 +264,40 @@ class TestAdminUserList:
         total_accounts = db_session.query(AccountModel).count()
         r1 = client.get("/admin/users")
         assert r1.status_code == 200
-        assert b"user_0" in r1.data
-        assert b"user_19" in r1.data
-        assert b"user_20" not in r1.data
+        assert b"user_24" in r1.data
+        assert b"user_6" in r1.data
+        assert b"user_5" not in r1.data
         assert b"page-link-num" in r1.data
         assert f"Manage Users ({total_accounts} users)".encode() in r1.data
         r2 = client.get("/admin/users?page=2")
         assert r2.status_code == 200
-        assert b"user_20" in r2.data
-        assert b"user_24" in r2.data
-        assert b"user_0" not in r2.data
+        assert b"user_5" in r2.data
+        assert b"user_0" in r2.data
+        assert b"user_24" not in r2.data
         assert b"page-link-num" in r2.data
+
+    def test_admin_user_list_next_link_uses_keyset_cursor(self, client, db_session):
+        for i in range(25):
+            db_session.add(AccountModel(
+                account_username=f"user_{i}",
+                account_email=f"user_{i}@test.com",
+                account_password="p",
+                account_role="user"
+            ))
+
+        db_session.add(AccountModel(
+            account_username="admin_user",
+            account_email="admin@test.com",
+            account_password="admin_pass",
+            account_role="admin"
+        ))
+        db_session.commit()
+        client.post("/login", data={"username": "admin_user", "password": "admin_pass"}, follow_redirects=True)
+        r1 = client.get("/admin/users")
+        cursor = re.search(rb"after=([A-Za-z0-9_-]+)", r1.data)
+        assert cursor is not None
+        r2 = client.get(f"/admin/users?page=2&after={cursor.group(1).decode()}")
+        assert r2.status_code == 200
+        assert b"user_5" in r2.data
+        assert b"user_0" in r2.data
+        assert b"user_6" not in r2.data
@@ -6,7 +6,7 @@ class TestFileUpload:
     """End-to-end tests for file upload and retrieval."""
 
     def test_upload_image_success(self, client):
-        data = {"file": (io.BytesIO(b"fake_image_data"), "photo.jpg", "image/jpeg")}
+        data = {"file": (io.BytesIO(b"\xff\xd8\xff\xe0\x00\x10JFIF"), "photo.jpg", "image/jpeg")}
         response = client.post(
             "/api/upload/image",
             data=data,
@@ -58,3 +58,35 @@ class TestFileUpload:
         assert serve_resp.status_code == 200
         assert serve_resp.mimetype == "image/png"
         assert serve_resp.data == b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
+
+    def test_revalidation_and_range_requests(self, client):
+        data = {"file": (io.BytesIO(b"\x89PNG\r\n\x1a\n0123456789"), "digits.png", "image/png")}
+        url = client.post("/api/upload/image", data=data, content_type="multipart/form-data").get_json()["url"]
+
+        first = client.get(url)
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+
+        revalidated = client.get(url, headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+
+        partial = client.get(url, headers={"Range": "bytes=8-11"})
+        assert partial.status_code == 206
+        assert partial.data == b"0123"
+
+    def test_serve_resized_variant(self, client):
+        from PIL import Image
+
+        original = io.BytesIO()
+        Image.new("RGB", (300, 200), "blue").save(original, format="PNG")
+        data = {"file": (io.BytesIO(original.getvalue()), "blue.png", "image/png")}
+        url = client.post("/api/upload/image", data=data, content_type="multipart/form-data").get_json()["url"]
+        variant_url = url.rsplit("/", 1)[0] + "/64x64.webp"
+
+        response = client.get(variant_url)
+        assert response.status_code == 200
+        assert response.mimetype == "image/webp"
+        assert Image.open(io.BytesIO(response.data)).size == (64, 64)
+
+        again = client.get(variant_url, headers={"If-None-Match": response.headers["ETag"]})
+        assert again.status_code == 304
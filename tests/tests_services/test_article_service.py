@@ -3,9 +3,12 @@ from datetime import UTC, datetime
 from unittest.mock import MagicMock
 
 from src.application.domain.account import AccountRole
-from src.application.domain.article import Article
+from src.application.domain.article import Article, ArticleCursor, ArticleWithAuthor
+from src.application.domain.comment import CommentWithAuthor
+from src.application.domain.page import Page
 from src.application.input_ports.file_management import FileManagementPort
 from src.application.output_ports.account_repository import AccountRepository
+from src.application.output_ports.article_renderer_repository import ArticleRendererRepository
 from src.application.output_ports.article_repository import ArticleRepository
 from src.application.output_ports.comment_repository import CommentRepository
 from src.application.services.article_service import ArticleService, _extract_image_uuids
@@ -13,6 +16,7 @@ from tests.test_domain_factories import (
     create_test_account,
     create_test_article,
     create_test_comment,
+    summarize_test_article,
 )
 
 
@@ -22,6 +26,7 @@ class ArticleServiceTestBase:
         self.mock_account_repo = MagicMock(spec=AccountRepository, autospec=True)
         self.mock_comment_repo = MagicMock(spec=CommentRepository, autospec=True)
         self.mock_file_service = MagicMock(spec=FileManagementPort)
+        self.mock_article_repo.replace_file_references.return_value = set()
         self.service = ArticleService(
             article_repository=self.mock_article_repo,
             account_repository=self.mock_account_repo,
@@ -50,6 +55,18 @@ class TestCreateArticle(ArticleServiceTestBase):
         assert result.article_author_id == fake_account.account_id
         assert result.article_description == ""
 
+    def test_create_article_records_file_references(self):
+        fake_account = create_test_account(account_role=AccountRole.AUTHOR)
+        self.mock_account_repo.get_by_id.return_value = fake_account
+        content = json.dumps([{"type": "image", "props": {"url": "/uploads/11111111-1111-1111-1111-111111111111/a.png"}}])
+
+        result = self.service.create_article("Title", content, fake_account.account_id, fake_account.account_role)
+
+        assert isinstance(result, Article)
+        self.mock_article_repo.replace_file_references.assert_called_once_with(
+            result.article_id, {"11111111-1111-1111-1111-111111111111"},
+        )
+
     def test_create_article_with_description(self):
         fake_account = create_test_account(account_role=AccountRole.ADMIN)
         self.mock_account_repo.get_by_id.return_value = fake_account
@@ -105,16 +122,16 @@ class TestCreateArticle(ArticleServiceTestBase):
 class TestGetArticles(ArticleServiceTestBase):
     def test_get_all_ordered_by_date_desc(self):
         fake_articles = [
-            create_test_article(
+            summarize_test_article(create_test_article(
                 article_id=2,
                 article_title="Recent Article",
                 article_published_at=datetime(2026, 3, 25),
-            ),
-            create_test_article(
+            )),
+            summarize_test_article(create_test_article(
                 article_id=1,
                 article_title="Old Article",
                 article_published_at=datetime(2026, 1, 1),
-            ),
+            )),
         ]
 
         self.mock_article_repo.get_all_ordered_by_date_desc.return_value = fake_articles
@@ -124,72 +141,48 @@ class TestGetArticles(ArticleServiceTestBase):
         first_article_list = result[0]
         assert first_article_list.article_title == "Recent Article"
 
-    def test_get_paginated_articles(self):
-        fake_articles = [
-            create_test_article(article_id=1, article_title="First", article_author_id=10),
-            create_test_article(article_id=2, article_title="Second", article_author_id=20)
-        ]
-
-        fake_authors = [
-            create_test_account(account_id=10, account_username="Author1"),
-            create_test_account(account_id=20, account_username="Author2")
+    def test_get_article_page(self):
+        fake_items = [
+            summarize_test_article(create_test_article(article_id=1, article_title="First", article_author_id=10), "Author1"),
+            summarize_test_article(create_test_article(article_id=2, article_title="Second", article_author_id=20), "Author2"),
         ]
-
-        self.mock_article_repo.get_paginated.return_value = fake_articles
-        self.mock_account_repo.get_by_ids.return_value = fake_authors
-        articles = self.service.get_paginated_articles(page=2, per_page=10)
-        article_1, article_2 = articles
-        assert article_1.article.article_title == "First"
-        assert article_1.author_name == "Author1"
-        assert article_2.article.article_title == "Second"
-        assert article_2.author_name == "Author2"
-
-    def test_get_paginated_articles_page_less_than_one(self):
-        fake_articles = [create_test_article(article_title="Paged Title", article_author_id=1)]
-        self.mock_article_repo.get_paginated.return_value = fake_articles
-        self.mock_account_repo.get_by_ids.return_value = [create_test_account(account_id=1, account_username="User")]
-        articles = self.service.get_paginated_articles(page=-5, per_page=10)
-        article_view, = articles
-        assert article_view.author_name == "User"
-
-    def test_get_paginated_articles_defaults(self):
-        self.mock_article_repo.get_paginated.return_value = []
-        self.mock_account_repo.get_by_ids.return_value = []
-        self.service.get_paginated_articles()
-        self.mock_article_repo.get_paginated.assert_called_once_with(1, 10)
-
-    def test_get_total_count(self):
-        self.mock_article_repo.count_all.return_value = 42
-        result = self.service.get_total_count()
-        self.mock_article_repo.count_all.assert_called_once()
-        assert result == 42
-
-    def test_get_paginated_articles_deduplication(self):
-        same_author_id = 99
-        fake_articles = [
-            create_test_article(article_id=1, article_author_id=same_author_id),
-            create_test_article(article_id=2, article_author_id=same_author_id),
-            create_test_article(article_id=3, article_author_id=42)
-        ]
-
-        self.mock_article_repo.get_paginated.return_value = fake_articles
-        self.mock_account_repo.get_by_ids.return_value = [
-            create_test_account(account_id=99, account_username="Author99"),
-            create_test_account(account_id=42, account_username="Author42")
-        ]
-
-        self.service.get_paginated_articles()
-        called_ids = self.mock_account_repo.get_by_ids.call_args[0][0]
-        assert len(called_ids) == 2
-        assert set(called_ids) == {99, 42}
-        self.mock_account_repo.get_by_id.assert_not_called()
-
-    def test_get_paginated_articles_unknown_author(self):
-        fake_articles = [create_test_article(article_id=1, article_author_id=999)]
-        self.mock_article_repo.get_paginated.return_value = fake_articles
-        self.mock_account_repo.get_by_ids.return_value = []
-        result = self.service.get_paginated_articles()
-        assert result[0].author_name == "Unknown"
+        self.mock_article_repo.get_page.return_value = Page(items=fake_items, total=12)
+        articles = self.service.get_article_page(page=2, per_page=10)
+        assert articles.items == fake_items
+        self.mock_article_repo.get_page.assert_called_once_with(2, 10, None)
+        self.mock_account_repo.get_by_ids.assert_not_called()
+
+    def test_get_article_page_less_than_one(self):
+        self.mock_article_repo.get_page.return_value = Page(items=[], total=0)
+        self.service.get_article_page(page=-5, per_page=10)
+        self.mock_article_repo.get_page.assert_called_once_with(1, 10, None)
+
+    def test_get_article_page_defaults(self):
+        self.mock_article_repo.get_page.return_value = Page(items=[], total=0)
+        self.service.get_article_page()
+        self.mock_article_repo.get_page.assert_called_once_with(1, 10, None)
+
+    def test_get_article_page_after_cursor_uses_keyset(self):
+        cursor = ArticleCursor(published_at=datetime(2024, 1, 1), article_id=7)
+        self.mock_article_repo.get_page.return_value = Page(items=[], total=0)
+        self.service.get_article_page(page=3, per_page=10, after=cursor)
+        self.mock_article_repo.get_page.assert_called_once_with(3, 10, cursor)
+
+    def test_get_article_page_returns_repository_page(self):
+        cursor = ArticleCursor(published_at=datetime(2024, 1, 1), article_id=7)
+        page = Page(items=[summarize_test_article(create_test_article(article_id=1), "Author1")], total=31)
+        self.mock_article_repo.get_page.return_value = page
+        result = self.service.get_article_page(page=0, per_page=10, after=cursor)
+        self.mock_article_repo.get_page.assert_called_once_with(1, 10, cursor)
+        assert result == page
+        self.mock_account_repo.get_by_ids.assert_not_called()
+
+    def test_search_article_page_returns_repository_page(self):
+        page = Page(items=[summarize_test_article(create_test_article(article_id=1), "Author1")], total=12)
+        self.mock_article_repo.search_page.return_value = page
+        result = self.service.search_article_page("python", page=2, per_page=10)
+        self.mock_article_repo.search_page.assert_called_once_with("python", 2, 10)
+        assert result == page
 
 
 class TestGetArticleById(ArticleServiceTestBase):
@@ -341,19 +334,13 @@ class TestGetAuthorName(ArticleServiceTestBase):
 
 class TestGetArticleWithComments(ArticleServiceTestBase):
     def test_get_article_with_comments_success(self):
-        article_author_id = 10
-        comment_author_id = 20
-        fake_article = create_test_article(article_id=1, article_author_id=article_author_id)
-        fake_comment = create_test_comment(comment_id=101, comment_article_id=1, comment_written_account_id=comment_author_id)
-        self.mock_article_repo.get_by_id.return_value = fake_article
-        self.mock_comment_repo.get_all_by_article_id.return_value = [fake_comment]
-
-        fake_accounts = [
-            create_test_account(account_id=article_author_id, account_username="ArticleAuthor"),
-            create_test_account(account_id=comment_author_id, account_username="CommentAuthor")
+        fake_article = create_test_article(article_id=1, article_author_id=10)
+        fake_comment = create_test_comment(comment_id=101, comment_article_id=1, comment_written_account_id=20)
+        self.mock_article_repo.get_with_author.return_value = ArticleWithAuthor(fake_article, "ArticleAuthor")
+        self.mock_comment_repo.get_all_with_authors_by_article_id.return_value = [
+            CommentWithAuthor(fake_comment, "CommentAuthor"),
         ]
 
-        self.mock_account_repo.get_by_ids.return_value = fake_accounts
         result = self.service.get_article_with_comments(article_id=1)
         assert not isinstance(result, str)
         assert result.article_with_author.article.article_id == 1
@@ -362,25 +349,15 @@ class TestGetArticleWithComments(ArticleServiceTestBase):
         root_node = result.nested_comments[0]
         assert root_node.comment.comment.comment_id == 101
         assert root_node.comment.author_name == "CommentAuthor"
-        self.mock_article_repo.get_by_id.assert_called_once_with(1)
-        self.mock_comment_repo.get_all_by_article_id.assert_called_once_with(1)
-        called_author_ids = self.mock_account_repo.get_by_ids.call_args[0][0]
-        assert set(called_author_ids) == {article_author_id, comment_author_id}
+        self.mock_article_repo.get_with_author.assert_called_once_with(1)
+        self.mock_comment_repo.get_all_with_authors_by_article_id.assert_called_once_with(1)
+        self.mock_account_repo.get_by_ids.assert_not_called()
 
     def test_get_article_with_comments_article_not_found(self):
-        self.mock_article_repo.get_by_id.return_value = None
+        self.mock_article_repo.get_with_author.return_value = None
         result = self.service.get_article_with_comments(article_id=999)
         assert result == "Article not found."
-
-    def test_get_article_with_comments_unknown_author(self):
-        fake_article = create_test_article(article_id=1, article_author_id=999)
-        self.mock_article_repo.get_by_id.return_value = fake_article
-        self.mock_comment_repo.get_all_by_article_id.return_value = []
-        self.mock_account_repo.get_by_ids.return_value = []
-        result = self.service.get_article_with_comments(article_id=1)
-        assert not isinstance(result, str)
-        assert result.article_with_author.author_name == "Unknown"
-        self.mock_account_repo.get_by_ids.assert_called_once()
+        self.mock_comment_repo.get_all_with_authors_by_article_id.assert_not_called()
 
 
 class TestExtractImageUuids:
@@ -434,13 +411,27 @@ class TestDeleteArticleOrphanCleanup(ArticleServiceTestBase):
         fake_account = create_test_account(account_id=1, account_role=AccountRole.AUTHOR)
         self.mock_article_repo.get_by_id.return_value = fake_article
         self.mock_account_repo.get_by_id.return_value = fake_account
+        self.mock_article_repo.replace_file_references.return_value = {"11111111-1111-1111-1111-111111111111"}
 
         result = self.service.delete_article(article_id=1, user_id=1)
 
         assert result is True
-        self.mock_file_service.delete_file.assert_called_once_with("11111111-1111-1111-1111-111111111111")
+        self.mock_article_repo.replace_file_references.assert_called_once_with(1, set())
+        self.mock_file_service.delete_files.assert_called_once_with({"11111111-1111-1111-1111-111111111111"})
         self.mock_article_repo.delete.assert_called_once_with(fake_article)
 
+    def test_delete_article_keeps_files_still_referenced(self):
+        fake_article = create_test_article(article_id=1, article_author_id=1)
+        fake_account = create_test_account(account_id=1, account_role=AccountRole.AUTHOR)
+        self.mock_article_repo.get_by_id.return_value = fake_article
+        self.mock_account_repo.get_by_id.return_value = fake_account
+
+        result = self.service.delete_article(article_id=1, user_id=1)
+
+        assert result is True
+        self.mock_file_service.delete_files.assert_not_called()
+        self.mock_file_service.delete_file.assert_not_called()
+
     def test_delete_article_no_files_does_not_call_file_service(self):
         fake_article = create_test_article(article_id=1, article_author_id=1, article_content="no images here")
         fake_account = create_test_account(account_id=1, account_role=AccountRole.AUTHOR)
@@ -450,7 +441,7 @@ class TestDeleteArticleOrphanCleanup(ArticleServiceTestBase):
         result = self.service.delete_article(article_id=1, user_id=1)
 
         assert result is True
-        self.mock_file_service.delete_file.assert_not_called()
+        self.mock_file_service.delete_files.assert_not_called()
         self.mock_article_repo.delete.assert_called_once_with(fake_article)
 
     def test_delete_article_unauthorized_does_not_delete_files(self):
@@ -462,7 +453,8 @@ class TestDeleteArticleOrphanCleanup(ArticleServiceTestBase):
         result = self.service.delete_article(article_id=1, user_id=99)
 
         assert result == "Unauthorized : Only authors or admins can delete articles."
-        self.mock_file_service.delete_file.assert_not_called()
+        self.mock_file_service.delete_files.assert_not_called()
+        self.mock_article_repo.replace_file_references.assert_not_called()
         self.mock_article_repo.delete.assert_not_called()
 
     def test_delete_article_no_file_service_does_not_crash(self):
@@ -499,13 +491,17 @@ class TestUpdateArticleOrphanCleanup(ArticleServiceTestBase):
         fake_account = create_test_account(account_id=1, account_role=AccountRole.AUTHOR)
         self.mock_article_repo.get_by_id.return_value = fake_article
         self.mock_account_repo.get_by_id.return_value = fake_account
+        self.mock_article_repo.replace_file_references.return_value = {"11111111-1111-1111-1111-111111111111"}
 
         result = self.service.update_article(
             article_id=1, user_id=1, title="New", content=new_content,
         )
 
         assert isinstance(result, Article)
-        self.mock_file_service.delete_file.assert_called_once_with("11111111-1111-1111-1111-111111111111")
+        self.mock_article_repo.replace_file_references.assert_called_once_with(
+            1, {"22222222-2222-2222-2222-222222222222"},
+        )
+        self.mock_file_service.delete_files.assert_called_once_with({"11111111-1111-1111-1111-111111111111"})
         self.mock_article_repo.save.assert_called_once()
 
     def test_update_article_no_old_images_does_not_delete(self):
@@ -523,7 +519,7 @@ class TestUpdateArticleOrphanCleanup(ArticleServiceTestBase):
         )
 
         assert isinstance(result, Article)
-        self.mock_file_service.delete_file.assert_not_called()
+        self.mock_file_service.delete_files.assert_not_called()
         self.mock_article_repo.save.assert_called_once()
 
     def test_update_article_same_images_does_not_delete(self):
@@ -541,7 +537,7 @@ class TestUpdateArticleOrphanCleanup(ArticleServiceTestBase):
         )
 
         assert isinstance(result, Article)
-        self.mock_file_service.delete_file.assert_not_called()
+        self.mock_file_service.delete_files.assert_not_called()
         self.mock_article_repo.save.assert_called_once()
 
     def test_update_article_no_file_service_does_not_crash(self):
@@ -581,3 +577,49 @@ class TestUpdateArticleOrphanCleanup(ArticleServiceTestBase):
         assert isinstance(result, Article)
         assert result.article_edited_at is not None
         assert (datetime.now(UTC) - result.article_edited_at).total_seconds() < 5
+
+
+class TestArticleRendering(ArticleServiceTestBase):
+    def setup_method(self):
+        super().setup_method()
+        self.mock_renderer = MagicMock(spec=ArticleRendererRepository)
+        self.mock_renderer.version = 2
+        self.mock_renderer.render.side_effect = lambda content: f"<p>{content}</p>"
+        self.service.renderer = self.mock_renderer
+
+    def test_create_article_stores_rendered_html(self):
+        self.mock_account_repo.get_by_id.return_value = create_test_account(account_role=AccountRole.AUTHOR)
+        result = self.service.create_article(title="T", content="Body", author_id=1, author_role="author")
+        assert isinstance(result, Article)
+        assert result.article_content_html == "<p>Body</p>"
+        assert result.article_renderer_version == 2
+        self.mock_article_repo.save.assert_called_once_with(result)
+
+    def test_update_article_renders_new_content(self):
+        fake_article = create_test_article(article_id=1, article_author_id=1)
+        fake_article.article_content_html, fake_article.article_renderer_version = "<p>Old</p>", 2
+        self.mock_article_repo.get_by_id.return_value = fake_article
+        self.mock_account_repo.get_by_id.return_value = create_test_account(account_id=1, account_role=AccountRole.AUTHOR)
+        result = self.service.update_article(article_id=1, user_id=1, title="T", content="New")
+        assert isinstance(result, Article)
+        assert result.article_content_html == "<p>New</p>"
+
+    def test_detail_uses_stored_html_of_current_version(self):
+        fake_article = create_test_article(article_id=1, article_author_id=10)
+        fake_article.article_content_html, fake_article.article_renderer_version = "<p>Stored</p>", 2
+        self.mock_article_repo.get_with_author.return_value = ArticleWithAuthor(fake_article, "Author")
+        self.mock_comment_repo.get_all_with_authors_by_article_id.return_value = []
+        result = self.service.get_article_with_comments(article_id=1)
+        assert not isinstance(result, str)
+        assert result.article_with_author.article.article_content_html == "<p>Stored</p>"
+        self.mock_renderer.render.assert_not_called()
+
+    def test_detail_renders_stale_html(self):
+        fake_article = create_test_article(article_id=1, article_author_id=10)
+        fake_article.article_content_html, fake_article.article_renderer_version = "<p>Stale</p>", 1
+        self.mock_article_repo.get_with_author.return_value = ArticleWithAuthor(fake_article, "Author")
+        self.mock_comment_repo.get_all_with_authors_by_article_id.return_value = []
+        result = self.service.get_article_with_comments(article_id=1)
+        assert not isinstance(result, str)
+        assert result.article_with_author.article.article_content_html == f"<p>{fake_article.article_content}</p>"
+        self.mock_article_repo.save.assert_not_called()
@@ -1,6 +1,7 @@
 from unittest.mock import MagicMock
 
 from src.application.domain.account import AccountRole
+from src.application.domain.comment import CommentWithAuthor
 from src.application.output_ports.account_repository import AccountRepository
 from src.application.output_ports.article_repository import ArticleRepository
 from src.application.output_ports.comment_repository import CommentRepository
@@ -129,39 +130,34 @@ class TestCreateReply(CommentServiceTestBase):
         assert saved_reply.comment_written_account_id == fake_account.account_id
         assert saved_reply.comment_reply_to == parent_comment.comment_id
         assert saved_reply.comment_content == "This is a reply"
+        assert saved_reply.comment_depth == 1
         assert result is saved_reply
 
     def test_create_reply_success_nested_comment(self):
         fake_account = create_test_account(account_id=1, account_role=AccountRole.USER)
         self.mock_account_repo.get_by_id.return_value = fake_account
 
-        root_comment = create_test_comment(
-            comment_id=10,
-            comment_reply_to=None,
-        )
         parent_comment = create_test_comment(
             comment_id=15,
             comment_article_id=5,
             comment_written_account_id=2,
             comment_reply_to=10,
             comment_content="I am a reply",
+            comment_depth=1,
         )
-
-        def mock_get_by_id(cid):
-            mapping = {10: root_comment, 15: parent_comment}
-            return mapping.get(cid)
-
-        self.mock_comment_repo.get_by_id.side_effect = mock_get_by_id
+        self.mock_comment_repo.get_by_id.return_value = parent_comment
 
         result = self.service.create_reply(
             parent_comment_id=parent_comment.comment_id,
             user_id=fake_account.account_id, content="Replying to a reply"
         )
 
+        self.mock_comment_repo.get_by_id.assert_called_once_with(parent_comment.comment_id)
         self.mock_comment_repo.save.assert_called_once()
         index_first_arg = 0
         saved_reply = self.mock_comment_repo.save.call_args.args[index_first_arg]
         assert saved_reply.comment_reply_to == parent_comment.comment_id
+        assert saved_reply.comment_depth == 2
         assert result is saved_reply
 
     def test_create_reply_parent_not_found(self):
@@ -200,18 +196,11 @@ class TestCreateReply(CommentServiceTestBase):
         self.mock_account_repo.get_by_id.return_value = create_test_account(
             account_id=1, account_role=AccountRole.USER
         )
-        deep_comment_1 = create_test_comment(comment_id=1, comment_reply_to=None)
-        deep_comment_2 = create_test_comment(comment_id=2, comment_reply_to=1)
-        deep_comment_3 = create_test_comment(comment_id=3, comment_reply_to=2)
-        deep_parent = create_test_comment(comment_id=4, comment_reply_to=3)
-
-        def mock_get_by_id(cid):
-            mapping = {1: deep_comment_1, 2: deep_comment_2, 3: deep_comment_3, 4: deep_parent}
-            return mapping.get(cid)
-
-        self.mock_comment_repo.get_by_id.side_effect = mock_get_by_id
+        deep_parent = create_test_comment(comment_id=4, comment_reply_to=3, comment_depth=3)
+        self.mock_comment_repo.get_by_id.return_value = deep_parent
 
         result = self.service.create_reply(4, 1, "Too deep reply")
+        self.mock_comment_repo.get_by_id.assert_called_once_with(4)
         self.mock_comment_repo.save.assert_not_called()
         assert isinstance(result, str)
         assert "maximum nesting depth" in result.lower()
@@ -222,30 +211,27 @@ class TestGetComments(CommentServiceTestBase):
         self.mock_article_repo.get_by_id.return_value = None
         result = self.service.get_comments_for_article(article_id=999)
         self.mock_article_repo.get_by_id.assert_called_once_with(999)
-        self.mock_comment_repo.get_all_by_article_id.assert_not_called()
+        self.mock_comment_repo.get_all_with_authors_by_article_id.assert_not_called()
         assert result == "Article not found."
 
     def test_get_comments_for_article_empty(self):
         fake_article = create_test_article(article_id=1, article_author_id=2)
         self.mock_article_repo.get_by_id.return_value = fake_article
-        self.mock_comment_repo.get_all_by_article_id.return_value = []
-        self.mock_account_repo.get_by_ids.return_value = []
+        self.mock_comment_repo.get_all_with_authors_by_article_id.return_value = []
         comments = self.service.get_comments_for_article(article_id=fake_article.article_id)
         self.mock_article_repo.get_by_id.assert_called_once_with(fake_article.article_id)
-        self.mock_comment_repo.get_all_by_article_id.assert_called_once_with(fake_article.article_id)
+        self.mock_comment_repo.get_all_with_authors_by_article_id.assert_called_once_with(fake_article.article_id)
         assert not isinstance(comments, str)
         assert comments == []
 
     def test_get_comments_for_article_success(self):
         fake_article = create_test_article(article_id=1, article_author_id=2)
         self.mock_article_repo.get_by_id.return_value = fake_article
-        root_author_id = 3
-        reply_author_id = 4
 
         root_comment = create_test_comment(
             comment_id=10,
             comment_article_id=fake_article.article_id,
-            comment_written_account_id=root_author_id,
+            comment_written_account_id=3,
             comment_reply_to=None,
             comment_content="First!",
         )
@@ -253,16 +239,14 @@ class TestGetComments(CommentServiceTestBase):
         reply = create_test_comment(
             comment_id=15,
             comment_article_id=fake_article.article_id,
-            comment_written_account_id=reply_author_id,
+            comment_written_account_id=4,
             comment_reply_to=root_comment.comment_id,
             comment_content="Awesome!",
         )
 
-        self.mock_comment_repo.get_all_by_article_id.return_value = [root_comment, reply]
-
-        self.mock_account_repo.get_by_ids.return_value = [
-            create_test_account(account_id=root_author_id, account_username="Author3"),
-            create_test_account(account_id=reply_author_id, account_username="Author4")
+        self.mock_comment_repo.get_all_with_authors_by_article_id.return_value = [
+            CommentWithAuthor(root_comment, "Author3"),
+            CommentWithAuthor(reply, "Author4", author_avatar_file_id="avatar-4"),
         ]
 
         result = self.service.get_comments_for_article(article_id=fake_article.article_id)
@@ -273,17 +257,21 @@ class TestGetComments(CommentServiceTestBase):
         assert root_node.comment.author_name == "Author3"
         assert reply_node.comment.comment == reply
         assert reply_node.comment.author_name == "Author4"
+        assert reply_node.comment.author_avatar_file_id == "avatar-4"
+        assert reply_node.depth == 1
+        self.mock_account_repo.get_by_ids.assert_not_called()
 
     def test_get_comments_for_article_ordering(self):
         from datetime import datetime
         fake_article = create_test_article(article_id=1, article_author_id=2)
         self.mock_article_repo.get_by_id.return_value = fake_article
-        self.mock_account_repo.get_by_ids.return_value = []
         comment_1 = create_test_comment(comment_id=1, comment_posted_at=datetime(2026, 1, 1), comment_reply_to=None)
         comment_2 = create_test_comment(comment_id=2, comment_posted_at=datetime(2026, 1, 2), comment_reply_to=None)
         reply_1 = create_test_comment(comment_id=3, comment_posted_at=datetime(2026, 1, 4), comment_reply_to=2)
         reply_2 = create_test_comment(comment_id=4, comment_posted_at=datetime(2026, 1, 3), comment_reply_to=2)
-        self.mock_comment_repo.get_all_by_article_id.return_value = [comment_1, comment_2, reply_1, reply_2]
+        self.mock_comment_repo.get_all_with_authors_by_article_id.return_value = [
+            CommentWithAuthor(c, "Anonymous") for c in (comment_1, comment_2, reply_1, reply_2)
+        ]
         result = self.service.get_comments_for_article(article_id=1)
         assert not isinstance(result, str)
         latest_root, oldest_root = result
@@ -293,17 +281,6 @@ class TestGetComments(CommentServiceTestBase):
         assert latest_reply.comment.comment.comment_id == reply_1.comment_id
         assert oldest_reply.comment.comment.comment_id == reply_2.comment_id
 
-    def test_get_comments_for_article_unknown_author(self):
-        fake_article = create_test_article(article_id=1, article_author_id=2)
-        self.mock_article_repo.get_by_id.return_value = fake_article
-        comment = create_test_comment(comment_id=1, comment_written_account_id=999, comment_reply_to=None)
-        self.mock_comment_repo.get_all_by_article_id.return_value = [comment]
-        self.mock_account_repo.get_by_ids.return_value = []
-        result = self.service.get_comments_for_article(article_id=1)
-        assert not isinstance(result, str)
-        comment_node, = result
-        assert comment_node.comment.author_name == "Anonymous"
-
 
 class TestDeleteComment(CommentServiceTestBase):
     def test_delete_comment_soft_delete_by_author(self):
@@ -1,10 +1,30 @@
+import hashlib
+from io import BytesIO
 from unittest.mock import MagicMock
 
+import pytest
+
 from src.application.application_exceptions import FileTooLargeError, FileTypeError
 from src.application.domain.file_record import FileRecord
+from src.application.domain.image_variant import IMAGE_VARIANTS, ImageVariant
 from src.application.output_ports.file_storage_repository import FileStorageRepository
+from src.application.output_ports.image_processor_repository import ImageProcessorRepository
 from src.application.services.file_service import FileService
 
+PNG_DATA = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
+JPEG_DATA = b"\xff\xd8\xff\xe0\x00\x10JFIF"
+
+
+class _UnseekableStream:
+    def __init__(self, data: bytes):
+        self._stream = BytesIO(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._stream.read(size)
+
+    def seekable(self) -> bool:
+        return False
+
 
 class TestFileService:
     def setup_method(self):
@@ -15,7 +35,7 @@ class TestFileService:
     def test_upload_file_valid_image(self):
         result = self.service.upload_file(
             filename="photo.jpg",
-            data=b"fake_image_data",
+            data=JPEG_DATA,
             mime_type="image/jpeg",
         )
 
@@ -23,20 +43,26 @@ class TestFileService:
         assert isinstance(result, FileRecord)
         assert result.original_filename == "photo.jpg"
         assert result.mime_type == "image/jpeg"
-        assert result.size == len(b"fake_image_data")
+        assert result.size == len(JPEG_DATA)
+        assert result.data == JPEG_DATA
 
     def test_upload_file_uppercase_extension(self):
         result = self.service.upload_file(
             filename="photo.JPG",
-            data=b"fake",
+            data=JPEG_DATA,
             mime_type="image/jpeg",
         )
 
         self.mock_storage.save.assert_called_once()
         assert result.original_filename == "photo.JPG"
 
+    def test_upload_file_passes_content_digest_to_repository(self):
+        self.service.upload_file(filename="a.png", data=PNG_DATA, mime_type="image/png")
+
+        saved = self.mock_storage.save.call_args.args[0]
+        assert saved.content_sha256 == hashlib.sha256(PNG_DATA).hexdigest()
+
     def test_upload_file_invalid_extension(self):
-        import pytest
         with pytest.raises(FileTypeError, match="txt"):
             self.service.upload_file(
                 filename="notes.txt",
@@ -46,7 +72,6 @@ class TestFileService:
         self.mock_storage.save.assert_not_called()
 
     def test_upload_file_non_image_mime(self):
-        import pytest
         with pytest.raises(FileTypeError, match="application/pdf"):
             self.service.upload_file(
                 filename="image.png",
@@ -56,8 +81,7 @@ class TestFileService:
         self.mock_storage.save.assert_not_called()
 
     def test_upload_file_too_large(self):
-        import pytest
-        large_data = b"x" * (5 * 1024 * 1024 + 1)
+        large_data = PNG_DATA + b"x" * (5 * 1024 * 1024 + 1 - len(PNG_DATA))
         with pytest.raises(FileTooLargeError, match="5242881"):
             self.service.upload_file(
                 filename="huge.png",
@@ -66,6 +90,51 @@ class TestFileService:
             )
         self.mock_storage.save.assert_not_called()
 
+    def test_upload_file_too_large_stops_reading_at_limit(self):
+        stream = BytesIO(PNG_DATA + b"x" * (8 * 1024 * 1024))
+        with pytest.raises(FileTooLargeError):
+            self.service.upload_file_stream(filename="huge.png", stream=stream, mime_type="image/png")
+        assert stream.tell() < 5 * 1024 * 1024 + 64 * 1024 + 1
+        self.mock_storage.save.assert_not_called()
+
+    def test_upload_file_stream_hands_stream_to_repository(self):
+        stream = BytesIO(PNG_DATA)
+        result = self.service.upload_file_stream(filename="tiny.png", stream=stream, mime_type="image/png")
+
+        saved = self.mock_storage.save.call_args.args[0]
+        assert saved.stream is stream
+        assert stream.tell() == 0
+        assert result.size == len(PNG_DATA)
+        assert result.content_sha256 == hashlib.sha256(PNG_DATA).hexdigest()
+
+    def test_upload_file_stream_spools_unseekable_stream(self):
+        def check_spooled(record):
+            assert record.stream.read() == PNG_DATA
+            return record
+
+        self.mock_storage.save.side_effect = check_spooled
+        self.service.upload_file_stream(filename="tiny.png", stream=_UnseekableStream(PNG_DATA), mime_type="image/png")
+        self.mock_storage.save.assert_called_once()
+
+    def test_upload_file_rejects_content_that_is_not_an_image(self):
+        with pytest.raises(FileTypeError):
+            self.service.upload_file(filename="photo.png", data=b"MZ\x90\x00 not an image", mime_type="image/png")
+        self.mock_storage.save.assert_not_called()
+
+    @pytest.mark.parametrize(("data", "mime_type"), [
+        (PNG_DATA, "image/png"),
+        (JPEG_DATA, "image/jpeg"),
+        (b"GIF89a\x01\x00\x01\x00", "image/gif"),
+        (b"RIFF\x24\x00\x00\x00WEBPVP8 ", "image/webp"),
+        (b"\x00\x00\x00\x1cftypavif\x00\x00\x00\x00", "image/avif"),
+        (b"BM\x36\x00\x00\x00", "image/bmp"),
+        (b"II*\x00\x08\x00\x00\x00", "image/tiff"),
+        (b'<?xml version="1.0"?>\n<svg xmlns="http://www.w3.org/2000/svg"/>', "image/svg+xml"),
+    ])
+    def test_upload_file_stores_sniffed_mime_type(self, data, mime_type):
+        result = self.service.upload_file(filename="image.png", data=data, mime_type="image/png")
+        assert result.mime_type == mime_type
+
     def test_get_file_found(self):
         expected = FileRecord(
             file_id="uuid-789",
@@ -89,7 +158,105 @@ class TestFileService:
         self.mock_storage.get.assert_called_once_with("uuid-missing")
         assert result is None
 
+    def test_get_file_metadata_delegates_to_storage(self):
+        expected = FileRecord(
+            file_id="uuid-789", original_filename="found.png", mime_type="image/png", size=256, data=None,
+        )
+        self.mock_storage.get_metadata.return_value = expected
+
+        result = self.service.get_file_metadata("uuid-789")
+
+        self.mock_storage.get_metadata.assert_called_once_with("uuid-789")
+        self.mock_storage.get.assert_not_called()
+        assert result is expected
+
     def test_delete_file_delegates_to_storage(self):
         self.service.delete_file("uuid-to-delete")
 
         self.mock_storage.delete.assert_called_once_with("uuid-to-delete")
+
+    def test_delete_files_deletes_in_one_call(self):
+        self.service.delete_files({"uuid-1", "uuid-2"})
+        self.service.delete_files(set())
+
+        self.mock_storage.delete_many.assert_called_once_with({"uuid-1", "uuid-2"})
+
+
+class TestFileServiceImageVariants:
+    def setup_method(self):
+        self.mock_storage = MagicMock(spec=FileStorageRepository, autospec=True)
+        self.mock_storage.save.side_effect = lambda x: x
+        self.mock_storage.save_variant.side_effect = lambda file_id, variant, record: record
+        self.mock_processor = MagicMock(spec=ImageProcessorRepository, autospec=True)
+        self.service = FileService(self.mock_storage, self.mock_processor)
+        self.original = FileRecord(
+            file_id="uuid-1", original_filename="photo.png", mime_type="image/png", size=5, data=b"image",
+        )
+
+    def test_unknown_variant_returns_none(self):
+        assert self.service.get_image_variant("uuid-1", 123, 45, "webp") is None
+        self.mock_storage.get_variant.assert_not_called()
+
+    def test_without_processor_returns_none(self):
+        service = FileService(self.mock_storage)
+        assert service.get_image_variant("uuid-1", 64, 64, "webp") is None
+
+    def test_stored_variant_is_returned_without_rendering(self):
+        stored = FileRecord(file_id="uuid-1", original_filename="64x64.webp", mime_type="image/webp", size=1, data=b"v")
+        self.mock_storage.get_variant.return_value = stored
+
+        assert self.service.get_image_variant("uuid-1", 64, 64, "webp") is stored
+        self.mock_storage.get_variant.assert_called_once_with("uuid-1", ImageVariant(64, 64, "webp"))
+        self.mock_processor.render.assert_not_called()
+
+    def test_missing_variant_is_rendered_and_stored(self):
+        self.mock_storage.get_variant.return_value = None
+        self.mock_storage.get.return_value = self.original
+        self.mock_processor.render.return_value = b"webp"
+
+        result = self.service.get_image_variant("uuid-1", 960, 0, "webp")
+
+        assert result is not None
+        assert result.data == b"webp"
+        assert result.mime_type == "image/webp"
+        assert result.original_filename == "960x0.webp"
+        self.mock_processor.render.assert_called_once_with(b"image", ImageVariant(960, 0, "webp"))
+        self.mock_storage.save_variant.assert_called_once_with("uuid-1", ImageVariant(960, 0, "webp"), result)
+
+    def test_unrenderable_image_returns_original(self):
+        self.mock_storage.get_variant.return_value = None
+        self.mock_storage.get.return_value = self.original
+        self.mock_processor.render.return_value = None
+
+        assert self.service.get_image_variant("uuid-1", 64, 64, "avif") is self.original
+        self.mock_storage.save_variant.assert_not_called()
+
+    def test_variant_of_missing_file_returns_none(self):
+        self.mock_storage.get_variant.return_value = None
+        self.mock_storage.get.return_value = None
+
+        assert self.service.get_image_variant("uuid-missing", 64, 64, "webp") is None
+        self.mock_processor.render.assert_not_called()
+
+    def test_eager_upload_renders_every_variant(self):
+        service = FileService(self.mock_storage, self.mock_processor, eager_variants=True)
+        self.mock_processor.render_all.side_effect = lambda data, variants: [b"v"] * len(variants)
+
+        service.upload_file(filename="photo.png", data=PNG_DATA, mime_type="image/png")
+
+        rendered = self.mock_processor.render_all.call_args.args[1]
+        assert set(rendered) == IMAGE_VARIANTS
+        assert self.mock_storage.save_variant.call_count == len(IMAGE_VARIANTS)
+
+    def test_upload_records_image_width(self):
+        self.mock_processor.get_width.return_value = 640
+
+        saved = self.service.upload_file(filename="photo.png", data=PNG_DATA, mime_type="image/png")
+
+        assert saved.image_width == 640
+        self.mock_processor.get_width.assert_called_once()
+
+    def test_lazy_upload_renders_nothing(self):
+        self.service.upload_file(filename="photo.png", data=PNG_DATA, mime_type="image/png")
+
+        self.mock_processor.render_all.assert_not_called()
@@ -1,6 +1,8 @@
+from datetime import datetime
 from unittest.mock import MagicMock
 
-from src.application.domain.account import Account, AccountRole
+from src.application.domain.account import Account, AccountCursor, AccountRole
+from src.application.domain.page import Page
 from src.application.output_ports.account_repository import AccountRepository
 from src.application.output_ports.account_session_repository import AccountSessionRepository
 from src.application.output_ports.password_hasher_repository import PasswordHasherRepository
@@ -104,6 +106,15 @@ class TestLoginService:
         assert result is None
         self.mock_repo.update_email.assert_called_once_with(1, "new@test.com")
 
+    def test_update_email_refreshes_session_account(self):
+        fake_account = create_test_account(account_id=1, account_email="old@test.com")
+        updated = create_test_account(account_id=1, account_email="new@test.com")
+        self.mock_session_repo.get_account.return_value = fake_account
+        self.mock_repo.find_by_email.return_value = None
+        self.mock_repo.get_by_id.return_value = updated
+        self.service.update_email("new@test.com")
+        self.mock_session_repo.save_account.assert_called_once_with(updated)
+
     def test_update_email_taken_returns_error(self):
         fake_account = create_test_account(account_id=1, account_email="old@test.com")
         other = create_test_account(account_id=2, account_email="taken@test.com")
@@ -143,6 +154,25 @@ class TestLoginService:
         self.mock_hasher.hash.assert_not_called()
         self.mock_repo.update_password.assert_not_called()
 
+    def test_get_account_page_delegates_to_repository(self):
+        page = Page(items=[create_test_account()], total=21)
+        self.mock_repo.get_page.return_value = page
+        cursor = AccountCursor(datetime(2024, 1, 1), 42)
+        assert self.service.get_account_page(page=2, per_page=20, after=cursor) == page
+        self.mock_repo.get_page.assert_called_once_with(2, 20, cursor)
+
+    def test_search_account_page_delegates_to_repository(self):
+        page = Page(items=[], total=0)
+        self.mock_repo.search_page.return_value = page
+        assert self.service.search_account_page("zzz", page=1, per_page=20) == page
+        self.mock_repo.search_page.assert_called_once_with("zzz", 1, 20)
+
+    def test_suggest_accounts_delegates_to_repository(self):
+        fake_account = create_test_account()
+        self.mock_repo.suggest_by_username.return_value = [fake_account]
+        assert self.service.suggest_accounts("le", limit=5) == [fake_account]
+        self.mock_repo.suggest_by_username.assert_called_once_with("le", 5)
+
     def test_delete_account_success(self):
         fake_account = create_test_account(account_id=1)
         self.mock_repo.get_by_id.return_value = fake_account
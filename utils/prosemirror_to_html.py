@@ -1,9 +1,87 @@
 import json
+import re
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import partial
 
 from markupsafe import Markup, escape
 
+from src.application.domain.image_variant import CONTENT_WIDTHS, VARIANT_FORMATS
 
-def prosemirror_to_html(content_json: str | None, base_url: str = "") -> Markup:
+# Version of the HTML produced by prosemirror_to_html. Increase it whenever
+# the output for an unchanged document changes, then run
+# `flask articles render` to refresh the HTML stored with the articles.
+RENDERER_VERSION = 2
+
+# Images uploaded to the blog, which are served in resized variants.
+_UPLOAD_URL = re.compile(r"^/uploads/([0-9a-fA-F-]{36})/[^/?#]+$")
+# UUIDs of the uploads a serialized document may show as images.
+_UPLOAD_ID = re.compile(r'"/uploads/([0-9a-fA-F-]{36})/')
+
+# Rendered width of the article body: the full viewport up to 56rem.
+_CONTENT_SIZES = "(max-width: 56rem) 100vw, 56rem"
+
+def _escape(value: object) -> str:
+    """Escape a JSON value for HTML like markupsafe.escape, as a plain str.
+
+    Markup instances are tracked by the garbage collector, and buffering
+    hundreds of thousands of them makes every collection rescan them all.
+    JSON values never define __html__, so both escapes agree on them.
+    """
+    return (
+        str(value)
+        .replace("&", "&amp;")
+        .replace(">", "&gt;")
+        .replace("<", "&lt;")
+        .replace("'", "&#39;")
+        .replace('"', "&#34;")
+    )
+
+
+# Children of an open container still to render, with the closing tag
+# written after them and the base URL of their images.
+_Frame = tuple[Iterator[tuple[int, object]], str, str]
+# A block renderer writes the block to the output buffer. A container
+# returns its children, closing tag and base URL instead of closing itself.
+_BlockRenderer = Callable[[dict, dict, list, str, list[str]], tuple[Iterable, str, str] | None]
+
+
+def uploaded_image_ids(content_json: str | None) -> set[str]:
+    """Return the UUIDs of the uploads a document may show as images.
+
+    The serialized document is scanned without being parsed, so every
+    string starting with an upload URL counts, images or not.
+
+    Args:
+        content_json: The serialized editor document.
+
+    Returns:
+        set[str]: The UUIDs, as written in the URLs.
+    """
+    if not content_json:
+        return set()
+    return set(_UPLOAD_ID.findall(content_json))
+
+
+def prosemirror_to_html(
+    content_json: str | None, base_url: str = "", image_widths: Mapping[str, int] | None = None,
+) -> Markup:
+    """Render a BlockNote/ProseMirror JSON document to HTML.
+
+    The document tree is walked with an explicit stack holding one frame
+    per open container rather than by recursion, so that deeply nested
+    lists cannot exhaust the interpreter stack, and every fragment is
+    appended to a single output buffer joined once at the end.
+
+    Args:
+        content_json: The serialized editor document. Content that is not
+            valid JSON is rendered as one escaped paragraph.
+        base_url: Prefix of site-relative image URLs, or "" to keep them relative.
+        image_widths: Width of the uploaded images by UUID. Only uploads
+            whose width is given are offered in resized variants.
+
+    Returns:
+        Markup: The HTML of the document.
+    """
     if not content_json:
         return Markup("")
     try:
@@ -12,107 +90,195 @@ def prosemirror_to_html(content_json: str | None, base_url: str = "") -> Markup:
         return Markup(f"<p>{escape(content_json)}</p>")
     if not isinstance(blocks, list):
         return Markup("")
-    parts = [_render_block(b, base_url) for b in blocks]
-    return Markup("\n".join(parts))
-
-
-def _render_block(block, base_url: str = "") -> str:
-    if not isinstance(block, dict):
-        return escape(str(block))
-    t = block.get("type", "")
-    content = block.get("content") or []
-    attrs = block.get("props") or block.get("attrs") or {}
-
-    if t == "paragraph":
-        return f"<p>{_render_inline(content)}</p>"
-
-    if t == "heading":
-        level = attrs.get("level", 2)
-        level = max(1, min(6, level))
-        return f"<h{level}>{_render_inline(content)}</h{level}>"
-
-    if t == "bulletList":
-        inner = "\n".join(_render_block(item, base_url) for item in content)
-        return f"<ul>\n{inner}\n</ul>"
-
-    if t == "orderedList":
-        inner = "\n".join(_render_block(item, base_url) for item in content)
-        return f"<ol>\n{inner}\n</ol>"
-
-    if t == "listItem":
-        inner = _render_list_item_content(content, base_url)
-        return f"<li>\n{inner}\n</li>"
-
-    if t == "codeBlock":
-        lang = attrs.get("language", "")
-        code_text = _extract_code_text(content)
-        escaped_code = escape(code_text)
-        if lang:
-            return f'<pre><code class="language-{escape(lang)}">{escaped_code}</code></pre>'
-        return f"<pre><code>{escaped_code}</code></pre>"
-
-    if t in ("blockquote", "quote"):
-        return f"<blockquote>\n{_render_inline(content)}\n</blockquote>"
-
-    if t == "horizontalRule":
-        return "<hr>"
-
-    if t == "image":
-        url = _abs_url(attrs.get("url", "") or "", base_url)
-        alt = attrs.get("alt", "") or ""
-        caption = attrs.get("caption", "") or ""
-        img = f'<img src="{escape(url)}" alt="{escape(alt)}">'
-        if caption:
-            cap = f"<figcaption>{escape(caption)}</figcaption>"
-            return f"<figure>\n{img}\n{cap}\n</figure>"
-        return f"<figure>\n{img}\n</figure>"
-
-    if t == "video":
-        url = attrs.get("url", "") or ""
-        if not url:
-            return ""
-        return f'<p><a href="{escape(url)}">Watch video</a></p>'
-
-    if t == "checkListItem":
-        inner = _render_list_item_content(content)
-        if attrs.get("checked"):
-            return f'<li class="checked">\n{inner}\n</li>'
-        return f"<li>\n{inner}\n</li>"
-
-    if t == "table":
-        if isinstance(content, dict):
-            rows = content.get("rows") or []
-            rows_html = []
-            for row in rows:
-                if not isinstance(row, dict):
-                    rows_html.append(escape(str(row)))
-                    continue
-                cells = row.get("cells") or []
-                cells_html = "\n".join(_render_block(cell, base_url) for cell in cells)
-                rows_html.append(f"<tr>\n{cells_html}\n</tr>")
-            inner = "\n".join(rows_html)
+    renderers = _BLOCK_RENDERERS
+    if image_widths:
+        renderers = {**_BLOCK_RENDERERS, "image": partial(_render_image, image_widths=image_widths)}
+    out: list[str] = []
+    stack: list[_Frame] = [(enumerate(blocks), "", base_url)]
+    while stack:
+        children, closing, children_base_url = stack[-1]
+        for index, block in children:
+            if index:
+                out.append("\n")
+            if not isinstance(block, dict):
+                out.append(_escape(block))
+                continue
+            content = block.get("content") or []
+            attrs = block.get("props") or block.get("attrs") or {}
+            render = renderers.get(block.get("type", ""), _render_paragraph)
+            container = render(block, attrs, content, children_base_url, out)
+            if container is not None:
+                nested, nested_closing, nested_base_url = container
+                stack.append((enumerate(nested), nested_closing, nested_base_url))
+                break
         else:
-            inner = "\n".join(_render_block(item, base_url) for item in content)
-        return f"<table>\n{inner}\n</table>\n<br>"
+            stack.pop()
+            out.append(closing)
+    return Markup("".join(out))
+
+
+def _render_list_item_content(content: list, closing: str, base_url: str, out: list[str]):
+    """Write the inline content of a list item and its closing tag, or return its nested blocks."""
+    if content:
+        first = content[0]
+        if not (isinstance(first, dict) and first.get("type") == "text"):
+            return content, closing, base_url
+        _write_inline(out, content)
+    out.append(closing)
+    return None
+
+
+def _render_paragraph(block, attrs, content, base_url, out) -> None:
+    out.append("<p>")
+    _write_inline(out, content)
+    out.append("</p>")
+
+
+def _render_heading(block, attrs, content, base_url, out) -> None:
+    level = attrs.get("level", 2)
+    level = max(1, min(6, level))
+    out.append(f"<h{level}>")
+    _write_inline(out, content)
+    out.append(f"</h{level}>")
+
+
+def _list_renderer(tag: str) -> _BlockRenderer:
+    """Build the renderer of a list block whose children are list items."""
+    opening, closing = f"<{tag}>\n", f"\n</{tag}>"
+
+    def render(block, attrs, content, base_url, out):
+        out.append(opening)
+        return content, closing, base_url
+
+    return render
+
+
+def _render_list_item(block, attrs, content, base_url, out):
+    out.append("<li>\n")
+    return _render_list_item_content(content, "\n</li>", base_url, out)
+
+
+def _render_check_list_item(block, attrs, content, base_url, out):
+    out.append('<li class="checked">\n' if attrs.get("checked") else "<li>\n")
+    # Nested images of a check list item have always been left relative.
+    return _render_list_item_content(content, "\n</li>", "", out)
+
 
-    if t in ("tableRow",):
-        inner = "\n".join(_render_block(item, base_url) for item in content)
-        return f"<tr>\n{inner}\n</tr>"
+def _render_code_block(block, attrs, content, base_url, out) -> None:
+    lang = attrs.get("language", "")
+    escaped_code = _escape(_extract_code_text(content))
+    if lang:
+        out.append(f'<pre><code class="language-{_escape(lang)}">{escaped_code}</code></pre>')
+    else:
+        out.append(f"<pre><code>{escaped_code}</code></pre>")
 
-    if t in ("tableCell", "tableHeaderCell"):
-        tag = "th" if t == "tableHeaderCell" else "td"
-        return f"<{tag}>{_render_inline(content)}</{tag}>"
 
-    return f"<p>{_render_inline(content)}</p>"
+def _render_blockquote(block, attrs, content, base_url, out) -> None:
+    out.append("<blockquote>\n")
+    _write_inline(out, content)
+    out.append("\n</blockquote>")
 
 
-def _render_list_item_content(content: list, base_url: str = "") -> str:
-    if not content:
-        return ""
-    first = content[0]
-    if isinstance(first, dict) and first.get("type") == "text":
-        return _render_inline(content)
-    return "\n".join(_render_block(item, base_url) for item in content)
+def _render_horizontal_rule(block, attrs, content, base_url, out) -> None:
+    out.append("<hr>")
+
+
+def _render_image(block, attrs, content, base_url, out, image_widths: Mapping[str, int] | None = None) -> None:
+    raw_url = attrs.get("url", "") or ""
+    url = _abs_url(raw_url, base_url)
+    alt = attrs.get("alt", "") or ""
+    caption = attrs.get("caption", "") or ""
+    img = f'<img src="{_escape(url)}" alt="{_escape(alt)}">'
+    upload = _UPLOAD_URL.match(raw_url) if image_widths else None
+    if upload and upload.group(1) in image_widths:
+        img = _render_picture(raw_url, img, base_url, image_widths[upload.group(1)])
+    if caption:
+        out.append(f"<figure>\n{img}\n<figcaption>{_escape(caption)}</figcaption>\n</figure>")
+    else:
+        out.append(f"<figure>\n{img}\n</figure>")
+
+
+def _render_video(block, attrs, content, base_url, out) -> None:
+    url = attrs.get("url", "") or ""
+    if url:
+        out.append(f'<p><a href="{_escape(url)}">Watch video</a></p>')
+
+
+def _render_table(block, attrs, content, base_url, out):
+    out.append("<table>\n")
+    if isinstance(content, dict):
+        # Rows given as {"rows": [{"cells": [...]}]} render like tableRow blocks.
+        rows = (
+            {"type": "tableRow", "content": row.get("cells") or []} if isinstance(row, dict) else row
+            for row in content.get("rows") or []
+        )
+        return rows, "\n</table>\n<br>", base_url
+    return content, "\n</table>\n<br>", base_url
+
+
+def _render_table_row(block, attrs, content, base_url, out):
+    out.append("<tr>\n")
+    return content, "\n</tr>", base_url
+
+
+def _cell_renderer(tag: str) -> _BlockRenderer:
+    """Build the renderer of a table cell holding inline content."""
+    opening, closing = f"<{tag}>", f"</{tag}>"
+
+    def render(block, attrs, content, base_url, out) -> None:
+        out.append(opening)
+        _write_inline(out, content)
+        out.append(closing)
+
+    return render
+
+
+# Renderers by block type. Blocks of any other type render as paragraphs.
+_BLOCK_RENDERERS: dict[str, _BlockRenderer] = {
+    "paragraph": _render_paragraph,
+    "heading": _render_heading,
+    "bulletList": _list_renderer("ul"),
+    "orderedList": _list_renderer("ol"),
+    "listItem": _render_list_item,
+    "codeBlock": _render_code_block,
+    "blockquote": _render_blockquote,
+    "quote": _render_blockquote,
+    "horizontalRule": _render_horizontal_rule,
+    "image": _render_image,
+    "video": _render_video,
+    "checkListItem": _render_check_list_item,
+    "table": _render_table,
+    "tableRow": _render_table_row,
+    "tableCell": _cell_renderer("td"),
+    "tableHeaderCell": _cell_renderer("th"),
+}
+
+
+def _variant_widths(original_width: int) -> list[tuple[int, int]]:
+    """Return the content variants to offer for an image, with the width each one really has.
+
+    Variants are never upscaled: those narrower than the original keep
+    their width, and the first one at least as wide is the original width
+    re-encoded. Wider ones would only repeat it.
+    """
+    widths = [(width, width) for width in CONTENT_WIDTHS if width < original_width]
+    wider = next((width for width in CONTENT_WIDTHS if width >= original_width), None)
+    if wider is not None:
+        widths.append((wider, original_width))
+    return widths
+
+
+def _render_picture(upload_url: str, img: str, base_url: str, original_width: int) -> str:
+    """Wrap the img of an uploaded image in a picture offering its resized AVIF and WebP variants."""
+    variants_base = upload_url.rsplit("/", 1)[0]
+    variant_widths = _variant_widths(original_width)
+    sources = []
+    for fmt in VARIANT_FORMATS:
+        srcset = ", ".join(
+            f"{_abs_url(f'{variants_base}/{variant}x0.{fmt}', base_url)} {width}w" for variant, width in variant_widths
+        )
+        sources.append(f'<source type="image/{fmt}" srcset="{_escape(srcset)}" sizes="{_CONTENT_SIZES}">')
+    return "<picture>\n" + "\n".join(sources) + f"\n{img}\n</picture>"
 
 
 def _abs_url(url: str, base_url: str) -> str:
@@ -123,58 +289,72 @@ def _abs_url(url: str, base_url: str) -> str:
     return url
 
 
-def _render_inline(content: list) -> str:
-    if not content:
-        return ""
-    parts = []
+# Tags of the marks that take no attribute. BlockNote "styles" switch on the
+# marks of the same name.
+_MARK_TAGS: dict[str, tuple[str, str]] = {
+    "bold": ("<strong>", "</strong>"),
+    "italic": ("<em>", "</em>"),
+    "underline": ("<u>", "</u>"),
+    "strike": ("<s>", "</s>"),
+    "code": ("<code>", "</code>"),
+}
+
+
+def _link_tags(attrs: dict) -> tuple[str, str] | None:
+    return f'<a href="{_escape(attrs.get("href", ""))}">', "</a>"
+
+
+def _text_color_tags(attrs: dict) -> tuple[str, str] | None:
+    color = attrs.get("color", "")
+    return (f'<span style="color:{color}">', "</span>") if color else None
+
+
+def _background_color_tags(attrs: dict) -> tuple[str, str] | None:
+    background = attrs.get("backgroundColor", "")
+    return (f'<span style="background-color:{background}">', "</span>") if background else None
+
+
+# Tags of the marks built from their attributes, or None when a mark wraps nothing.
+_MARK_RENDERERS: dict[str, Callable[[dict], tuple[str, str] | None]] = {
+    "link": _link_tags,
+    "textColor": _text_color_tags,
+    "backgroundColor": _background_color_tags,
+}
+
+
+def _write_inline(out: list[str], content: list) -> None:
+    """Append the text and hard breaks of inline content; other nodes are dropped."""
     for node in content:
         if not isinstance(node, dict):
             continue
-        nt = node.get("type")
-        if nt == "text":
-            text = node.get("text", "")
-            marks = node.get("marks") or []
-            styles = node.get("styles") or {}
-            if styles:
-                mark_map = {"bold": "bold", "italic": "italic", "underline": "underline", "strike": "strike", "code": "code"}
-                for k, v in styles.items():
-                    if v and k in mark_map:
-                        marks.append({"type": mark_map[k]})
-            parts.append(_render_marks(text, marks))
-        elif nt == "hardBreak":
-            parts.append("<br>")
-    return "".join(parts)
+        node_type = node.get("type")
+        if node_type == "text":
+            _write_text(out, node)
+        elif node_type == "hardBreak":
+            out.append("<br>")
 
 
-def _render_marks(text: str, marks: list) -> str:
-    if not marks:
-        return escape(text)
-    result = escape(text)
-    for mark in reversed(marks):
-        mt = mark.get("type", "")
-        m_attrs = mark.get("attrs") or {}
-        if mt == "bold":
-            result = f"<strong>{result}</strong>"
-        elif mt == "italic":
-            result = f"<em>{result}</em>"
-        elif mt == "underline":
-            result = f"<u>{result}</u>"
-        elif mt == "strike":
-            result = f"<s>{result}</s>"
-        elif mt == "link":
-            href = m_attrs.get("href", "")
-            result = f'<a href="{escape(href)}">{result}</a>'
-        elif mt == "code":
-            result = f"<code>{result}</code>"
-        elif mt == "textColor":
-            color = m_attrs.get("color", "")
-            if color:
-                result = f'<span style="color:{color}">{result}</span>'
-        elif mt == "backgroundColor":
-            bg = m_attrs.get("backgroundColor", "")
-            if bg:
-                result = f'<span style="background-color:{bg}">{result}</span>'
-    return result
+def _write_text(out: list[str], node: dict) -> None:
+    """Append a text node wrapped in its marks, the first mark outermost."""
+    closings: list[str] = []
+    for mark in node.get("marks") or []:
+        mark_type = mark.get("type", "")
+        tags = _MARK_TAGS.get(mark_type)
+        if tags is None:
+            render = _MARK_RENDERERS.get(mark_type)
+            tags = render(mark.get("attrs") or {}) if render else None
+            if tags is None:
+                continue
+        out.append(tags[0])
+        closings.append(tags[1])
+    styles = node.get("styles") or {}
+    for style, enabled in styles.items():
+        if enabled and style in _MARK_TAGS:
+            opening, closing = _MARK_TAGS[style]
+            out.append(opening)
+            closings.append(closing)
+    out.append(_escape(node.get("text", "")))
+    out.extend(reversed(closings))
 
 
 def _extract_code_text(content: list) -> str:
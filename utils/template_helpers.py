@@ -7,57 +7,117 @@ from babel.dates import format_datetime
 from flask_babel import get_locale
 from markupsafe import Markup, escape
 
+VITE_PREFIX = "dist/"
+
 
 class ViteManifest:
     """
     Reads the Vite build manifest to resolve hashed asset filenames.
 
-    Reads the manifest file on every call so that rebuilds (which change
-    file hashes) take effect without restarting Flask.
+    The manifest is parsed once, together with the asset URLs injected in
+    every page, and kept in memory. When reload is enabled, each access
+    stats the file and parses it again only if its modification time,
+    inode or size changed, so that rebuilds (which change file hashes)
+    take effect without restarting Flask. Otherwise the first parse is
+    kept for the life of the process.
     """
     _manifest_path: str | None = None
+    _reload: bool = True
+    # (stat signature of the parsed file, manifest, template context), or None before the first load.
+    _cache: tuple[tuple[int, int, int] | None, dict, dict] | None = None
 
     @classmethod
-    def init(cls, static_dir: str | None) -> None:
+    def init(cls, static_dir: str | None, reload: bool = True) -> None:
         if static_dir is None:
             raise RuntimeError("Flask static_folder is None; cannot locate Vite manifest.")
         cls._manifest_path = os.path.join(static_dir, ".vite", "manifest.json")
+        cls._reload = reload
+        cls._cache = None
 
     @classmethod
-    def _load(cls) -> dict:
-        if cls._manifest_path and os.path.exists(cls._manifest_path):
-            with open(cls._manifest_path) as f:
-                return json.load(f)
-        return {}
-
-    @classmethod
-    def get(cls, entry: str = "core/entry.jsx") -> dict:
-        manifest = cls._load()
-        return manifest.get(entry, {})
+    def _signature(cls) -> tuple[int, int, int] | None:
+        """Return the modification time, inode and size of the manifest, or None if it is missing."""
+        if not cls._manifest_path:
+            return None
+        try:
+            stat = os.stat(cls._manifest_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_ino, stat.st_size
 
     @classmethod
-    def get_js(cls, entry: str = "core/entry.jsx") -> str | None:
-        data = cls.get(entry)
-        return data.get("file")
+    def _current(cls) -> tuple[tuple[int, int, int] | None, dict, dict]:
+        """Return the cached manifest and context, parsing the file first if it changed."""
+        cache = cls._cache
+        if cache is not None and not cls._reload:
+            return cache
+        signature = cls._signature()
+        if cache is not None and cache[0] == signature:
+            return cache
+        manifest: dict = {}
+        if signature is not None and cls._manifest_path:
+            try:
+                with open(cls._manifest_path) as f:
+                    manifest = json.load(f)
+            except FileNotFoundError:
+                signature = None
+        # Replaced as a whole, so that concurrent readers see either version.
+        cache = (signature, manifest, cls._build_context(manifest))
+        cls._cache = cache
+        return cache
 
     @classmethod
-    def get_css(cls, entry: str = "core/entry.jsx") -> list[str]:
-        data = cls.get(entry)
+    def _build_context(cls, manifest: dict) -> dict:
+        """Resolve the asset URLs of the default entry into the template context."""
+        js_file = cls._js(manifest)
+        css_files = cls._css(manifest)
+        vendor_js = cls._vendor_js(manifest)
+        return {
+            "vite_js_url": VITE_PREFIX + js_file if js_file else None,
+            "vite_css_urls": [VITE_PREFIX + f for f in css_files],
+            "vite_vendor_js_url": VITE_PREFIX + vendor_js if vendor_js else None,
+        }
+
+    @staticmethod
+    def _js(manifest: dict, entry: str = "core/entry.jsx") -> str | None:
+        return manifest.get(entry, {}).get("file")
+
+    @staticmethod
+    def _css(manifest: dict, entry: str = "core/entry.jsx") -> list[str]:
+        data = manifest.get(entry, {})
         css = list(data.get("css", []) or [])
         for imp in data.get("imports", []):
-            imp_data = cls._load().get(imp, {})
-            css.extend(imp_data.get("css", []) or [])
+            css.extend(manifest.get(imp, {}).get("css", []) or [])
         return css
 
-    @classmethod
-    def get_vendor_js(cls) -> str | None:
-        manifest = cls._load()
+    @staticmethod
+    def _vendor_js(manifest: dict) -> str | None:
         for entry_data in manifest.values():
             path = entry_data.get("file", "")
             if path.startswith("assets/vendor-") and path.endswith(".js"):
                 return path
         return None
 
+    @classmethod
+    def context(cls) -> dict:
+        return cls._current()[2]
+
+    @classmethod
+    def get(cls, entry: str = "core/entry.jsx") -> dict:
+        return cls._current()[1].get(entry, {})
+
+    @classmethod
+    def get_js(cls, entry: str = "core/entry.jsx") -> str | None:
+        return cls._js(cls._current()[1], entry)
+
+    @classmethod
+    def get_css(cls, entry: str = "core/entry.jsx") -> list[str]:
+        return cls._css(cls._current()[1], entry)
+
+    @classmethod
+    def get_vendor_js(cls) -> str | None:
+        return cls._vendor_js(cls._current()[1])
+
 def nl2br_filter(text: str | None) -> str:
     """
     Jinja2 filter that escapes HTML and converts newlines to <br> tags.
@@ -84,23 +144,18 @@ def inject_vite_assets() -> dict:
     Context processor that injects Vite-built asset URLs into the
     template rendering context.
 
-    Reads the Vite manifest to resolve hashed filenames for the
-    BlockNote React frontend bundle.
+    Returns the context ViteManifest resolved from the manifest when it
+    was last parsed, for the BlockNote React frontend bundle, so that a
+    render costs at most a stat of the manifest. The returned dict is
+    shared between renders and must not be modified.
 
     Returns:
-        dict: Contains ``vite_js_url`` (str or None) and
-        ``vite_css_urls`` (list of str) pointing to hashed assets
-        under the ``dist/`` subdirectory.
+        dict: Contains ``vite_js_url`` (str or None),
+        ``vite_css_urls`` (list of str) and ``vite_vendor_js_url``
+        (str or None) pointing to hashed assets under the ``dist/``
+        subdirectory.
     """
-    js_file = ViteManifest.get_js()
-    css_files = ViteManifest.get_css()
-    vendor_js = ViteManifest.get_vendor_js()
-    VITE_PREFIX = "dist/"
-    return {
-        "vite_js_url": VITE_PREFIX + js_file if js_file else None,
-        "vite_css_urls": [VITE_PREFIX + f for f in css_files] if css_files else [],
-        "vite_vendor_js_url": VITE_PREFIX + vendor_js if vendor_js else None,
-    }
+    return ViteManifest.context()
 
 
 def inject_current_year() -> dict[str, int]: